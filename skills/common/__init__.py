@@ -18,6 +18,10 @@ from .memory_client import (
     get_client,
     with_retries,
     RateLimiter,
+    get_rate_limiter,
+    rate_limit_stats,
+    MemoryWorkerPool,
+    WorkerUnavailable,
     redact_sensitive,
 )
 
@@ -26,6 +30,7 @@ from .taxonomy import (
     TaxonomyExtractionResult,
     CollectionTags,
     extract_taxonomy_features,
+    extract_taxonomy_features_batch,
     get_bridge_attributes,
     get_episodic_associations,
     create_verifier,
@@ -48,12 +53,17 @@ __all__ = [
     "get_client",
     "with_retries",
     "RateLimiter",
+    "get_rate_limiter",
+    "rate_limit_stats",
+    "MemoryWorkerPool",
+    "WorkerUnavailable",
     "redact_sensitive",
     # Taxonomy
     "ContentType",
     "TaxonomyExtractionResult",
     "CollectionTags",
     "extract_taxonomy_features",
+    "extract_taxonomy_features_batch",
     "get_bridge_attributes",
     "get_episodic_associations",
     "create_verifier",
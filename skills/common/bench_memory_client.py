@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark MemoryClient backends: persistent worker pool vs CLI subprocess.
+
+Measures single-call latency (p50/p95) and batch_recall throughput for each
+backend against the same memory project.
+
+Usage:
+    python -m common.bench_memory_client --calls 20 --batch 200
+    python -m common.bench_memory_client --backend worker --concurrency 8
+"""
+
+import argparse
+import statistics
+import time
+from typing import Dict, List
+
+from common.memory_client import MemoryClient, MemoryScope
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def bench_backend(
+    use_worker: bool,
+    calls: int,
+    batch: int,
+    concurrency: int,
+    scope: str,
+) -> Dict[str, float]:
+    """Run latency and throughput measurements for one backend."""
+    client = MemoryClient(scope=scope, use_worker=use_worker)
+
+    # Warm-up (spawns and loads the worker when use_worker=True)
+    warm_start = time.perf_counter()
+    client.recall("benchmark warm-up query")
+    warmup = time.perf_counter() - warm_start
+
+    latencies = []
+    for i in range(calls):
+        start = time.perf_counter()
+        client.recall(f"benchmark latency query {i}")
+        latencies.append(time.perf_counter() - start)
+
+    queries = [f"benchmark batch query {i}" for i in range(batch)]
+    start = time.perf_counter()
+    client.batch_recall(queries, concurrency=concurrency)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "warmup_s": warmup,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+        "batch_s": elapsed,
+        "batch_qps": batch / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["both", "worker", "cli"], default="both")
+    parser.add_argument("--calls", type=int, default=20, help="Sequential calls for latency")
+    parser.add_argument("--batch", type=int, default=100, help="Queries for batch_recall throughput")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--scope", default=MemoryScope.TEST.value)
+    args = parser.parse_args()
+
+    backends = {"worker": [True], "cli": [False], "both": [True, False]}[args.backend]
+
+    print(f"{'backend':<8} {'warmup_s':>9} {'p50_ms':>9} {'p95_ms':>9} {'batch_s':>9} {'batch_qps':>10}")
+    for use_worker in backends:
+        stats = bench_backend(use_worker, args.calls, args.batch, args.concurrency, args.scope)
+        name = "worker" if use_worker else "cli"
+        print(
+            f"{name:<8} {stats['warmup_s']:>9.2f} {stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} "
+            f"{stats['batch_s']:>9.2f} {stats['batch_qps']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,10 @@ All skills should use this module instead of implementing their own memory integ
 
 Features:
 - Retry logic with exponential backoff
-- Rate limiting (token bucket)
+- Rate limiting (per-scope token buckets with burst)
 - Structured logging with PII redaction
 - Scope validation
+- Persistent worker pool (one warm co-process, CLI subprocess as fallback)
 - Both CLI and Python API support
 
 Usage:
@@ -28,10 +29,14 @@ Usage:
     )
 """
 
+import atexit
 import functools
 import json
 import logging
 import os
+import queue
+import select
+import shutil
 import subprocess
 import threading
 import time
@@ -48,6 +53,15 @@ from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 MAX_RETRIES = int(os.environ.get("MEMORY_MAX_RETRIES", "3"))
 RETRY_BASE_DELAY = float(os.environ.get("MEMORY_RETRY_DELAY", "0.5"))
 RATE_LIMIT_RPS = int(os.environ.get("MEMORY_RATE_LIMIT_RPS", "10"))
+RATE_LIMIT_BURST = int(os.environ.get("MEMORY_RATE_LIMIT_BURST", str(RATE_LIMIT_RPS)))
+
+# Persistent worker configuration (CLI subprocess is the fallback)
+USE_WORKER = os.environ.get("MEMORY_USE_WORKER", "1").lower() not in ("0", "false", "no")
+WORKER_POOL_SIZE = int(os.environ.get("MEMORY_WORKER_POOL_SIZE", "2"))
+WORKER_TIMEOUT = float(os.environ.get("MEMORY_WORKER_TIMEOUT", "30"))
+WORKER_STARTUP_TIMEOUT = float(os.environ.get("MEMORY_WORKER_STARTUP_TIMEOUT", "120"))
+WORKER_RETRY_AFTER = float(os.environ.get("MEMORY_WORKER_RETRY_AFTER", "60"))
+BATCH_SIZE = int(os.environ.get("MEMORY_BATCH_SIZE", "64"))
 
 # Path resolution
 MEMORY_ROOT = os.environ.get(
@@ -213,49 +227,336 @@ def with_retries(
 
 class RateLimiter:
     """
-    Simple token-bucket rate limiter for API calls.
+    Thread-safe token-bucket rate limiter for API calls.
 
-    Thread-safe implementation that limits requests per second.
+    Tokens refill continuously at `requests_per_second` up to `burst`, so idle
+    periods allow a burst of back-to-back requests. Each acquire reserves a
+    token under the lock and sleeps *outside* it, so concurrent callers wait
+    in parallel for their own slot instead of queueing behind one sleeper.
 
     Example:
-        limiter = RateLimiter(requests_per_second=5)
+        limiter = RateLimiter(requests_per_second=5, burst=10)
         for item in items:
             limiter.acquire()  # Blocks if rate exceeded
             process(item)
+
+        # In async code
+        await limiter.acquire_async()
     """
 
-    def __init__(self, requests_per_second: int = RATE_LIMIT_RPS):
+    def __init__(self, requests_per_second: float = RATE_LIMIT_RPS, burst: Optional[int] = None):
         """
         Initialize rate limiter.
 
         Args:
-            requests_per_second: Maximum requests allowed per second
+            requests_per_second: Sustained requests allowed per second
+            burst: Bucket capacity (default: one second worth of requests)
         """
-        self.interval = 1.0 / max(1, requests_per_second)
-        self.last_request = 0.0
+        self.rate = float(max(1, requests_per_second))
+        self.interval = 1.0 / self.rate
+        self.capacity = float(max(1, burst if burst is not None else int(self.rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
         self._lock = threading.Lock()
 
-    def acquire(self) -> float:
+        # Counters
+        self.acquired = 0
+        self.throttled = 0
+        self.throttled_seconds = 0.0
+
+    def _reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens (possibly into debt) and return how long to wait for them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+
+            wait = max(0.0, -self._tokens / self.rate)
+            self.acquired += 1
+            if wait > 0:
+                self.throttled += 1
+                self.throttled_seconds += wait
+            return wait
+
+    def acquire(self, tokens: float = 1.0) -> float:
         """
         Acquire permission to make a request, blocking if necessary.
 
         Returns:
             Time waited in seconds (0.0 if no wait was needed)
         """
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """
+        Async variant of acquire() that yields to the event loop while throttled.
+
+        Returns:
+            Time waited in seconds (0.0 if no wait was needed)
+        """
+        import asyncio
+
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for monitoring."""
+        with self._lock:
+            return {
+                "rate": self.rate,
+                "burst": self.capacity,
+                "tokens": max(0.0, self._tokens),
+                "acquired": self.acquired,
+                "throttled": self.throttled,
+                "throttled_seconds": round(self.throttled_seconds, 3),
+            }
+
+
+# Per-scope rate limiters for memory operations
+_scope_limiters: Dict[str, RateLimiter] = {}
+_scope_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(scope: Optional[str] = None) -> RateLimiter:
+    """
+    Get the shared rate limiter for a memory scope.
+
+    Each scope gets its own bucket so a bulk ingest in one scope does not
+    starve interactive recalls in another.
+    """
+    key = scope or ""
+    with _scope_limiters_lock:
+        if key not in _scope_limiters:
+            _scope_limiters[key] = RateLimiter(RATE_LIMIT_RPS, burst=RATE_LIMIT_BURST)
+        return _scope_limiters[key]
+
+
+def rate_limit_stats() -> Dict[str, Dict[str, Any]]:
+    """Return throttling counters for every scope bucket."""
+    with _scope_limiters_lock:
+        limiters = dict(_scope_limiters)
+    return {scope or "default": limiter.stats() for scope, limiter in limiters.items()}
+
+
+# Global rate limiter for memory operations (unscoped bucket)
+_memory_limiter = get_rate_limiter()
+
+
+# =============================================================================
+# PERSISTENT WORKER POOL
+# =============================================================================
+
+WORKER_SCRIPT = Path(__file__).resolve().parent / "memory_worker.py"
+
+
+class WorkerUnavailable(RuntimeError):
+    """Raised when no persistent memory worker can serve a request."""
+
+
+class WorkerRequestLost(WorkerUnavailable):
+    """Raised when a request reached a worker but no response came back.
+
+    The worker may already have applied it, so writes must not be replayed.
+    """
+
+
+class _MemoryWorker:
+    """
+    One long-lived memory_worker.py co-process.
+
+    Requests are written as JSON lines to stdin and answered on stdout.
+    A worker serves one request at a time; the pool hands out idle workers.
+    """
+
+    def __init__(self, memory_root: Path, startup_timeout: float = WORKER_STARTUP_TIMEOUT):
+        env = dict(os.environ, MEMORY_ROOT=str(memory_root), PYTHONUNBUFFERED="1")
+        uv = shutil.which("uv")
+        if uv:
+            cmd = [uv, "run", "--directory", str(memory_root), "--all-extras",
+                   "python", str(WORKER_SCRIPT)]
+        else:
+            import sys
+            cmd = [sys.executable, str(WORKER_SCRIPT)]
+
+        self._next_id = 0
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+            cwd=str(memory_root) if memory_root.exists() else None,
+            env=env,
+        )
+
+        hello = self._read_line(startup_timeout)
+        if not hello.get("ready"):
+            self.close()
+            raise WorkerUnavailable(hello.get("error", "Memory worker failed to start"))
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def _read_line(self, timeout: float) -> Dict[str, Any]:
+        """Read one protocol line from the worker, bounded by timeout."""
+        assert self.proc.stdout is not None
+        ready, _, _ = select.select([self.proc.stdout], [], [], timeout)
+        if not ready:
+            self.close()
+            raise WorkerUnavailable(f"Memory worker did not respond within {timeout:.0f}s")
+
+        line = self.proc.stdout.readline()
+        if not line:
+            self.close()
+            raise WorkerUnavailable("Memory worker exited unexpectedly")
+
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            self.close()
+            raise WorkerUnavailable(f"Malformed worker output: {line[:100]}")
+
+    def request(self, payload: Dict[str, Any], timeout: float = WORKER_TIMEOUT) -> Dict[str, Any]:
+        """Send a request and wait for its response."""
+        if not self.alive:
+            raise WorkerUnavailable("Memory worker is not running")
+
+        self._next_id += 1
+        payload = dict(payload, id=self._next_id)
+        assert self.proc.stdin is not None
+        try:
+            self.proc.stdin.write(json.dumps(payload) + "\n")
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            self.close()
+            raise WorkerUnavailable(f"Memory worker pipe closed: {e}")
+
+        try:
+            response = self._read_line(timeout)
+        except WorkerUnavailable as e:
+            raise WorkerRequestLost(str(e)) from e
+        if response.get("id") != self._next_id:
+            self.close()
+            raise WorkerRequestLost("Memory worker response out of sequence")
+        return response
+
+    def close(self) -> None:
+        """Terminate the co-process."""
+        if self.proc.poll() is None:
+            try:
+                if self.proc.stdin:
+                    self.proc.stdin.close()
+                self.proc.wait(timeout=2)
+            except Exception:
+                self.proc.kill()
+
+
+class MemoryWorkerPool:
+    """
+    Pool of persistent memory workers shared by all MemoryClient instances.
+
+    Workers are spawned lazily up to `size`. If a worker cannot be started,
+    the pool backs off for WORKER_RETRY_AFTER seconds so callers fall back
+    to the CLI instead of paying a failed startup on every call.
+
+    Example:
+        pool = MemoryWorkerPool(Path(MEMORY_ROOT), size=2)
+        response = pool.request({"op": "recall", "scope": "operational", "query": "auth"})
+    """
+
+    def __init__(self, memory_root: Path, size: int = WORKER_POOL_SIZE, timeout: float = WORKER_TIMEOUT):
+        self.memory_root = memory_root
+        self.size = max(1, size)
+        self.timeout = timeout
+        self._idle: "queue.LifoQueue[_MemoryWorker]" = queue.LifoQueue()
+        self._spawned = 0
+        self._lock = threading.Lock()
+        self._disabled_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        return time.time() >= self._disabled_until
+
+    def _checkout(self) -> _MemoryWorker:
+        """Get an idle worker, spawning one if the pool is not yet full."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
         with self._lock:
-            now = time.time()
-            elapsed = now - self.last_request
-            sleep_time = max(0.0, self.interval - elapsed)
+            spawn = self._spawned < self.size
+            if spawn:
+                self._spawned += 1
+
+        if not spawn:
+            return self._idle.get(timeout=self.timeout)
+
+        try:
+            return _MemoryWorker(self.memory_root)
+        except Exception as e:
+            with self._lock:
+                self._spawned -= 1
+                self._disabled_until = time.time() + WORKER_RETRY_AFTER
+            raise WorkerUnavailable(str(e)) from e
+
+    def request(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Send a request to an idle worker and return its response."""
+        if not self.available:
+            raise WorkerUnavailable("Memory worker pool is backing off after a failure")
+
+        try:
+            worker = self._checkout()
+        except queue.Empty:
+            raise WorkerUnavailable(f"No memory worker free within {self.timeout:.0f}s")
 
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+        try:
+            response = worker.request(payload, timeout=timeout or self.timeout)
+        except WorkerUnavailable:
+            with self._lock:
+                self._spawned -= 1
+            raise
+
+        self._idle.put(worker)
+        return response
+
+    def close(self) -> None:
+        """Terminate all idle workers."""
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            worker.close()
+            with self._lock:
+                self._spawned -= 1
 
-            self.last_request = time.time()
-            return sleep_time
 
+_worker_pools: Dict[str, MemoryWorkerPool] = {}
+_worker_pools_lock = threading.Lock()
 
-# Global rate limiter for memory operations
-_memory_limiter = RateLimiter(requests_per_second=RATE_LIMIT_RPS)
+
+def get_worker_pool(memory_root: Path) -> MemoryWorkerPool:
+    """Get or create the shared worker pool for a memory root."""
+    key = str(memory_root)
+    with _worker_pools_lock:
+        if key not in _worker_pools:
+            _worker_pools[key] = MemoryWorkerPool(memory_root)
+        return _worker_pools[key]
+
+
+@atexit.register
+def _close_worker_pools() -> None:
+    for pool in list(_worker_pools.values()):
+        pool.close()
 
 
 # =============================================================================
@@ -319,7 +620,7 @@ class MemoryClient:
     Standard client for interacting with the memory skill.
 
     Provides a consistent interface with built-in resilience patterns.
-    Supports both CLI subprocess and Python API backends.
+    Supports persistent worker, CLI subprocess and Python API backends.
 
     Example:
         client = MemoryClient(scope=MemoryScope.SECURITY)
@@ -341,7 +642,8 @@ class MemoryClient:
         self,
         scope: Union[str, MemoryScope] = MemoryScope.OPERATIONAL,
         use_python_api: bool = False,
-        memory_root: Optional[str] = None
+        memory_root: Optional[str] = None,
+        use_worker: Optional[bool] = None
     ):
         """
         Initialize memory client.
@@ -350,9 +652,12 @@ class MemoryClient:
             scope: Default scope for operations
             use_python_api: If True, use direct Python imports instead of CLI
             memory_root: Override path to memory project
+            use_worker: Route recall/learn through the persistent worker pool,
+                falling back to the CLI (default: MEMORY_USE_WORKER env, on)
         """
         self.scope = MemoryScope.validate(scope)
         self.use_python_api = use_python_api
+        self.use_worker = USE_WORKER if use_worker is None else use_worker
         self.memory_root = Path(memory_root or MEMORY_ROOT)
         self._python_client: Optional[Any] = None
 
@@ -412,14 +717,82 @@ class MemoryClient:
             RecallResult with matching items
         """
         effective_scope = MemoryScope.validate(scope) if scope else self.scope
-        _memory_limiter.acquire()
+        get_rate_limiter(effective_scope).acquire()
 
         logger.debug(f"Recalling: {query[:50]}... (scope={effective_scope}, k={k})")
 
         if self.use_python_api:
             return self._recall_python(query, effective_scope, k, threshold)
+        if self.use_worker:
+            result = self._recall_worker(query, effective_scope, k, threshold)
+            if result is not None:
+                return result
         return self._recall_cli(query, effective_scope, k, threshold)
 
+    def _worker_request(
+        self,
+        payload: Dict[str, Any],
+        timeout: Optional[float] = None,
+        idempotent: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Send a request through the persistent worker pool.
+
+        Args:
+            payload: Request to send
+            timeout: Response timeout (default: pool timeout)
+            idempotent: False for writes; a request the worker received but
+                never answered is then reported as failed instead of retried
+
+        Returns:
+            Worker response, or None if no worker is available (caller falls back to CLI)
+        """
+        pool = get_worker_pool(self.memory_root)
+        if not pool.available:
+            return None
+        try:
+            return pool.request(payload, timeout=timeout)
+        except WorkerRequestLost as e:
+            if idempotent:
+                logger.warning(f"Memory worker request lost, falling back to CLI: {e}")
+                return None
+            logger.warning(f"Memory worker request lost, not retrying write: {e}")
+            return {"ok": False, "error": f"Outcome unknown, not retried: {e}"}
+        except WorkerUnavailable as e:
+            logger.warning(f"Memory worker unavailable, falling back to CLI: {e}")
+            return None
+
+    def _recall_worker(
+        self,
+        query: str,
+        scope: str,
+        k: int,
+        threshold: float
+    ) -> Optional[RecallResult]:
+        """Recall via persistent worker. Returns None to request CLI fallback."""
+        response = self._worker_request({
+            "op": "recall",
+            "scope": scope,
+            "query": query,
+            "k": k,
+            "threshold": threshold,
+        })
+        if response is None:
+            return None
+
+        if not response.get("ok"):
+            logger.error(f"Recall failed: {response.get('error')}")
+            return RecallResult(query=query, scope=scope, k=k)
+
+        data = response.get("result") or {}
+        return RecallResult(
+            items=data.get("items", []),
+            query=query,
+            scope=scope,
+            k=k,
+            meta=data.get("meta", {})
+        )
+
     def _recall_cli(
         self,
         query: str,
@@ -513,14 +886,53 @@ class MemoryClient:
         """
         effective_scope = MemoryScope.validate(scope) if scope else self.scope
         tags = tags or []
-        _memory_limiter.acquire()
+        get_rate_limiter(effective_scope).acquire()
 
         logger.debug(f"Learning: {problem[:50]}... (scope={effective_scope})")
 
         if self.use_python_api:
             return self._learn_python(problem, solution, effective_scope, tags)
+        if self.use_worker:
+            result = self._learn_worker(problem, solution, effective_scope, tags)
+            if result is not None:
+                return result
         return self._learn_cli(problem, solution, effective_scope, tags)
 
+    def _learn_worker(
+        self,
+        problem: str,
+        solution: str,
+        scope: str,
+        tags: List[str]
+    ) -> Optional[LearnResult]:
+        """Learn via persistent worker. Returns None to request CLI fallback."""
+        response = self._worker_request({
+            "op": "learn",
+            "scope": scope,
+            "problem": problem,
+            "solution": solution,
+            "tags": tags,
+        }, idempotent=False)
+        if response is None:
+            return None
+
+        if not response.get("ok"):
+            return LearnResult(
+                success=False,
+                scope=scope,
+                error=response.get("error") or "Unknown error"
+            )
+
+        data = response.get("result") or {}
+        if not isinstance(data, dict):
+            return LearnResult(success=True, scope=scope)
+        return LearnResult(
+            success=data.get("success", True),
+            lesson_id=data.get("_key", data.get("id", "")),
+            scope=scope,
+            meta=data
+        )
+
     def _learn_cli(
         self,
         problem: str,
@@ -592,21 +1004,132 @@ class MemoryClient:
             meta=result
         )
 
+    def _learn_bulk(
+        self,
+        items: List[Dict[str, Any]],
+        scope: str
+    ) -> Optional[List[LearnResult]]:
+        """
+        Learn a chunk of items in one worker request.
+
+        Returns:
+            One LearnResult per item, or None if the chunk was never sent
+            to a worker (a chunk lost after sending fails instead, so the
+            caller does not learn its items twice)
+        """
+        get_rate_limiter(scope).acquire()
+        response = self._worker_request(
+            {
+                "op": "learn_batch",
+                "scope": scope,
+                "items": [
+                    {
+                        "problem": item.get("problem", ""),
+                        "solution": item.get("solution", ""),
+                        "tags": item.get("tags", []),
+                    }
+                    for item in items
+                ],
+            },
+            timeout=WORKER_TIMEOUT * max(1, len(items) // 8),
+            idempotent=False,
+        )
+        if response is None:
+            return None
+        if not response.get("ok"):
+            error = response.get("error") or "Unknown error"
+            return [LearnResult(success=False, scope=scope, error=error) for _ in items]
+
+        data = response.get("result") or {}
+        raw = data.get("results", [])
+        results = []
+        for i in range(len(items)):
+            entry = raw[i] if i < len(raw) else None
+            if not isinstance(entry, dict):
+                results.append(LearnResult(
+                    success=entry is not None,
+                    scope=scope,
+                    error=None if entry is not None else "Missing bulk result"
+                ))
+                continue
+            results.append(LearnResult(
+                success=entry.get("success", True),
+                lesson_id=entry.get("_key", entry.get("id", "")),
+                scope=scope,
+                error=entry.get("error"),
+                meta=entry
+            ))
+        return results
+
+    def _recall_bulk(
+        self,
+        queries: List[str],
+        scope: str,
+        k: int,
+        threshold: float
+    ) -> Optional[List[RecallResult]]:
+        """
+        Recall a chunk of queries in one worker request.
+
+        Returns:
+            One RecallResult per query, or None if the bulk path is unavailable
+        """
+        get_rate_limiter(scope).acquire()
+        response = self._worker_request(
+            {
+                "op": "recall_batch",
+                "scope": scope,
+                "queries": queries,
+                "k": k,
+                "threshold": threshold,
+            },
+            timeout=WORKER_TIMEOUT * max(1, len(queries) // 8),
+        )
+        if response is None:
+            return None
+        if not response.get("ok"):
+            logger.error(f"Batch recall failed: {response.get('error')}")
+            return [RecallResult(query=q, scope=scope, k=k) for q in queries]
+
+        data = response.get("result") or {}
+        raw = data.get("results", [])
+        results = []
+        for i, query in enumerate(queries):
+            entry = raw[i] if i < len(raw) and isinstance(raw[i], dict) else {}
+            results.append(RecallResult(
+                items=entry.get("items", []),
+                query=query,
+                scope=scope,
+                k=k,
+                meta=entry.get("meta", {})
+            ))
+        return results
+
     def batch_learn(
         self,
         items: List[Dict[str, Any]],
         scope: Optional[Union[str, MemoryScope]] = None,
         concurrency: int = 4,
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        batch_size: int = BATCH_SIZE
     ) -> List[LearnResult]:
         """
-        Store multiple items in memory with concurrent execution.
+        Store multiple items in memory.
+
+        With the persistent worker enabled, items are sent in chunks of
+        `batch_size` per request (one rate-limit token per chunk): a chunk costs
+        one worker round trip, but the worker still learns its items one by
+        one (see memory_worker.py). Chunks no worker
+        accepted fall back to concurrent single-item learn() calls; a chunk
+        whose request timed out after reaching a worker is reported as failed
+        rather than re-learned.
 
         Args:
             items: List of dicts with 'problem', 'solution', and optional 'tags'
             scope: Override default scope for all items
             concurrency: Max concurrent operations (default: 4)
             progress_callback: Optional callback(completed, total) for progress updates
+            batch_size: Items per worker request, at least 1 (default: MEMORY_BATCH_SIZE)
 
         Returns:
             List of LearnResult for each item (in same order as input)
@@ -619,9 +1142,19 @@ class MemoryClient:
         """
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
         effective_scope = MemoryScope.validate(scope) if scope else self.scope
         results: List[Optional[LearnResult]] = [None] * len(items)
         completed = 0
+        progress_lock = threading.Lock()
+
+        def report(count: int) -> None:
+            nonlocal completed
+            with progress_lock:
+                completed += count
+                if progress_callback:
+                    progress_callback(completed, len(items))
 
         def learn_item(idx: int, item: Dict[str, Any]) -> tuple[int, LearnResult]:
             result = self.learn(
@@ -632,30 +1165,47 @@ class MemoryClient:
             )
             return idx, result
 
-        # Use ThreadPoolExecutor for concurrent execution
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            futures = {
-                executor.submit(learn_item, idx, item): idx
-                for idx, item in enumerate(items)
-            }
-
-            for future in as_completed(futures):
-                try:
-                    idx, result = future.result()
-                    results[idx] = result
-                    completed += 1
-                    if progress_callback:
-                        progress_callback(completed, len(items))
-                except Exception as e:
-                    idx = futures[future]
-                    results[idx] = LearnResult(
-                        success=False,
-                        scope=effective_scope,
-                        error=str(e)
-                    )
-                    completed += 1
-                    if progress_callback:
-                        progress_callback(completed, len(items))
+        def learn_chunk(offset: int, chunk: List[Dict[str, Any]]) -> List[int]:
+            """Run one chunk in one worker request; return indexes that still need single calls."""
+            bulk = self._learn_bulk(chunk, effective_scope)
+            if bulk is None:
+                return list(range(offset, offset + len(chunk)))
+            for i, result in enumerate(bulk):
+                results[offset + i] = result
+            report(len(chunk))
+            return []
+
+        pending = list(range(len(items)))
+        if self.use_worker and not self.use_python_api and items:
+            pending = []
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, WORKER_POOL_SIZE))) as executor:
+                futures = [
+                    executor.submit(learn_chunk, offset, items[offset:offset + batch_size])
+                    for offset in range(0, len(items), batch_size)
+                ]
+                for future in futures:
+                    pending.extend(future.result())
+
+        if pending:
+            # Use ThreadPoolExecutor for concurrent single-item execution
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {
+                    executor.submit(learn_item, idx, items[idx]): idx
+                    for idx in pending
+                }
+
+                for future in as_completed(futures):
+                    try:
+                        idx, result = future.result()
+                        results[idx] = result
+                    except Exception as e:
+                        idx = futures[future]
+                        results[idx] = LearnResult(
+                            success=False,
+                            scope=effective_scope,
+                            error=str(e)
+                        )
+                    report(1)
 
         # Filter out None values (shouldn't happen, but defensive)
         final_results = [r for r in results if r is not None]
@@ -669,16 +1219,26 @@ class MemoryClient:
         queries: List[str],
         scope: Optional[Union[str, MemoryScope]] = None,
         k: int = 5,
-        concurrency: int = 4
+        concurrency: int = 4,
+        threshold: float = 0.3,
+        batch_size: int = BATCH_SIZE
     ) -> List[RecallResult]:
         """
-        Search memory for multiple queries with concurrent execution.
+        Search memory for multiple queries.
+
+        With the persistent worker enabled, queries are sent in chunks of
+        `batch_size` per request: a chunk costs one worker round trip, but the
+        worker still recalls its queries one by one (see memory_worker.py).
+        Chunks the worker cannot serve fall back to
+        concurrent single-query recall() calls.
 
         Args:
             queries: List of search queries
             scope: Override default scope
             k: Number of results per query
             concurrency: Max concurrent operations (default: 4)
+            threshold: Minimum similarity threshold
+            batch_size: Queries per worker request, at least 1 (default: MEMORY_BATCH_SIZE)
 
         Returns:
             List of RecallResult for each query (in same order as input)
@@ -691,31 +1251,54 @@ class MemoryClient:
         """
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be at least 1, got {batch_size}")
         effective_scope = MemoryScope.validate(scope) if scope else self.scope
         results: List[Optional[RecallResult]] = [None] * len(queries)
 
         def recall_query(idx: int, query: str) -> tuple[int, RecallResult]:
-            result = self.recall(query, scope=effective_scope, k=k)
+            result = self.recall(query, scope=effective_scope, k=k, threshold=threshold)
             return idx, result
 
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            futures = {
-                executor.submit(recall_query, idx, query): idx
-                for idx, query in enumerate(queries)
-            }
-
-            for future in as_completed(futures):
-                try:
-                    idx, result = future.result()
-                    results[idx] = result
-                except Exception as e:
-                    idx = futures[future]
-                    results[idx] = RecallResult(
-                        query=queries[idx],
-                        scope=effective_scope,
-                        k=k
-                    )
-                    logger.error(f"Batch recall failed for query {idx}: {e}")
+        def recall_chunk(offset: int, chunk: List[str]) -> List[int]:
+            """Run one chunk in one worker request; return indexes that still need single calls."""
+            bulk = self._recall_bulk(chunk, effective_scope, k, threshold)
+            if bulk is None:
+                return list(range(offset, offset + len(chunk)))
+            for i, result in enumerate(bulk):
+                results[offset + i] = result
+            return []
+
+        pending = list(range(len(queries)))
+        if self.use_worker and not self.use_python_api and queries:
+            pending = []
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, WORKER_POOL_SIZE))) as executor:
+                futures = [
+                    executor.submit(recall_chunk, offset, queries[offset:offset + batch_size])
+                    for offset in range(0, len(queries), batch_size)
+                ]
+                for future in futures:
+                    pending.extend(future.result())
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                futures = {
+                    executor.submit(recall_query, idx, queries[idx]): idx
+                    for idx in pending
+                }
+
+                for future in as_completed(futures):
+                    try:
+                        idx, result = future.result()
+                        results[idx] = result
+                    except Exception as e:
+                        idx = futures[future]
+                        results[idx] = RecallResult(
+                            query=queries[idx],
+                            scope=effective_scope,
+                            k=k
+                        )
+                        logger.error(f"Batch recall failed for query {idx}: {e}")
 
         return [r for r in results if r is not None]
 
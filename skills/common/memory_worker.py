@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Long-lived memory worker speaking JSON lines over stdin/stdout.
+
+Started by MemoryClient (see memory_client.MemoryWorkerPool) inside the memory
+project environment so graph_memory, the embedding model and the DB connection
+are loaded once and reused for every recall/learn request.
+
+Protocol (one JSON object per line):
+    startup  -> {"ready": true} or {"ready": false, "error": "..."}
+    request  <- {"id": 1, "op": "recall", "scope": "...", "query": "...", "k": 5, "threshold": 0.3}
+    request  <- {"id": 2, "op": "learn", "scope": "...", "problem": "...", "solution": "...", "tags": []}
+    request  <- {"id": 3, "op": "recall_batch", "scope": "...", "queries": [...], "k": 5, "threshold": 0.3}
+    request  <- {"id": 4, "op": "learn_batch", "scope": "...", "items": [{"problem": ..., "solution": ..., "tags": [...]}]}
+    request  <- {"id": 5, "op": "ping"}
+    response -> {"id": 1, "ok": true, "result": {...}} or {"id": 1, "ok": false, "error": "..."}
+
+Batch ops run each item through the same graph_memory recall/learn calls as
+the single ops, inside the worker: a chunk costs one round trip and reuses the
+loaded model and DB connection, but embedding, search and insert are still
+per item. graph_memory exposes no bulk API, and its lesson schema and search
+pipeline live outside this repo, so they are not reimplemented here.
+
+Usage:
+    uv run --directory "$MEMORY_ROOT" --all-extras python memory_worker.py
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+
+def _emit(stream: Any, payload: Dict[str, Any]) -> None:
+    """Write a single JSON line and flush it."""
+    stream.write(json.dumps(payload, default=str) + "\n")
+    stream.flush()
+
+
+def _recall_batch(client: Any, queries: List[str], k: int, threshold: float) -> Dict[str, Any]:
+    """Recall many queries; a failing query gets an empty result with the error."""
+    results = []
+    for query in queries:
+        try:
+            results.append(client.recall(query, k=k, threshold=threshold))
+        except Exception as e:
+            results.append({"items": [], "meta": {"error": f"{type(e).__name__}: {e}"}})
+    return {"results": results}
+
+
+def _learn_batch(client: Any, items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Learn many lessons; a failing item gets {"success": false, "error": ...}."""
+    results = []
+    for item in items:
+        try:
+            results.append(client.learn(
+                problem=item.get("problem", ""),
+                solution=item.get("solution", ""),
+                tags=item.get("tags", []),
+            ))
+        except Exception as e:
+            results.append({"success": False, "error": f"{type(e).__name__}: {e}"})
+    return {"results": results}
+
+
+def main() -> int:
+    # Responses go to the real stdout; anything graph_memory prints is
+    # redirected to stderr so it cannot corrupt the protocol stream.
+    out = sys.stdout
+    sys.stdout = sys.stderr
+
+    memory_root = Path(os.environ.get(
+        "MEMORY_ROOT",
+        str(Path.home() / "workspace" / "experiments" / "memory")
+    ))
+    sys.path.insert(0, str(memory_root / "src"))
+
+    try:
+        from graph_memory.api import MemoryClient as GMClient
+    except ImportError as e:
+        _emit(out, {"ready": False, "error": f"Could not import graph_memory: {e}"})
+        return 1
+
+    clients: Dict[str, Any] = {}
+
+    def get_client(scope: str) -> Any:
+        if scope not in clients:
+            clients[scope] = GMClient(scope=scope)
+        return clients[scope]
+
+    _emit(out, {"ready": True, "pid": os.getpid()})
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            op = request.get("op")
+
+            if op == "ping":
+                result: Any = {"pong": True}
+            elif op == "recall":
+                result = get_client(request["scope"]).recall(
+                    request["query"],
+                    k=request.get("k", 5),
+                    threshold=request.get("threshold", 0.3),
+                )
+            elif op == "learn":
+                result = get_client(request["scope"]).learn(
+                    problem=request["problem"],
+                    solution=request["solution"],
+                    tags=request.get("tags", []),
+                )
+            elif op == "recall_batch":
+                result = _recall_batch(
+                    get_client(request["scope"]),
+                    request["queries"],
+                    k=request.get("k", 5),
+                    threshold=request.get("threshold", 0.3),
+                )
+            elif op == "learn_batch":
+                result = _learn_batch(get_client(request["scope"]), request["items"])
+            else:
+                raise ValueError(f"Unknown op: {op}")
+
+            _emit(out, {"id": request_id, "ok": True, "result": result})
+        except Exception as e:
+            _emit(out, {"id": request_id, "ok": False, "error": f"{type(e).__name__}: {e}"})
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -45,13 +45,21 @@ Usage:
         author="Dan Abnett",
         genre="Warhammer 40K",
     )
+
+    # Backfilling a library (streams results, fans out across processes)
+    for features in extract_taxonomy_features_batch(items, ContentType.MOVIE, workers=8):
+        ...
 """
 
+import functools
+import multiprocessing
+import re
 import sys
+import time
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple, TypedDict
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, TypedDict
 
 # ==============================================================================
 # CANONICAL TAXONOMY IMPORTS
@@ -271,6 +279,168 @@ class TaxonomyExtractionResult(TypedDict):
     raw_matches: Dict[str, Any]
 
 
+# ==============================================================================
+# COMPILED INDICATOR MATCHING
+# ==============================================================================
+
+_INDICATOR_FIELDS = ("indicators", "themes", "artists", "authors", "genres", "emotions")
+
+
+def _trie_regex(patterns: Iterable[str]) -> str:
+    """
+    Build a prefix-trie regex from literal patterns.
+
+    Shared prefixes are factored out, so matching at a position walks at most
+    one branch per character instead of trying every pattern. Optional groups
+    are greedy, so the longest pattern is tried first.
+    """
+    trie: Dict[str, Any] = {}
+    for pattern in patterns:
+        node = trie
+        for ch in pattern:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if "" in node:
+            body = "(?:" + body + ")?"
+        return body
+
+    return build(trie)
+
+
+class IndicatorMatcher:
+    """
+    Multi-pattern matcher that finds every indicator in a text in one pass.
+
+    Patterns match case-insensitively on word boundaries, so "auth" no longer
+    fires inside "author". Overlapping hits are all reported: "sons of horus"
+    yields both "sons of horus" and "horus".
+
+    Example:
+        matcher = IndicatorMatcher(["iron warriors", "iron", "horus"])
+        matcher.find_all("the iron warriors of horus")
+        # frozenset({"iron warriors", "iron", "horus"})
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns = sorted({p.lower().strip() for p in patterns if isinstance(p, str) and p.strip()})
+        self._regex = (
+            re.compile(r"(?<!\w)(?=(" + _trie_regex(self.patterns) + r")(?!\w))")
+            if self.patterns else None
+        )
+
+        # Shorter patterns that are word-prefixes of a longer one; the regex
+        # reports only the longest match per position.
+        self._implied: Dict[str, List[str]] = {}
+        for pattern in self.patterns:
+            implied = [
+                other for other in self.patterns
+                if len(other) < len(pattern)
+                and pattern.startswith(other)
+                and not (pattern[len(other)].isalnum() or pattern[len(other)] == "_")
+            ]
+            if implied:
+                self._implied[pattern] = implied
+
+    def find_all(self, text_lower: str) -> FrozenSet[str]:
+        """Return the set of patterns present in already-lowercased text."""
+        if self._regex is None or not text_lower:
+            return frozenset()
+
+        hits: Set[str] = set(self._regex.findall(text_lower))
+        for found in list(hits):
+            hits.update(self._implied.get(found, ()))
+        return frozenset(hits)
+
+
+def _indicator_table(indicators: Dict[str, Dict]) -> Dict[str, List[str]]:
+    """Flatten a bridge indicator table into pattern -> bridges (one entry per occurrence)."""
+    table: Dict[str, List[str]] = {}
+    for bridge, bridge_def in indicators.items():
+        for field_name in _INDICATOR_FIELDS:
+            field_values = bridge_def.get(field_name, [])
+            if isinstance(field_values, dict):
+                field_values = list(field_values.keys())
+            for indicator in field_values:
+                if isinstance(indicator, str) and indicator.strip():
+                    table.setdefault(indicator.lower().strip(), []).append(bridge)
+    return table
+
+
+def _mapping_table(mapping: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """Lowercase a pattern -> values mapping, merging duplicate keys."""
+    table: Dict[str, List[str]] = {}
+    for pattern, values in mapping.items():
+        table.setdefault(pattern.lower().strip(), []).extend(values)
+    return table
+
+
+def _episodic_table() -> Dict[str, List[str]]:
+    """Map episodic music indicators to episode names."""
+    table: Dict[str, List[str]] = {}
+    for episode_name, episode_data in EPISODIC_ASSOCIATIONS.items():
+        for indicator in episode_data.get("music_indicators", []):
+            if isinstance(indicator, str) and indicator.strip():
+                table.setdefault(indicator.lower().strip(), []).append(episode_name)
+    return table
+
+
+# Precompiled tables, built once at import time
+_BRIDGE_TABLES: Dict[int, Dict[str, List[str]]] = {
+    id(MOVIE_BRIDGE_INDICATORS): _indicator_table(MOVIE_BRIDGE_INDICATORS),
+    id(BOOK_BRIDGE_INDICATORS): _indicator_table(BOOK_BRIDGE_INDICATORS),
+    id(MUSIC_BRIDGE_INDICATORS): _indicator_table(MUSIC_BRIDGE_INDICATORS),
+}
+_LORE_TABLE = _mapping_table(LORE_BRIDGE_MAPPINGS)
+_EPISODIC_TABLE = _episodic_table()
+
+# Single automaton over every known indicator table
+_MATCHER = IndicatorMatcher(
+    [p for table in _BRIDGE_TABLES.values() for p in table]
+    + list(_LORE_TABLE)
+    + list(_EPISODIC_TABLE)
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _find_indicators(text_lower: str) -> FrozenSet[str]:
+    """
+    All indicator hits in text, from one pass of the shared matcher.
+
+    Cached so the bridge, lore and episodic lookups for one item share a scan.
+    """
+    return _MATCHER.find_all(text_lower)
+
+
+# Caller-supplied tables, compiled on first use (keeps a reference so ids stay valid)
+_ADHOC_MATCHERS: Dict[int, Tuple[Dict[str, Dict], Dict[str, List[str]], IndicatorMatcher]] = {}
+
+
+def _bridge_hits(text_lower: str, indicators: Dict[str, Dict]) -> Tuple[Dict[str, List[str]], FrozenSet[str]]:
+    """Resolve the pattern table and hits for an indicator table."""
+    if not indicators:
+        return {}, frozenset()
+
+    table = _BRIDGE_TABLES.get(id(indicators))
+    if table is not None:
+        return table, _find_indicators(text_lower)
+
+    # Caller-supplied table: compile once per distinct table object
+    cached = _ADHOC_MATCHERS.get(id(indicators))
+    if cached is None or cached[0] is not indicators:
+        table = _indicator_table(indicators)
+        cached = (indicators, table, IndicatorMatcher(table))
+        if len(_ADHOC_MATCHERS) >= 32:
+            _ADHOC_MATCHERS.clear()
+        _ADHOC_MATCHERS[id(indicators)] = cached
+    return cached[1], cached[2].find_all(text_lower)
+
+
 # ==============================================================================
 # CORE EXTRACTION FUNCTIONS
 # ==============================================================================
@@ -329,6 +499,77 @@ def extract_taxonomy_features(
         return _extract_generic_features(content_type, combined_text)
 
 
+_ITEM_FIELDS = ("title", "artist", "author", "genre", "tags", "emotion", "description", "audio_features")
+
+
+def _extract_item(content_type: ContentType, item: Dict[str, Any]) -> TaxonomyExtractionResult:
+    """Extract features for one item dict (top-level so worker processes can run it)."""
+    return extract_taxonomy_features(content_type, **{k: item[k] for k in _ITEM_FIELDS if item.get(k) is not None})
+
+
+def extract_taxonomy_features_batch(
+    items: Iterable[Dict[str, Any]],
+    content_type: ContentType,
+    workers: int = 1,
+    chunksize: int = 256,
+    progress_callback: Optional[Callable[[int, float], None]] = None,
+    progress_every: int = 1000,
+) -> Iterator[TaxonomyExtractionResult]:
+    """
+    Extract taxonomy features for many items, streaming results in input order.
+
+    With workers > 1 items are fanned out to a process pool. On platforms with
+    fork, workers inherit the precompiled indicator tables instead of
+    rebuilding them.
+
+    Args:
+        items: Iterable of item dicts using extract_taxonomy_features keyword names
+            (title, artist, author, genre, tags, emotion, description, audio_features)
+        content_type: Content type applied to every item
+        workers: Number of worker processes (1 = in-process)
+        chunksize: Items sent to a worker per task
+        progress_callback: Optional callback(completed, items_per_sec)
+        progress_every: Call progress_callback every N items (and once at the end)
+
+    Yields:
+        TaxonomyExtractionResult for each item
+
+    Example:
+        for features in extract_taxonomy_features_batch(movies, ContentType.MOVIE, workers=8):
+            store(features)
+    """
+    extract = functools.partial(_extract_item, content_type)
+    start = time.perf_counter()
+    completed = 0
+
+    def report() -> None:
+        if progress_callback:
+            elapsed = time.perf_counter() - start
+            progress_callback(completed, completed / elapsed if elapsed > 0 else 0.0)
+
+    if workers <= 1:
+        results: Iterable[TaxonomyExtractionResult] = map(extract, items)
+        pool = None
+    else:
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+        pool = ctx.Pool(processes=workers)
+        results = pool.imap(extract, items, chunksize=max(1, chunksize))
+
+    try:
+        for result in results:
+            completed += 1
+            if progress_every and completed % progress_every == 0:
+                report()
+            yield result
+    finally:
+        if pool is not None:
+            pool.terminate()
+            pool.join()
+
+    report()
+
+
 def _build_combined_text(*args) -> str:
     """Build combined text from all inputs for pattern matching."""
     parts = []
@@ -341,26 +582,16 @@ def _build_combined_text(*args) -> str:
 
 
 def _extract_bridges_from_text(text: str, indicators: Dict[str, Dict]) -> Tuple[List[str], Dict[str, float]]:
-    """Extract bridge attributes from text using indicators."""
-    scores = {}
-    text_lower = text.lower()
-
-    for bridge, bridge_def in indicators.items():
-        score = 0.0
-        matches = 0
+    """Extract bridge attributes from lowercased text using indicators."""
+    scores: Dict[str, float] = {}
+    table, hits = _bridge_hits(text, indicators)
 
-        # Check various indicator fields
-        for field_name in ["indicators", "themes", "artists", "authors", "genres", "emotions"]:
-            field_values = bridge_def.get(field_name, [])
-            if isinstance(field_values, dict):
-                field_values = list(field_values.keys())
-            for indicator in field_values:
-                if isinstance(indicator, str) and indicator.lower() in text_lower:
-                    score += 1.0
-                    matches += 1
+    for pattern in hits:
+        for bridge in table.get(pattern, ()):
+            scores[bridge] = scores.get(bridge, 0.0) + 1.0
 
-        if matches > 0:
-            scores[bridge] = score / max(len(indicators.get(bridge, {})), 1)
+    for bridge in scores:
+        scores[bridge] = scores[bridge] / max(len(indicators.get(bridge, {})), 1)
 
     # Get top bridges with significant scores
     threshold = 0.2
@@ -374,35 +605,27 @@ def _extract_bridges_from_text(text: str, indicators: Dict[str, Dict]) -> Tuple[
 
 
 def _check_lore_entities(text: str) -> List[str]:
-    """Check for Warhammer 40K/Horus Heresy entities in text."""
+    """Check for Warhammer 40K/Horus Heresy entities in lowercased text."""
     bridges = set()
-    text_lower = text.lower()
 
-    for entity, entity_bridges in LORE_BRIDGE_MAPPINGS.items():
-        if entity.lower() in text_lower:
-            bridges.update(entity_bridges)
+    for pattern in _find_indicators(text):
+        bridges.update(_LORE_TABLE.get(pattern, ()))
 
     return list(bridges)
 
 
 def _get_episodic_associations(bridges: List[str], text: str = "") -> List[str]:
-    """Get episodic associations for bridges."""
+    """Get episodic associations for bridges (text must be lowercased)."""
     associations = []
 
     if _HMT_AVAILABLE:
         for episode_name, episode_data in EPISODIC_ASSOCIATIONS.items():
-            episode_bridge = episode_data.get("bridge", "")
-            if episode_bridge in bridges:
-                if episode_name not in associations:
-                    associations.append(episode_name)
-                continue
-
-            # Match by music indicators in text
-            for indicator in episode_data.get("music_indicators", []):
-                if indicator.lower() in text.lower():
-                    if episode_name not in associations:
-                        associations.append(episode_name)
-                    break
+            if episode_data.get("bridge", "") in bridges:
+                associations.append(episode_name)
+
+        # Match by music indicators in text
+        for pattern in _find_indicators(text):
+            associations.extend(_EPISODIC_TABLE.get(pattern, ()))
     else:
         # Fallback episode map
         episode_map = {
@@ -789,6 +1012,8 @@ def get_bridge_attributes(text: str, content_type: Optional[ContentType] = None)
         result = extract_taxonomy_features(content_type, title=text)
         return result["bridge_attributes"]
 
+    text = text.lower()
+
     # Check for lore entities first
     bridges = _check_lore_entities(text)
 
@@ -815,7 +1040,7 @@ def get_episodic_associations(bridges: List[str], text: str = "") -> List[str]:
     Returns:
         List of episode names (e.g., "Siege_of_Terra", "Davin_Corruption")
     """
-    return _get_episodic_associations(bridges, text)
+    return _get_episodic_associations(bridges, text.lower())
 
 
 def create_verifier(content_type: ContentType = ContentType.LORE):
@@ -853,6 +1078,7 @@ def is_taxonomy_available() -> Dict[str, bool]:
 __all__ = [
     # Core functions
     "extract_taxonomy_features",
+    "extract_taxonomy_features_batch",
     "get_bridge_attributes",
     "get_episodic_associations",
     "create_verifier",
@@ -861,6 +1087,7 @@ __all__ = [
     "ContentType",
     "TaxonomyExtractionResult",
     "CollectionTags",
+    "IndicatorMatcher",
     # Indicators (for reference)
     "MOVIE_BRIDGE_INDICATORS",
     "BOOK_BRIDGE_INDICATORS",
@@ -4,7 +4,7 @@ set -e
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 DATA_DIR="${HOME}/.pi/consume-book"
-REGISTRY_PATH="${DATA_DIR}/registry.json"
+REGISTRY_PATH="${DATA_DIR}/registry.db"
 NOTES_DIR="${DATA_DIR}/notes"
 BOOKMARKS_PATH="${DATA_DIR}/bookmarks.json"
 CACHE_DIR="${DATA_DIR}/cache"
@@ -368,16 +368,15 @@ def acquire_missing_books(
 
     # Check what's already local
     local_titles = set()
-    if book_registry_path.exists():
-        try:
-            from consume_common.registry import ContentRegistry
+    try:
+        from consume_common.registry import ContentRegistry
+        if ContentRegistry.exists(book_registry_path):
             registry = ContentRegistry(book_registry_path)
-            books = registry.list_content("book")
-            for book in books:
+            for book in registry.list_content("book"):
                 local_titles.add(book.get("title", "").lower())
                 result["local_books"].append(book.get("title"))
-        except Exception:
-            pass
+    except Exception:
+        pass
 
     # Find missing books
     for pattern in related_patterns:
@@ -598,13 +597,12 @@ def get_book_notes(
     # Find related book patterns
     related_patterns = find_related_books(movie_title)
 
-    if not book_registry_path.exists():
-        console.print("[yellow]No consume-book registry found[/yellow]")
-        return context
-
     # Load book registry
     try:
         from consume_common.registry import ContentRegistry
+        if not ContentRegistry.exists(book_registry_path):
+            console.print("[yellow]No consume-book registry found[/yellow]")
+            return context
         registry = ContentRegistry(book_registry_path)
         books = registry.list_content("book")
     except Exception as e:
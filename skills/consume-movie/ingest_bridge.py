@@ -76,12 +76,7 @@ def sync_from_ingest(ingest_path: Optional[Path] = None, registry_path: Optional
             }
 
             # Check if already exists
-            existing = None
-            for content in registry.list_content("movie"):
-                if content.get("source_path") == str(transcript_file):
-                    existing = content
-                    break
-
+            existing = registry.get_content_by_source_path(transcript_file)
             if existing:
                 console.print(f"[yellow]Skipping existing: {title}[/yellow]")
                 continue
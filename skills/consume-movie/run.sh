@@ -5,7 +5,7 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 # Global data directory per CONVENTIONS.md
 DATA_DIR="${HOME}/.pi/consume-movie"
-REGISTRY_PATH="${DATA_DIR}/registry.json"
+REGISTRY_PATH="${DATA_DIR}/registry.db"
 NOTES_DIR="${DATA_DIR}/notes"
 CLIPS_DIR="${DATA_DIR}/clips"
 
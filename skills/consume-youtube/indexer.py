@@ -1,18 +1,82 @@
-"""Transcript indexing for consume-youtube."""
+"""Transcript indexing for consume-youtube.
+
+Each channel has an index directory, ~/.pi/consume-youtube/indices/<channel>/:
+
+    manifest.json   index parts, and per transcript: path, size, mtime,
+                    part and document number
+    part-*.bin      immutable arrays, memory-mapped at query time:
+                      segment table (document, start, duration, token count)
+                      segment texts, each stored once (UTF-8)
+                      sorted vocabulary
+                      postings per term: (segment id, token position), uint32
+
+Writers hold an exclusive flock on <channel>/.lock and re-read the manifest
+under it; readers hold a shared lock while opening parts, so a writer never
+deletes a part that another process is about to map.
+
+Updates only read transcripts whose size or mtime changed. Their segments are
+written to a new part and the superseded copies become dead documents in the
+old parts, until parts are merged (more than MAX_PARTS parts, or more than
+MAX_DEAD_RATIO dead segments). Merging re-tokenizes the stored segment texts,
+not the transcript JSON.
+
+TranscriptIndex.search ranks segments with BM25; every query term must occur
+in the segment, and quoted parts of the query must occur as phrases. To rank
+hits from several channels together, search each index with the combined
+corpus_stats() of all of them, so every score uses the same IDF and length
+normalization.
+"""
 
 from __future__ import annotations
 
+import fcntl
 import json
+import math
+import mmap
+import os
 import re
+import uuid
+from array import array
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, Tuple
 
 from rich.console import Console
 
 console = Console()
 
 TOKEN_RE = re.compile(r"[a-z0-9']+")
+PHRASE_RE = re.compile(r'"([^"]*)"')
+
+INDEX_VERSION = 1
+DEFAULT_INDICES_DIR = Path.home() / ".pi" / "consume-youtube" / "indices"
+MAX_PARTS = 8
+MAX_DEAD_RATIO = 0.25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_MAGIC = b"CYTIDX01"
+# Part file sections in file order: (name, array typecode)
+_SECTIONS = (
+    ("seg_doc", "I"),
+    ("seg_start", "d"),
+    ("seg_duration", "d"),
+    ("seg_len", "I"),
+    ("text_off", "Q"),
+    ("text", "B"),
+    ("term_off", "Q"),
+    ("terms", "B"),
+    ("post_off", "Q"),
+    ("post_seg", "I"),
+    ("post_pos", "I"),
+)
+
+Segment = Tuple[float, float, str]  # (start, duration, text)
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.lower())
 
 
 def _detect_ingest_root(explicit_root: Optional[Path]) -> Optional[Path]:
@@ -32,32 +96,465 @@ def _detect_ingest_root(explicit_root: Optional[Path]) -> Optional[Path]:
     return None
 
 
-def _index_segment_terms(
-    index: dict[str, list[dict[str, object]]],
-    video_id: str,
-    start: float,
-    text: str,
-    max_occurrences_per_term: int,
-) -> None:
-    tokens = TOKEN_RE.findall(text.lower())
-    for token in tokens:
-        entries = index.setdefault(token, [])
-        if len(entries) >= max_occurrences_per_term:
+def _read_transcript(transcript_path: Path) -> Optional[tuple[str, list[Segment]]]:
+    """(video_id, non-empty segments) of an ingest-youtube transcript JSON."""
+    try:
+        data = json.loads(transcript_path.read_text(encoding="utf-8"))
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+        return None
+
+    meta = data.get("meta", {}) if isinstance(data, dict) else {}
+    video_id = meta.get("video_id", transcript_path.stem)
+    transcript = data.get("transcript", []) if isinstance(data, dict) else []
+
+    segments: list[Segment] = []
+    for segment in transcript:
+        text = str(segment.get("text", ""))
+        if not text.strip():
             continue
-        entries.append({
-            "video_id": video_id,
-            "start": start,
-            "text": text,
+        segments.append((float(segment.get("start", 0)), float(segment.get("duration", 0)), text))
+    return video_id, segments
+
+
+# ---------------------------------------------------------------------------
+# Part files
+# ---------------------------------------------------------------------------
+
+def _write_part(path: Path, docs: list[list[Segment]]) -> tuple[dict, list[dict]]:
+    """Write one part file for docs (segments per transcript).
+
+    Returns:
+        (part info for the manifest, per-doc first segment, count and tokens)
+    """
+    arrays = {name: array(code) for name, code in _SECTIONS if code != "B"}
+    text = bytearray()
+    postings: dict[str, array] = {}
+    arrays["text_off"].append(0)
+
+    doc_stats: list[dict] = []
+    for doc_no, segments in enumerate(docs):
+        first = len(arrays["seg_doc"])
+        doc_tokens = 0
+        for start, duration, seg_text in segments:
+            seg_id = len(arrays["seg_doc"])
+            tokens = tokenize(seg_text)
+            for pos, token in enumerate(tokens):
+                postings.setdefault(token, array("I")).extend((seg_id, pos))
+            arrays["seg_doc"].append(doc_no)
+            arrays["seg_start"].append(start)
+            arrays["seg_duration"].append(duration)
+            arrays["seg_len"].append(len(tokens))
+            text += seg_text.encode("utf-8")
+            arrays["text_off"].append(len(text))
+            doc_tokens += len(tokens)
+        doc_stats.append({
+            "first": first,
+            "count": len(arrays["seg_doc"]) - first,
+            "tokens": doc_tokens,
         })
 
+    # Segment ids and positions are appended in order, so each posting list is sorted
+    terms = bytearray()
+    arrays["term_off"].append(0)
+    arrays["post_off"].append(0)
+    for term in sorted(postings):
+        pairs = postings[term]
+        terms += term.encode("utf-8")
+        arrays["term_off"].append(len(terms))
+        arrays["post_seg"].extend(pairs[0::2])
+        arrays["post_pos"].extend(pairs[1::2])
+        arrays["post_off"].append(len(arrays["post_seg"]))
+
+    blobs = {"text": text, "terms": terms}
+    sections: dict[str, list[int]] = {}
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(_MAGIC)
+        for name, _code in _SECTIONS:
+            data = blobs[name] if name in blobs else arrays[name]
+            handle.write(b"\0" * (-handle.tell() % 8))
+            sections[name] = [handle.tell(), len(data)]
+            handle.write(data)
+    os.replace(tmp_path, path)
+
+    info = {"sections": sections, "segments": len(arrays["seg_doc"])}
+    return info, doc_stats
+
+
+class _Part:
+    """Read-only, memory-mapped view of a part file."""
+
+    def __init__(self, path: Path, sections: dict[str, list[int]]) -> None:
+        with open(path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(_MAGIC)] != _MAGIC:
+            raise ValueError(f"Not a transcript index part: {path}")
+
+        buffer = memoryview(self._mmap)
+        for name, code in _SECTIONS:
+            offset, count = sections[name]
+            size = array(code).itemsize
+            setattr(self, name, buffer[offset:offset + count * size].cast(code))
+
+    def _term(self, i: int) -> bytes:
+        return self.terms[self.term_off[i]:self.term_off[i + 1]].tobytes()
+
+    def lookup(self, term: str) -> tuple[int, int]:
+        """Posting range [lo, hi) of a term (empty if absent)."""
+        key = term.encode("utf-8")
+        lo, hi = 0, len(self.term_off) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self.term_off) - 1 and self._term(lo) == key:
+            return self.post_off[lo], self.post_off[lo + 1]
+        return 0, 0
+
+    def segment(self, seg: int) -> Segment:
+        text = self.text[self.text_off[seg]:self.text_off[seg + 1]].tobytes().decode("utf-8")
+        return self.seg_start[seg], self.seg_duration[seg], text
+
+    def context(self, lo: int, hi: int) -> str:
+        parts = [self.segment(seg)[2].strip() for seg in range(lo, hi)]
+        return " ".join(part for part in parts if part)
+
+
+# ---------------------------------------------------------------------------
+# Channel index
+# ---------------------------------------------------------------------------
+
+class TranscriptIndex:
+    """Incremental, memory-mapped BM25 index over one channel's transcripts."""
+
+    def __init__(self, channel: str, indices_dir: Optional[Path] = None) -> None:
+        self.channel = channel
+        self.path = (indices_dir or DEFAULT_INDICES_DIR) / channel
+        self.manifest_path = self.path / "manifest.json"
+        self._manifest_stamp: Optional[tuple[int, int]] = None
+        self.manifest = self._load_manifest()
+        self._parts: dict[str, _Part] = {}
+
+    @contextmanager
+    def _locked(self, exclusive: bool) -> Iterator[None]:
+        """Hold the index directory's flock (exclusive for writers)."""
+        self.path.mkdir(parents=True, exist_ok=True)
+        with open(self.path / ".lock", "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _stamp(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = self.manifest_path.stat()
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _load_manifest(self) -> dict:
+        self._manifest_stamp = self._stamp()
+        try:
+            manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            if manifest.get("version") == INDEX_VERSION:
+                return manifest
+        except (OSError, json.JSONDecodeError):
+            pass
+        return {"version": INDEX_VERSION, "channel": self.channel, "updated_at": None, "parts": {}, "docs": {}}
+
+    def _save_manifest(self) -> None:
+        self.manifest["updated_at"] = datetime.now(timezone.utc).isoformat()
+        tmp_path = self.manifest_path.with_name(self.manifest_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(self.manifest), encoding="utf-8")
+        os.replace(tmp_path, self.manifest_path)
+        self._manifest_stamp = self._stamp()
+
+        # Parts no longer referenced by the manifest (merged or fully superseded).
+        # Only called under the exclusive lock, so this manifest is the latest.
+        for part_path in self.path.glob("part-*.bin"):
+            if part_path.name not in self.manifest["parts"]:
+                part_path.unlink(missing_ok=True)
+
+    def _part(self, name: str) -> _Part:
+        part = self._parts.get(name)
+        if part is None:
+            part = _Part(self.path / name, self.manifest["parts"][name]["sections"])
+            self._parts[name] = part
+        return part
+
+    def _add_part(self, docs: dict[str, dict], new_docs: list[tuple[str, dict, list[Segment]]]) -> None:
+        """Write new_docs (key, manifest entry, segments) as a part and register them in docs."""
+        name = f"part-{uuid.uuid4().hex[:12]}.bin"
+        info, doc_stats = _write_part(self.path / name, [segments for _, _, segments in new_docs])
+        self.manifest["parts"][name] = info
+        for doc_no, ((key, entry, _), stats) in enumerate(zip(new_docs, doc_stats)):
+            docs[key] = {**entry, "part": name, "doc": doc_no, **stats}
+
+    def _dead_ratio(self) -> float:
+        total = sum(part["segments"] for part in self.manifest["parts"].values())
+        live = sum(entry["count"] for entry in self.manifest["docs"].values())
+        return 1 - live / total if total else 0.0
+
+    def _merge(self) -> None:
+        """Rewrite all live documents into a single part."""
+        live: list[tuple[str, dict, list[Segment]]] = []
+        for key, entry in self.manifest["docs"].items():
+            part = self._part(entry["part"])
+            segments = [part.segment(seg) for seg in range(entry["first"], entry["first"] + entry["count"])]
+            base = {k: entry[k] for k in ("video_id", "size", "mtime_ns")}
+            live.append((key, base, segments))
+
+        docs: dict[str, dict] = {}
+        self.manifest["parts"] = {}
+        if live:
+            self._add_part(docs, live)
+        self.manifest["docs"] = docs
+
+    def update(self, transcript_paths: Iterable[Path], prune: bool = True, rebuild: bool = False) -> dict[str, int]:
+        """Bring the index in line with transcript files.
+
+        New or changed transcripts (by size and mtime) are read and added as
+        one new part; transcripts that no longer exist are dropped.
+
+        Args:
+            transcript_paths: Transcript JSON files of the channel
+            prune: Also drop indexed transcripts not in transcript_paths
+            rebuild: Discard the existing index and read every transcript
+
+        Returns:
+            Counts of indexed, unchanged and removed transcripts
+        """
+        with self._locked(exclusive=True):
+            # Another process may have updated the index since it was loaded
+            self.manifest = self._load_manifest()
+            return self._update(transcript_paths, prune, rebuild)
+
+    def _update(self, transcript_paths: Iterable[Path], prune: bool, rebuild: bool) -> dict[str, int]:
+        if rebuild:
+            self.manifest["parts"] = {}
+            self.manifest["docs"] = {}
+        docs = self.manifest["docs"]
+        counts = {"indexed": 0, "unchanged": 0, "removed": 0}
+        dirty = rebuild
+
+        seen: set[str] = set()
+        new_docs: list[tuple[str, dict, list[Segment]]] = []
+        for transcript_path in transcript_paths:
+            key = str(transcript_path)
+            seen.add(key)
+            entry = docs.get(key)
+            try:
+                stat = transcript_path.stat()
+            except OSError:
+                if entry:
+                    del docs[key]
+                    counts["removed"] += 1
+                    dirty = True
+                continue
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                counts["unchanged"] += 1
+                continue
+
+            dirty = True
+            docs.pop(key, None)
+            transcript = _read_transcript(transcript_path)
+            if transcript is None:
+                continue
+            video_id, segments = transcript
+            new_docs.append((key, {"video_id": video_id, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}, segments))
+
+        if prune:
+            for key in [key for key in docs if key not in seen]:
+                del docs[key]
+                counts["removed"] += 1
+                dirty = True
+
+        if not dirty:
+            return counts
+
+        if new_docs:
+            self._add_part(docs, new_docs)
+            counts["indexed"] = len(new_docs)
+
+        live_parts = {entry["part"] for entry in docs.values()}
+        self.manifest["parts"] = {
+            name: info for name, info in self.manifest["parts"].items() if name in live_parts
+        }
+        if len(self.manifest["parts"]) > MAX_PARTS or self._dead_ratio() > MAX_DEAD_RATIO:
+            self._merge()
+        self._save_manifest()
+        return counts
+
+    def _open_live(self) -> None:
+        """Map every live part while writers are excluded; open maps outlive a later unlink."""
+        with self._locked(exclusive=False):
+            if self._stamp() != self._manifest_stamp:
+                self.manifest = self._load_manifest()
+            for entry in self.manifest["docs"].values():
+                self._part(entry["part"])
+
+    def _hits(
+        self, terms: list[str]
+    ) -> Tuple[dict[str, int], list[tuple[_Part, dict[int, str], dict[str, dict[int, list[int]]]]]]:
+        """Document frequency of each term over the live index, and term -> segment -> positions per part."""
+        # Live documents per part; other documents in a part are superseded copies
+        live: dict[str, dict[int, str]] = {}
+        for key, entry in self.manifest["docs"].items():
+            live.setdefault(entry["part"], {})[entry["doc"]] = key
+
+        df = dict.fromkeys(terms, 0)
+        part_hits: list[tuple[_Part, dict[int, str], dict[str, dict[int, list[int]]]]] = []
+        for name, part_docs in live.items():
+            part = self._part(name)
+            hits: dict[str, dict[int, list[int]]] = {}
+            for term in terms:
+                lo, hi = part.lookup(term)
+                by_seg: dict[int, list[int]] = {}
+                for seg, pos in zip(part.post_seg[lo:hi].tolist(), part.post_pos[lo:hi].tolist()):
+                    if part.seg_doc[seg] in part_docs:
+                        by_seg.setdefault(seg, []).append(pos)
+                df[term] += len(by_seg)
+                hits[term] = by_seg
+            part_hits.append((part, part_docs, hits))
+        return df, part_hits
+
+    def corpus_stats(self, query: str) -> dict:
+        """BM25 collection statistics of the live index for a query.
+
+        Combined over several indexes (combine_corpus_stats) and passed to
+        search(corpus=...), they score hits as one index over all of them would.
+
+        Returns:
+            segments and tokens (live totals) and df (segments per query term)
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        stats: dict = {"segments": 0, "tokens": 0, "df": dict.fromkeys(terms, 0)}
+        if not terms or not self.path.exists():
+            return stats
+        self._open_live()
+        docs = self.manifest["docs"].values()
+        stats["segments"] = sum(entry["count"] for entry in docs)
+        stats["tokens"] = sum(entry["tokens"] for entry in docs)
+        stats["df"], _ = self._hits(terms)
+        return stats
+
+    def search(
+        self,
+        query: str,
+        context_segments: int = 1,
+        transcript_paths: Optional[set[str]] = None,
+        limit: Optional[int] = None,
+        corpus: Optional[dict] = None,
+    ) -> list[dict[str, object]]:
+        """BM25-ranked segments containing every query term.
+
+        Quoted parts of the query ("dark age") must appear as phrases.
+
+        Args:
+            query: Search terms, optionally with quoted phrases
+            context_segments: Neighbouring segments to return on each side
+            transcript_paths: Only return segments of these transcripts
+            limit: Maximum number of results
+            corpus: Collection statistics to score with (see corpus_stats), so
+                scores are comparable across indexes; defaults to this index's
+
+        Returns:
+            Hits sorted by score: video_id, transcript_path, start, duration,
+            text, context_before, context_after and score
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        phrases = [phrase for phrase in map(tokenize, PHRASE_RE.findall(query)) if len(phrase) > 1]
+        if not terms or not self.path.exists():
+            return []
+
+        self._open_live()
+        docs = self.manifest["docs"]
+        n_segments = sum(entry["count"] for entry in docs.values())
+        if not n_segments:
+            return []
+        df, part_hits = self._hits(terms)
+        if corpus is not None:
+            n_segments, n_tokens, df = corpus["segments"], corpus["tokens"], corpus["df"]
+        else:
+            n_tokens = sum(entry["tokens"] for entry in docs.values())
+        avg_len = n_tokens / n_segments
+
+        idf = {term: math.log(1 + (n_segments - df[term] + 0.5) / (df[term] + 0.5)) for term in terms}
+
+        results: list[dict[str, object]] = []
+        for part, part_docs, hits in part_hits:
+            rarest = min(terms, key=lambda term: len(hits[term]))
+            for seg in hits[rarest]:
+                if any(seg not in hits[term] for term in terms):
+                    continue
+                if not all(_has_phrase(phrase, hits, seg) for phrase in phrases):
+                    continue
+                key = part_docs[part.seg_doc[seg]]
+                if transcript_paths is not None and key not in transcript_paths:
+                    continue
+
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * part.seg_len[seg] / avg_len)
+                score = 0.0
+                for term in terms:
+                    tf = len(hits[term][seg])
+                    score += idf[term] * tf * (BM25_K1 + 1) / (tf + norm)
+
+                entry = docs[key]
+                first, end = entry["first"], entry["first"] + entry["count"]
+                start, duration, text = part.segment(seg)
+                results.append({
+                    "video_id": entry["video_id"],
+                    "transcript_path": key,
+                    "start": start,
+                    "duration": duration,
+                    "text": text,
+                    "context_before": part.context(max(first, seg - context_segments), seg),
+                    "context_after": part.context(seg + 1, min(end, seg + 1 + context_segments)),
+                    "score": round(score, 4),
+                })
+
+        results.sort(key=lambda hit: (-hit["score"], hit["video_id"], hit["start"]))
+        return results[:limit] if limit is not None else results
+
+    def stats(self) -> dict[str, int]:
+        """Number of parts, transcripts and live segments."""
+        return {
+            "parts": len(self.manifest["parts"]),
+            "transcripts": len(self.manifest["docs"]),
+            "segments": sum(entry["count"] for entry in self.manifest["docs"].values()),
+        }
+
+
+def _has_phrase(phrase: list[str], hits: dict[str, dict[int, list[int]]], seg: int) -> bool:
+    starts = set(hits[phrase[0]][seg])
+    for offset, token in enumerate(phrase[1:], start=1):
+        starts &= {pos - offset for pos in hits[token][seg]}
+        if not starts:
+            return False
+    return True
+
+
+def combine_corpus_stats(stats: Iterable[dict]) -> dict:
+    """Sum corpus_stats() of several indexes for the same query."""
+    combined: dict = {"segments": 0, "tokens": 0, "df": {}}
+    for item in stats:
+        combined["segments"] += item["segments"]
+        combined["tokens"] += item["tokens"]
+        for term, count in item["df"].items():
+            combined["df"][term] = combined["df"].get(term, 0) + count
+    return combined
+
 
 def build_index(
     channel: str,
     ingest_root: Optional[Path] = None,
     output_dir: Optional[Path] = None,
-    max_occurrences_per_term: int = 200,
+    rebuild: bool = False,
 ) -> Path:
-    """Build a lightweight inverted index for a channel."""
+    """Build or incrementally update the transcript index for a channel."""
     ingest_root = _detect_ingest_root(ingest_root)
     if not ingest_root:
         raise FileNotFoundError("Ingest root not found")
@@ -66,42 +563,25 @@ def build_index(
     if not channel_dir.exists():
         raise FileNotFoundError(f"Channel directory not found: {channel_dir}")
 
-    if not output_dir:
-        output_dir = Path.home() / ".pi" / "consume-youtube" / "indices"
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    index: dict[str, list[dict[str, object]]] = {}
+    output_dir = output_dir or DEFAULT_INDICES_DIR
     transcript_files = [
         path for path in channel_dir.glob("*.json")
         if not path.name.startswith(".")
     ]
 
-    for transcript_path in transcript_files:
-        try:
-            data = json.loads(transcript_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            continue
-
-        meta = data.get("meta", {}) if isinstance(data, dict) else {}
-        video_id = meta.get("video_id", transcript_path.stem)
-        transcript = data.get("transcript", []) if isinstance(data, dict) else []
-
-        for segment in transcript:
-            text = str(segment.get("text", ""))
-            if not text:
-                continue
-            start = float(segment.get("start", 0))
-            _index_segment_terms(index, video_id, start, text, max_occurrences_per_term)
+    index = TranscriptIndex(channel, output_dir)
+    counts = index.update(transcript_files, rebuild=rebuild)
+    console.print(
+        f"[green]Indexed {counts['indexed']} transcripts "
+        f"({counts['unchanged']} unchanged, {counts['removed']} removed)[/green]"
+    )
 
-    payload = {
-        "channel": channel,
-        "updated_at": datetime.now(timezone.utc).isoformat(),
-        "terms": index,
-    }
+    # Index format used before the part files; superseded by the directory
+    legacy_path = output_dir / f"{channel}.json"
+    if legacy_path.exists():
+        legacy_path.unlink()
 
-    output_path = output_dir / f"{channel}.json"
-    output_path.write_text(json.dumps(payload), encoding="utf-8")
-    return output_path
+    return index.path
 
 
 def main() -> None:
@@ -112,7 +592,7 @@ def main() -> None:
     parser.add_argument("--channel", required=True, help="Channel name")
     parser.add_argument("--ingest-root", help="Ingest root directory")
     parser.add_argument("--output-dir", help="Output directory for indices")
-    parser.add_argument("--max-occurrences", type=int, default=200, help="Max occurrences per term")
+    parser.add_argument("--rebuild", action="store_true", help="Re-read every transcript")
 
     args = parser.parse_args()
 
@@ -123,7 +603,7 @@ def main() -> None:
         channel=args.channel,
         ingest_root=ingest_root,
         output_dir=output_dir,
-        max_occurrences_per_term=args.max_occurrences,
+        rebuild=args.rebuild,
     )
 
     console.print(f"[green]Index written: {index_path}[/green]")
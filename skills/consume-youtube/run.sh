@@ -4,7 +4,7 @@ set -e
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 
 DATA_DIR="${HOME}/.pi/consume-youtube"
-REGISTRY_PATH="${DATA_DIR}/registry.json"
+REGISTRY_PATH="${DATA_DIR}/registry.db"
 NOTES_DIR="${DATA_DIR}/notes"
 INDICES_DIR="${DATA_DIR}/indices"
 
@@ -46,7 +46,7 @@ case "$1" in
         echo "  search <query> [--channel <name>] [--video <id>] Search transcripts"
         echo "  note --video <id> --timestamp <sec> --note <t>   Add note"
         echo "  list [--json] [--channel <name>]                List videos"
-        echo "  index --channel <name>                           Build index"
+        echo "  index --channel <name> [--rebuild]               Build/update index"
         echo "  info                                             Show paths"
         exit 1
         ;;
@@ -10,6 +10,8 @@ from rich.console import Console
 
 from consume_common.registry import ContentRegistry
 
+from .indexer import TranscriptIndex, combine_corpus_stats
+
 console = Console()
 
 
@@ -18,9 +20,16 @@ def search_transcripts(
     channel: Optional[str] = None,
     video_id: Optional[str] = None,
     context_segments: int = 1,
-    registry_path: Optional[Path] = None
+    registry_path: Optional[Path] = None,
+    indices_dir: Optional[Path] = None,
+    limit: Optional[int] = None,
 ) -> list[dict[str, object]]:
-    """Search for text in YouTube transcripts."""
+    """Search YouTube transcripts, ranked by BM25.
+
+    Every query term must appear in a matching segment; quoted parts of the
+    query must appear as phrases. Each channel's index is brought up to date
+    with the registry first, which only re-reads new or changed transcripts.
+    """
     if not registry_path:
         registry_path = Path.home() / ".pi" / "consume-youtube" / "registry.json"
 
@@ -29,72 +38,67 @@ def search_transcripts(
 
     if channel:
         videos = [v for v in videos if v.get("metadata", {}).get("channel") == channel]
-    if video_id:
-        videos = [v for v in videos if v.get("metadata", {}).get("video_id") == video_id]
-
-    results: list[dict[str, object]] = []
-    query_lower = query.lower()
 
+    # Index directories are named after the transcript's channel directory, as in build_index
+    by_channel: dict[str, list[dict]] = {}
     for video in videos:
-        source_path = video.get("source_path")
-        if not source_path:
-            continue
-
-        transcript_path = Path(source_path)
-        if not transcript_path.exists():
-            continue
-
-        try:
-            data = json.loads(transcript_path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError:
-            continue
-
-        transcript = data.get("transcript", []) if isinstance(data, dict) else []
-
-        for index, segment in enumerate(transcript):
-            text = str(segment.get("text", ""))
-            if query_lower not in text.lower():
-                continue
-
-            start = float(segment.get("start", 0))
-            context_before = _collect_context(transcript, index - context_segments, index)
-            context_after = _collect_context(transcript, index + 1, index + 1 + context_segments)
+        channel_dir = Path(video["source_path"]).parent.name if video.get("source_path") else ""
+        if channel_dir:
+            by_channel.setdefault(channel_dir, []).append(video)
+
+    searches: list[tuple[TranscriptIndex, dict[str, dict]]] = []
+    for channel_dir, channel_videos in by_channel.items():
+        index = TranscriptIndex(channel_dir, indices_dir)
+        # Not pruned: the index may also hold transcripts not synced into the registry yet
+        index.update([Path(v["source_path"]) for v in channel_videos], prune=False)
+
+        wanted = {
+            v["source_path"]: v for v in channel_videos
+            if not video_id or v.get("metadata", {}).get("video_id") == video_id
+        }
+        if wanted:
+            searches.append((index, wanted))
+
+    # Score every channel with the same corpus statistics so the scores compare
+    corpus = combine_corpus_stats(index.corpus_stats(query) for index, _ in searches)
 
+    results: list[dict[str, object]] = []
+    for index, wanted in searches:
+        hits = index.search(
+            query, context_segments=context_segments, transcript_paths=set(wanted), limit=limit, corpus=corpus
+        )
+        for hit in hits:
+            video = wanted[hit["transcript_path"]]
             results.append({
-                "video_id": video.get("metadata", {}).get("video_id"),
+                "video_id": video.get("metadata", {}).get("video_id") or hit["video_id"],
                 "video_title": video.get("title", "Unknown"),
                 "channel": video.get("metadata", {}).get("channel"),
-                "start": start,
-                "duration": float(segment.get("duration", 0)),
-                "text": text,
-                "context_before": context_before,
-                "context_after": context_after,
+                "start": hit["start"],
+                "duration": hit["duration"],
+                "text": hit["text"],
+                "context_before": hit["context_before"],
+                "context_after": hit["context_after"],
+                "score": hit["score"],
             })
 
+    results.sort(key=lambda result: -result["score"])
+    if limit is not None:
+        results = results[:limit]
+
     console.print(f"[green]Found {len(results)} matches for '{query}'[/green]")
     return results
 
 
-def _collect_context(transcript: list[dict], start: int, end: int) -> str:
-    start = max(0, start)
-    end = min(len(transcript), end)
-    parts: list[str] = []
-    for i in range(start, end):
-        text = str(transcript[i].get("text", "")).strip()
-        if text:
-            parts.append(text)
-    return " ".join(parts)
-
-
 def main() -> None:
     """CLI entry point for search."""
     import argparse
 
     parser = argparse.ArgumentParser(description="Search YouTube transcripts")
-    parser.add_argument("query", help="Text to search for")
+    parser.add_argument("query", help="Words to search for; quote phrases to match them exactly")
     parser.add_argument("--channel", help="Channel name")
     parser.add_argument("--video", help="Video ID")
     parser.add_argument("--context", type=int, default=1, help="Context segments (default: 1)")
+    parser.add_argument("--limit", type=int, help="Maximum number of results")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
 
     args = parser.parse_args()
@@ -104,6 +108,7 @@ def main() -> None:
         channel=args.channel,
         video_id=args.video,
         context_segments=args.context,
+        limit=args.limit,
     )
 
     if args.json:
@@ -116,7 +121,7 @@ def main() -> None:
         for result in results:
             console.print(f"\n[bold]{result['video_title']}[/bold]")
             console.print(f"  Channel: {result['channel']}")
-            console.print(f"  Time: {result['start']:.1f}s")
+            console.print(f"  Time: {result['start']:.1f}s  (score {result['score']:.2f})")
             console.print(f"  Text: {result['text']}")
             if result["context_before"]:
                 console.print(f"  Before: {result['context_before']}")
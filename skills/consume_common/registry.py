@@ -1,11 +1,60 @@
-"""ContentRegistry - Manages registry of consumed content."""
+"""ContentRegistry - Manages registry of consumed content.
+
+Contents are stored in SQLite next to the configured registry path
+(registry.json -> registry.db), indexed by type and source_path, with an
+FTS5 trigram index over title and metadata for search_content. An existing
+JSON registry is imported on first open and renamed to *.json.migrated.
+"""
 
 import json
+import sqlite3
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contents (
+    id INTEGER PRIMARY KEY,
+    content_id TEXT NOT NULL UNIQUE,
+    type TEXT,
+    title TEXT NOT NULL DEFAULT '',
+    source_path TEXT,
+    metadata_text TEXT NOT NULL DEFAULT '',
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS contents_type ON contents (type);
+CREATE INDEX IF NOT EXISTS contents_source_path ON contents (source_path);
+CREATE TABLE IF NOT EXISTS registry_meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# External-content FTS table kept in sync with `contents` by triggers
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS contents_fts USING fts5(
+    title, metadata_text, content='contents', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS contents_ai AFTER INSERT ON contents BEGIN
+    INSERT INTO contents_fts (rowid, title, metadata_text)
+    VALUES (new.id, new.title, new.metadata_text);
+END;
+CREATE TRIGGER IF NOT EXISTS contents_ad AFTER DELETE ON contents BEGIN
+    INSERT INTO contents_fts (contents_fts, rowid, title, metadata_text)
+    VALUES ('delete', old.id, old.title, old.metadata_text);
+END;
+CREATE TRIGGER IF NOT EXISTS contents_au AFTER UPDATE ON contents BEGIN
+    INSERT INTO contents_fts (contents_fts, rowid, title, metadata_text)
+    VALUES ('delete', old.id, old.title, old.metadata_text);
+    INSERT INTO contents_fts (rowid, title, metadata_text)
+    VALUES (new.id, new.title, new.metadata_text);
+END;
+"""
+
+# Trigram queries need at least this many characters
+_FTS_MIN_QUERY = 3
+
 
 class ContentRegistry:
     """Manages a registry of ingested content (movies, books, videos)."""
@@ -14,25 +63,104 @@ class ContentRegistry:
         """Initialize the registry.
 
         Args:
-            registry_path: Path to the registry JSON file
+            registry_path: Path to the registry. A .json path is stored in the
+                sibling .db file; any other path is used as the database.
         """
         self.registry_path = Path(registry_path)
-        self._data: dict[str, Any] = {"contents": {}, "metadata": {}}
-        self._load()
-
-    def _load(self) -> None:
-        """Load registry from disk."""
-        if self.registry_path.exists():
-            with open(self.registry_path, "r", encoding="utf-8") as f:
-                self._data = json.load(f)
-        else:
-            self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-            self._save()
+        self.db_path = self.db_path_for(self.registry_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(self.db_path, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        try:
+            self._conn.executescript(_FTS_SCHEMA)
+            self._fts = True
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5 or older than the trigram tokenizer (3.34)
+            self._fts = False
+
+        if self.db_path != self.registry_path and self.registry_path.exists():
+            self._migrate_json(self.registry_path)
+
+    @staticmethod
+    def db_path_for(registry_path: Path | str) -> Path:
+        """Database file used for a registry path (registry.json -> registry.db)."""
+        path = Path(registry_path)
+        return path.with_suffix(".db") if path.suffix == ".json" else path
+
+    @classmethod
+    def exists(cls, registry_path: Path | str) -> bool:
+        """Whether a registry has been created at this path, without creating one.
+
+        True for the database or a JSON registry that has not been migrated yet.
+        """
+        path = Path(registry_path)
+        return cls.db_path_for(path).exists() or (path.suffix == ".json" and path.exists())
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def __enter__(self) -> "ContentRegistry":
+        return self
 
-    def _save(self) -> None:
-        """Save registry to disk."""
-        with open(self.registry_path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, indent=2, default=str)
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _migrate_json(self, json_path: Path) -> None:
+        """Import a JSON registry, then rename it so it is only imported once.
+
+        Imports are idempotent, so concurrent first opens may both import; the
+        one that loses the rename finds the rows already committed.
+        """
+        try:
+            with open(json_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return  # another opener migrated and renamed it first
+
+        with self._conn:
+            for content_id, content in data.get("contents", {}).items():
+                content.setdefault("content_id", content_id)
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO contents "
+                    "(content_id, type, title, source_path, metadata_text, data) VALUES (?, ?, ?, ?, ?, ?)",
+                    self._row(content),
+                )
+            if data.get("metadata"):
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO registry_meta (key, value) VALUES ('metadata', ?)",
+                    (json.dumps(data["metadata"], default=str),),
+                )
+        try:
+            json_path.rename(json_path.with_name(json_path.name + ".migrated"))
+        except FileNotFoundError:
+            pass  # another opener renamed it first
+
+    @staticmethod
+    def _row(content: dict[str, Any]) -> tuple:
+        """Column values for a content dict, starting with content_id."""
+        metadata = content.get("metadata") or {}
+        # Values are stringified as the JSON registry's search did; newlines keep them apart
+        metadata_text = "\n".join(str(v) for v in metadata.values()) if isinstance(metadata, dict) else ""
+        return (
+            content["content_id"],
+            content.get("type"),
+            str(content.get("title") or ""),
+            content.get("source_path"),
+            metadata_text,
+            json.dumps(content, default=str),
+        )
+
+    def _write(self, content: dict[str, Any]) -> None:
+        """Replace a stored content dict (must already exist)."""
+        content_id, *columns = self._row(content)
+        self._conn.execute(
+            "UPDATE contents SET type = ?, title = ?, source_path = ?, metadata_text = ?, data = ? "
+            "WHERE content_id = ?",
+            (*columns, content_id),
+        )
 
     def add_content(self, content: dict[str, Any]) -> str:
         """Add content to the registry.
@@ -49,8 +177,12 @@ class ContentRegistry:
         content["consume_count"] = 0
         content["last_consumed"] = None
 
-        self._data["contents"][content_id] = content
-        self._save()
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO contents (content_id, type, title, source_path, metadata_text, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                self._row(content),
+            )
         return content_id
 
     def get_content(self, content_id: str) -> Optional[dict[str, Any]]:
@@ -62,7 +194,22 @@ class ContentRegistry:
         Returns:
             Content dict or None if not found
         """
-        return self._data["contents"].get(content_id)
+        row = self._conn.execute("SELECT data FROM contents WHERE content_id = ?", (content_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_content_by_source_path(self, source_path: Path | str) -> Optional[dict[str, Any]]:
+        """Get the first content registered for a source path.
+
+        Args:
+            source_path: Source path as stored in the content dict
+
+        Returns:
+            Content dict or None if not found
+        """
+        row = self._conn.execute(
+            "SELECT data FROM contents WHERE source_path = ? ORDER BY id LIMIT 1", (str(source_path),)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
 
     def update_content(self, content_id: str, updates: dict[str, Any]) -> bool:
         """Update content metadata.
@@ -74,11 +221,15 @@ class ContentRegistry:
         Returns:
             True if updated, False if not found
         """
-        if content_id not in self._data["contents"]:
-            return False
-
-        self._data["contents"][content_id].update(updates)
-        self._save()
+        with self._conn:
+            # Take the write lock before reading so concurrent updates don't lose each other
+            self._conn.execute("BEGIN IMMEDIATE")
+            content = self.get_content(content_id)
+            if content is None:
+                return False
+
+            content.update(updates)
+            self._write(content)
         return True
 
     def delete_content(self, content_id: str) -> bool:
@@ -90,12 +241,9 @@ class ContentRegistry:
         Returns:
             True if deleted, False if not found
         """
-        if content_id not in self._data["contents"]:
-            return False
-
-        del self._data["contents"][content_id]
-        self._save()
-        return True
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM contents WHERE content_id = ?", (content_id,))
+        return cursor.rowcount > 0
 
     def list_content(self, content_type: Optional[str] = None) -> list[dict[str, Any]]:
         """List all content, optionally filtered by type.
@@ -106,10 +254,13 @@ class ContentRegistry:
         Returns:
             List of content dicts
         """
-        contents = list(self._data["contents"].values())
         if content_type:
-            contents = [c for c in contents if c.get("type") == content_type]
-        return contents
+            rows = self._conn.execute(
+                "SELECT data FROM contents WHERE type = ? ORDER BY id", (content_type,)
+            )
+        else:
+            rows = self._conn.execute("SELECT data FROM contents ORDER BY id")
+        return [json.loads(data) for (data,) in rows]
 
     def record_consumption(
         self,
@@ -127,36 +278,45 @@ class ContentRegistry:
         Returns:
             True if recorded, False if content not found
         """
-        if content_id not in self._data["contents"]:
-            return False
+        with self._conn:
+            self._conn.execute("BEGIN IMMEDIATE")
+            content = self.get_content(content_id)
+            if content is None:
+                return False
 
-        content = self._data["contents"][content_id]
-        content["consume_count"] = content.get("consume_count", 0) + 1
-        content["last_consumed"] = datetime.now(timezone.utc).isoformat()
+            content["consume_count"] = content.get("consume_count", 0) + 1
+            content["last_consumed"] = datetime.now(timezone.utc).isoformat()
 
-        if duration is not None:
-            content["last_duration"] = duration
+            if duration is not None:
+                content["last_duration"] = duration
 
-        if notes:
-            content["note_ids"] = content.get("note_ids", []) + notes
+            if notes:
+                content["note_ids"] = content.get("note_ids", []) + notes
 
-        self._save()
+            self._write(content)
         return True
 
     def search_content(self, query: str) -> list[dict[str, Any]]:
         """Search content by title or metadata.
 
         Args:
-            query: Search query (case-insensitive)
+            query: Search query (case-insensitive substring)
 
         Returns:
             List of matching content dicts
         """
-        query = query.lower()
-        results = []
-        for content in self._data["contents"].values():
-            if query in content.get("title", "").lower():
-                results.append(content)
-            elif any(query in str(v).lower() for v in content.get("metadata", {}).values()):
-                results.append(content)
-        return results
+        if self._fts and len(query) >= _FTS_MIN_QUERY:
+            phrase = '"' + query.replace('"', '""') + '"'
+            rows = self._conn.execute(
+                "SELECT data FROM contents WHERE id IN "
+                "(SELECT rowid FROM contents_fts WHERE contents_fts MATCH ?) ORDER BY id",
+                (phrase,),
+            )
+        else:
+            pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            rows = self._conn.execute(
+                "SELECT data FROM contents "
+                "WHERE title LIKE ? ESCAPE '\\' OR metadata_text LIKE ? ESCAPE '\\' ORDER BY id",
+                (pattern, pattern),
+            )
+        return [json.loads(data) for (data,) in rows]
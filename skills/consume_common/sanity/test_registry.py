@@ -54,16 +54,27 @@ def test_registry_crud():
         assert len(entries) == 0, f"Expected 0 entries after delete, got {len(entries)}"
 
         # Verify persistence
-        assert os.path.exists(registry_path), "Registry file should exist"
-        with open(registry_path, 'r') as f:
-            data = json.load(f)
-            assert "contents" in data, "Registry should have 'contents' key"
+        kept_id = registry.add_content({
+            "type": "book",
+            "title": "Horus Rising",
+            "source_path": "/path/to/book.epub",
+            "metadata": {"author": "Dan Abnett"}
+        })
+        registry.close()
+        assert os.path.exists(registry.db_path), "Registry database should exist"
+        registry = ContentRegistry(registry_path)
+        assert registry.get_content(kept_id)["title"] == "Horus Rising", "Expected entry to persist"
+        assert registry.get_content_by_source_path("/path/to/book.epub")["content_id"] == kept_id
+        assert [c["content_id"] for c in registry.search_content("abnett")] == [kept_id]
+        assert [c["content_id"] for c in registry.search_content("rising")] == [kept_id]
+        assert registry.search_content("Test Movie") == [], "Deleted entry should not match"
+        registry.close()
 
         print(f"PASS: ContentRegistry CRUD operations successful")
         print(f"  - Created: {movie_id}")
         print(f"  - Updated: consume_count")
         print(f"  - Deleted: confirmed")
-        print(f"  - Persisted: {registry_path}")
+        print(f"  - Persisted: {registry.db_path}")
         return True
 
     except Exception as e:
@@ -77,6 +88,59 @@ def test_registry_crud():
             shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+def test_registry_json_migration():
+    """Test that a JSON registry is imported into the database."""
+    try:
+        from registry import ContentRegistry
+    except ImportError as e:
+        print(f"SKIP: ContentRegistry not importable: {e}")
+        return True  # Skip, not fail
+
+    temp_dir = tempfile.mkdtemp()
+    registry_path = os.path.join(temp_dir, "registry.json")
+
+    try:
+        with open(registry_path, "w") as f:
+            json.dump({"contents": {
+                "abc": {
+                    "content_id": "abc",
+                    "type": "youtube",
+                    "title": "Siege of Terra",
+                    "source_path": "/path/to/video.json",
+                    "metadata": {"channel": "luetin09"},
+                    "consume_count": 2,
+                }
+            }, "metadata": {}}, f)
+
+        registry = ContentRegistry(registry_path)
+        entry = registry.get_content("abc")
+        assert entry is not None, "Expected migrated entry"
+        assert entry["consume_count"] == 2, "Expected fields to survive migration"
+        assert [c["content_id"] for c in registry.list_content("youtube")] == ["abc"]
+        assert registry.search_content("LUETIN"), "Expected metadata search on migrated entry"
+        assert not os.path.exists(registry_path), "JSON registry should be renamed after migration"
+        assert os.path.exists(registry_path + ".migrated"), "JSON registry should be kept as backup"
+
+        registry.record_consumption("abc", duration=30.0)
+        registry.close()
+        registry = ContentRegistry(registry_path)
+        assert registry.get_content("abc")["consume_count"] == 3, "Expected consumption to persist"
+        registry.close()
+
+        print("PASS: ContentRegistry JSON migration successful")
+        return True
+
+    except Exception as e:
+        print(f"FAIL: Error migrating ContentRegistry: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    finally:
+        if os.path.exists(temp_dir):
+            import shutil
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
 if __name__ == "__main__":
-    success = test_registry_crud()
+    success = test_registry_crud() and test_registry_json_migration()
     exit(0 if success else 1)
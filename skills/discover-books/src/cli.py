@@ -201,25 +201,31 @@ def recommendations(
 
     from pathlib import Path
 
+    skills_dir = Path(__file__).resolve().parent.parent.parent
+    try:
+        from consume_common.registry import ContentRegistry
+    except ImportError:
+        sys.path.insert(0, str(skills_dir))
+        from consume_common.registry import ContentRegistry
+
+    # registry.json names the registry; its data lives in registry.db once migrated
     registry_path = Path.home() / ".pi" / "consume-book" / "registry.json"
-    if not registry_path.exists():
-        registry_path = Path(__file__).parent.parent.parent / "consume-book" / "registry.json"
+    if not ContentRegistry.exists(registry_path):
+        registry_path = skills_dir / "consume-book" / "registry.json"
 
-    if not registry_path.exists():
+    if not ContentRegistry.exists(registry_path):
         console.print("[yellow]No consume-book history found. Read some books first![/yellow]")
         raise typer.Exit(1)
 
     try:
-        with open(registry_path) as f:
-            registry = json.load(f)
-
-        books = registry.get("books", {})
+        with ContentRegistry(registry_path) as registry:
+            books = registry.list_content("book")
         if not books:
             console.print("[yellow]No books in history. Read some books first![/yellow]")
             raise typer.Exit(1)
 
         # Get most recently consumed books
-        recent = sorted(books.values(), key=lambda x: x.get("last_consumed", ""), reverse=True)[:3]
+        recent = sorted(books, key=lambda x: x.get("last_consumed") or "", reverse=True)[:3]
         console.print(f"[dim]Based on: {', '.join(b.get('title', 'Unknown')[:30] for b in recent)}[/dim]")
 
         # Get recommendations based on subjects
@@ -187,28 +187,33 @@ def recommendations(
     console.print("[dim]Loading consume-movie history...[/dim]")
 
     # Try to load from consume-movie registry
-    import json
     from pathlib import Path
 
+    skills_dir = Path(__file__).resolve().parent.parent.parent
+    try:
+        from consume_common.registry import ContentRegistry
+    except ImportError:
+        sys.path.insert(0, str(skills_dir))
+        from consume_common.registry import ContentRegistry
+
+    # registry.json names the registry; its data lives in registry.db once migrated
     registry_path = Path.home() / ".pi" / "consume-movie" / "registry.json"
-    if not registry_path.exists():
-        registry_path = Path(__file__).parent.parent.parent / "consume-movie" / "registry.json"
+    if not ContentRegistry.exists(registry_path):
+        registry_path = skills_dir / "consume-movie" / "registry.json"
 
-    if not registry_path.exists():
+    if not ContentRegistry.exists(registry_path):
         console.print("[yellow]No consume-movie history found. Watch some movies first![/yellow]")
         raise typer.Exit(1)
 
     try:
-        with open(registry_path) as f:
-            registry = json.load(f)
-
-        movies = registry.get("movies", {})
+        with ContentRegistry(registry_path) as registry:
+            movies = registry.list_content("movie")
         if not movies:
             console.print("[yellow]No movies in history. Watch some movies first![/yellow]")
             raise typer.Exit(1)
 
         # Get most recently consumed movies
-        recent = sorted(movies.values(), key=lambda x: x.get("last_consumed", ""), reverse=True)[:3]
+        recent = sorted(movies, key=lambda x: x.get("last_consumed") or "", reverse=True)[:3]
         console.print(f"[dim]Based on: {', '.join(m.get('title', 'Unknown')[:30] for m in recent)}[/dim]")
 
         # Get recommendations for each
@@ -26,4 +26,7 @@ __all__ = [
     "discord",
     "readarr",
     "synthesis",
+    "pipeline",
+    "cache",
+    "status",
 ]
@@ -19,6 +19,7 @@ if str(_SCRIPT_DIR.parent) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR.parent))
 
 from dogpile.config import SKILLS_DIR
+from dogpile.pipeline import propagate_deadline
 from dogpile.utils import log_status, with_semaphore, run_command
 
 
@@ -158,7 +159,7 @@ def run_stage2_arxiv(arxiv_res: Dict[str, Any], query: str, search_codex_fn) ->
             log_status(f"ArXiv Stage 2: Fetching details for {len(valid_papers)} papers...", provider="arxiv", status="RUNNING")
 
             with ThreadPoolExecutor(max_workers=2) as executor:
-                futures = {executor.submit(search_arxiv_details, p["id"]): p for p in valid_papers}
+                futures = {executor.submit(propagate_deadline(search_arxiv_details), p["id"]): p for p in valid_papers}
                 for f in as_completed(futures):
                     res = f.result()
                     if "items" in res and res["items"]:
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""Persistent provider response cache for Dogpile.
+
+Provider results are stored in SQLite (dogpile_cache.db) under a content
+address: the SHA-256 of (provider, normalized query, variant), where the
+variant is the preset or any other setting the result depends on. Every
+dogpile process shares the cache, so agents repeating a tailored query
+within its TTL do not spend provider rate limit budget.
+
+- Freshness: per-provider (fresh, stale) windows from CACHE_TTLS.
+  Stale entries are returned immediately while one process refreshes
+  them in the background (stale-while-revalidate).
+- Size: above CACHE_MAX_BYTES, expired entries and then the least
+  recently used ones are evicted.
+- Stats: hits, stale hits, misses and evictions per provider.
+- Errors: error results are never cached.
+"""
+import hashlib
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Add parent directory to path for package imports when running as script
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR.parent) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR.parent))
+
+from dogpile.config import CACHE_DB, CACHE_MAX_BYTES, CACHE_TTLS, PROVIDER_DEADLINES
+from dogpile.pipeline import run_with_deadline
+from dogpile.utils import log_status
+
+# Lookup states
+FRESH = "fresh"
+STALE = "stale"
+MISS = "miss"
+
+EVICT_TO = 0.9  # evict down to this fraction of max_bytes
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    query TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL,
+    revalidating REAL,
+    value TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS stats (
+    provider TEXT PRIMARY KEY,
+    hits INTEGER NOT NULL DEFAULT 0,
+    stale_hits INTEGER NOT NULL DEFAULT 0,
+    misses INTEGER NOT NULL DEFAULT 0,
+    evictions INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a query."""
+    return " ".join(query.lower().split())
+
+
+def cache_key(provider: str, query: str, variant: Any = None) -> str:
+    """Content address of a provider result."""
+    material = json.dumps([provider, normalize_query(query), variant], sort_keys=True)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def is_error_result(value: Any) -> bool:
+    """Whether a provider result reports a failure (and must not be cached)."""
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return value.startswith("Error")
+    if isinstance(value, dict):
+        return "error" in value
+    if isinstance(value, list) and value and isinstance(value[0], dict):
+        return "error" in value[0] or str(value[0].get("title", "")).startswith("Error")
+    return False
+
+
+class ProviderCache:
+    """On-disk provider result cache shared by all dogpile processes."""
+
+    def __init__(
+        self,
+        db_file: Path = CACHE_DB,
+        ttls: Optional[Dict[str, Tuple[float, float]]] = None,
+        max_bytes: int = CACHE_MAX_BYTES,
+    ):
+        self.db_file = Path(db_file)
+        self.ttls = CACHE_TTLS if ttls is None else ttls
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+    def _conn(self) -> sqlite3.Connection:
+        """Per-thread connection (pipeline steps look up concurrently)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    def _count(self, provider: str, column: str, n: int = 1) -> None:
+        self._conn().execute(
+            f"INSERT INTO stats (provider, {column}) VALUES (?, ?) "
+            f"ON CONFLICT(provider) DO UPDATE SET {column} = {column} + excluded.{column}",
+            (provider, n),
+        )
+
+    def enabled_for(self, provider: str) -> bool:
+        """Whether results of a provider are cached."""
+        return provider in self.ttls
+
+    # =========================================================================
+    # LOOKUP / STORE
+    # =========================================================================
+
+    def lookup(self, provider: str, query: str, variant: Any = None) -> Tuple[str, Any]:
+        """Look up a cached result.
+
+        Returns:
+            (state, value) where state is FRESH, STALE or MISS (value None)
+        """
+        fresh, stale = self.ttls[provider]
+        key = cache_key(provider, query, variant)
+        now = time.time()
+        conn = self._conn()
+        row = conn.execute("SELECT created, value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None or now - row[0] > fresh + stale:
+            self._count(provider, "misses")
+            return MISS, None
+        conn.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        if now - row[0] <= fresh:
+            self._count(provider, "hits")
+            return FRESH, json.loads(row[1])
+        self._count(provider, "stale_hits")
+        return STALE, json.loads(row[1])
+
+    def store(self, provider: str, query: str, value: Any, variant: Any = None) -> None:
+        """Store a result, evicting old entries if the cache is over size."""
+        data = json.dumps(value)
+        now = time.time()
+        self._conn().execute(
+            "INSERT OR REPLACE INTO entries (key, provider, query, created, accessed, size, revalidating, value) "
+            "VALUES (?, ?, ?, ?, ?, ?, NULL, ?)",
+            (cache_key(provider, query, variant), provider, normalize_query(query), now, now, len(data), data),
+        )
+        self.evict()
+
+    def fetch(
+        self,
+        provider: str,
+        query: str,
+        fn: Callable[[], Any],
+        variant: Any = None,
+        cacheable: Callable[[Any], bool] = lambda value: not is_error_result(value),
+    ) -> Any:
+        """Return a cached result, or call fn and cache what it returns.
+
+        Args:
+            provider: Provider name (key of CACHE_TTLS)
+            query: Query the result is for
+            fn: Produces the result on a miss (and on revalidation)
+            variant: Preset or other setting the result depends on
+            cacheable: Decides whether a result from fn may be stored
+        """
+        if not self.enabled_for(provider):
+            return fn()
+        try:
+            state, value = self.lookup(provider, query, variant)
+        except sqlite3.Error as e:
+            log_status(f"Cache lookup failed for {provider}: {e}")
+            return fn()
+
+        if state == FRESH:
+            log_status(f"Cache hit for {provider}: '{query[:60]}'", provider=provider, status="DONE")
+            return value
+        if state == STALE:
+            log_status(f"Stale cache hit for {provider}, revalidating: '{query[:60]}'", provider=provider, status="DONE")
+            try:
+                self._revalidate(provider, query, fn, variant, cacheable)
+            except sqlite3.Error as e:
+                log_status(f"Cache revalidation failed for {provider}: {e}")
+            return value
+
+        value = fn()
+        if cacheable(value):
+            try:
+                self.store(provider, query, value, variant)
+            except sqlite3.Error as e:
+                log_status(f"Cache store failed for {provider}: {e}")
+        return value
+
+    def _revalidate(self, provider: str, query: str, fn: Callable[[], Any], variant: Any, cacheable) -> None:
+        """Refresh a stale entry in the background, once across processes."""
+        key = cache_key(provider, query, variant)
+        timeout = PROVIDER_DEADLINES.get(provider, 120)
+        now = time.time()
+        claimed = self._conn().execute(
+            "UPDATE entries SET revalidating = ? WHERE key = ? AND (revalidating IS NULL OR revalidating < ?)",
+            (now, key, now - timeout),
+        ).rowcount
+        if not claimed:
+            return  # another process is refreshing it
+
+        def refresh() -> None:
+            try:
+                value = run_with_deadline(timeout, fn)
+                if cacheable(value):
+                    self.store(provider, query, value, variant)
+                    return
+            except Exception as e:
+                log_status(f"Cache revalidation failed for {provider}: {e}")
+            try:
+                self._conn().execute("UPDATE entries SET revalidating = NULL WHERE key = ?", (key,))
+            except sqlite3.Error:
+                pass
+
+        # Not a daemon: the refreshed result is written before the process exits
+        threading.Thread(target=refresh, name=f"dogpile-revalidate-{provider}").start()
+
+    # =========================================================================
+    # EVICTION / STATS
+    # =========================================================================
+
+    def evict(self) -> int:
+        """Drop expired entries, then least recently used ones, while over size.
+
+        Returns:
+            Number of entries evicted
+        """
+        conn = self._conn()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        now = time.time()
+        evicted = 0
+        for provider, (fresh, stale) in self.ttls.items():
+            n = conn.execute(
+                "DELETE FROM entries WHERE provider = ? AND created < ?", (provider, now - fresh - stale)
+            ).rowcount
+            if n:
+                self._count(provider, "evictions", n)
+                evicted += n
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        target = self.max_bytes * EVICT_TO
+        if total > target:
+            victims = []
+            for key, provider, size in conn.execute("SELECT key, provider, size FROM entries ORDER BY accessed"):
+                if total <= target:
+                    break
+                victims.append((key, provider))
+                total -= size
+            conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key, _ in victims])
+            by_provider: Dict[str, int] = {}
+            for _, provider in victims:
+                by_provider[provider] = by_provider.get(provider, 0) + 1
+            for provider, n in by_provider.items():
+                self._count(provider, "evictions", n)
+            evicted += len(victims)
+        return evicted
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and per-provider entry and hit/miss counts."""
+        conn = self._conn()
+        providers: Dict[str, Dict[str, Any]] = {}
+
+        def row(provider: str) -> Dict[str, Any]:
+            return providers.setdefault(provider, {
+                "entries": 0, "bytes": 0, "hits": 0, "stale_hits": 0,
+                "misses": 0, "evictions": 0, "hit_rate": 0.0,
+            })
+
+        for provider, entries, size in conn.execute(
+            "SELECT provider, COUNT(*), SUM(size) FROM entries GROUP BY provider"
+        ):
+            row(provider).update(entries=entries, bytes=size)
+        for provider, hits, stale_hits, misses, evictions in conn.execute(
+            "SELECT provider, hits, stale_hits, misses, evictions FROM stats"
+        ):
+            lookups = hits + stale_hits + misses
+            row(provider).update(
+                hits=hits,
+                stale_hits=stale_hits,
+                misses=misses,
+                evictions=evictions,
+                hit_rate=round((hits + stale_hits) / lookups, 3) if lookups else 0.0,
+            )
+        return {
+            "db": str(self.db_file),
+            "entries": sum(p["entries"] for p in providers.values()),
+            "bytes": sum(p["bytes"] for p in providers.values()),
+            "max_bytes": self.max_bytes,
+            "providers": dict(sorted(providers.items())),
+        }
+
+    def clear(self) -> None:
+        """Remove all entries and stats."""
+        conn = self._conn()
+        conn.execute("DELETE FROM entries")
+        conn.execute("DELETE FROM stats")
+
+
+_cache: Optional[ProviderCache] = None
+
+
+def get_cache() -> ProviderCache:
+    """Get the global provider cache."""
+    global _cache
+    if _cache is None:
+        _cache = ProviderCache()
+    return _cache
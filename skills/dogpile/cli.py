@@ -18,9 +18,9 @@ Resilience features (based on 2025-2026 best practices):
 """
 import json
 import sys
+from functools import partial
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 # Add parent directory to path for package imports when running as script
 _SCRIPT_DIR = Path(__file__).resolve().parent
@@ -35,8 +35,11 @@ from dogpile.config import (
     console,
     REGISTRY_AVAILABLE,
     get_registry,
+    PROVIDER_DEADLINES,
     VERSION,
 )
+from dogpile.cache import ProviderCache, get_cache
+from dogpile.pipeline import SKIPPED, Step, StepOutcome, TIMEOUT, run_pipeline
 from dogpile.utils import log_status
 from dogpile.error_tracking import (
     start_session as start_error_session,
@@ -64,58 +67,86 @@ from dogpile.youtube_search import search_youtube, run_stage2_youtube
 from dogpile.wayback import search_wayback
 from dogpile.discord import search_discord_messages
 from dogpile.readarr import search_readarr
-from dogpile.synthesis import generate_report
+from dogpile.synthesis import (
+    REPORT_SECTIONS,
+    format_provider_section,
+    format_synthesis_section,
+    generate_report_from_results,
+)
+
+# Stage-1 step -> DogpileMonitor provider name (where they differ)
+MONITOR_PROVIDERS = {"codex_knowledge": "codex"}
 
 
-def run_stage1_searches(
+def build_search_steps(
     tailored: Dict[str, str],
     query: str,
     use_github_skill: bool,
-    is_code_related: bool
-) -> Dict[str, Any]:
-    """Stage 1: Run broad parallel searches across all providers.
+    is_code_related: bool,
+    preset: Optional[str] = None,
+    cache: Optional[ProviderCache] = None,
+) -> List[Step]:
+    """Build the provider chains as a pipeline dependency graph.
 
-    Uses ThreadPoolExecutor with provider semaphores for rate limit protection.
+    Stage 1 is a broad search per provider. Each stage-2 deep dive depends
+    only on its own provider's stage-1 step, so it starts as soon as that
+    result arrives. Provider semaphores still guard rate limits, and stage-1
+    results are served from the provider cache when one is given.
 
     Args:
         tailored: Dict of service-specific queries
         query: Original search query
         use_github_skill: Whether to use /github-search skill
         is_code_related: Whether query is code-related
+        preset: Active preset name (part of the cache key)
+        cache: Provider cache, or None to always query providers
 
     Returns:
-        Dict with results from each provider
+        Pipeline steps in dependency order
     """
-    # Explicitly define the callable to avoid lambda/decoration issues
     if use_github_skill:
-        def github_search_func(q):
-            return search_github_via_skill(q, deep=is_code_related, treesitter=False, taxonomy=False)
+        github_search_func = partial(search_github_via_skill, deep=is_code_related, treesitter=False, taxonomy=False)
     else:
-        def github_search_func(q):
-            return search_github(q)
-
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        future_brave = executor.submit(search_brave, tailored["brave"])
-        future_perplexity = executor.submit(search_perplexity, tailored["perplexity"])
-        future_github = executor.submit(github_search_func, tailored["github"])
-        future_arxiv = executor.submit(search_arxiv, tailored["arxiv"])
-        future_youtube = executor.submit(search_youtube, tailored["youtube"])
-        future_readarr = executor.submit(search_readarr, tailored.get("readarr", query))
-        future_wayback = executor.submit(search_wayback, query)
-        future_codex_src = executor.submit(search_codex_knowledge, query)
-        future_discord = executor.submit(search_discord_messages, query)
-
-        return {
-            "brave": future_brave.result(),
-            "perplexity": future_perplexity.result(),
-            "github": future_github.result(),
-            "arxiv": future_arxiv.result(),
-            "youtube": future_youtube.result(),
-            "readarr": future_readarr.result(),
-            "wayback": future_wayback.result(),
-            "codex_knowledge": future_codex_src.result(),
-            "discord": future_discord.result(),
-        }
+        github_search_func = search_github
+
+    def cached(provider: str, fn, q: str, variant: Any = preset):
+        call = partial(fn, q)
+        if cache is None:
+            return call
+        return partial(cache.fetch, provider, q, call, variant)
+
+    # Fallbacks keep the shape each formatter expects when a step fails or times out
+    def error_dict(msg: str) -> Dict[str, Any]:
+        return {"error": msg}
+
+    def youtube_error(msg: str) -> List[Dict[str, str]]:
+        return [{"title": f"Error: {msg}", "url": "", "id": "", "description": ""}]
+
+    def step(name: str, fn, deps=(), fallback=error_dict) -> Step:
+        return Step(name, fn, tuple(deps), PROVIDER_DEADLINES.get(name), fallback)
+
+    return [
+        # Stage 1: Broad searches
+        step("brave", cached("brave", search_brave, tailored["brave"])),
+        step("perplexity", cached("perplexity", search_perplexity, tailored["perplexity"])),
+        step("github", cached("github", github_search_func, tailored["github"],
+                              variant=[preset, use_github_skill, is_code_related])),
+        step("arxiv", cached("arxiv", search_arxiv, tailored["arxiv"])),
+        step("youtube", cached("youtube", search_youtube, tailored["youtube"]), fallback=youtube_error),
+        step("readarr", partial(search_readarr, tailored.get("readarr", query)), fallback=lambda msg: [{"error": msg}]),
+        step("wayback", cached("wayback", search_wayback, query)),
+        step("codex_knowledge", partial(search_codex_knowledge, query), fallback=lambda msg: f"Error: {msg}"),
+        step("discord", partial(search_discord_messages, query)),
+        # Stage 2: Deep dives, each chained to its own stage-1 result
+        step("github_deep",
+             partial(run_stage2_github, query=query, is_code_related=is_code_related, search_codex_fn=search_codex),
+             deps=["github"], fallback=lambda msg: ([], {}, None, [])),
+        step("arxiv_deep", partial(run_stage2_arxiv, query=query, search_codex_fn=search_codex),
+             deps=["arxiv"], fallback=lambda msg: ([], [])),
+        step("youtube_deep", run_stage2_youtube, deps=["youtube"], fallback=lambda msg: []),
+        step("brave_deep", partial(run_stage2_brave, query=query, search_codex_fn=search_codex),
+             deps=["brave"], fallback=lambda msg: []),
+    ]
 
 
 @app.command()
@@ -126,6 +157,8 @@ def search(
     tailor: bool = typer.Option(True, "--tailor/--no-tailor", help="Tailor queries per service"),
     use_github_skill: bool = typer.Option(True, "--github-skill/--no-github-skill", help="Use /github-search skill"),
     auto_preset: bool = typer.Option(False, "--auto-preset", help="Auto-detect preset from query"),
+    stream: bool = typer.Option(True, "--stream/--no-stream", help="Print each provider's section as soon as its chain finishes"),
+    use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse cached provider results (see resource-stats)"),
 ):
     """Aggregate search results from multiple sources."""
 
@@ -142,6 +175,8 @@ def search(
             tailor=tailor,
             use_github_skill=use_github_skill,
             auto_preset=auto_preset,
+            stream=stream,
+            use_cache=use_cache,
             monitor=monitor,
         )
         search_success = True
@@ -163,7 +198,7 @@ def search(
             if session.get("rate_limits_hit"):
                 console.print(f"  Rate limits: {session['rate_limits_hit']}")
             console.print(f"  Total errors: {session.get('error_count', 0)}")
-            console.print("[dim]  See dogpile_errors.json for details[/dim]")
+            console.print("[dim]  See dogpile_errors.jsonl for details[/dim]")
 
 
 def _run_search(
@@ -174,8 +209,12 @@ def _run_search(
     use_github_skill: bool,
     auto_preset: bool,
     monitor,
+    stream: bool = True,
+    use_cache: bool = True,
 ):
     """Internal search implementation."""
+    cache = get_cache() if use_cache else None
+
     # 0. Handle preset selection
     active_preset = None
     preset_brave_query = None
@@ -210,7 +249,15 @@ def _run_search(
     # 2. Tailor queries for each service (expert-level optimization)
     monitor.start_stage("tailoring")
     if tailor:
-        tailored = tailor_queries_for_services(query, is_code_related)
+        tailor_call = partial(tailor_queries_for_services, query, is_code_related)
+        if cache:
+            # Reused tailored queries let repeated searches hit the provider cache
+            tailored = cache.fetch(
+                "tailor", query, tailor_call, variant=is_code_related,
+                cacheable=lambda t: any(q != query for q in t.values()),
+            )
+        else:
+            tailored = tailor_call()
         console.print("[dim]Tailored queries:[/dim]")
         for svc, q in tailored.items():
             console.print(f"  [cyan]{svc}:[/cyan] {q[:60]}...")
@@ -224,43 +271,49 @@ def _run_search(
         console.print(f"  [magenta]brave (preset):[/magenta] {preset_brave_query[:80]}...")
     monitor.complete_stage("tailoring")
 
-    # Stage 1: Broad parallel searches
-    monitor.start_stage("stage1")
-    stage1_results = run_stage1_searches(tailored, query, use_github_skill, is_code_related)
-    monitor.complete_stage("stage1")
-
-    brave_res = stage1_results["brave"]
-    perp_res = stage1_results["perplexity"]
-    github_res = stage1_results["github"]
-    arxiv_res = stage1_results["arxiv"]
-    youtube_res = stage1_results["youtube"]
-    readarr_res = stage1_results["readarr"]
-    wayback_res = stage1_results["wayback"]
-    codex_src_res = stage1_results["codex_knowledge"]
-    discord_res = stage1_results["discord"]
-
-    # Stage 2: Deep dives
-    # 2.1 GitHub Multi-Stage
-    monitor.start_stage("stage2_github")
-    github_details, github_deep, target_repo, deep_code_res = run_stage2_github(
-        github_res, query, is_code_related, search_codex
-    )
-    monitor.complete_stage("stage2_github")
-
-    # 2.2 ArXiv Multi-Stage
-    monitor.start_stage("stage2_arxiv")
-    arxiv_details, arxiv_deep = run_stage2_arxiv(arxiv_res, query, search_codex)
-    monitor.complete_stage("stage2_arxiv")
+    # Stages 1 + 2: provider chains run as a dependency graph
+    steps = build_search_steps(tailored, query, use_github_skill, is_code_related, preset, cache)
+    stage1 = {s.name for s in steps if not s.deps}
+    section_steps = {step_name: provider for provider, step_name in REPORT_SECTIONS.items()}
+    results: Dict[str, Any] = {}
 
-    # 2.3 YouTube Two-Stage
-    monitor.start_stage("stage2_youtube")
-    youtube_transcripts = run_stage2_youtube(youtube_res)
-    monitor.complete_stage("stage2_youtube")
+    for name in stage1:
+        monitor.start_provider(MONITOR_PROVIDERS.get(name, name))
+    monitor.start_stage("stage1")
 
-    # 2.4 Brave Deep Extraction
-    monitor.start_stage("stage2_brave")
-    brave_deep = run_stage2_brave(brave_res, query, search_codex)
-    monitor.complete_stage("stage2_brave")
+    if stream:
+        console.print(Markdown(f"# Dogpile Report: {query}"))
+
+    def on_step(outcome: StepOutcome) -> None:
+        results[outcome.name] = outcome.result
+        provider = outcome.name.removesuffix("_deep")
+        if outcome.status == SKIPPED:
+            # The failed dependency has already been logged as the error
+            log_status(f"{outcome.name} skipped: {outcome.error}", provider=provider, status="SKIPPED")
+        elif not outcome.ok:
+            log_status(
+                f"{outcome.name} {outcome.status}: {outcome.error}",
+                provider=provider,
+                status="ERROR",
+                error_type="timeout" if outcome.status == TIMEOUT else None,
+            )
+            monitor.log_error(provider, f"{outcome.name}: {outcome.error}", outcome.status)
+
+        if outcome.name in stage1:
+            monitor.complete_provider(MONITOR_PROVIDERS.get(outcome.name, outcome.name), outcome.ok, outcome.error)
+            if stage1 <= results.keys():
+                monitor.complete_stage("stage1")
+        else:
+            monitor.complete_stage(f"stage2_{provider}")
+
+        # Stream the section once its whole chain has finished
+        section = section_steps.get(outcome.name)
+        if stream and section:
+            console.print(Markdown("\n".join(format_provider_section(section, results))))
+
+    outcomes = run_pipeline(steps, on_complete=on_step)
+    slowest = max(outcomes.values(), key=lambda o: o.elapsed)
+    console.print(f"[dim]Provider chains finished (slowest step: {slowest.name} {slowest.elapsed:.1f}s)[/dim]")
 
     # Synthesis (Codex High Reasoning)
     monitor.start_stage("synthesis")
@@ -268,26 +321,7 @@ def _run_search(
     console.print("\n[bold cyan]Synthesizing report via Codex (gpt-5.2 High Reasoning)...[/bold cyan]")
 
     # Generate initial report for synthesis
-    initial_report = generate_report(
-        query=query,
-        wayback_res=wayback_res,
-        codex_src_res=codex_src_res,
-        perp_res=perp_res,
-        readarr_res=readarr_res,
-        discord_res=discord_res,
-        github_res=github_res,
-        github_details=github_details,
-        github_deep=github_deep,
-        target_repo=target_repo,
-        deep_code_res=deep_code_res,
-        brave_res=brave_res,
-        brave_deep=brave_deep,
-        arxiv_res=arxiv_res,
-        arxiv_details=arxiv_details,
-        arxiv_deep=arxiv_deep,
-        youtube_res=youtube_res,
-        youtube_transcripts=youtube_transcripts,
-    )
+    initial_report = generate_report_from_results(query, results)
 
     synthesis_prompt = (
         f"Synthesize the following research results for the query '{query}' into a concise, "
@@ -304,31 +338,13 @@ def _run_search(
         monitor.log_error("codex", f"Synthesis failed: {synthesis[:100]}", "api_error")
         synthesis = None
 
-    # Generate final report with synthesis
-    final_report = generate_report(
-        query=query,
-        wayback_res=wayback_res,
-        codex_src_res=codex_src_res,
-        perp_res=perp_res,
-        readarr_res=readarr_res,
-        discord_res=discord_res,
-        github_res=github_res,
-        github_details=github_details,
-        github_deep=github_deep,
-        target_repo=target_repo,
-        deep_code_res=deep_code_res,
-        brave_res=brave_res,
-        brave_deep=brave_deep,
-        arxiv_res=arxiv_res,
-        arxiv_details=arxiv_details,
-        arxiv_deep=arxiv_deep,
-        youtube_res=youtube_res,
-        youtube_transcripts=youtube_transcripts,
-        synthesis=synthesis,
-    )
-
-    # Print the report
-    console.print(Markdown(final_report))
+    # Print the report (sections were already streamed)
+    if stream:
+        synthesis_lines = format_synthesis_section(synthesis)
+        if synthesis_lines:
+            console.print(Markdown("\n".join(synthesis_lines)))
+    else:
+        console.print(Markdown(generate_report_from_results(query, results, synthesis)))
 
 
 @app.command()
@@ -420,24 +436,47 @@ def presets(
 
 
 @app.command()
-def resource_stats():
-    """Show statistics about available resources."""
-    if not REGISTRY_AVAILABLE:
-        console.print("[red]Resource registry not available.[/red]")
-        raise typer.Exit(1)
-
-    registry = get_registry()
-    stats = registry.stats()
+def resource_stats(
+    output_json: bool = typer.Option(False, "--json", help="Output as JSON"),
+    clear_cache: bool = typer.Option(False, "--clear-cache", help="Clear the provider cache after display"),
+):
+    """Show statistics about available resources and the provider cache."""
+    cache = get_cache()
+    cache_stats = cache.stats()
 
-    console.print("[bold]Resource Registry Statistics[/bold]\n")
-    console.print(f"  Total resources: [cyan]{stats['total_resources']}[/cyan]")
-    console.print(f"  Unique tags: [cyan]{stats['unique_tags']}[/cyan]")
-    console.print(f"  With API: [cyan]{stats['with_api']}[/cyan]")
-    console.print(f"  Free: [green]{stats['free']}[/green]")
-    console.print(f"  Auth required: [yellow]{stats['auth_required']}[/yellow]")
-    console.print("\n  [bold]Categories:[/bold]")
-    for cat, count in stats["categories"].items():
-        console.print(f"    {cat}: {count}")
+    if output_json:
+        stats = get_registry().stats() if REGISTRY_AVAILABLE else None
+        print(json.dumps({"resources": stats, "cache": cache_stats, "cache_cleared": clear_cache}, indent=2))
+    else:
+        if REGISTRY_AVAILABLE:
+            stats = get_registry().stats()
+            console.print("[bold]Resource Registry Statistics[/bold]\n")
+            console.print(f"  Total resources: [cyan]{stats['total_resources']}[/cyan]")
+            console.print(f"  Unique tags: [cyan]{stats['unique_tags']}[/cyan]")
+            console.print(f"  With API: [cyan]{stats['with_api']}[/cyan]")
+            console.print(f"  Free: [green]{stats['free']}[/green]")
+            console.print(f"  Auth required: [yellow]{stats['auth_required']}[/yellow]")
+            console.print("\n  [bold]Categories:[/bold]")
+            for cat, count in stats["categories"].items():
+                console.print(f"    {cat}: {count}")
+        else:
+            console.print("[yellow]Resource registry not available.[/yellow]")
+
+        console.print("\n[bold]Provider Cache[/bold]\n")
+        console.print(f"  Entries: [cyan]{cache_stats['entries']}[/cyan]")
+        console.print(f"  Size: [cyan]{cache_stats['bytes'] / 1024 / 1024:.1f} MB[/cyan] "
+                      f"of {cache_stats['max_bytes'] / 1024 / 1024:.0f} MB")
+        for provider, p in cache_stats["providers"].items():
+            console.print(
+                f"    {provider}: {p['entries']} entries, {p['hits']} hits, {p['stale_hits']} stale, "
+                f"{p['misses']} misses ({p['hit_rate']:.0%} hit rate), {p['evictions']} evicted"
+            )
+        console.print(f"[dim]  {cache_stats['db']}[/dim]")
+
+    if clear_cache:
+        cache.clear()
+        if not output_json:
+            console.print("[green]Provider cache cleared.[/green]")
 
 
 @app.command()
@@ -505,7 +544,8 @@ def errors(
         # Clear error logs
         tracker = get_tracker()
         try:
-            tracker.error_log.unlink(missing_ok=True)
+            for log in tracker.error_log.parent.glob(f"{tracker.error_log.name}*"):
+                log.unlink(missing_ok=True)  # includes rotated logs
             tracker.human_log.unlink(missing_ok=True)
             Path(tracker.log_dir / "rate_limit_state.json").unlink(missing_ok=True)
             console.print("[green]Error logs cleared.[/green]")
@@ -5,6 +5,8 @@ Contains:
 - Path definitions (SKILLS_DIR)
 - Provider semaphores for concurrency control
 - Rate limit state tracking
+- Per-step pipeline deadlines
+- Provider cache location, size and TTLs
 - Typer app and Rich console setup
 - Optional dependency detection (tenacity, resource registry, discord)
 """
@@ -12,7 +14,7 @@ import json
 import sys
 import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 # Core dependencies
 try:
@@ -91,6 +93,61 @@ PROVIDER_SEMAPHORES: Dict[str, threading.Semaphore] = {
 # Rate limit tracking per provider
 RATE_LIMIT_STATE: Dict[str, Dict[str, Any]] = {}
 
+# =============================================================================
+# PIPELINE DEADLINES
+# =============================================================================
+# Seconds from search start after which a pipeline step is abandoned and
+# reported as timed out. Stage-2 deadlines bound the whole provider chain
+# (stage 1 + deep dive), so the search takes at most the longest of these.
+PROVIDER_DEADLINES: Dict[str, float] = {
+    "brave": 60,
+    "perplexity": 120,
+    "github": 120,
+    "arxiv": 60,
+    "youtube": 60,
+    "readarr": 60,
+    "wayback": 30,
+    "codex_knowledge": 180,
+    "discord": 60,
+    "github_deep": 420,
+    "arxiv_deep": 420,
+    "youtube_deep": 240,
+    "brave_deep": 240,
+}
+
+# =============================================================================
+# PROVIDER CACHE
+# =============================================================================
+# Stage-1 results (and tailored queries) are cached on disk and shared by
+# every dogpile process, keyed by (provider, normalized query, preset).
+CACHE_DB = Path(__file__).resolve().parent / "dogpile_cache.db"
+CACHE_MAX_BYTES = 256 * 1024 * 1024  # LRU eviction above this
+
+# Provider -> (fresh seconds, stale seconds). Fresh entries are served as is;
+# for `stale` seconds after that they are served while a background refresh
+# runs (stale-while-revalidate); older entries are misses.
+HOUR = 3600
+CACHE_TTLS: Dict[str, Tuple[float, float]] = {
+    "brave": (6 * HOUR, 24 * HOUR),
+    "perplexity": (24 * HOUR, 72 * HOUR),
+    "github": (6 * HOUR, 24 * HOUR),
+    "arxiv": (24 * HOUR, 7 * 24 * HOUR),
+    "youtube": (12 * HOUR, 72 * HOUR),
+    "wayback": (7 * 24 * HOUR, 30 * 24 * HOUR),
+    "tailor": (7 * 24 * HOUR, 30 * 24 * HOUR),
+}
+
+# =============================================================================
+# STATUS & ERROR LOGS
+# =============================================================================
+# Written by the status aggregator (status.py) on its own thread
+STATUS_STATE_FILE = Path("dogpile_state.json")  # relative to cwd, read by monitor.py
+STATUS_FLUSH_INTERVAL = 0.5  # max state file writes: one per interval
+ERROR_LOG = Path(__file__).resolve().parent / "dogpile_errors.jsonl"
+ERROR_LOG_MAX_BYTES = 5 * 1024 * 1024  # rotate to .1, .2, ... above this
+ERROR_LOG_BACKUPS = 3
+HUMAN_LOG = Path(__file__).resolve().parent / "dogpile.log"
+
 # =============================================================================
 # CLI SETUP
 # =============================================================================
@@ -16,6 +16,12 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+try:
+    from .pipeline import step_timeout
+except ImportError:  # imported standalone, outside the dogpile package
+    def step_timeout(default: float) -> float:
+        return default
+
 # Path to clawdbot
 CLAWDBOT_DIR = Path("/home/graham/workspace/experiments/clawdbot")
 
@@ -87,7 +93,7 @@ def search_discord(
                 cwd=CLAWDBOT_DIR,
                 capture_output=True,
                 text=True,
-                timeout=30,
+                timeout=step_timeout(30),
             )
 
             if result.returncode == 0:
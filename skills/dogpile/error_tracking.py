@@ -7,7 +7,9 @@ Provides:
 - Error aggregation for debugging
 - JSON log export for agent analysis
 
-Log file: dogpile_errors.json (structured) and dogpile.log (human-readable)
+Log files: dogpile_errors.jsonl (structured; one error or session record per
+line, rotated) and dogpile.log (human-readable). Both are appended by the
+status aggregator's writer thread, never rewritten.
 """
 import json
 import os
@@ -20,6 +22,9 @@ from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+from dogpile.config import ERROR_LOG, HUMAN_LOG
+from dogpile.status import get_aggregator
+
 
 class ErrorSeverity(str, Enum):
     """Error severity levels."""
@@ -111,8 +116,8 @@ class ErrorTracker:
 
         # File paths
         self.log_dir = Path(__file__).parent
-        self.error_log = self.log_dir / "dogpile_errors.json"
-        self.human_log = self.log_dir / "dogpile.log"
+        self.error_log = ERROR_LOG
+        self.human_log = HUMAN_LOG
 
         # State
         self.current_session: Optional[SearchSession] = None
@@ -163,50 +168,23 @@ class ErrorTracker:
             self._save_session()
             self._log_human(f"=== Session {self.current_session.session_id} {status} ===")
             self.current_session = None
+            get_aggregator().flush()
 
     def _save_session(self):
-        """Save session to error log."""
+        """Append the session summary and rate-limit state to the error log (its errors are already there)."""
         if not self.current_session:
             return
 
-        try:
-            # Load existing sessions
-            sessions = []
-            if self.error_log.exists():
-                try:
-                    data = json.loads(self.error_log.read_text())
-                    sessions = data.get("sessions", [])
-                except Exception:
-                    pass
-
-            # Add current session
-            session_dict = asdict(self.current_session)
-            session_dict["errors"] = [e.to_dict() for e in self.current_session.errors]
-            sessions.append(session_dict)
-
-            # Keep last 50 sessions
-            sessions = sessions[-50:]
-
-            # Write atomically
-            output = {
-                "last_updated": datetime.now().isoformat(),
-                "sessions": sessions,
-                "rate_limits": {p: asdict(s) for p, s in self.rate_limits.items()},
-            }
-            tmp = self.error_log.with_suffix(".tmp")
-            tmp.write_text(json.dumps(output, indent=2))
-            os.replace(tmp, self.error_log)
-        except Exception as e:
-            self._log_human(f"Failed to save session: {e}")
+        session_dict = asdict(self.current_session)
+        session_dict["errors"] = len(self.current_session.errors)
+        with self._lock:
+            rate_limits = {p: asdict(s) for p, s in self.rate_limits.items()}
+        get_aggregator().record({"type": "session", **session_dict, "rate_limits": rate_limits})
 
     def _log_human(self, msg: str):
         """Append to human-readable log."""
-        try:
-            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            with open(self.human_log, "a") as f:
-                f.write(f"[{timestamp}] {msg}\n")
-        except Exception:
-            pass
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        get_aggregator().log(f"[{timestamp}] {msg}")
 
     def log_error(
         self,
@@ -234,10 +212,13 @@ class ErrorTracker:
 
         with self._lock:
             self.errors.append(event)
+            session_id = None
             if self.current_session:
+                session_id = self.current_session.session_id
                 self.current_session.errors.append(event)
                 if provider not in self.current_session.providers_failed:
                     self.current_session.providers_failed.append(provider)
+        get_aggregator().record({"type": "error", "session_id": session_id, **event.to_dict()})
 
         # Log to human-readable
         severity_prefix = {
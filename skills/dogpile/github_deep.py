@@ -22,6 +22,7 @@ if str(_SCRIPT_DIR.parent) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR.parent))
 
 from dogpile.config import console
+from dogpile.pipeline import propagate_deadline
 from dogpile.utils import log_status, run_command
 from dogpile.github_search import (
     search_github_code,
@@ -318,7 +319,7 @@ def run_stage2_github(
             log_status(f"GitHub Stage 2: Fetching details for {len(repos)} repos...", provider="github", status="RUNNING")
 
             with ThreadPoolExecutor(max_workers=3) as executor:
-                futures = {executor.submit(fetch_repo_details, r.get("fullName")): r for r in repos if r.get("fullName")}
+                futures = {executor.submit(propagate_deadline(fetch_repo_details), r.get("fullName")): r for r in repos if r.get("fullName")}
                 for f in as_completed(futures):
                     res = f.result()
                     if res and not res.get("error"):
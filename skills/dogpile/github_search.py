@@ -27,6 +27,7 @@ if str(_SCRIPT_DIR.parent) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR.parent))
 
 from dogpile.config import SKILLS_DIR
+from dogpile.pipeline import step_timeout
 from dogpile.utils import log_status, with_semaphore, run_command, create_retry_decorator
 
 
@@ -57,7 +58,7 @@ def search_github(query: str) -> Dict[str, Any]:
     # Check for rate limit in repo search
     if "rate limit" in repos_out.lower() or "secondary rate limit" in repos_out.lower():
         log_status("GitHub rate limited, backing off 60s...", provider="github", status="RATE_LIMITED")
-        time.sleep(60)  # GitHub recommends waiting until reset, use 60s as safe default
+        time.sleep(step_timeout(60))  # GitHub recommends waiting until reset, use 60s as safe default
         repos_out = run_command(repos_cmd)  # Retry once
 
     issues_out = run_command(issues_cmd)
@@ -128,7 +129,7 @@ def search_github_via_skill(query: str, deep: bool = True, treesitter: bool = Fa
         # Check for rate limit errors
         if "rate limit" in output.lower() or "secondary rate limit" in output.lower():
             log_status("GitHub rate limited via skill, backing off 60s...", provider="github", status="RATE_LIMITED")
-            time.sleep(60)
+            time.sleep(step_timeout(60))
             output = run_command(cmd, cwd=github_skill)  # Retry once
 
         if output.startswith("Error:"):
@@ -22,6 +22,7 @@ _SCRIPT_DIR = Path(__file__).resolve().parent
 if str(_SCRIPT_DIR.parent) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR.parent))
 
+from dogpile.pipeline import step_timeout
 from dogpile.utils import log_status
 from dogpile.error_tracking import log_rate_limit
 
@@ -80,7 +81,7 @@ class CodexProvider(LLMProvider):
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=120,
+                timeout=step_timeout(120),
                 cwd=str(self.script.parent),
             )
 
@@ -164,7 +165,7 @@ class OpenAIProvider(LLMProvider):
         try:
             if hasattr(httpx, 'Client'):
                 # httpx
-                with httpx.Client(timeout=120) as client:
+                with httpx.Client(timeout=step_timeout(120)) as client:
                     response = client.post(
                         "https://api.openai.com/v1/chat/completions",
                         headers=headers,
@@ -176,7 +177,7 @@ class OpenAIProvider(LLMProvider):
                     "https://api.openai.com/v1/chat/completions",
                     headers=headers,
                     json=payload,
-                    timeout=120,
+                    timeout=step_timeout(120),
                 )
 
             if response.status_code == 401:
@@ -230,7 +231,7 @@ class ClaudeProvider(LLMProvider):
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=180,  # Claude can be slower
+                timeout=step_timeout(180),  # Claude can be slower
             )
 
             output = result.stdout + result.stderr
@@ -286,7 +287,7 @@ class PiProvider(LLMProvider):
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=180,
+                timeout=step_timeout(180),
             )
 
             if result.returncode == 0 and result.stdout.strip():
@@ -356,7 +357,7 @@ class GeminiProvider(LLMProvider):
 
         try:
             if hasattr(httpx, 'Client'):
-                with httpx.Client(timeout=120) as client:
+                with httpx.Client(timeout=step_timeout(120)) as client:
                     response = client.post(
                         f"{url}?key={self.api_key}",
                         headers=headers,
@@ -367,7 +368,7 @@ class GeminiProvider(LLMProvider):
                     f"{url}?key={self.api_key}",
                     headers=headers,
                     json=payload,
-                    timeout=120,
+                    timeout=step_timeout(120),
                 )
 
             if response.status_code == 401 or response.status_code == 403:
@@ -439,7 +440,7 @@ class AnthropicProvider(LLMProvider):
 
         try:
             if hasattr(httpx, 'Client'):
-                with httpx.Client(timeout=120) as client:
+                with httpx.Client(timeout=step_timeout(120)) as client:
                     response = client.post(
                         "https://api.anthropic.com/v1/messages",
                         headers=headers,
@@ -450,7 +451,7 @@ class AnthropicProvider(LLMProvider):
                     "https://api.anthropic.com/v1/messages",
                     headers=headers,
                     json=payload,
-                    timeout=120,
+                    timeout=step_timeout(120),
                 )
 
             if response.status_code == 401:
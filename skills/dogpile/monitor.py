@@ -4,6 +4,7 @@ Textual Monitor for Dogpile.
 Tails dogpile.log and updates a status dashboard.
 """
 import asyncio
+import json
 import os
 from pathlib import Path
 from textual.app import App, ComposeResult
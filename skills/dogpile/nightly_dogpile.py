@@ -57,12 +57,16 @@ def record_nightly_assessment(project: str, issue: Dict[str, Any], research: str
         print(f"Assessment recording failed: {e}", file=sys.stderr)
 
 def trigger_dogpile(topic: str) -> str:
-    """Run dogpile search and return summary."""
+    """Run dogpile search and return summary.
+
+    Provider results and tailored queries come from dogpile's shared cache
+    while fresh, so overlapping topics across projects and nights reuse them.
+    """
     print(f"Dogpiling on: {topic}")
     try:
-        # Call dogpile search
+        # Unattended: no ambiguity prompt (keeps the cache key stable), whole report at once
         result = subprocess.run(
-            [str(DOGPILE_SCRIPT), "search", topic],
+            [str(DOGPILE_SCRIPT), "search", topic, "--no-interactive", "--no-stream"],
             capture_output=True, text=True, check=True
         )
         return result.stdout
@@ -15,6 +15,7 @@ if str(_SCRIPT_DIR.parent) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR.parent))
 
 from dogpile.config import SKILLS_DIR
+from dogpile.pipeline import step_timeout
 from dogpile.utils import log_status, with_semaphore, run_command, create_retry_decorator
 
 
@@ -41,7 +42,7 @@ def search_perplexity(query: str) -> Dict[str, Any]:
             # Check for rate limit errors
             if "429" in output or "rate limit" in output.lower():
                 log_status("Perplexity rate limited, backing off...", provider="perplexity", status="RATE_LIMITED")
-                time.sleep(10)  # Perplexity is paid, be conservative
+                time.sleep(step_timeout(10))  # Perplexity is paid, be conservative
             return {"error": output}
 
         return json.loads(output)
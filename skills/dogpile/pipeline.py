@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""Dependency-graph executor for Dogpile provider chains.
+
+Each provider is a chain of steps (e.g. github -> github_deep). A step starts
+as soon as the steps it depends on have finished, so one provider's deep dive
+does not wait for every other provider's broad search, and latency is that of
+the slowest chain rather than the sum of stages.
+
+Every step may carry a deadline, in seconds from pipeline start. A step still
+running at its deadline is abandoned and replaced by its fallback value, and
+the deadline is exposed to the step's thread (remaining_time, step_timeout) so
+run_command, provider HTTP calls and backoff sleeps stop when it passes. Steps
+whose dependencies failed or timed out are skipped with their fallback value.
+Steps run on daemon threads, so an abandoned step never delays process exit.
+
+Results are reported through on_complete as each step finishes, so callers
+can stream partial reports.
+"""
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
+
+R = TypeVar("R")
+
+# Step statuses
+DONE = "done"
+ERROR = "error"
+TIMEOUT = "timeout"
+SKIPPED = "skipped"
+
+_local = threading.local()
+
+
+def _no_fallback(message: str) -> Any:
+    return None
+
+
+@dataclass
+class Step:
+    """A unit of work in the pipeline.
+
+    Attributes:
+        name: Unique step name
+        fn: Called with the results of `deps`, in order, as positional args
+        deps: Names of steps that must finish first
+        deadline: Seconds from pipeline start after which the step is abandoned
+        fallback: Builds the step's result from an error message when it fails,
+            times out or is skipped (shaped like a normal result)
+    """
+    name: str
+    fn: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    deadline: Optional[float] = None
+    fallback: Callable[[str], Any] = _no_fallback
+
+
+@dataclass
+class StepOutcome:
+    """Result of a finished step."""
+    name: str
+    status: str
+    result: Any
+    elapsed: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == DONE
+
+
+# =============================================================================
+# DEADLINE PROPAGATION
+# =============================================================================
+
+def current_deadline() -> Optional[float]:
+    """Deadline (time.monotonic() value) of the step running in this thread."""
+    return getattr(_local, "deadline", None)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current step's deadline (None if it has none)."""
+    deadline = current_deadline()
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.monotonic())
+
+
+def step_timeout(default: float) -> float:
+    """Timeout for a blocking call: `default`, capped at the step's remaining time.
+
+    Use for HTTP requests, subprocesses and backoff sleeps inside a step:
+        urllib.request.urlopen(url, timeout=step_timeout(10))
+    """
+    remaining = remaining_time()
+    return default if remaining is None else min(default, remaining)
+
+
+def propagate_deadline(fn: Callable[..., R]) -> Callable[..., R]:
+    """Carry the current step's deadline into work submitted to another thread.
+
+    Use when a step fans out through its own executor:
+        executor.submit(propagate_deadline(fetch_details), item_id)
+    """
+    deadline = current_deadline()
+
+    @wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> R:
+        return _call_with_deadline(deadline, fn, *args, **kwargs)
+    return wrapper
+
+
+def run_with_deadline(timeout: float, fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    """Run fn in this thread with a deadline `timeout` seconds from now.
+
+    For provider calls made outside a pipeline (e.g. cache revalidation).
+    """
+    return _call_with_deadline(time.monotonic() + timeout, fn, *args, **kwargs)
+
+
+def _call_with_deadline(deadline: Optional[float], fn: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    previous = current_deadline()
+    _local.deadline = deadline
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _local.deadline = previous
+
+
+# =============================================================================
+# EXECUTOR
+# =============================================================================
+
+def _start(name: str, fn: Callable[..., Any], *args: Any) -> Future:
+    """Run fn(*args) on a daemon thread and return a Future for its result."""
+    future: Future = Future()
+    future.set_running_or_notify_cancel()
+
+    def target() -> None:
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, name=f"dogpile-{name}", daemon=True).start()
+    return future
+
+
+def _validate(steps: Sequence[Step]) -> None:
+    """Check names are unique and every dependency is declared earlier."""
+    seen: set = set()
+    for step in steps:
+        if step.name in seen:
+            raise ValueError(f"Duplicate step name: {step.name}")
+        for dep in step.deps:
+            if dep not in seen:
+                raise ValueError(f"Step '{step.name}' depends on unknown or later step '{dep}'")
+        seen.add(step.name)
+
+
+def run_pipeline(
+    steps: Sequence[Step],
+    on_complete: Optional[Callable[[StepOutcome], None]] = None,
+) -> Dict[str, StepOutcome]:
+    """Run steps as their dependencies finish, enforcing per-step deadlines.
+
+    Args:
+        steps: Steps in dependency order (a step's deps must come before it)
+        on_complete: Called in the calling thread as each step finishes
+
+    Returns:
+        Dict of step name -> StepOutcome
+
+    Each step runs on its own daemon thread. Abandoned steps keep running in
+    the background until their own I/O returns (bounded by step_timeout), but
+    they are not joined at interpreter exit.
+    """
+    _validate(steps)
+    start = time.monotonic()
+    outcomes: Dict[str, StepOutcome] = {}
+    running: Dict[Future, Step] = {}
+    started: Dict[str, float] = {}
+
+    def finish(step: Step, status: str, result: Any, error: Optional[str] = None) -> None:
+        elapsed = time.monotonic() - started.get(step.name, time.monotonic())
+        outcome = StepOutcome(step.name, status, result, round(elapsed, 2), error)
+        outcomes[step.name] = outcome
+        if on_complete:
+            on_complete(outcome)
+
+    def fail(step: Step, status: str, message: str) -> None:
+        try:
+            result = step.fallback(message)
+        except Exception:
+            result = None
+        finish(step, status, result, message)
+
+    def schedule() -> None:
+        pending: List[Step] = [s for s in steps if s.name not in outcomes and s.name not in started]
+        for step in pending:
+            blocked = [d for d in step.deps if d in outcomes and not outcomes[d].ok]
+            if blocked:
+                fail(step, SKIPPED, f"Skipped: {blocked[0]} {outcomes[blocked[0]].status}")
+            elif all(d in outcomes for d in step.deps):
+                deadline_at = start + step.deadline if step.deadline is not None else None
+                args = [outcomes[d].result for d in step.deps]
+                started[step.name] = time.monotonic()
+                running[_start(step.name, _call_with_deadline, deadline_at, step.fn, *args)] = step
+
+    while len(outcomes) < len(steps):
+        # Skips can unblock further skips, so schedule until stable
+        count = -1
+        while count != len(outcomes) + len(started):
+            count = len(outcomes) + len(started)
+            schedule()
+        if not running:
+            continue
+
+        deadlines = [start + s.deadline for s in running.values() if s.deadline is not None]
+        timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+        done, _ = wait(running, timeout=timeout, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            step = running.pop(future)
+            try:
+                finish(step, DONE, future.result())
+            except Exception as e:
+                fail(step, ERROR, f"{type(e).__name__}: {e}")
+
+        now = time.monotonic()
+        for future, step in list(running.items()):
+            if step.deadline is not None and now >= start + step.deadline:
+                del running[future]
+                fail(step, TIMEOUT, f"Deadline exceeded ({step.deadline:.1f}s)")
+
+    return outcomes
@@ -37,6 +37,9 @@ MODULES=(
     "discord.py"
     "readarr.py"
     "formatters.py"
+    "pipeline.py"
+    "cache.py"
+    "status.py"
     "synthesis.py"
     "cli.py"
     "__init__.py"
@@ -75,6 +78,9 @@ sys.path.insert(0, '$(dirname $SCRIPT_DIR)')
 # Test all module imports
 from dogpile.config import app, console, SKILLS_DIR, VERSION
 from dogpile.utils import run_command, log_status, with_semaphore
+from dogpile.pipeline import Step, run_pipeline
+from dogpile.cache import ProviderCache, get_cache
+from dogpile.status import get_aggregator, get_status_snapshot
 from dogpile.brave import search_brave
 from dogpile.perplexity import search_perplexity
 from dogpile.arxiv_search import search_arxiv
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""In-process status aggregator for Dogpile.
+
+Provider threads used to read, modify and rewrite dogpile_state.json on every
+status line, and the error tracker rewrote the whole error log per session.
+Concurrent steps lost each other's updates and every event hit the disk.
+
+Now threads only post events onto a queue (no locks on the producer side).
+A single writer thread applies them in batches:
+- Provider status and recent errors are kept in memory; snapshot() returns
+  the latest applied state without touching disk.
+- dogpile_state.json is rewritten at most once per STATUS_FLUSH_INTERVAL.
+- Error events and session summaries are appended to dogpile_errors.jsonl,
+  rotated above ERROR_LOG_MAX_BYTES.
+- Human-readable lines are appended to dogpile.log.
+
+Pending events are flushed at interpreter exit.
+"""
+import atexit
+import copy
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add parent directory to path for package imports when running as script
+_SCRIPT_DIR = Path(__file__).resolve().parent
+if str(_SCRIPT_DIR.parent) not in sys.path:
+    sys.path.insert(0, str(_SCRIPT_DIR.parent))
+
+from dogpile.config import (
+    ERROR_LOG,
+    ERROR_LOG_BACKUPS,
+    ERROR_LOG_MAX_BYTES,
+    HUMAN_LOG,
+    STATUS_FLUSH_INTERVAL,
+    STATUS_STATE_FILE,
+)
+
+MAX_STATE_ERRORS = 20  # errors kept in the state file
+
+
+class StatusAggregator:
+    """Single-writer sink for status events, error records and log lines."""
+
+    def __init__(
+        self,
+        state_file: Path = STATUS_STATE_FILE,
+        error_log: Path = ERROR_LOG,
+        human_log: Path = HUMAN_LOG,
+        flush_interval: float = STATUS_FLUSH_INTERVAL,
+    ):
+        self.state_file = Path(state_file)
+        self.error_log = Path(error_log)
+        self.human_log = Path(human_log)
+        self.flush_interval = flush_interval
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._state = self._load_state()
+        self._snapshot: Dict[str, Any] = copy.deepcopy(self._state)
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name="dogpile-status", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Start from the existing state file so earlier provider status is kept."""
+        try:
+            state = json.loads(self.state_file.read_text())
+            return state if isinstance(state, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    # =========================================================================
+    # PRODUCER API (any thread)
+    # =========================================================================
+
+    def update(
+        self,
+        msg: str,
+        provider: Optional[str] = None,
+        status: Optional[str] = None,
+        error: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Post a status line; `error` adds an entry to the state's error list."""
+        self._queue.put(("status", (time.strftime("%Y-%m-%d %H:%M:%S"), msg, provider, status, error)))
+
+    def record(self, record: Dict[str, Any]) -> None:
+        """Append a structured record to the JSONL error log."""
+        self._queue.put(("record", record))
+
+    def log(self, line: str) -> None:
+        """Append a line to the human-readable log."""
+        self._queue.put(("log", line))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Latest applied state (providers, errors, last_msg); treat as read-only."""
+        return self._snapshot
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything posted so far is on disk."""
+        if self._closed:
+            return False
+        done = threading.Event()
+        self._queue.put(("flush", done))
+        return done.wait(timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Flush pending events and stop the writer thread."""
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(("stop", done))
+        done.wait(timeout)
+        self._closed = True
+
+    # =========================================================================
+    # WRITER THREAD
+    # =========================================================================
+
+    def _run(self) -> None:
+        dirty = False
+        last_flush = 0.0
+        while True:
+            timeout = max(0.0, last_flush + self.flush_interval - time.monotonic()) if dirty else None
+            batch = []
+            try:
+                batch.append(self._queue.get(timeout=timeout))
+                while True:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+
+            records: List[Dict[str, Any]] = []
+            lines: List[str] = []
+            waiters: List[threading.Event] = []
+            stop = False
+            for kind, payload in batch:
+                if kind == "status":
+                    self._apply(*payload)
+                    dirty = True
+                elif kind == "record":
+                    records.append(payload)
+                elif kind == "log":
+                    lines.append(payload)
+                else:
+                    waiters.append(payload)
+                    stop = stop or kind == "stop"
+
+            if records:
+                self._append_records(records)
+            if lines:
+                self._append(self.human_log, "".join(f"{line}\n" for line in lines))
+            if dirty:
+                self._snapshot = copy.deepcopy(self._state)
+                if waiters or time.monotonic() - last_flush >= self.flush_interval:
+                    self._write_state()
+                    dirty = False
+                    last_flush = time.monotonic()
+            for done in waiters:
+                done.set()
+            if stop:
+                return
+
+    def _apply(self, timestamp: str, msg: str, provider: Optional[str], status: Optional[str],
+               error: Optional[Dict[str, Any]]) -> None:
+        state = self._state
+        if provider:
+            state.setdefault("providers", {})[provider] = status or "RUNNING"
+            if error is not None:
+                errors = state.setdefault("errors", [])
+                errors.append({"provider": provider, "status": status, "message": msg, **error, "timestamp": timestamp})
+                del errors[:-MAX_STATE_ERRORS]
+        state["last_msg"] = msg
+        state["last_updated"] = timestamp
+
+    def _write_state(self) -> None:
+        try:
+            tmp = self.state_file.with_name(f"{self.state_file.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self._state, indent=2))
+            os.replace(tmp, self.state_file)
+        except OSError:
+            pass
+
+    def _append(self, path: Path, data: str) -> None:
+        try:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(data)
+        except OSError:
+            pass
+
+    def _append_records(self, records: List[Dict[str, Any]]) -> None:
+        """Append records, rotating before any record that would cross ERROR_LOG_MAX_BYTES."""
+        try:
+            size = self.error_log.stat().st_size
+        except OSError:
+            size = 0
+        lines: List[str] = []
+        for record in records:
+            line = json.dumps(record, default=str) + "\n"
+            length = len(line.encode("utf-8"))
+            if size and size + length > ERROR_LOG_MAX_BYTES:
+                if lines:
+                    self._append(self.error_log, "".join(lines))
+                    lines = []
+                try:
+                    self._rotate()
+                except OSError:
+                    pass
+                size = 0
+            lines.append(line)
+            size += length
+        if lines:
+            self._append(self.error_log, "".join(lines))
+
+    def _rotate(self) -> None:
+        """dogpile_errors.jsonl -> .1 -> .2 ... (oldest beyond ERROR_LOG_BACKUPS dropped)."""
+        for i in range(ERROR_LOG_BACKUPS - 1, 0, -1):
+            older = self.error_log.with_name(f"{self.error_log.name}.{i}")
+            if older.exists():
+                os.replace(older, self.error_log.with_name(f"{self.error_log.name}.{i + 1}"))
+        if ERROR_LOG_BACKUPS > 0:
+            os.replace(self.error_log, self.error_log.with_name(f"{self.error_log.name}.1"))
+        else:
+            self.error_log.unlink()
+
+
+_aggregator: Optional[StatusAggregator] = None
+_aggregator_lock = threading.Lock()
+
+
+def get_aggregator() -> StatusAggregator:
+    """Get the process-wide status aggregator (started on first use)."""
+    global _aggregator
+    if _aggregator is None:
+        with _aggregator_lock:
+            if _aggregator is None:
+                _aggregator = StatusAggregator()
+    return _aggregator
+
+
+def get_status_snapshot() -> Dict[str, Any]:
+    """In-memory view of dogpile_state.json for in-process monitors."""
+    return get_aggregator().snapshot()
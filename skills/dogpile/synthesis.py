@@ -276,6 +276,70 @@ def format_youtube_section(youtube_res: List[Dict], youtube_transcripts: List[Di
     return lines
 
 
+# Report order of provider sections, and the pipeline step that completes each
+REPORT_SECTIONS: Dict[str, str] = {
+    "wayback": "wayback",
+    "codex_knowledge": "codex_knowledge",
+    "perplexity": "perplexity",
+    "readarr": "readarr",
+    "discord": "discord",
+    "github": "github_deep",
+    "brave": "brave_deep",
+    "arxiv": "arxiv_deep",
+    "youtube": "youtube_deep",
+}
+
+
+def format_provider_section(provider: str, results: Dict[str, Any]) -> List[str]:
+    """Format one provider's section from pipeline results.
+
+    Args:
+        provider: Key of REPORT_SECTIONS
+        results: Step name -> result (needs the provider's stage-1 step and,
+            for chained providers, its deep-dive step)
+
+    Returns:
+        Markdown lines for the section
+    """
+    if provider == "wayback":
+        return format_wayback_section(results["wayback"])
+    if provider == "codex_knowledge":
+        return format_codex_section(results["codex_knowledge"])
+    if provider == "perplexity":
+        return format_perplexity_section(results["perplexity"])
+    if provider == "readarr":
+        return format_readarr_section(results["readarr"])
+    if provider == "discord":
+        return format_discord_section(results["discord"])
+    if provider == "github":
+        github_details, github_deep, target_repo, deep_code_res = results["github_deep"]
+        return format_github_section(results["github"], github_details, github_deep, target_repo, deep_code_res)
+    if provider == "brave":
+        return format_brave_section(results["brave"], results["brave_deep"])
+    if provider == "arxiv":
+        arxiv_details, arxiv_deep = results["arxiv_deep"]
+        return format_arxiv_section(results["arxiv"], arxiv_details, arxiv_deep)
+    if provider == "youtube":
+        return format_youtube_section(results["youtube"], results["youtube_deep"])
+    raise ValueError(f"Unknown report section: {provider}")
+
+
+def format_synthesis_section(synthesis: Optional[str]) -> List[str]:
+    """Format the Codex synthesis (empty if synthesis failed)."""
+    if not synthesis or synthesis.startswith("Error:"):
+        return []
+    return ["## Codex Synthesis (gpt-5.2 High Reasoning)", synthesis, ""]
+
+
+def generate_report_from_results(query: str, results: Dict[str, Any], synthesis: Optional[str] = None) -> str:
+    """Generate full markdown report from pipeline results (step name -> result)."""
+    md_lines = [f"# Dogpile Report: {query}", ""]
+    for provider in REPORT_SECTIONS:
+        md_lines.extend(format_provider_section(provider, results))
+    md_lines.extend(format_synthesis_section(synthesis))
+    return "\n".join(md_lines)
+
+
 def generate_report(
     query: str,
     wayback_res: Dict[str, Any],
@@ -298,23 +362,19 @@ def generate_report(
     synthesis: Optional[str] = None
 ) -> str:
     """Generate full markdown report from all search results."""
-    md_lines = [f"# Dogpile Report: {query}", ""]
-
-    md_lines.extend(format_wayback_section(wayback_res))
-    md_lines.extend(format_codex_section(codex_src_res))
-    md_lines.extend(format_perplexity_section(perp_res))
-    md_lines.extend(format_readarr_section(readarr_res))
-    md_lines.extend(format_discord_section(discord_res))
-    md_lines.extend(format_github_section(
-        github_res, github_details, github_deep, target_repo, deep_code_res
-    ))
-    md_lines.extend(format_brave_section(brave_res, brave_deep))
-    md_lines.extend(format_arxiv_section(arxiv_res, arxiv_details, arxiv_deep))
-    md_lines.extend(format_youtube_section(youtube_res, youtube_transcripts))
-
-    if synthesis and not synthesis.startswith("Error:"):
-        md_lines.append("## Codex Synthesis (gpt-5.2 High Reasoning)")
-        md_lines.append(synthesis)
-        md_lines.append("")
-
-    return "\n".join(md_lines)
+    results = {
+        "wayback": wayback_res,
+        "codex_knowledge": codex_src_res,
+        "perplexity": perp_res,
+        "readarr": readarr_res,
+        "discord": discord_res,
+        "github": github_res,
+        "github_deep": (github_details, github_deep, target_repo, deep_code_res),
+        "brave": brave_res,
+        "brave_deep": brave_deep,
+        "arxiv": arxiv_res,
+        "arxiv_deep": (arxiv_details, arxiv_deep),
+        "youtube": youtube_res,
+        "youtube_deep": youtube_transcripts,
+    }
+    return generate_report_from_results(query, results, synthesis)
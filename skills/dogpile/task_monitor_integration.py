@@ -16,6 +16,8 @@ import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
+from dogpile.status import get_status_snapshot
+
 # Task monitor registry location
 TASK_MONITOR_REGISTRY = Path.home() / ".pi" / "task-monitor" / "registry.json"
 TASK_MONITOR_API_URL = os.environ.get("TASK_MONITOR_API", "http://localhost:8765")
@@ -123,6 +125,9 @@ class DogpileMonitor:
 
         elapsed = now - self.start_time
 
+        # Live provider status from log_status (in memory, no state file read)
+        live = get_status_snapshot()
+
         # Calculate progress
         providers_done = sum(1 for s in self.provider_status.values() if s in ("done", "error"))
         progress_pct = (self.completed_steps / self.total_steps * 100) if self.total_steps > 0 else 0
@@ -140,6 +145,8 @@ class DogpileMonitor:
             },
             "provider_status": self.provider_status,
             "provider_times": self.provider_times,
+            "provider_events": live.get("providers", {}),
+            "last_msg": live.get("last_msg"),
             "errors": self.errors[-10:],  # Last 10 errors
             "rate_limits": self.rate_limits,
             "elapsed_seconds": round(elapsed, 1),
@@ -8,8 +8,6 @@ Contains:
 - with_semaphore: Decorator for provider-specific concurrency control
 - create_retry_decorator: Create tenacity retry decorators
 """
-import json
-import os
 import subprocess
 import sys
 import time
@@ -31,6 +29,8 @@ from dogpile.config import (
     RATE_LIMIT_STATE,
     TENACITY_AVAILABLE,
 )
+from dogpile.pipeline import remaining_time, step_timeout
+from dogpile.status import get_aggregator
 
 # Import error tracking (lazy to avoid circular imports)
 _error_tracker = None
@@ -59,12 +59,21 @@ if TENACITY_AVAILABLE:
         stop_after_delay,
         wait_random_exponential,
         retry_if_exception_type,
+        stop_base,
     )
 
+    class _stop_at_deadline(stop_base):
+        """Stop retrying once the current pipeline step's deadline has passed."""
+
+        def __call__(self, retry_state: Any) -> bool:
+            return remaining_time() == 0
+
 
 def run_command(cmd: List[str], cwd: Optional[Path] = None) -> str:
     """Run a command and return stdout.
 
+    Inside a pipeline step the command is killed at the step's deadline.
+
     Args:
         cmd: Command and arguments as list
         cwd: Working directory for command execution
@@ -78,11 +87,14 @@ def run_command(cmd: List[str], cwd: Optional[Path] = None) -> str:
             capture_output=True,
             text=True,
             check=True,
-            cwd=cwd
+            cwd=cwd,
+            timeout=remaining_time(),
         )
         return result.stdout.strip()
     except subprocess.CalledProcessError as e:
         return f"Error: {e.stderr}"
+    except subprocess.TimeoutExpired:
+        return "Error: Deadline exceeded"
     except Exception as e:
         return f"Error: {e}"
 
@@ -96,12 +108,12 @@ def log_status(
     http_status: Optional[int] = None,
     retry_after: Optional[float] = None,
 ):
-    """Log status to stderr and update task-monitor state with atomic writes.
+    """Log status to stderr and post it to the status aggregator.
 
     Args:
         msg: Status message to log
         provider: Provider name (github, arxiv, etc.)
-        status: Provider status (RUNNING, DONE, ERROR, RATE_LIMITED)
+        status: Provider status (RUNNING, DONE, ERROR, RATE_LIMITED, SKIPPED)
         error_type: Type of error (rate_limit, timeout, auth_failure, etc.)
         error_details: Additional error context for debugging
         http_status: HTTP status code if applicable
@@ -152,41 +164,12 @@ def log_status(
         elif status == "DONE":
             tracker.log_success(provider, msg)
 
-    # Update state for task-monitor atomically
-    state_file = Path("dogpile_state.json")
-    state: Dict[str, Any] = {}
-    if state_file.exists():
-        try:
-            state = json.loads(state_file.read_text())
-        except Exception:
-            state = {}
-
-    if provider:
-        state.setdefault("providers", {})[provider] = status or "RUNNING"
-
-        # Track errors in state for agent visibility
-        if status in ("ERROR", "RATE_LIMITED") or error_type:
-            state.setdefault("errors", []).append({
-                "provider": provider,
-                "status": status,
-                "message": msg,
-                "error_type": error_type,
-                "http_status": http_status,
-                "retry_after": retry_after,
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-            })
-            # Keep only last 20 errors
-            state["errors"] = state["errors"][-20:]
-
-    state["last_msg"] = msg
-    state["last_updated"] = time.strftime("%Y-%m-%d %H:%M:%S")
-
-    try:
-        tmp = state_file.with_suffix(".tmp")
-        tmp.write_text(json.dumps(state, indent=2))
-        os.replace(tmp, state_file)
-    except Exception:
-        pass
+    # Update state for task-monitor (coalesced and written by the status aggregator)
+    error = None
+    if provider and (status in ("ERROR", "RATE_LIMITED") or error_type):
+        # Tracked in state for agent visibility
+        error = {"error_type": error_type, "http_status": http_status, "retry_after": retry_after}
+    get_aggregator().update(msg, provider=provider, status=status, error=error)
 
 
 def parse_rate_limit_headers(headers: Dict[str, str], provider: str) -> Optional[float]:
@@ -345,8 +328,9 @@ def create_retry_decorator(provider: str, max_attempts: int = 3, max_delay: int
         return identity
 
     return retry(
-        stop=(stop_after_attempt(max_attempts) | stop_after_delay(300)),  # 5 min max
+        stop=(stop_after_attempt(max_attempts) | stop_after_delay(300) | _stop_at_deadline()),  # 5 min max
         wait=wait_random_exponential(multiplier=1, min=1, max=max_delay),
+        sleep=lambda seconds: time.sleep(step_timeout(seconds)),
         retry=retry_if_exception_type((ConnectionError, TimeoutError, OSError)),
         reraise=True,
     )
@@ -15,6 +15,7 @@ _SCRIPT_DIR = Path(__file__).resolve().parent
 if str(_SCRIPT_DIR.parent) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR.parent))
 
+from dogpile.pipeline import step_timeout
 from dogpile.utils import log_status, with_semaphore, parse_rate_limit_headers
 
 
@@ -40,12 +41,12 @@ def search_wayback(query: str) -> Dict[str, Any]:
     api_url = f"http://archive.org/wayback/available?url={query}"
 
     try:
-        with urllib.request.urlopen(api_url, timeout=10) as resp:
+        with urllib.request.urlopen(api_url, timeout=step_timeout(10)) as resp:
             # Check rate limit headers
             headers = dict(resp.headers)
             wait_time = parse_rate_limit_headers(headers, "wayback")
             if wait_time:
-                time.sleep(min(wait_time, 30))  # Cap at 30s
+                time.sleep(step_timeout(min(wait_time, 30)))  # Cap at 30s
 
             data = json.loads(resp.read().decode())
             # Format: {"archived_snapshots": {"closest": {"available": true, "url": "...", ...}}}
@@ -19,6 +19,7 @@ if str(_SCRIPT_DIR.parent) not in sys.path:
     sys.path.insert(0, str(_SCRIPT_DIR.parent))
 
 from dogpile.config import SKILLS_DIR
+from dogpile.pipeline import propagate_deadline, step_timeout
 from dogpile.utils import log_status, with_semaphore, run_command
 
 
@@ -53,7 +54,7 @@ def search_youtube(query: str) -> List[Dict[str, str]]:
         # Check for rate limit
         if "429" in output or "rate limit" in output.lower():
             log_status("YouTube rate limited, backing off 30s...", provider="youtube", status="RATE_LIMITED")
-            time.sleep(30)
+            time.sleep(step_timeout(30))
             output = run_command(cmd)  # Retry once
 
         if output.startswith("Error"):
@@ -131,7 +132,7 @@ def run_stage2_youtube(youtube_res: List[Dict]) -> List[Dict]:
             )
 
             with ThreadPoolExecutor(max_workers=2) as executor:
-                futures = {executor.submit(search_youtube_transcript, v["id"]): v for v in valid_videos}
+                futures = {executor.submit(propagate_deadline(search_youtube_transcript), v["id"]): v for v in valid_videos}
                 for f in as_completed(futures):
                     res = f.result()
                     if "full_text" in res:
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Load-test the embedding service: concurrent single-text /embed calls.
+
+Reports p50/p99 latency and texts/sec. With --compare, starts two local
+services (micro-batching on and off) and runs the same load against each.
+
+Usage:
+    python bench_embed.py --requests 2000 --concurrency 50
+    python bench_embed.py --url http://127.0.0.1:8602 --concurrency 100
+    python bench_embed.py --compare --requests 1000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import httpx
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+
+
+def _percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    idx = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+async def run_load(url: str, requests: int, concurrency: int) -> Dict[str, float]:
+    """Send `requests` single-text /embed calls with `concurrency` in flight."""
+    latencies: List[float] = []
+    counter = iter(range(requests))
+
+    async with httpx.AsyncClient(base_url=url, timeout=120.0,
+                                 limits=httpx.Limits(max_connections=concurrency)) as client:
+        await client.post("/embed", json={"text": "warm-up"})
+
+        async def worker():
+            for i in counter:
+                text = f"benchmark sentence number {i} " + "lorem ipsum " * (i % 16)
+                start = time.perf_counter()
+                resp = await client.post("/embed", json={"text": text})
+                resp.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+        info = (await client.get("/info")).json()
+
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "texts_per_s": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "avg_batch": (info.get("batching") or {}).get("avg_batch_size", 1.0),
+    }
+
+
+def _start_service(port: int, microbatch: bool) -> subprocess.Popen:
+    env = dict(os.environ, EMBEDDING_PORT=str(port), EMBEDDING_MICROBATCH="1" if microbatch else "0")
+    proc = subprocess.Popen(
+        [sys.executable, str(SCRIPT_DIR / "embed.py"), "serve"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    deadline = time.time() + 300
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{url}/health", timeout=1.0).status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            pass
+        if proc.poll() is not None:
+            raise RuntimeError(f"embedding service on port {port} exited with {proc.returncode}")
+        time.sleep(0.5)
+    proc.kill()
+    raise RuntimeError(f"embedding service on port {port} did not start")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=os.environ.get("EMBEDDING_SERVICE_URL", "http://127.0.0.1:8602"))
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--compare", action="store_true",
+                        help="Start local services with micro-batching on and off and compare")
+    parser.add_argument("--port", type=int, default=8612, help="First port used by --compare")
+    args = parser.parse_args()
+
+    if args.compare:
+        targets = []
+        for offset, microbatch in enumerate((True, False)):
+            port = args.port + offset
+            targets.append(("batched" if microbatch else "per-request", f"http://127.0.0.1:{port}",
+                            _start_service(port, microbatch)))
+    else:
+        targets = [("service", args.url, None)]
+
+    print(f"{'mode':<12} {'p50_ms':>9} {'p99_ms':>9} {'texts/s':>10} {'avg_batch':>10}")
+    try:
+        for name, url, _ in targets:
+            stats = asyncio.run(run_load(url, args.requests, args.concurrency))
+            print(f"{name:<12} {stats['p50_ms']:>9.1f} {stats['p99_ms']:>9.1f} "
+                  f"{stats['texts_per_s']:>10.1f} {stats['avg_batch']:>10.1f}")
+    finally:
+        for _, _, proc in targets:
+            if proc is not None:
+                proc.terminate()
+                proc.wait(timeout=10)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,12 +10,14 @@ Usage:
 """
 
 import argparse
+import asyncio
+import io
 import json
 import os
 import signal
 import sys
 import time
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Optional
 
 # Lazy imports for heavy deps
@@ -23,6 +25,9 @@ _model = None
 _model_name = None
 _device = None
 
+# Binary transport: responses as NumPy .npy (float32) when the client sends this Accept type
+BINARY_MEDIA_TYPE = "application/octet-stream"
+
 
 def get_config():
     """Get configuration from environment."""
@@ -32,6 +37,10 @@ def get_config():
         "port": int(os.environ.get("EMBEDDING_PORT", "8602")),
         "host": os.environ.get("EMBEDDING_HOST", "0.0.0.0"),
         "service_url": os.environ.get("EMBEDDING_SERVICE_URL", "http://127.0.0.1:8602"),
+        "workers": int(os.environ.get("EMBEDDING_WORKERS", "1")),
+        "microbatch": os.environ.get("EMBEDDING_MICROBATCH", "1") != "0",
+        "batch_max": int(os.environ.get("EMBEDDING_BATCH_MAX", "64")),
+        "batch_wait_ms": float(os.environ.get("EMBEDDING_BATCH_WAIT_MS", "5")),
     }
 
 
@@ -76,18 +85,21 @@ def load_model():
         raise
 
 
+def encode_array(texts: list[str], show_progress_bar: bool = False):
+    """Embed texts into a float32 numpy array of shape (len(texts), dimensions)."""
+    model = load_model()
+    embeddings = model.encode(texts, convert_to_numpy=True, show_progress_bar=show_progress_bar)
+    return embeddings.astype("float32", copy=False)
+
+
 def embed_text(text: str) -> list[float]:
     """Embed a single text string."""
-    model = load_model()
-    embedding = model.encode(text, convert_to_numpy=True)
-    return embedding.tolist()
+    return encode_array([text])[0].tolist()
 
 
 def embed_batch(texts: list[str]) -> list[list[float]]:
     """Embed multiple texts."""
-    model = load_model()
-    embeddings = model.encode(texts, convert_to_numpy=True, show_progress_bar=len(texts) > 10)
-    return embeddings.tolist()
+    return encode_array(texts, show_progress_bar=len(texts) > 10).tolist()
 
 
 def get_dimensions() -> int:
@@ -123,12 +135,16 @@ def try_service_embed_batch(texts: list[str]) -> Optional[list[list[float]]]:
     
     try:
         import httpx
+        import numpy as np
         resp = httpx.post(
             f"{service_url}/embed/batch",
             json={"texts": texts},
+            headers={"Accept": BINARY_MEDIA_TYPE},
             timeout=60.0  # Longer timeout for batch
         )
         if resp.status_code == 200:
+            if resp.headers.get("content-type", "").startswith(BINARY_MEDIA_TYPE):
+                return np.load(io.BytesIO(resp.content), allow_pickle=False).tolist()
             return resp.json()["vectors"]
     except Exception:
         pass
@@ -136,6 +152,177 @@ def try_service_embed_batch(texts: list[str]) -> Optional[list[list[float]]]:
     return None
 
 
+# ============================================================================
+# Micro-batching
+# ============================================================================
+
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512)
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent encode requests into a single model.encode call.
+
+    A collector takes the first queued request, keeps gathering for up to
+    max_wait_ms or until max_batch texts, runs one encode (sentence-transformers
+    sorts the inputs by length, so each forward pass sees similar lengths) and
+    scatters the rows back to each caller. At most `concurrency` batches encode
+    at once; while they run, the next batch keeps filling.
+    """
+
+    def __init__(self, encode_fn, run_blocking, max_batch: int = 64,
+                 max_wait_ms: float = 5.0, concurrency: int = 1):
+        self.encode_fn = encode_fn
+        self.run_blocking = run_blocking
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+        self.concurrency = concurrency
+        self._queue: Optional[asyncio.Queue] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # Metrics
+        self.queued_texts = 0
+        self.requests_total = 0
+        self.texts_total = 0
+        self.batches_total = 0
+        self.max_batch_seen = 0
+        self.encode_seconds = 0.0
+        self.queue_wait_seconds = 0.0
+        self.batch_size_buckets = [0] * len(BATCH_SIZE_BUCKETS)  # cumulative (le)
+
+    def start(self):
+        self._queue = asyncio.Queue()
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._task = asyncio.get_running_loop().create_task(self._collect())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+
+    @property
+    def queue_depth(self) -> int:
+        """Requests waiting to be picked into a batch."""
+        return self._queue.qsize() if self._queue else 0
+
+    async def encode(self, texts: list[str]):
+        """Queue texts for the next batch and wait for their vectors."""
+        if not texts:
+            return await self.run_blocking(self.encode_fn, texts)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.queued_texts += len(texts)
+        self._queue.put_nowait((texts, future, loop.time()))
+        return await future
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._slots.acquire()
+            batch = [await self._queue.get()]
+            size = len(batch[0][0])
+            deadline = loop.time() + self.max_wait
+            while size < self.max_batch:
+                try:
+                    if not self._queue.empty():
+                        item = self._queue.get_nowait()
+                    else:
+                        remaining = deadline - loop.time()
+                        if remaining <= 0:
+                            break
+                        item = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                size += len(item[0])
+            loop.create_task(self._dispatch(batch))
+
+    async def _dispatch(self, batch):
+        try:
+            now = asyncio.get_running_loop().time()
+            texts = [text for item_texts, _, _ in batch for text in item_texts]
+            self.queued_texts -= len(texts)
+            self.queue_wait_seconds += sum(now - queued_at for _, _, queued_at in batch)
+
+            start = time.perf_counter()
+            try:
+                vectors = await self.run_blocking(self.encode_fn, texts)
+            except Exception as e:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            self._record(len(batch), len(texts), time.perf_counter() - start)
+
+            offset = 0
+            for item_texts, future, _ in batch:
+                if not future.done():  # caller may have disconnected
+                    future.set_result(vectors[offset:offset + len(item_texts)])
+                offset += len(item_texts)
+        finally:
+            self._slots.release()
+
+    def _record(self, requests: int, size: int, elapsed: float):
+        self.requests_total += requests
+        self.texts_total += size
+        self.batches_total += 1
+        self.max_batch_seen = max(self.max_batch_seen, size)
+        self.encode_seconds += elapsed
+        for i, bound in enumerate(BATCH_SIZE_BUCKETS):
+            if size <= bound:
+                self.batch_size_buckets[i] += 1
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "queued_texts": self.queued_texts,
+            "requests": self.requests_total,
+            "texts": self.texts_total,
+            "batches": self.batches_total,
+            "avg_batch_size": round(self.texts_total / self.batches_total, 2) if self.batches_total else 0,
+            "max_batch_size": self.max_batch_seen,
+            "avg_queue_wait_ms": round(1000 * self.queue_wait_seconds / self.requests_total, 2) if self.requests_total else 0,
+            "max_batch": self.max_batch,
+            "max_wait_ms": self.max_wait * 1000,
+        }
+
+    def prometheus_lines(self) -> list[str]:
+        lines = [
+            "# HELP embedding_queue_depth Requests waiting to be batched",
+            "# TYPE embedding_queue_depth gauge",
+            f"embedding_queue_depth {self.queue_depth}",
+            "",
+            "# HELP embedding_queued_texts Texts queued or encoding",
+            "# TYPE embedding_queued_texts gauge",
+            f"embedding_queued_texts {self.queued_texts}",
+            "",
+            "# HELP embedding_requests_total Requests served through the batcher",
+            "# TYPE embedding_requests_total counter",
+            f"embedding_requests_total {self.requests_total}",
+            "",
+            "# HELP embedding_encode_seconds_total Time spent in model.encode",
+            "# TYPE embedding_encode_seconds_total counter",
+            f"embedding_encode_seconds_total {self.encode_seconds:.6f}",
+            "",
+            "# HELP embedding_queue_wait_seconds_total Time requests spent queued",
+            "# TYPE embedding_queue_wait_seconds_total counter",
+            f"embedding_queue_wait_seconds_total {self.queue_wait_seconds:.6f}",
+            "",
+            "# HELP embedding_batch_size Texts per model.encode call",
+            "# TYPE embedding_batch_size histogram",
+        ]
+        for bound, count in zip(BATCH_SIZE_BUCKETS, self.batch_size_buckets):
+            lines.append(f'embedding_batch_size_bucket{{le="{bound}"}} {count}')
+        lines.extend([
+            f'embedding_batch_size_bucket{{le="+Inf"}} {self.batches_total}',
+            f"embedding_batch_size_sum {self.texts_total}",
+            f"embedding_batch_size_count {self.batches_total}",
+        ])
+        return lines
+
+
 # ============================================================================
 # CLI Commands
 # ============================================================================
@@ -143,21 +330,60 @@ def try_service_embed_batch(texts: list[str]) -> Optional[list[list[float]]]:
 def cmd_serve(args):
     """Start FastAPI server (runs forever until Ctrl+C)."""
     import uvicorn
-    from fastapi import FastAPI
+    import numpy as np
+    from concurrent.futures import ThreadPoolExecutor
+    from fastapi import FastAPI, Request, Response
+    from fastapi.responses import PlainTextResponse
     from pydantic import BaseModel
     
+    config = get_config()
+    # model.encode runs here so the event loop (and /health) stays responsive
+    executor = ThreadPoolExecutor(max_workers=config["workers"], thread_name_prefix="embedding")
+    
+    async def run_blocking(fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+    
+    batcher = None
+    if config["microbatch"]:
+        batcher = MicroBatcher(
+            encode_array,
+            run_blocking,
+            max_batch=config["batch_max"],
+            max_wait_ms=config["batch_wait_ms"],
+            concurrency=config["workers"],
+        )
+    
+    async def encode(texts: list[str]):
+        if batcher is not None:
+            return await batcher.encode(texts)
+        return await run_blocking(encode_array, texts)
+    
+    def npy_response(vectors) -> Response:
+        buf = io.BytesIO()
+        np.save(buf, vectors)
+        return Response(
+            content=buf.getvalue(),
+            media_type=BINARY_MEDIA_TYPE,
+            headers={"X-Embedding-Model": str(_model_name), "X-Embedding-Dimensions": str(vectors.shape[-1])}
+        )
+    
     @asynccontextmanager
     async def lifespan(app):
         """Modern FastAPI lifespan handler."""
         # Startup: pre-load model
-        load_model()
-        config = get_config()
+        await run_blocking(load_model)
+        if batcher is not None:
+            batcher.start()
+            print(f"[embedding] Micro-batching: max {batcher.max_batch} texts / {config['batch_wait_ms']}ms", file=sys.stderr)
         print(f"[embedding] Service ready on http://127.0.0.1:{config['port']}", file=sys.stderr)
         print(f"[embedding] Model: {_model_name}, Device: {_device}", file=sys.stderr)
         print(f"[embedding] Press Ctrl+C to stop", file=sys.stderr)
         yield
         # Shutdown
         print("[embedding] Shutting down...", file=sys.stderr)
+        if batcher is not None:
+            await batcher.stop()
+        executor.shutdown(wait=False)
     
     app = FastAPI(title="Embedding Service", version="1.0.0", lifespan=lifespan)
     
@@ -168,22 +394,26 @@ def cmd_serve(args):
         texts: list[str]
     
     @app.post("/embed")
-    async def embed_endpoint(req: EmbedRequest):
-        vector = embed_text(req.text)
+    async def embed_endpoint(req: EmbedRequest, request: Request):
+        vectors = await encode([req.text])
+        if BINARY_MEDIA_TYPE in request.headers.get("accept", ""):
+            return npy_response(vectors[0])
         return {
-            "vector": vector,
+            "vector": vectors[0].tolist(),
             "model": _model_name,
-            "dimensions": len(vector)
+            "dimensions": vectors.shape[1]
         }
     
     @app.post("/embed/batch")
-    async def embed_batch_endpoint(req: EmbedBatchRequest):
-        vectors = embed_batch(req.texts)
+    async def embed_batch_endpoint(req: EmbedBatchRequest, request: Request):
+        vectors = await encode(req.texts)
+        if BINARY_MEDIA_TYPE in request.headers.get("accept", ""):
+            return npy_response(vectors)
         return {
-            "vectors": vectors,
+            "vectors": vectors.tolist(),
             "model": _model_name,
             "count": len(vectors),
-            "dimensions": len(vectors[0]) if vectors else 0
+            "dimensions": vectors.shape[1] if len(vectors) else 0
         }
     
     @app.get("/info")
@@ -193,9 +423,16 @@ def cmd_serve(args):
             "model": _model_name,
             "device": _device,
             "dimensions": get_dimensions(),
+            "batching": batcher.stats() if batcher is not None else None,
             "status": "ready"
         }
     
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def prometheus_metrics() -> str:
+        """Prometheus-compatible metrics endpoint."""
+        lines = batcher.prometheus_lines() if batcher is not None else []
+        return "\n".join(lines) + "\n"
+    
     @app.get("/health")
     async def health():
         return {"status": "ok"}
@@ -204,7 +441,6 @@ def cmd_serve(args):
     async def shutdown():
         """Gracefully shutdown the service."""
         print("[embedding] Shutdown requested via API", file=sys.stderr)
-        import asyncio
         asyncio.get_event_loop().call_later(0.5, lambda: os._exit(0))
         return {"status": "shutting_down"}
     
@@ -216,11 +452,9 @@ def cmd_serve(args):
         _model = None  # Clear cached model
         _model_name = None
         _device = None
-        load_model()  # Reload
+        await run_blocking(load_model)  # Reload
         return {"status": "reloaded", "model": _model_name, "device": _device}
     
-    config = get_config()
-    
     # Handle graceful shutdown
     def handle_signal(signum, frame):
         print("\n[embedding] Received shutdown signal", file=sys.stderr)
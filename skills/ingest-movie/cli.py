@@ -13,6 +13,7 @@ from rich.console import Console
 from config import VALID_EMOTIONS, VALID_TAGS, validate_env
 from search import search_nzb, display_search_results
 from scenes import parse_subtitle_file, collect_matches, infer_emotion_from_tags
+from subindex import SubtitleIndex
 from extract import extract_video_clip, extract_audio
 from transcribe import (
     run_whisper,
@@ -172,6 +173,72 @@ def scenes_find_cmd(
             console.print(f"ffmpeg -ss {format_hms(clip_start)} -to {format_hms(clip_end)} -i '{video_file}' -c copy clip_{idx}.mkv")
 
 
+@scenes_app.command("index")
+def scenes_index_cmd(
+    library_path: Optional[Path] = typer.Option(None, "--library", "-l", help="Movie library (default: DEFAULT_MOVIE_LIBRARY)"),
+    subtitle_files: Optional[list[Path]] = typer.Option(None, "--subtitle", "-s", exists=True, help="Index only these SRTs"),
+    force: bool = typer.Option(False, "--force", help="Re-index unchanged subtitles"),
+):
+    """Build or update the library-wide subtitle index."""
+    with SubtitleIndex() as index:
+        if subtitle_files:
+            indexed = sum(index.add_subtitle(srt, force=force) for srt in subtitle_files)
+            console.print(f"[green]Indexed {indexed} of {len(subtitle_files)} subtitle file(s)[/green]")
+        else:
+            counts = index.update_library(library_path, force=force)
+            console.print(
+                f"[green]Indexed {counts['indexed']}[/green], unchanged {counts['unchanged']}, "
+                f"removed {counts['removed']}"
+            )
+        stats = index.stats()
+    console.print(f"[dim]Index: {stats['movies']} movies, {stats['entries']} entries, {stats['postings']} postings[/dim]")
+
+
+@scenes_app.command("search")
+def scenes_search_cmd(
+    query: Optional[str] = typer.Option(None, "--query", "-q", help="Phrase to match"),
+    tags: Optional[list[str]] = typer.Option(None, "--tag", "-t", help="Required tag (repeat for AND)"),
+    emotion: Optional[str] = typer.Option(None, "--emotion", "-e"),
+    movie: Optional[str] = typer.Option(None, "--movie", "-m", help="Restrict to matching movie names"),
+    window: float = typer.Option(15.0, help="Padding seconds"),
+    max_matches: int = typer.Option(10),
+    json_output: bool = typer.Option(False, "--json"),
+):
+    """Search the subtitle index across the whole library (see `scenes index`)."""
+    if not query and not tags and not emotion:
+        raise typer.BadParameter("Provide --query, --tag, or --emotion")
+    for tag in tags or []:
+        if tag.lower() not in VALID_TAGS:
+            raise typer.BadParameter(f"Unknown tag. Allowed: {sorted(VALID_TAGS)}")
+    if emotion and emotion.lower() not in VALID_EMOTIONS:
+        raise typer.BadParameter(f"Unknown emotion. Allowed: {sorted(VALID_EMOTIONS)}")
+
+    with SubtitleIndex() as index:
+        clips = index.search(query, tags or [], emotion, movie, max_matches)
+
+    for clip in clips:
+        clip["clip_start"] = round(max(0.0, clip["start"] - window), 3)
+        clip["clip_end"] = round(clip["end"] + window, 3)
+    if json_output:
+        print(json.dumps(clips, indent=2))
+        return
+    if not clips:
+        console.print("[yellow]No matches found (run `scenes index` after adding subtitles)[/yellow]")
+        return
+
+    console.print(f"[green]Found {len(clips)} clip candidate(s)[/green]")
+    for idx, clip in enumerate(clips, 1):
+        console.print(f"\n[bold]{idx}. {clip['movie']}[/bold] (score {clip['score']})")
+        console.print(f"Window: {format_seconds(clip['start'])} → {format_seconds(clip['end'])}")
+        console.print(f"Clip: {format_seconds(clip['clip_start'])} → {format_seconds(clip['clip_end'])}")
+        console.print(f"Text: {clip['text'].strip()[:100]}")
+        if clip["video_file"]:
+            console.print(
+                f"ffmpeg -ss {format_hms(clip['clip_start'])} -to {format_hms(clip['clip_end'])} "
+                f"-i '{clip['video_file']}' -c copy clip_{idx}.mkv"
+            )
+
+
 @scenes_app.command("analyze")
 def scenes_analyze_cmd(
     subtitle_file: Path = typer.Option(..., "--subtitle", "-s", exists=True),
@@ -23,6 +23,7 @@ FFMPEG_BIN = os.environ.get("FFMPEG_BIN", "/usr/bin/ffmpeg")
 # Audio intensity tagging thresholds (override via env)
 RMS_THRESHOLD = float(os.environ.get("AUDIO_RMS_THRESHOLD", "0.2"))
 RMS_WINDOW_SEC = float(os.environ.get("AUDIO_RMS_WINDOW_SEC", "0.5"))
+RMS_FRAME_SEC = float(os.environ.get("AUDIO_RMS_FRAME_SEC", "0.05"))  # envelope resolution
 
 # Radarr configuration
 RADARR_URL = os.environ.get("RADARR_URL", "http://localhost:7878")
@@ -36,6 +37,7 @@ CLIPS_DIR = SKILL_DIR / "clips"
 INVENTORY_FILE = SKILL_DIR / "inventory.json"
 INVENTORY_LOCK_FILE = SKILL_DIR / ".inventory.lock"
 DOGPILE_DIR = SKILL_DIR.parent / "dogpile"
+SUBTITLE_INDEX_DB = SKILL_DIR / "subtitle_index.db"  # library-wide subtitle search (subindex.py)
 
 # Media library paths (default, override with CLI args)
 DEFAULT_MOVIE_LIBRARY = Path("/mnt/storage12tb/media/movies")
@@ -0,0 +1,154 @@
+"""
+Movie Ingest Skill - Audio Envelope Module
+RMS envelope of an audio track, cached on disk, with fast per-segment queries.
+
+The track is read once in blocks (never whole) and reduced to one RMS value
+per RMS_FRAME_SEC frame. The float32 envelope is cached next to the
+transcript (<transcript>.rms.npz), so re-tagging a movie with new thresholds
+does not touch the audio again.
+
+Segment queries use a sparse table over sliding-window RMS: the loudest
+RMS_WINDOW_SEC window inside any segment is found in O(1), vectorized over
+all segments.
+
+Requires soundfile and numpy (callers treat ImportError as "skip tagging").
+"""
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import soundfile as sf
+
+from config import RMS_FRAME_SEC, RMS_WINDOW_SEC
+
+BLOCK_FRAMES = 1024  # envelope frames decoded per soundfile block
+
+
+# -----------------------------------------------------------------------------
+# Envelope Computation
+# -----------------------------------------------------------------------------
+def compute_rms_envelope(audio_file: Path, frame_sec: float = RMS_FRAME_SEC) -> tuple[np.ndarray, float]:
+    """
+    One pass over the audio in blocks; channels are mixed down to mono.
+
+    Returns:
+        (frame RMS as float32, actual frame length in seconds)
+    """
+    info = sf.info(str(audio_file))
+    frame_len = max(1, int(round(info.samplerate * frame_sec)))
+    parts = []
+    for block in sf.blocks(str(audio_file), blocksize=frame_len * BLOCK_FRAMES, dtype="float32", always_2d=True):
+        mono = block.mean(axis=1) if block.shape[1] > 1 else block[:, 0]
+        full = len(mono) // frame_len * frame_len
+        if full:
+            frames = mono[:full].reshape(-1, frame_len)
+            parts.append(np.sqrt(np.mean(np.square(frames, dtype=np.float64), axis=1)))
+        if full < len(mono):
+            # Only the last block can end in a partial frame
+            tail = mono[full:].astype(np.float64)
+            parts.append(np.array([np.sqrt(np.mean(tail ** 2))]))
+    rms = np.concatenate(parts).astype(np.float32) if parts else np.zeros(0, dtype=np.float32)
+    return rms, frame_len / info.samplerate
+
+
+def load_rms_envelope(
+    audio_file: Path,
+    cache_file: Optional[Path] = None,
+    frame_sec: float = RMS_FRAME_SEC,
+) -> "RmsEnvelope":
+    """
+    Envelope for an audio file, from cache_file when it matches the audio.
+
+    The cache records the audio's size and mtime and the frame length, and is
+    rebuilt when any of them changed.
+    """
+    stat = audio_file.stat()
+    source = np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+    if cache_file and cache_file.exists():
+        try:
+            with np.load(cache_file, allow_pickle=False) as cached:
+                if (np.array_equal(cached["source"], source)
+                        and np.isclose(float(cached["requested_sec"]), frame_sec)):
+                    return RmsEnvelope(cached["rms"], float(cached["frame_sec"]))
+        except (OSError, KeyError, ValueError):
+            pass
+
+    rms, actual_sec = compute_rms_envelope(audio_file, frame_sec)
+    if cache_file:
+        try:
+            # np.savez appends .npz to other suffixes; write via a handle to keep the name
+            tmp = cache_file.with_name(cache_file.name + ".tmp")
+            with open(tmp, "wb") as f:
+                np.savez(f, rms=rms, frame_sec=actual_sec, requested_sec=frame_sec, source=source)
+            tmp.replace(cache_file)
+        except OSError:
+            pass
+    return RmsEnvelope(rms, actual_sec)
+
+
+# -----------------------------------------------------------------------------
+# Range Queries
+# -----------------------------------------------------------------------------
+class RmsEnvelope:
+    """Frame RMS of a track with vectorized per-segment max-RMS lookups."""
+
+    def __init__(self, frame_rms: np.ndarray, frame_sec: float, window_sec: float = RMS_WINDOW_SEC):
+        self.frame_rms = np.asarray(frame_rms, dtype=np.float32)
+        self.frame_sec = frame_sec
+        self.window = max(1, int(round(window_sec / frame_sec)))
+
+        energy = self.frame_rms.astype(np.float64) ** 2
+        self._cumsum = np.concatenate(([0.0], np.cumsum(energy)))
+
+        # RMS of every window of `window` frames, by start frame
+        w = self.window
+        if len(energy) >= w:
+            window_rms = np.sqrt(np.maximum(self._cumsum[w:] - self._cumsum[:-w], 0.0) / w)
+        else:
+            window_rms = np.zeros(0)
+
+        # Sparse table: level k holds the max of 2**k consecutive windows
+        levels = [window_rms.astype(np.float32)]
+        span = 1
+        while span * 2 <= len(window_rms):
+            prev = levels[-1]
+            levels.append(np.maximum(prev[:-span], prev[span:]))
+            span *= 2
+        self._table = levels
+
+    def __len__(self) -> int:
+        return len(self.frame_rms)
+
+    def _range_max(self, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """Max window RMS over window starts [lo, hi) (hi > lo), per query."""
+        out = np.zeros(len(lo), dtype=np.float32)
+        k = np.floor(np.log2(hi - lo)).astype(np.int64)
+        for level in np.unique(k):
+            sel = k == level
+            table = self._table[level]
+            out[sel] = np.maximum(table[lo[sel]], table[hi[sel] - (1 << level)])
+        return out
+
+    def max_rms(self, starts, ends) -> np.ndarray:
+        """
+        Loudest RMS_WINDOW_SEC window RMS inside each [start, end) segment, in seconds.
+
+        Segments no longer than one window get their overall RMS; empty or
+        out-of-range segments get NaN.
+        """
+        n = len(self.frame_rms)
+        starts = np.asarray(starts, dtype=np.float64)
+        ends = np.asarray(ends, dtype=np.float64)
+        a = np.clip(np.floor(starts / self.frame_sec), 0, n).astype(np.int64)
+        b = np.clip(np.ceil(ends / self.frame_sec), 0, n).astype(np.int64)
+        length = b - a
+
+        out = np.full(len(starts), np.nan, dtype=np.float32)
+        short = (length > 0) & (length <= self.window)
+        if short.any():
+            total = self._cumsum[b[short]] - self._cumsum[a[short]]
+            out[short] = np.sqrt(np.maximum(total, 0.0) / length[short])
+        long_ = length > self.window
+        if long_.any():
+            out[long_] = self._range_max(a[long_], b[long_] - self.window + 1)
+        return out
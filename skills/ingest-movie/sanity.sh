@@ -12,6 +12,8 @@ echo "Testing ingest-movie modular CLI..."
 "$SCRIPT_DIR"/run.sh scenes extract --help >/dev/null && echo "✓ scenes extract --help"
 "$SCRIPT_DIR"/run.sh scenes analyze --help >/dev/null && echo "✓ scenes analyze --help"
 "$SCRIPT_DIR"/run.sh scenes quality --help >/dev/null && echo "✓ scenes quality --help"
+"$SCRIPT_DIR"/run.sh scenes index --help >/dev/null && echo "✓ scenes index --help"
+"$SCRIPT_DIR"/run.sh scenes search --help >/dev/null && echo "✓ scenes search --help"
 
 # Batch subcommands
 "$SCRIPT_DIR"/run.sh batch discover --help >/dev/null && echo "✓ batch discover --help"
@@ -14,7 +14,6 @@ from config import (
     EMOTION_TAG_MAP,
     TAG_TO_EMOTION,
     RMS_THRESHOLD,
-    RMS_WINDOW_SEC,
     VALID_TAGS,
     VALID_EMOTIONS,
 )
@@ -67,17 +66,19 @@ def extract_subtitle_tags(text: str) -> list[str]:
     return sorted(tags)
 
 
-def parse_subtitle_file(path: Path) -> list[dict]:
+def parse_subtitle_file(path: Path, verbose: bool = True) -> list[dict]:
     """
     Parse an SRT file into a list of entries with start, end, text, and tags.
     Uses encoding fallback chain for robustness.
+    Set verbose=False to skip the encoding and summary lines (bulk indexing).
     """
     if path.suffix.lower() != ".srt":
         raise ValueError("Only .srt subtitles are supported")
 
     try:
         content, encoding = read_file_with_encoding_fallback(path)
-        console.print(f"[dim]Read subtitle with encoding: {encoding}[/dim]")
+        if verbose:
+            console.print(f"[dim]Read subtitle with encoding: {encoding}[/dim]")
     except ValueError as e:
         console.print(f"[red]Failed to read subtitle file: {e}[/red]")
         return []
@@ -130,10 +131,11 @@ def parse_subtitle_file(path: Path) -> list[dict]:
     if buffer:
         flush_block(buffer)
 
-    console.print(
-        f"[dim]Subtitle parse summary: total={total}, valid={len(entries)}, "
-        f"malformed={malformed}, inverted={inverted}[/dim]"
-    )
+    if verbose:
+        console.print(
+            f"[dim]Subtitle parse summary: total={total}, valid={len(entries)}, "
+            f"malformed={malformed}, inverted={inverted}[/dim]"
+        )
     return entries
 
 
@@ -197,14 +199,33 @@ def attach_tags_to_segments(segments: list[dict], entries: list[dict]) -> None:
             seg["tags"] = sorted(set(seg["tags"]) | seg_tags)
 
 
-def attach_audio_intensity_tags(audio_file: Path, segments: list[dict]) -> set[str]:
+def intensity_tags_for_rms(rms_max: float, threshold: float = RMS_THRESHOLD) -> set[str]:
+    """Intensity tags for a segment's peak windowed RMS."""
+    if rms_max > threshold * 2:
+        return {"rage_candidate"}
+    if rms_max > threshold:
+        return {"anger_candidate"}
+    if rms_max < 0.05:
+        return {"whisper_candidate"}
+    return set()
+
+
+def attach_audio_intensity_tags(
+    audio_file: Path,
+    segments: list[dict],
+    envelope_cache: Optional[Path] = None,
+    threshold: float = RMS_THRESHOLD,
+) -> set[str]:
     """
     Analyze audio RMS levels and tag segments with intensity markers.
     Requires soundfile and numpy.
+
+    The RMS envelope is computed once per audio file (see envelope.py) and
+    cached at envelope_cache, so re-tagging with another threshold only
+    re-runs the per-segment lookups.
     """
     try:
-        import soundfile as sf
-        import numpy as np
+        from envelope import load_rms_envelope
     except ImportError:
         console.print("[yellow]soundfile or numpy not installed; skipping audio intensity tagging.[/yellow]")
         return set()
@@ -212,41 +233,21 @@ def attach_audio_intensity_tags(audio_file: Path, segments: list[dict]) -> set[s
     if not audio_file.exists():
         return set()
 
-    intensity_tags = set()
     try:
-        data, sr = sf.read(audio_file)
+        envelope = load_rms_envelope(audio_file, envelope_cache)
     except Exception as e:
         console.print(f"[yellow]Failed to read audio for intensity tagging: {e}[/yellow]")
         return set()
 
-    if getattr(data, "ndim", 1) > 1:
-        data = data.mean(axis=1)
+    starts = [seg.get("start", 0.0) for seg in segments]
+    ends = [seg.get("start", 0.0) + seg.get("duration", 0.0) for seg in segments]
+    peaks = envelope.max_rms(starts, ends)
 
-    window_size = int(sr * RMS_WINDOW_SEC)
-
-    for seg in segments:
-        start = seg.get("start", 0.0)
-        end = start + seg.get("duration", 0.0)
-        start_idx = max(0, int(start * sr))
-        end_idx = min(len(data), int(end * sr))
-        if end_idx <= start_idx:
+    intensity_tags = set()
+    for seg, rms_max in zip(segments, peaks.tolist()):
+        if rms_max != rms_max:  # NaN: empty or outside the track
             continue
-        segment_audio = data[start_idx:end_idx]
-        if len(segment_audio) <= window_size:
-            rms = float(np.sqrt(np.mean(segment_audio ** 2))) if len(segment_audio) else 0.0
-            rms_max = rms
-        else:
-            windows = [segment_audio[i:i+window_size] for i in range(0, len(segment_audio), window_size)]
-            rms_max = max(float(np.sqrt(np.mean(w ** 2))) for w in windows if len(w))
-
-        segment_tags = set()
-        if rms_max > RMS_THRESHOLD * 2:
-            segment_tags.add("rage_candidate")
-        elif rms_max > RMS_THRESHOLD:
-            segment_tags.add("anger_candidate")
-        elif rms_max < 0.05:
-            segment_tags.add("whisper_candidate")
-
+        segment_tags = intensity_tags_for_rms(rms_max, threshold)
         if segment_tags:
             intensity_tags.update(segment_tags)
             seg.setdefault("tags", [])
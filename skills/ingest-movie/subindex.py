@@ -0,0 +1,325 @@
+"""
+Movie Ingest Skill - Subtitle Index Module
+On-disk inverted index over every subtitle entry in the movie library.
+
+`scenes find` re-parses and scans one SRT per call. The index parses each
+movie's subtitle once and stores postings in SQLite (subtitle_index.db):
+
+    w:<token>    positional postings, for phrase queries
+    t:<tag>      cue tags from extract_subtitle_tags
+    e:<emotion>  emotions whose EMOTION_TAG_MAP tags the entry carries
+
+Each posting points at an entry row carrying (movie, entry index, start, end),
+so library-wide queries return clip candidates without reading any SRT.
+Subtitles are re-indexed only when their size or mtime changed, and
+download_subtitles indexes new files as they land.
+"""
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from rich.console import Console
+
+from config import DEFAULT_MOVIE_LIBRARY, EMOTION_TAG_MAP, SUBTITLE_INDEX_DB
+from scenes import parse_subtitle_file
+from utils import find_media_file, find_subtitle_file
+
+console = Console()
+
+MERGE_GAP_SEC = 2.0  # matching entries closer than this form one clip (as collect_matches)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+(?:'[a-z0-9]+)*")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS movies (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    subtitle_file TEXT NOT NULL UNIQUE,
+    video_file TEXT,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    movie_id INTEGER NOT NULL REFERENCES movies(id) ON DELETE CASCADE,
+    idx INTEGER NOT NULL,
+    start REAL NOT NULL,
+    end REAL NOT NULL,
+    text TEXT NOT NULL,
+    tags TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_movie ON entries (movie_id, start);
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    entry_id INTEGER NOT NULL REFERENCES entries(id) ON DELETE CASCADE,
+    pos INTEGER NOT NULL,
+    PRIMARY KEY (term, entry_id, pos)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_entry ON postings (entry_id);
+"""
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word tokens, keeping inner apostrophes (don't, o'neill)."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def emotions_for_tags(tags: Iterable[str]) -> set[str]:
+    """Emotions whose EMOTION_TAG_MAP contains any of the tags."""
+    tags = {t.lower() for t in tags}
+    return {
+        emotion for emotion, emotion_tags in EMOTION_TAG_MAP.items()
+        if tags & {t.lower() for t in emotion_tags}
+    }
+
+
+class SubtitleIndex:
+    """SQLite-backed inverted index of subtitle entries across movies."""
+
+    def __init__(self, db_file: Path = SUBTITLE_INDEX_DB):
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_file, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA foreign_keys=ON")
+        self.conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "SubtitleIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Indexing
+    # -------------------------------------------------------------------------
+    def add_subtitle(
+        self,
+        subtitle_file: Path,
+        name: Optional[str] = None,
+        video_file: Optional[Path] = None,
+        force: bool = False,
+    ) -> bool:
+        """
+        Index one subtitle file, replacing its previous postings.
+
+        Returns:
+            True if the file was (re)indexed, False if it was unchanged
+        """
+        subtitle_file = subtitle_file.resolve()
+        stat = subtitle_file.stat()
+        row = self.conn.execute(
+            "SELECT id, size, mtime_ns FROM movies WHERE subtitle_file = ?", (str(subtitle_file),)
+        ).fetchone()
+        if row and not force and row[1] == stat.st_size and row[2] == stat.st_mtime_ns:
+            return False
+
+        entries = parse_subtitle_file(subtitle_file, verbose=False)
+        name = name or subtitle_file.parent.name
+        if video_file is None:
+            video_file = find_media_file(subtitle_file.parent)
+
+        with self.conn:
+            if row:
+                self.conn.execute("DELETE FROM movies WHERE id = ?", (row[0],))
+            movie_id = self.conn.execute(
+                "INSERT INTO movies (name, subtitle_file, video_file, size, mtime_ns, indexed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (name, str(subtitle_file), str(video_file) if video_file else None,
+                 stat.st_size, stat.st_mtime_ns, time.time()),
+            ).lastrowid
+            for idx, entry in enumerate(entries):
+                entry_id = self.conn.execute(
+                    "INSERT INTO entries (movie_id, idx, start, end, text, tags) VALUES (?, ?, ?, ?, ?, ?)",
+                    (movie_id, idx, entry["start"], entry["end"], entry["text"], json.dumps(entry["tags"])),
+                ).lastrowid
+                postings = {(f"w:{tok}", pos) for pos, tok in enumerate(tokenize(entry["text"]))}
+                postings |= {(f"t:{tag.lower()}", 0) for tag in entry["tags"]}
+                postings |= {(f"e:{emotion}", 0) for emotion in emotions_for_tags(entry["tags"])}
+                self.conn.executemany(
+                    "INSERT INTO postings (term, entry_id, pos) VALUES (?, ?, ?)",
+                    [(term, entry_id, pos) for term, pos in postings],
+                )
+        return True
+
+    def remove_subtitle(self, subtitle_file: Path) -> None:
+        """Drop a subtitle file and its postings from the index."""
+        with self.conn:
+            self.conn.execute("DELETE FROM movies WHERE subtitle_file = ?", (str(subtitle_file),))
+
+    def update_library(self, library_path: Optional[Path] = None, force: bool = False) -> Dict[str, int]:
+        """
+        Bring the index in line with a library: index new or changed
+        subtitles and drop movies whose subtitle is gone.
+
+        Returns:
+            Counts of indexed, unchanged and removed movies
+        """
+        library = (library_path or DEFAULT_MOVIE_LIBRARY).resolve()
+        counts = {"indexed": 0, "unchanged": 0, "removed": 0}
+        seen: set[str] = set()
+        if library.exists():
+            for movie_dir in sorted(library.iterdir()):
+                if not movie_dir.is_dir():
+                    continue
+                srt = find_subtitle_file(movie_dir, prefer_sdh=True)
+                if not srt:
+                    continue
+                seen.add(str(srt.resolve()))
+                try:
+                    changed = self.add_subtitle(srt, name=movie_dir.name, force=force)
+                except (OSError, ValueError) as e:
+                    console.print(f"[yellow]Skipping {srt.name}: {e}[/yellow]")
+                    continue
+                counts["indexed" if changed else "unchanged"] += 1
+
+        prefix = str(library) + "/"
+        for (subtitle_file,) in self.conn.execute("SELECT subtitle_file FROM movies").fetchall():
+            if subtitle_file.startswith(prefix) and subtitle_file not in seen:
+                self.remove_subtitle(Path(subtitle_file))
+                counts["removed"] += 1
+        return counts
+
+    def stats(self) -> Dict[str, int]:
+        """Number of indexed movies, entries and postings."""
+        return {
+            table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("movies", "entries", "postings")
+        }
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+    def _phrase_sql(self, tokens: list[str]) -> tuple[str, list[str]]:
+        """Entries containing the tokens at consecutive positions.
+
+        The join is driven from the longest token, usually the rarest, so
+        common words ("you", "the") only probe the (term, entry, pos) key.
+        """
+        anchor = max(range(len(tokens)), key=lambda i: len(tokens[i]))
+        others = [i for i in range(len(tokens)) if i != anchor]
+        joins = "".join(
+            f" JOIN postings p{i} ON p{i}.term = ? AND p{i}.entry_id = pa.entry_id"
+            f" AND p{i}.pos = pa.pos + {i - anchor}"
+            for i in others
+        )
+        params = [f"w:{tokens[i]}" for i in others] + [f"w:{tokens[anchor]}"]
+        return f"SELECT DISTINCT pa.entry_id FROM postings pa{joins} WHERE pa.term = ?", params
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        tags: Iterable[str] = (),
+        emotion: Optional[str] = None,
+        movie: Optional[str] = None,
+        max_results: int = 10,
+        merge_adjacent: bool = True,
+    ) -> list[dict]:
+        """
+        Ranked clip candidates across the library.
+
+        Args:
+            query: Phrase that must appear in the entry (word-token match)
+            tags: Tags that must all be present (conjunction)
+            emotion: Emotion whose tags must be present (any of them)
+            movie: Restrict to movies whose name contains this
+            max_results: Number of clips to return
+            merge_adjacent: Merge matching entries within MERGE_GAP_SEC
+
+        Returns:
+            Clips sorted by score: movie, subtitle_file, video_file, start,
+            end, text, tags, entries (matching entry count) and score
+        """
+        tags = [t.lower() for t in tags]
+        selects: list[str] = []
+        params: list[Any] = []
+        tokens = tokenize(query) if query else []
+        if query and not tokens:
+            return []
+        if tokens:
+            sql, phrase_params = self._phrase_sql(tokens)
+            selects.append(sql)
+            params += phrase_params
+        for tag in tags:
+            selects.append("SELECT entry_id FROM postings WHERE term = ?")
+            params.append(f"t:{tag}")
+        if emotion:
+            selects.append("SELECT entry_id FROM postings WHERE term = ?")
+            params.append(f"e:{emotion.lower()}")
+        if not selects:
+            raise ValueError("Provide a query, tags or an emotion")
+
+        sql = (
+            "SELECT e.movie_id, m.name, m.subtitle_file, m.video_file, e.start, e.end, e.text, e.tags "
+            "FROM entries e JOIN movies m ON m.id = e.movie_id "
+            f"WHERE e.id IN ({' INTERSECT '.join(selects)})"
+        )
+        if movie:
+            sql += " AND m.name LIKE ?"
+            params.append(f"%{movie}%")
+        sql += " ORDER BY e.movie_id, e.start"
+        rows = self.conn.execute(sql, params).fetchall()
+
+        wanted = set(tags)
+        if emotion:
+            wanted |= {t.lower() for t in EMOTION_TAG_MAP.get(emotion.lower(), set())}
+
+        clips: list[dict] = []
+        for movie_id, name, subtitle_file, video_file, start, end, text, tags_json in rows:
+            entry_tags = set(json.loads(tags_json))
+            weight = 1 + len(entry_tags & wanted)
+            last = clips[-1] if clips else None
+            if (merge_adjacent and last and last["_movie_id"] == movie_id
+                    and start - last["end"] <= MERGE_GAP_SEC):
+                last["end"] = max(last["end"], end)
+                last["text"] = f"{last['text']} {text}".strip()
+                last["tags"] = sorted(set(last["tags"]) | entry_tags)
+                last["entries"] += 1
+                last["score"] += weight
+                continue
+            clips.append({
+                "_movie_id": movie_id,
+                "movie": name,
+                "subtitle_file": subtitle_file,
+                "video_file": video_file,
+                "start": start,
+                "end": end,
+                "text": text,
+                "tags": sorted(entry_tags),
+                "entries": 1,
+                "score": weight,
+            })
+
+        clips.sort(key=lambda c: (-c["score"], c["movie"], c["start"]))
+        for clip in clips:
+            del clip["_movie_id"]
+        return clips[:max_results]
+
+
+def index_movie_dir(movie_dir: Path) -> bool:
+    """
+    Reindex one movie directory in the default index (e.g. after a download).
+
+    The subtitle is chosen with find_subtitle_file, as update_library does, and
+    any other subtitle previously indexed from the directory is dropped.
+
+    Returns:
+        True if the chosen subtitle was (re)indexed
+    """
+    movie_dir = movie_dir.resolve()
+    srt = find_subtitle_file(movie_dir, prefer_sdh=True)
+    with SubtitleIndex() as index:
+        chosen = str(srt.resolve()) if srt else None
+        for (subtitle_file,) in index.conn.execute("SELECT subtitle_file FROM movies").fetchall():
+            if subtitle_file != chosen and Path(subtitle_file).parent == movie_dir:
+                index.remove_subtitle(Path(subtitle_file))
+        if not srt:
+            return False
+        return index.add_subtitle(srt, name=movie_dir.name)
@@ -64,9 +64,11 @@ def download_subtitles(
                 candidate = video_path.with_suffix(ext)
                 if candidate.exists():
                     console.print(f"[green]Downloaded: {candidate.name}[/green]")
+                    _index_movie_dir(video_path.parent)
                     return candidate
 
             console.print(f"[green]Downloaded subtitle (check video directory)[/green]")
+            _index_movie_dir(video_path.parent)
             return srt_path
 
         console.print(f"[yellow]No subtitles found for {video_path.name}[/yellow]")
@@ -77,6 +79,15 @@ def download_subtitles(
         return None
 
 
+def _index_movie_dir(movie_dir: Path) -> None:
+    """Reindex a movie directory in the library subtitle index after a download."""
+    try:
+        from subindex import index_movie_dir
+        index_movie_dir(movie_dir)
+    except Exception as e:
+        console.print(f"[yellow]Subtitle index not updated: {e}[/yellow]")
+
+
 def batch_download_subtitles(
     directory: Path,
     language: str = "en",
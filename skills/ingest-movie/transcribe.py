@@ -203,7 +203,9 @@ def create_persona_json(
     subtitle_tag_set = {tag for entry in subtitle_entries for tag in entry["tags"]}
 
     # Attach audio intensity tags
-    audio_tag_set = attach_audio_intensity_tags(audio_file, formatted_segments)
+    audio_tag_set = attach_audio_intensity_tags(
+        audio_file, formatted_segments, envelope_cache=transcript_json.with_suffix(".rms.npz")
+    )
     aggregate_tags = sorted(subtitle_tag_set | audio_tag_set)
 
     # Compute ToM-aligned emotional dimensions
@@ -22,6 +22,7 @@ from youtube_transcripts.config import (
     BATCH_DELAY_MAX,
     BACKOFF_BASE,
     BACKOFF_MAX,
+    WHISPER_WORKERS,
 )
 from youtube_transcripts.utils import (
     extract_video_id,
@@ -362,6 +363,7 @@ def batch(
     max_videos: int = typer.Option(0, "--max", "-n", help="Max videos (0 = all)"),
     backoff_base: int = typer.Option(BACKOFF_BASE, "--backoff-base", help="Base backoff"),
     backoff_max: int = typer.Option(BACKOFF_MAX, "--backoff-max", help="Max backoff"),
+    whisper_workers: int = typer.Option(WHISPER_WORKERS, "--whisper-workers", help="Concurrent Whisper jobs"),
 ):
     """Batch process YouTube videos with proxy and exponential backoff."""
     run_batch(
@@ -376,6 +378,7 @@ def batch(
         max_videos=max_videos,
         backoff_base=backoff_base,
         backoff_max=backoff_max,
+        whisper_workers=whisper_workers,
     )
 
 
@@ -39,6 +39,7 @@ def get_status(output_dir: str) -> dict:
         "current_method": state.get("current_method", ""),
         "last_updated": state.get("last_updated", ""),
         "consecutive_failures": state.get("consecutive_failures", 0),
+        "pipeline": state.get("pipeline", {}),
     }
 
 
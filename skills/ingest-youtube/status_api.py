@@ -70,6 +70,7 @@ def get_job_status(output_dir: str) -> dict:
         "current_method": state.get("current_method", ""),
         "last_updated": state.get("last_updated", ""),
         "consecutive_failures": state.get("consecutive_failures", 0),
+        "pipeline": state.get("pipeline", {}),
     }
 
 
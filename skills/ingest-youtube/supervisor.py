@@ -140,6 +140,7 @@ class BatchJob:
     max_restarts: int = 10
     last_restart: float = 0
     hung_timeout: int = 1800  # 30 min default - consider hung if no progress
+    whisper_workers: int = 2
     _completed_history: list = field(default_factory=list)  # (timestamp, count) for rate calc
     _last_progress_time: float = field(default_factory=time.time)
     _last_completed_count: int = 0
@@ -166,8 +167,9 @@ class BatchJob:
 
     @property
     def completed_videos(self) -> int:
-        state = self._read_state()
-        return len(state.get("completed", []))
+        completed = self._read_state().get("completed", 0)
+        # Progress-journal headers store a count; legacy state files a list
+        return len(completed) if isinstance(completed, list) else completed
 
     @property
     def stats(self) -> dict:
@@ -185,6 +187,11 @@ class BatchJob:
         state = self._read_state()
         return state.get("current_method", "")
 
+    @property
+    def pipeline(self) -> dict:
+        """Throughput and per-stage queue depth written by the batch pipeline."""
+        return self._read_state().get("pipeline", {})
+
     @property
     def last_updated(self) -> str:
         state = self._read_state()
@@ -295,6 +302,7 @@ class BatchJob:
             "--backoff-base", "60",
             "--backoff-max", "900",
             "--whisper",
+            "--whisper-workers", str(self.whisper_workers),
             "--resume",
         ]
 
@@ -435,11 +443,14 @@ class Supervisor:
             else:
                 status = "[yellow]○ Stop[/]"
 
-            # Current video/method
+            # Current video/method (Whisper jobs run alongside caption fetching)
             current = job.current_video
             method = job.current_method
-            if current:
-                if method == "whisper":
+            whisper_active = job.pipeline.get("whisper_active", {})
+            if whisper_active and not current:
+                current_str = f"[magenta]🎤 x{len(whisper_active)}[/]"
+            elif current:
+                if method in ("whisper", "queued-whisper"):
                     current_str = f"[magenta]🎤 {current[:11]}[/]"
                 elif method == "proxy":
                     current_str = f"[yellow]🔄 {current[:11]}[/]"
@@ -632,6 +643,7 @@ def multi(
             delay_max=job_cfg.get("delay_max", 60),
             max_restarts=job_cfg.get("max_restarts", 10),
             hung_timeout=job_cfg.get("hung_timeout", 1800),  # 30 min default
+            whisper_workers=job_cfg.get("whisper_workers", 2),
         ))
 
     supervisor = Supervisor(jobs)
@@ -662,6 +674,7 @@ def status(
     completed = len([f for f in json_files if f.name != ".batch_state.json"])
 
     stats = state.get("stats", {})
+    pipeline = state.get("pipeline", {})
     result = {
         "output_dir": str(output_dir),
         "completed": completed,
@@ -670,6 +683,7 @@ def status(
         "current_method": state.get("current_method", ""),
         "last_updated": state.get("last_updated", "unknown"),
         "consecutive_failures": state.get("consecutive_failures", 0),
+        "pipeline": pipeline,
     }
 
     if json_output:
@@ -678,12 +692,19 @@ def status(
         current = state.get("current_video", "")
         method = state.get("current_method", "")
         current_str = f"{current} ({method})" if current else "idle"
+        throughput = pipeline.get("throughput", {})
+        depth = pipeline.get("queue_depth", {})
+        rate_str = " | ".join(f"{stage} {throughput.get(stage, 0)}/h" for stage in ("captions", "whisper", "metadata"))
+        queue_str = " | ".join(f"{stage} {depth.get(stage, 0)}" for stage in ("captions", "whisper", "metadata"))
 
         console.print(Panel(
             f"""[bold]Batch Status: {output_dir}[/]
 
 Completed: [cyan]{completed}[/]
 Current:   [yellow]{current_str}[/]
+Whisper:   [magenta]{len(pipeline.get('whisper_active', {}))} active[/] / {pipeline.get('whisper_workers', 0)} workers
+Rate:      {rate_str}
+Queued:    {queue_str}
 Success:   [green]{stats.get('success', 0)}[/]
 Failed:    [red]{stats.get('failed', 0)}[/]
 Whisper:   [magenta]{stats.get('whisper', 0)}[/]
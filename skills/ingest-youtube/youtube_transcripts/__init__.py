@@ -18,6 +18,7 @@ from youtube_transcripts.utils import (
 )
 from youtube_transcripts.downloader import (
     fetch_video_metadata,
+    fetch_videos_metadata,
     search_videos,
     download_audio,
 )
@@ -43,6 +44,7 @@ __all__ = [
     "is_rate_limit_error",
     # Downloader
     "fetch_video_metadata",
+    "fetch_videos_metadata",
     "search_videos",
     "download_audio",
     # Transcriber
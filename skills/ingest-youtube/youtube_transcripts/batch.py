@@ -4,12 +4,31 @@ This module handles bulk transcript fetching with:
 - Resume capability via state file
 - Exponential backoff on rate limits
 - Smart delays based on method used
+
+Videos flow through a staged pipeline so a slow Whisper job never holds up
+cheap caption fetches:
+
+    captions  (main thread)   fetch with backoff, then the smart delay
+        |  no captions
+        v
+    whisper   (worker pool)   download audio + transcribe, fed by a bounded
+        |                     queue (caption fetching pauses while it is full)
+        v
+    metadata  (one thread)    metadata fetched in batches, then results saved
+                              and the video marked completed
+
+Throughput and per-stage queue depth are written to the state file header
+(`pipeline`) for the supervisor.
 """
 from __future__ import annotations
 
+import queue
 import random
+import threading
 import time
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 
 import typer
 
@@ -19,9 +38,13 @@ from youtube_transcripts.config import (
     EXTENDED_BREAK_DURATION,
     SMART_DELAY_DIRECT,
     SMART_DELAY_PROXY,
+    WHISPER_WORKERS,
+    WHISPER_QUEUE_SIZE,
+    METADATA_BATCH_SIZE,
+    METADATA_BATCH_WAIT,
 )
 from youtube_transcripts.utils import is_rate_limit_error
-from youtube_transcripts.downloader import fetch_video_metadata
+from youtube_transcripts.downloader import fetch_videos_metadata
 from youtube_transcripts.transcriber import (
     fetch_single_transcript_with_backoff,
     transcribe_with_whisper_fallback,
@@ -33,6 +56,22 @@ from youtube_transcripts.formatter import (
     print_batch_summary,
 )
 
+# Pipeline stages, in order
+STAGES = ("captions", "whisper", "metadata")
+
+
+@dataclass
+class _Video:
+    """A video moving through the pipeline."""
+    vid: str
+    idx: int
+    out_file: Path
+    transcript: list = field(default_factory=list)
+    full_text: str = ""
+    method: Optional[str] = None
+    error: Optional[str] = None
+    took_ms: int = 0
+
 
 def run_batch(
     input_path: Path,
@@ -46,6 +85,7 @@ def run_batch(
     max_videos: int,
     backoff_base: int,
     backoff_max: int,
+    whisper_workers: int = WHISPER_WORKERS,
 ) -> None:
     """Run batch processing of YouTube videos.
 
@@ -61,6 +101,7 @@ def run_batch(
         max_videos: Maximum videos to process (0 = all)
         backoff_base: Base backoff delay (seconds)
         backoff_max: Maximum backoff delay (seconds)
+        whisper_workers: Concurrent Whisper download + transcription jobs
     """
     if not input_path.exists():
         typer.echo(f"Error: Input file not found: {input_path}", err=True)
@@ -99,116 +140,327 @@ def run_batch(
     proxy_status = "IPRoyal proxy" if use_proxy else "direct (no proxy)"
     typer.echo(f"Processing {total} videos via {proxy_status}", err=True)
     typer.echo(f"Delay: {delay_min}-{delay_max}s | Backoff: {backoff_base}-{backoff_max}s", err=True)
+    if not no_whisper:
+        typer.echo(f"Whisper workers: {max(1, whisper_workers)}", err=True)
 
-    for idx, vid in enumerate(pending, 1):
-        _process_single_video(
-            vid=vid,
-            idx=idx,
-            total=total,
-            output_path=output_path,
-            lang=lang,
-            use_proxy=use_proxy,
-            no_whisper=no_whisper,
-            resume=resume,
-            backoff_base=backoff_base,
-            backoff_max=backoff_max,
-            delay_min=delay_min,
-            delay_max=delay_max,
-            state_manager=state_manager,
-        )
+    pipeline = BatchPipeline(
+        output_path=output_path,
+        lang=lang,
+        use_proxy=use_proxy,
+        no_whisper=no_whisper,
+        resume=resume,
+        backoff_base=backoff_base,
+        backoff_max=backoff_max,
+        delay_min=delay_min,
+        delay_max=delay_max,
+        state_manager=state_manager,
+        whisper_workers=whisper_workers,
+    )
+    pipeline.run(pending)
 
     print_batch_summary(state_manager.stats, output_path)
+    if pipeline.errors:
+        typer.echo(f"{len(pipeline.errors)} metadata/save errors (see pipeline.errors in .batch_state.json); "
+                   "rerun with --resume to retry unsaved videos", err=True)
 
 
-def _process_single_video(
-    vid: str,
-    idx: int,
-    total: int,
-    output_path: Path,
-    lang: str,
-    use_proxy: bool,
-    no_whisper: bool,
-    resume: bool,
-    backoff_base: int,
-    backoff_max: int,
-    delay_min: int,
-    delay_max: int,
-    state_manager: BatchStateManager,
-) -> None:
-    """Process a single video in batch mode."""
-    typer.echo(f"\n[{idx}/{total}] Processing: {vid}", err=True)
-    state_manager.save(vid, "fetching")
-
-    out_file = output_path / f"{vid}.json"
-    if out_file.exists() and resume:
-        typer.echo(f"  Skipping (already exists): {out_file}", err=True)
-        state_manager.mark_completed(vid)
-        state_manager.record_skipped()
-        return
-
-    t0 = time.time()
-
-    # Fetch with backoff
-    transcript, full_text, method, error = fetch_single_transcript_with_backoff(
-        vid, lang, use_proxy, backoff_base, backoff_max
-    )
+class BatchPipeline:
+    """Caption fetching, Whisper fallback and metadata/saving as concurrent stages."""
 
-    # Try Whisper fallback if enabled
-    if not method and not no_whisper:
-        typer.echo(f"  Trying Whisper fallback...", err=True)
-        state_manager.save(vid, "whisper")
-        transcript, full_text, method, whisper_error = transcribe_with_whisper_fallback(
-            vid, lang, use_local=True
-        )
-        if not method:
-            error = whisper_error
+    def __init__(
+        self,
+        output_path: Path,
+        lang: str,
+        use_proxy: bool,
+        no_whisper: bool,
+        resume: bool,
+        backoff_base: int,
+        backoff_max: int,
+        delay_min: int,
+        delay_max: int,
+        state_manager: BatchStateManager,
+        whisper_workers: int = WHISPER_WORKERS,
+        whisper_queue_size: int = WHISPER_QUEUE_SIZE,
+        metadata_batch_size: int = METADATA_BATCH_SIZE,
+        metadata_batch_wait: float = METADATA_BATCH_WAIT,
+    ):
+        self.output_path = output_path
+        self.lang = lang
+        self.use_proxy = use_proxy
+        self.no_whisper = no_whisper
+        self.resume = resume
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.delay_min = delay_min
+        self.delay_max = delay_max
+        self.state_manager = state_manager
+        self.whisper_workers = 0 if no_whisper else max(1, whisper_workers)
+        self.metadata_batch_size = max(1, metadata_batch_size)
+        self.metadata_batch_wait = metadata_batch_wait
 
-    took_ms = int((time.time() - t0) * 1000)
-    metadata = fetch_video_metadata(vid)
+        self.whisper_queue: queue.Queue = queue.Queue(maxsize=max(1, whisper_queue_size))
+        self.metadata_queue: queue.Queue = queue.Queue()
 
-    result = build_result(
-        vid=vid,
-        lang=lang,
-        took_ms=took_ms,
-        method=method,
-        transcript=transcript,
-        full_text=full_text,
-        errors=[error] if error else [],
-        metadata=metadata,
-    )
+        # Pipeline counters, guarded by state_manager.lock
+        self.total = 0
+        self.started = time.time()
+        self.captions_pending = 0
+        self.current_vid = ""
+        self.current_method = ""
+        self.whisper_active: dict[str, float] = {}  # vid -> start time
+        self.metadata_pending = 0  # waiting in the queue or the current batch
+        self.done = {stage: 0 for stage in STAGES}
+        self.errors: list[dict] = []  # videos the metadata stage failed to save
+
+    # =========================================================================
+    # RUN
+    # =========================================================================
+
+    def run(self, vids: list[str]) -> None:
+        """Process videos through all stages and wait for the last result."""
+        self.total = len(vids)
+        self.started = time.time()
+        self.captions_pending = len(vids)
+
+        workers = [
+            threading.Thread(target=self._whisper_worker, name=f"whisper-{i + 1}", daemon=True)
+            for i in range(self.whisper_workers)
+        ]
+        saver = threading.Thread(target=self._metadata_stage, name="metadata", daemon=True)
+        for t in workers + [saver]:
+            t.start()
+
+        for idx, vid in enumerate(vids, 1):
+            self._fetch_captions(_Video(vid, idx, self.output_path / f"{vid}.json"), last=idx == len(vids))
+
+        # Drain: Whisper workers first, then the metadata stage
+        for _ in workers:
+            self.whisper_queue.put(None)
+        for t in workers:
+            t.join()
+        self.metadata_queue.put(None)
+        saver.join()
+        self._set_current("", "")
 
-    save_json(result, out_file)
+    # =========================================================================
+    # STAGE 1: CAPTIONS (main thread, rate limited)
+    # =========================================================================
 
-    if method:
-        typer.echo(f"  Success ({method}, {took_ms}ms): {out_file.name}", err=True)
-        state_manager.record_success(method)
-    else:
-        if error and is_rate_limit_error(error):
-            typer.echo(f"  Rate limited: {error[:80]}...", err=True)
-            state_manager.record_failure(is_rate_limit=True)
+    def _fetch_captions(self, video: _Video, last: bool) -> None:
+        """Fetch one video's captions, hand it on, then apply the smart delay."""
+        typer.echo(f"\n[{video.idx}/{self.total}] Processing: {video.vid}", err=True)
+        self._set_current(video.vid, "fetching")
+
+        if video.out_file.exists() and self.resume:
+            typer.echo(f"  Skipping (already exists): {video.out_file}", err=True)
+            with self.state_manager.lock:
+                self.captions_pending -= 1
+                self.state_manager.mark_completed(video.vid)
+                self.state_manager.record_skipped()
+            self._save()
+            return
+
+        t0 = time.time()
+        transcript, full_text, method, error = fetch_single_transcript_with_backoff(
+            video.vid, self.lang, self.use_proxy, self.backoff_base, self.backoff_max
+        )
+        video.transcript, video.full_text, video.method, video.error = transcript, full_text, method, error
+        video.took_ms = int((time.time() - t0) * 1000)
+        self.state_manager.record_caption_fetch(
+            is_rate_limit=not method and bool(error) and is_rate_limit_error(error)
+        )
+
+        with self.state_manager.lock:
+            self.captions_pending -= 1
+            self.done["captions"] += 1
+
+        if not method and self.whisper_workers:
+            typer.echo(f"  No captions, queued for Whisper ({self.whisper_queue.qsize()} waiting)", err=True)
+            self._set_current(video.vid, "queued-whisper")
+            # Blocks while the Whisper queue is full, so fetching cannot run away
+            self.whisper_queue.put(video)
         else:
-            typer.echo(f"  Failed: {error[:80] if error else 'Unknown'}...", err=True)
-            state_manager.record_failure(is_rate_limit=False)
-
-    state_manager.mark_completed(vid)
-    state_manager.save("", "")
-
-    # Check for too many consecutive rate limits
-    if state_manager.consecutive_failures >= CONSECUTIVE_FAILURE_THRESHOLD:
-        typer.echo(f"\n  WARNING: {state_manager.consecutive_failures} consecutive rate limits!", err=True)
-        typer.echo(f"  Taking extended break ({EXTENDED_BREAK_DURATION // 60} min)...", err=True)
-        time.sleep(EXTENDED_BREAK_DURATION)
-        state_manager.consecutive_failures = 0
-
-    # Delay before next (except for last)
-    if idx < total:
-        if method == "direct":
-            actual_delay = random.randint(*SMART_DELAY_DIRECT)
-        elif method == "proxy":
-            actual_delay = random.randint(*SMART_DELAY_PROXY)
+            self._to_metadata(video)
+        self._save()
+
+        # Check for too many consecutive rate limits
+        if self.state_manager.consecutive_failures >= CONSECUTIVE_FAILURE_THRESHOLD:
+            typer.echo(f"\n  WARNING: {self.state_manager.consecutive_failures} consecutive rate limits!", err=True)
+            typer.echo(f"  Taking extended break ({EXTENDED_BREAK_DURATION // 60} min)...", err=True)
+            self._set_current("", "break")
+            time.sleep(EXTENDED_BREAK_DURATION)
+            with self.state_manager.lock:
+                self.state_manager.consecutive_failures = 0
+
+        # Delay before next (except for last)
+        if not last:
+            if method == "direct":
+                actual_delay = random.randint(*SMART_DELAY_DIRECT)
+            elif method == "proxy":
+                actual_delay = random.randint(*SMART_DELAY_PROXY)
+            else:
+                delay = random.randint(self.delay_min, self.delay_max)
+                jitter = random.uniform(0.9, 1.1)
+                actual_delay = int(delay * jitter)
+            typer.echo(f"  Waiting {actual_delay}s before next...", err=True)
+            self._set_current("", "waiting")
+            time.sleep(actual_delay)
+
+    # =========================================================================
+    # STAGE 2: WHISPER (worker pool)
+    # =========================================================================
+
+    def _whisper_worker(self) -> None:
+        while True:
+            video = self.whisper_queue.get()
+            if video is None:
+                return
+            with self.state_manager.lock:
+                self.whisper_active[video.vid] = time.time()
+            self._save()
+
+            typer.echo(f"  [{video.vid}] Trying Whisper fallback...", err=True)
+            t0 = time.time()
+            try:
+                transcript, full_text, method, whisper_error = transcribe_with_whisper_fallback(
+                    video.vid, self.lang, use_local=True
+                )
+            except Exception as e:
+                transcript, full_text, method, whisper_error = [], "", None, f"Whisper error: {e}"
+            video.took_ms += int((time.time() - t0) * 1000)
+            if method:
+                video.transcript, video.full_text, video.method, video.error = transcript, full_text, method, None
+            else:
+                video.error = whisper_error
+
+            with self.state_manager.lock:
+                self.whisper_active.pop(video.vid, None)
+                self.done["whisper"] += 1
+            self._to_metadata(video)
+
+    # =========================================================================
+    # STAGE 3: METADATA + SAVE (one thread)
+    # =========================================================================
+
+    def _to_metadata(self, video: _Video) -> None:
+        with self.state_manager.lock:
+            self.metadata_pending += 1
+        self.metadata_queue.put(video)
+
+    def _metadata_stage(self) -> None:
+        """Collect finished videos and fetch their metadata in batches."""
+        batch: list[_Video] = []
+        batch_started = 0.0
+        while True:
+            timeout = None
+            if batch:
+                timeout = max(0.0, batch_started + self.metadata_batch_wait - time.time())
+            try:
+                video = self.metadata_queue.get(timeout=timeout)
+            except queue.Empty:
+                video = False  # partial batch waited long enough
+
+            if video:
+                if not batch:
+                    batch_started = time.time()
+                batch.append(video)
+                if len(batch) < self.metadata_batch_size:
+                    continue
+            if batch:
+                try:
+                    self._save_batch(batch)
+                except Exception as e:
+                    # Keep the stage alive; the failed videos stay pending for --resume
+                    self._record_error("", f"Metadata batch failed: {e}")
+                batch = []
+            if video is None:
+                return
+
+    def _save_batch(self, batch: list[_Video]) -> None:
+        """Fetch metadata for a batch, then save and record each result."""
+        try:
+            metadata = fetch_videos_metadata([v.vid for v in batch])
+        except Exception:
+            metadata = {}
+
+        for video in batch:
+            try:
+                self._save_video(video, metadata.get(video.vid, {}))
+            except Exception as e:
+                self._record_error(video.vid, f"Save failed: {e}")
+            with self.state_manager.lock:
+                self.metadata_pending -= 1
+        self._save()
+
+    def _save_video(self, video: _Video, metadata: dict) -> None:
+        """Save one result and mark the video completed."""
+        result = build_result(
+            vid=video.vid,
+            lang=self.lang,
+            took_ms=video.took_ms,
+            method=video.method,
+            transcript=video.transcript,
+            full_text=video.full_text,
+            errors=[video.error] if video.error else [],
+            metadata=metadata,
+        )
+        save_json(result, video.out_file)
+
+        method, error = video.method, video.error
+        if method:
+            typer.echo(f"  Success ({method}, {video.took_ms}ms): {video.out_file.name}", err=True)
+            self.state_manager.record_success(method)
+        elif error and is_rate_limit_error(error):
+            typer.echo(f"  Rate limited: {video.vid}: {error[:80]}...", err=True)
+            self.state_manager.record_failure(is_rate_limit=True)
         else:
-            delay = random.randint(delay_min, delay_max)
-            jitter = random.uniform(0.9, 1.1)
-            actual_delay = int(delay * jitter)
-        typer.echo(f"  Waiting {actual_delay}s before next...", err=True)
-        time.sleep(actual_delay)
+            typer.echo(f"  Failed: {video.vid}: {error[:80] if error else 'Unknown'}...", err=True)
+            self.state_manager.record_failure(is_rate_limit=False)
+
+        with self.state_manager.lock:
+            self.state_manager.mark_completed(video.vid)
+            self.done["metadata"] += 1
+
+    def _record_error(self, vid: str, error: str) -> None:
+        """Log a metadata-stage failure and keep it in the pipeline status."""
+        typer.echo(f"  ERROR: {vid + ': ' if vid else ''}{error}", err=True)
+        self.state_manager.record_failure(is_rate_limit=False)
+        with self.state_manager.lock:
+            self.errors.append({"vid": vid, "error": error, "at": time.strftime("%Y-%m-%d %H:%M:%S")})
+
+    # =========================================================================
+    # STATE
+    # =========================================================================
+
+    def _set_current(self, vid: str, method: str) -> None:
+        with self.state_manager.lock:
+            self.current_vid, self.current_method = vid, method
+        self._save()
+
+    def _save(self) -> None:
+        with self.state_manager.lock:
+            self.state_manager.save(self.current_vid, self.current_method, pipeline=self.status())
+
+    def status(self) -> dict:
+        """Throughput (videos/hour) and queue depth per stage."""
+        with self.state_manager.lock:
+            hours = max(time.time() - self.started, 1.0) / 3600
+            now = time.time()
+            return {
+                "total": self.total,
+                "started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started)),
+                "throughput": {
+                    stage: round(self.done[stage] / hours, 1) for stage in STAGES
+                },
+                "queue_depth": {
+                    "captions": self.captions_pending,
+                    "whisper": self.whisper_queue.qsize(),
+                    "metadata": self.metadata_pending,
+                },
+                "done": dict(self.done),
+                "whisper_workers": self.whisper_workers,
+                "whisper_active": {
+                    vid: int(now - since) for vid, since in self.whisper_active.items()
+                },
+                "errors": list(self.errors),
+            }
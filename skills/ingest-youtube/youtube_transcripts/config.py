@@ -14,8 +14,8 @@ from typing import Optional, TypedDict
 # Path Configuration
 # ============================================================================
 
-# Skills directory (parent of youtube-transcripts)
-SKILLS_DIR = Path(__file__).resolve().parents[1]
+# Skills directory (parent of ingest-youtube)
+SKILLS_DIR = Path(__file__).resolve().parents[2]
 
 # Ensure skills dir is in path for imports
 if str(SKILLS_DIR) not in sys.path:
@@ -143,6 +143,13 @@ EXTENDED_BREAK_DURATION = 900  # 15 minutes
 SMART_DELAY_DIRECT = (2, 5)
 SMART_DELAY_PROXY = (5, 15)
 
+# Pipeline stages (see batch.py): captions are fetched one video at a time
+# under the delays above; videos without captions queue for Whisper workers
+WHISPER_WORKERS = 2  # concurrent audio download + transcription jobs
+WHISPER_QUEUE_SIZE = 4  # caption fetching pauses while this many are waiting
+METADATA_BATCH_SIZE = 10  # videos per yt-dlp metadata session
+METADATA_BATCH_WAIT = 30  # seconds before a partial metadata batch is fetched
+
 
 # ============================================================================
 # Rate Limiting Detection
@@ -1,7 +1,7 @@
 """Video and audio download functionality for youtube-transcripts skill.
 
 This module handles:
-- Video metadata fetching via yt-dlp
+- Video metadata fetching via yt-dlp (single or batched)
 - Video search via yt-dlp
 - Audio download for Whisper transcription
 """
@@ -28,10 +28,23 @@ def fetch_video_metadata(vid: str) -> dict:
         Dictionary with title, channel, upload_date, duration_sec, description, view_count.
         Empty dict on failure.
     """
+    return fetch_videos_metadata([vid]).get(vid, {})
+
+
+def fetch_videos_metadata(vids: list[str]) -> dict[str, dict]:
+    """Fetch metadata for several videos in one yt-dlp session.
+
+    Args:
+        vids: YouTube video IDs
+
+    Returns:
+        Dictionary of video ID -> metadata (as fetch_video_metadata).
+        Videos whose metadata could not be fetched map to an empty dict.
+    """
     try:
         import yt_dlp
     except ImportError:
-        return {}
+        return {vid: {} for vid in vids}
 
     ydl_opts = {
         "quiet": True,
@@ -40,23 +53,30 @@ def fetch_video_metadata(vid: str) -> dict:
         "skip_download": True,
     }
 
+    results: dict[str, dict] = {}
     try:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(
-                f"https://www.youtube.com/watch?v={vid}",
-                download=False
-            )
-            return {
-                "title": info.get("title", ""),
-                "channel": info.get("uploader", ""),
-                "upload_date": info.get("upload_date", ""),
-                "duration_sec": info.get("duration", 0),
-                "description": info.get("description", ""),
-                "view_count": info.get("view_count", 0),
-            }
+            for vid in vids:
+                try:
+                    info = ydl.extract_info(
+                        f"https://www.youtube.com/watch?v={vid}",
+                        download=False
+                    )
+                except Exception:
+                    # Silent fail on metadata
+                    results[vid] = {}
+                    continue
+                results[vid] = {
+                    "title": info.get("title", ""),
+                    "channel": info.get("uploader", ""),
+                    "upload_date": info.get("upload_date", ""),
+                    "duration_sec": info.get("duration", 0),
+                    "description": info.get("description", ""),
+                    "view_count": info.get("view_count", 0),
+                }
     except Exception:
-        # Silent fail on metadata
-        return {}
+        pass
+    return {vid: results.get(vid, {}) for vid in vids}
 
 
 def search_videos(query: str, max_results: int = 5) -> list[dict]:
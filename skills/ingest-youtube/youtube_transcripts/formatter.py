@@ -8,12 +8,22 @@ This module handles:
 from __future__ import annotations
 
 import json
-import time
+import sys
+import threading
 from pathlib import Path
 from typing import Optional, Any
 
+from youtube_transcripts.config import SKILLS_DIR
 from youtube_transcripts.utils import format_duration, truncate_text
 
+# Optional shared progress-journal writer (lives with task-monitor)
+try:
+    if str(SKILLS_DIR / "task-monitor") not in sys.path:
+        sys.path.append(str(SKILLS_DIR / "task-monitor"))
+    from progress_journal import ProgressJournal
+except ImportError:
+    ProgressJournal = None
+
 
 def build_result(
     vid: Optional[str],
@@ -172,8 +182,47 @@ def save_json(data: dict, path: Path, indent: int = 2) -> None:
         json.dump(data, f, ensure_ascii=False, indent=indent)
 
 
+class _JsonState:
+    """Plain JSON state file with the full completed list (no task-monitor).
+
+    Same interface as ProgressJournal, in the legacy format it migrates from.
+    """
+
+    def __init__(self, state_file: Path):
+        self.state_file = Path(state_file)
+        self.completed: set[str] = set()
+        self.fields: dict[str, Any] = {}
+
+    def load(self) -> bool:
+        if not self.state_file.exists():
+            return False
+        with open(self.state_file) as f:
+            self.fields = json.load(f)
+        completed = self.fields.pop("completed", [])
+        self.completed = set(completed) if isinstance(completed, list) else set()
+        return True
+
+    def mark_completed(self, item_id: str) -> None:
+        self.completed.add(str(item_id))
+
+    def save(self, **fields: Any) -> None:
+        self.fields.update(fields)
+        tmp = self.state_file.with_name(self.state_file.name + ".tmp")
+        save_json({**self.fields, "completed": sorted(self.completed)}, tmp)
+        tmp.replace(self.state_file)
+
+
 class BatchStateManager:
-    """Manages batch processing state for resume capability."""
+    """Manages batch processing state for resume capability.
+
+    State is a progress journal (see task-monitor/progress_journal.py): a small
+    header that is rewritten on save, plus an append-only log of completed IDs,
+    so saving no longer rewrites the whole completed list. Without task-monitor
+    it falls back to a plain JSON file holding the full list.
+
+    Methods may be called from the batch pipeline's stage threads; updates and
+    saves are serialized by `lock`.
+    """
 
     def __init__(self, state_file: Path):
         """Initialize batch state manager.
@@ -182,7 +231,7 @@ class BatchStateManager:
             state_file: Path to state file
         """
         self.state_file = state_file
-        self.completed: set[str] = set()
+        self.journal = ProgressJournal(state_file) if ProgressJournal else _JsonState(state_file)
         self.stats = {
             "success": 0,
             "failed": 0,
@@ -191,6 +240,12 @@ class BatchStateManager:
             "whisper": 0,
         }
         self.consecutive_failures = 0
+        self.lock = threading.RLock()
+
+    @property
+    def completed(self) -> set[str]:
+        """IDs of completed videos."""
+        return self.journal.completed
 
     def load(self) -> bool:
         """Load state from file.
@@ -198,39 +253,38 @@ class BatchStateManager:
         Returns:
             True if state was loaded, False otherwise
         """
-        if not self.state_file.exists():
-            return False
-
         try:
-            with open(self.state_file) as f:
-                state = json.load(f)
-                self.completed = set(state.get("completed", []))
-                self.stats = state.get("stats", self.stats)
-                self.consecutive_failures = state.get("consecutive_failures", 0)
-            return True
+            if not self.journal.load():
+                return False
         except Exception:
             return False
+        self.stats = self.journal.fields.get("stats", self.stats)
+        self.consecutive_failures = self.journal.fields.get("consecutive_failures", 0)
+        return True
 
     def save(
         self,
         current_vid: str = "",
         current_method: str = "",
+        pipeline: Optional[dict] = None,
     ) -> None:
         """Save current state to file.
 
         Args:
-            current_vid: Currently processing video ID
+            current_vid: Video ID currently fetching captions
             current_method: Current processing method
+            pipeline: Throughput and per-stage queue depth (batch pipeline)
         """
-        with open(self.state_file, 'w') as f:
-            json.dump({
-                "completed": list(self.completed),
-                "stats": self.stats,
-                "consecutive_failures": self.consecutive_failures,
-                "last_updated": time.strftime("%Y-%m-%d %H:%M:%S"),
-                "current_video": current_vid,
-                "current_method": current_method,
-            }, f, indent=2)
+        fields: dict[str, Any] = {
+            "stats": self.stats,
+            "consecutive_failures": self.consecutive_failures,
+            "current_video": current_vid,
+            "current_method": current_method,
+        }
+        if pipeline is not None:
+            fields["pipeline"] = pipeline
+        with self.lock:
+            self.journal.save(**fields)
 
     def mark_completed(self, vid: str) -> None:
         """Mark a video as completed.
@@ -238,7 +292,8 @@ class BatchStateManager:
         Args:
             vid: Video ID
         """
-        self.completed.add(vid)
+        with self.lock:
+            self.journal.mark_completed(vid)
 
     def is_completed(self, vid: str) -> bool:
         """Check if video is already completed.
@@ -257,10 +312,10 @@ class BatchStateManager:
         Args:
             method: Method used (direct, proxy, whisper-local, whisper-api)
         """
-        self.stats["success"] += 1
-        if "whisper" in method:
-            self.stats["whisper"] += 1
-        self.consecutive_failures = 0
+        with self.lock:
+            self.stats["success"] += 1
+            if "whisper" in method:
+                self.stats["whisper"] += 1
 
     def record_failure(self, is_rate_limit: bool = False) -> None:
         """Record a failed transcript fetch.
@@ -268,16 +323,31 @@ class BatchStateManager:
         Args:
             is_rate_limit: Whether the failure was due to rate limiting
         """
-        if is_rate_limit:
-            self.stats["rate_limited"] += 1
-            self.consecutive_failures += 1
-        else:
-            self.stats["failed"] += 1
-            self.consecutive_failures = 0
+        with self.lock:
+            if is_rate_limit:
+                self.stats["rate_limited"] += 1
+            else:
+                self.stats["failed"] += 1
+
+    def record_caption_fetch(self, is_rate_limit: bool) -> None:
+        """Track consecutive rate-limited caption fetches (for extended breaks).
+
+        Counted when captions are fetched rather than when the video's result
+        is recorded, which may be after a Whisper fallback.
+
+        Args:
+            is_rate_limit: Whether the caption fetch was rate limited
+        """
+        with self.lock:
+            if is_rate_limit:
+                self.consecutive_failures += 1
+            else:
+                self.consecutive_failures = 0
 
     def record_skipped(self) -> None:
         """Record a skipped video (already exists)."""
-        self.stats["skipped"] += 1
+        with self.lock:
+            self.stats["skipped"] += 1
 
 
 def print_search_results_table(results: list[dict], query: str) -> None:
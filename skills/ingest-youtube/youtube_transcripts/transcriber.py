@@ -12,6 +12,7 @@ import os
 import time
 import random
 import tempfile
+import threading
 from pathlib import Path
 from typing import Optional, Any
 
@@ -40,8 +41,9 @@ from youtube_transcripts.utils import (
 from youtube_transcripts.downloader import download_audio
 
 
-# Cache for local Whisper model (avoid reloading)
+# Cache for local Whisper model (avoid reloading); batch Whisper workers share it
 _LOCAL_WHISPER_MODEL = None
+_LOCAL_WHISPER_LOCK = threading.Lock()
 
 
 def fetch_transcript_with_retry(
@@ -219,24 +221,25 @@ def transcribe_whisper_local(
         return [], "", "faster-whisper not installed. Run: pip install faster-whisper"
 
     try:
-        # Load model (cached after first load)
-        if _LOCAL_WHISPER_MODEL is None:
-            typer.echo(f"    Loading faster-whisper model '{model_size}' (first time only)...", err=True)
-            # Use GPU with float16 for speed, fall back to CPU with int8
-            try:
-                _LOCAL_WHISPER_MODEL = WhisperModel(
-                    model_size,
-                    device=WHISPER_GPU_DEVICE,
-                    compute_type=WHISPER_GPU_COMPUTE_TYPE
-                )
-                typer.echo(f"    Using GPU (CUDA) with {WHISPER_GPU_COMPUTE_TYPE}", err=True)
-            except Exception:
-                _LOCAL_WHISPER_MODEL = WhisperModel(
-                    model_size,
-                    device=WHISPER_CPU_DEVICE,
-                    compute_type=WHISPER_CPU_COMPUTE_TYPE
-                )
-                typer.echo(f"    Using CPU with {WHISPER_CPU_COMPUTE_TYPE}", err=True)
+        # Load model (cached after first load, once across worker threads)
+        with _LOCAL_WHISPER_LOCK:
+            if _LOCAL_WHISPER_MODEL is None:
+                typer.echo(f"    Loading faster-whisper model '{model_size}' (first time only)...", err=True)
+                # Use GPU with float16 for speed, fall back to CPU with int8
+                try:
+                    _LOCAL_WHISPER_MODEL = WhisperModel(
+                        model_size,
+                        device=WHISPER_GPU_DEVICE,
+                        compute_type=WHISPER_GPU_COMPUTE_TYPE
+                    )
+                    typer.echo(f"    Using GPU (CUDA) with {WHISPER_GPU_COMPUTE_TYPE}", err=True)
+                except Exception:
+                    _LOCAL_WHISPER_MODEL = WhisperModel(
+                        model_size,
+                        device=WHISPER_CPU_DEVICE,
+                        compute_type=WHISPER_CPU_COMPUTE_TYPE
+                    )
+                    typer.echo(f"    Using CPU with {WHISPER_CPU_COMPUTE_TYPE}", err=True)
 
         # Transcribe - faster-whisper returns a generator
         segments_gen, info = _LOCAL_WHISPER_MODEL.transcribe(
@@ -14,12 +14,14 @@ from daemon import SchedulerDaemon, stop_daemon
 from executor import run_job
 from job_registry import (
     load_jobs,
+    get_job,
     register_job,
     unregister_job,
     set_job_enabled,
-    update_job_run_status,
     import_from_yaml,
 )
+from log_store import list_run_ids, tail_lines, tail_run_log
+from run_history import record_run_start, record_run_end
 from report import generate_report_data, print_report_json, print_report_rich, print_report_plain
 from utils import (
     rprint,
@@ -108,6 +110,8 @@ def cmd_register(args: Namespace) -> None:
             workdir=args.workdir,
             description=args.description,
             enabled=args.enabled,
+            priority=args.priority,
+            resources=args.resources,
         )
         print(f"Registered job: {args.name}")
         if args.json:
@@ -196,18 +200,27 @@ def cmd_list(args: Namespace) -> None:
 
 def cmd_run(args: Namespace) -> None:
     """Run a job immediately."""
-    jobs = load_jobs()
+    job = get_job(args.name)
 
-    if args.name not in jobs:
+    if job is None:
         print(f"Job not found: {args.name}")
         sys.exit(1)
 
-    job = jobs[args.name]
     print(f"Running job: {args.name}")
-    result = run_job(job)
-
-    # Update metadata
-    update_job_run_status(args.name, result["status"], result.get("duration"))
+    run_id = record_run_start(args.name)
+    result = run_job(job, run_id=run_id)
+
+    # Record the run and update metadata
+    record_run_end(
+        run_id,
+        result["status"],
+        exit_code=result.get("exit_code"),
+        duration=result.get("duration"),
+        output_bytes=result.get("output_bytes"),
+        cpu_user=result.get("cpu_user"),
+        cpu_system=result.get("cpu_system"),
+        max_rss_bytes=result.get("max_rss_bytes"),
+    )
 
     if args.json:
         print(json.dumps(result, indent=2))
@@ -234,17 +247,20 @@ def cmd_disable(args: Namespace) -> None:
 def cmd_logs(args: Namespace) -> None:
     """Show job logs."""
     if args.name:
+        lines = args.lines or 50
+        run_ids = list_run_ids(args.name)
+        if run_ids:
+            # Output of the most recent run
+            print(tail_run_log(args.name, run_ids[-1], lines)["logs"], end="")
+            return
+
         log_file = LOG_DIR / f"{args.name}.log"
         if not log_file.exists():
             print(f"No logs for: {args.name}")
             return
 
-        lines = args.lines or 50
-        # Read last N lines
-        with open(log_file) as f:
-            all_lines = f.readlines()
-            for line in all_lines[-lines:]:
-                print(line, end="")
+        found, _ = tail_lines(log_file, lines)
+        print(b"".join(found).decode("utf-8", "replace"), end="")
     else:
         # List all log files
         for log_file in sorted(LOG_DIR.glob("*.log")):
@@ -280,7 +296,7 @@ def cmd_load(args: Namespace) -> None:
     yaml_path = Path(args.file)
 
     try:
-        loaded, skipped = import_from_yaml(yaml_path, args.include_disabled)
+        loaded, skipped = import_from_yaml(yaml_path, args.include_disabled, replace=args.replace)
     except Exception as e:
         rprint(f"[red]Error loading {yaml_path}:[/red] {e}")
         sys.exit(1)
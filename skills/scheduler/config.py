@@ -13,7 +13,8 @@ from threading import Lock
 # ============================================================================
 
 DATA_DIR = Path(os.getenv("SCHEDULER_DATA_DIR", Path.home() / ".pi" / "scheduler"))
-JOBS_FILE = DATA_DIR / "jobs.json"
+JOBS_FILE = DATA_DIR / "jobs.json"  # legacy; imported into DB_FILE on first use
+DB_FILE = DATA_DIR / "scheduler.db"
 PID_FILE = Path(os.getenv("SCHEDULER_PID_FILE", DATA_DIR / "scheduler.pid"))
 PORT_FILE = DATA_DIR / ".port"
 LOG_DIR = DATA_DIR / "logs"
@@ -24,6 +25,26 @@ LOG_DIR = DATA_DIR / "logs"
 
 DEFAULT_METRICS_PORT = int(os.getenv("SCHEDULER_METRICS_PORT", "8610"))
 
+# Days of per-run history kept in DB_FILE
+RUN_HISTORY_DAYS = float(os.getenv("SCHEDULER_RUN_HISTORY_DAYS", "30"))
+
+# Per-run output segments (see log_store.py)
+LOG_SEGMENT_BYTES = int(os.getenv("SCHEDULER_LOG_SEGMENT_BYTES", str(4 * 1024 * 1024)))
+LOG_MAX_SEGMENTS = int(os.getenv("SCHEDULER_LOG_MAX_SEGMENTS", "8"))
+LOG_RUNS_PER_JOB = int(os.getenv("SCHEDULER_LOG_RUNS_PER_JOB", "50"))
+
+# Resource pools jobs are admitted against (see job_queue.py), and what a job
+# without a 'resources' entry needs
+RESOURCE_POOLS = os.getenv("SCHEDULER_RESOURCES", "gpu=1,cpu=4,net=8")
+DEFAULT_JOB_RESOURCES = os.getenv("SCHEDULER_DEFAULT_RESOURCES", "cpu=1")
+# A pending job gains one priority level per this many seconds of waiting, so
+# frequent high-priority jobs cannot starve others (0 disables aging)
+PRIORITY_AGING_SECONDS = float(os.getenv("SCHEDULER_PRIORITY_AGING", "600"))
+
+# Runs missed by up to this many seconds (daemon busy or restarting) still fire,
+# coalesced into one
+MISFIRE_GRACE_SECONDS = int(os.getenv("SCHEDULER_MISFIRE_GRACE", "300"))
+
 # ============================================================================
 # Global Runtime State
 # ============================================================================
@@ -34,6 +55,7 @@ class RunningJob(TypedDict, total=False):
     started: float
     progress: str
     command: str
+    queue_wait: float
 
 RunningJobs = dict[str, RunningJob]
 
@@ -44,7 +66,7 @@ class MetricsCounters(TypedDict):
     jobs_timeout: int
 
 # Running jobs state (for progress tracking)
-# Format: {job_name: {"started": timestamp, "progress": str, "command": str}}
+# Format: {job_name: {"started": timestamp, "progress": str, "command": str, "queue_wait": float}}
 RUNNING_JOBS: RunningJobs = {}
 RUNNING_JOBS_LOCK = Lock()
 
@@ -9,11 +9,14 @@ import sys
 import time
 from typing import Any, Optional, TYPE_CHECKING
 
-from config import PID_FILE, DEFAULT_METRICS_PORT, set_start_time
+from config import PID_FILE, DEFAULT_METRICS_PORT, MISFIRE_GRACE_SECONDS, set_start_time
 from cron_parser import parse_interval
 from executor import job_wrapper
-from job_registry import load_jobs
+from job_metrics import JOB_METRICS
+from job_queue import JobQueue, format_resources, set_job_queue
+from job_registry import get_job, load_jobs
 from metrics_server import start_metrics_server
+from run_history import get_run_stats, prune_run_history
 from utils import ensure_dirs, rprint, HAS_APSCHEDULER
 
 if HAS_APSCHEDULER:
@@ -33,6 +36,7 @@ class SchedulerDaemon:
         self.scheduler: Optional[Any] = None
         self.running = False
         self.metrics_server: Optional["UvicornServer"] = None
+        self.queue: Optional[JobQueue] = None
 
     def start(self, metrics_port: int = DEFAULT_METRICS_PORT) -> None:
         """
@@ -70,11 +74,23 @@ class SchedulerDaemon:
         # Start metrics server
         self.metrics_server = start_metrics_server(metrics_port)
 
+        # Drop run history past the retention window
+        pruned = prune_run_history()
+        if pruned:
+            print(f"[scheduler] Pruned {pruned} old run records")
+
+        # Triggers enqueue; the queue starts jobs as their resources free up
+        self.queue = JobQueue(lambda name, wait: job_wrapper(name, queue_wait=wait))
+        set_job_queue(self.queue)
+        self.queue.start()
+        rprint(f"[green][scheduler][/green] Resource pools: {format_resources(self.queue.capacity)}")
+
         # Setup scheduler
         self.scheduler = BackgroundScheduler()
 
         # Load and schedule all enabled jobs
         jobs = load_jobs()
+        JOB_METRICS.seed(jobs, get_run_stats())
         for name, job in jobs.items():
             if job.get("enabled", True):
                 try:
@@ -118,14 +134,31 @@ class SchedulerDaemon:
             return
 
         self.scheduler.add_job(
-            job_wrapper,
+            self._enqueue,
             trigger=trigger,
             args=[name],
             id=name,
             replace_existing=True,
+            coalesce=True,
+            max_instances=1,
+            misfire_grace_time=MISFIRE_GRACE_SECONDS,
         )
         print(f"[scheduler] Scheduled: {name}")
 
+    def _enqueue(self, name: str) -> None:
+        """
+        APScheduler callback: queue a job to run when its resources are free.
+
+        Args:
+            name: Job name.
+        """
+        job = get_job(name)
+        if job is None:
+            rprint(f"[yellow][scheduler][/yellow] Job not found: {name}")
+            return
+        if not self.queue.submit(job):
+            rprint(f"[yellow][scheduler][/yellow] {name} still queued; trigger coalesced")
+
     def _shutdown(self, signum: int, frame: Any) -> None:
         """
         Handle shutdown signal.
@@ -141,6 +174,9 @@ class SchedulerDaemon:
         """Cleanup on exit."""
         if self.scheduler:
             self.scheduler.shutdown(wait=False)
+        if self.queue:
+            self.queue.stop()
+            set_job_queue(None)
         if PID_FILE.exists():
             PID_FILE.unlink()
         print("[scheduler] Stopped")
@@ -3,15 +3,21 @@ Job executor - handles job execution with progress tracking and logging.
 
 Provides both interactive (with Rich progress) and background execution modes.
 """
+import os
+import signal
 import subprocess
+import sys
 import threading
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Optional
 
 from config import LOG_DIR, RUNNING_JOBS, METRICS_COUNTERS, RUNNING_JOBS_LOCK, METRICS_LOCK
-from job_registry import load_jobs, update_job_run_status
+from job_metrics import JOB_METRICS
+from job_registry import get_job
+from log_store import RunLogWriter
+from run_history import record_run_start, record_run_end
 from utils import (
     ensure_dirs,
     rprint,
@@ -24,16 +30,22 @@ if HAS_RICH:
     from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
 
 
-def run_job(job: dict[str, Any], show_progress: bool = True) -> dict[str, Any]:
+def run_job(job: dict[str, Any], show_progress: bool = True, run_id: Optional[int] = None) -> dict[str, Any]:
     """
     Execute a job and return result with optional progress display.
 
+    Output is streamed to the run's log segments (see log_store.py) rather than
+    buffered in memory.
+
     Args:
         job: Job dictionary with 'name', 'command', and optional 'workdir', 'timeout'.
         show_progress: Whether to show Rich progress indicator.
+        run_id: Run history id used to name the output log (defaults to a timestamp).
 
     Returns:
-        Result dictionary with 'status', 'exit_code', and 'duration'.
+        Result dictionary with 'status', 'exit_code', 'duration', 'output_bytes',
+        'run_id', and the job's 'cpu_user'/'cpu_system' seconds and 'max_rss_bytes'
+        (None where wait4 is unavailable; no RSS for timed-out runs).
     """
     name = job["name"]
     command = job["command"]
@@ -43,138 +55,239 @@ def run_job(job: dict[str, Any], show_progress: bool = True) -> dict[str, Any]:
     ensure_dirs()
     log_file = LOG_DIR / f"{name}.log"
     start_time = datetime.now()
+    if run_id is None:
+        run_id = int(time.time() * 1000)
+    writer = RunLogWriter(name, run_id)
 
     # Rich progress context
     if show_progress and HAS_RICH and console:
-        result = _run_with_progress(name, command, workdir, timeout, log_file, start_time)
+        status, returncode, usage = _run_with_progress(name, command, workdir, timeout, writer)
     else:
-        result = _run_simple(name, command, workdir, timeout, log_file, start_time)
+        status, returncode, usage = _execute(command, workdir, timeout, writer)
 
-    return result
+    writer.close(status=status, exit_code=returncode)
+    _write_log(log_file, name, command, workdir, status, returncode, start_time, writer)
 
+    return {
+        "status": status,
+        "exit_code": returncode,
+        "duration": (datetime.now() - start_time).total_seconds(),
+        "output_bytes": writer.bytes_written,
+        "run_id": run_id,
+        **usage,
+    }
 
-def _run_with_progress(
-    name: str,
-    command: str,
-    workdir: str,
-    timeout: int,
-    log_file: Path,
-    start_time: datetime,
-) -> dict[str, Any]:
-    """Run a job with Rich progress display."""
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TimeElapsedColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task(f"[cyan]Running {name}...", total=None)
 
-        stdout_lines: list[str] = []
-        stderr_lines: list[str] = []
-        process: subprocess.Popen | None = None
-        stdout_thread: threading.Thread | None = None
-        stderr_thread: threading.Thread | None = None
+_NO_USAGE: dict[str, Optional[float]] = {"cpu_user": None, "cpu_system": None, "max_rss_bytes": None}
+
+# Runs the job's shell from a small, fresh interpreter and writes the shell's
+# usage (RUSAGE_CHILDREN) to the report fd. wait4() on a child forked from the
+# daemon is no good for RSS: Linux carries the parent's peak RSS across
+# fork+exec, so every job would read at least the daemon's size.
+_LAUNCHER = """
+import os, resource, signal, sys
+report = int(sys.argv[2])
+pid = os.fork()
+if pid == 0:
+    os.close(report)
+    for sig in (signal.SIGPIPE, signal.SIGXFSZ):
+        signal.signal(sig, signal.SIG_DFL)
+    try:
+        os.execv("/bin/sh", ["/bin/sh", "-c", sys.argv[1]])
+    finally:
+        os._exit(127)
+_, status = os.waitpid(pid, 0)
+ru = resource.getrusage(resource.RUSAGE_CHILDREN)
+os.write(report, ("%r %r %d" % (ru.ru_utime, ru.ru_stime, ru.ru_maxrss)).encode())
+if os.WIFSIGNALED(status):
+    sig = os.WTERMSIG(status)
+    if sig not in (signal.SIGKILL, signal.SIGSTOP):
+        signal.signal(sig, signal.SIG_DFL)
+    os.kill(os.getpid(), sig)
+os._exit(os.waitstatus_to_exitcode(status) & 0xFF)
+"""
 
-        try:
-            process = subprocess.Popen(
-                command,
-                shell=True,
-                cwd=workdir,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-            )
-
-            def read_stream(stream, lines_list):
-                for line in iter(stream.readline, ''):
-                    lines_list.append(line)
-                    progress.update(task, description=f"[cyan]{name}: {line.strip()[:50]}")
-
-            stdout_thread = threading.Thread(target=read_stream, args=(process.stdout, stdout_lines))
-            stderr_thread = threading.Thread(target=read_stream, args=(process.stderr, stderr_lines))
-            stdout_thread.start()
-            stderr_thread.start()
-
-            process.wait(timeout=timeout)
-
-            stdout = ''.join(stdout_lines)
-            stderr = ''.join(stderr_lines)
-            returncode = process.returncode
-
-            status = "success" if returncode == 0 else "failed"
-            color = "green" if status == "success" else "red"
-            progress.update(task, description=f"[{color}]{name}: {status}")
 
-        except subprocess.TimeoutExpired:
-            if process:
-                process.kill()
-            progress.update(task, description=f"[red]{name}: TIMEOUT")
-            status = "timeout"
-            returncode = -1
-            stdout = ''.join(stdout_lines)
-            stderr = ''.join(stderr_lines)
-        except Exception as e:
-            status = "failed"
-            returncode = -1
-            stdout = ''.join(stdout_lines)
-            stderr = (''.join(stderr_lines) + f"\n{e}") if stderr_lines else str(e)
-            progress.update(task, description=f"[red]{name}: failed")
+class _ChildReaper:
+    """
+    Reap the job launcher with os.wait4() in a thread and collect its report.
+
+    The reported usage covers the job's shell and every descendant it waited
+    for. Popen.wait() would reap the launcher itself and discard its usage.
+    """
+
+    def __init__(self, process: subprocess.Popen, report_fd: int) -> None:
+        self.process = process
+        self.usage: Optional[Any] = None
+        self._report_fd = report_fd
+        self._thread = threading.Thread(target=self._reap, daemon=True)
+        self._thread.start()
+
+    def _reap(self) -> None:
+        try:
+            _, wait_status, self.usage = os.wait4(self.process.pid, 0)
+        except ChildProcessError:
+            return  # already reaped through Popen
+        self.process.returncode = os.waitstatus_to_exitcode(wait_status)
+
+    def wait(self, timeout: Optional[float]) -> int:
+        """Wait for exit; raises subprocess.TimeoutExpired like Popen.wait()."""
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise subprocess.TimeoutExpired(self.process.args, timeout)
+        if self.process.returncode is None:
+            self.process.wait()
+        return self.process.returncode
+
+    def _read_report(self) -> Optional[list[str]]:
+        """The launcher's usage line, or None if it died before writing it."""
+        try:
+            fields = os.read(self._report_fd, 256).decode().split()
+        except OSError:
+            return None
         finally:
-            for t in (stdout_thread, stderr_thread):
-                if t and t.is_alive():
-                    t.join(timeout=1)
+            os.close(self._report_fd)
+        return fields if len(fields) == 3 else None
+
+    def resource_usage(self) -> dict[str, Optional[float]]:
+        """CPU seconds and peak RSS of the finished job (None if unknown)."""
+        if self.usage is None:
+            os.close(self._report_fd)
+            return dict(_NO_USAGE)
+        report = self._read_report()
+        if report is None:
+            # Launcher killed (timeout): its own wait4 CPU is close enough, RSS is not
+            return {
+                "cpu_user": round(self.usage.ru_utime, 3),
+                "cpu_system": round(self.usage.ru_stime, 3),
+                "max_rss_bytes": None,
+            }
+        # ru_maxrss is in kilobytes on Linux, bytes on macOS
+        rss_scale = 1 if sys.platform == "darwin" else 1024
+        return {
+            "cpu_user": round(float(report[0]), 3),
+            "cpu_system": round(float(report[1]), 3),
+            "max_rss_bytes": int(report[2]) * rss_scale,
+        }
 
-    _write_log(log_file, name, command, workdir, status, returncode, start_time, stdout, stderr)
 
-    return {
-        "status": status,
-        "exit_code": returncode,
-        "duration": (datetime.now() - start_time).total_seconds(),
+def _spawn(command: str, workdir: str) -> tuple[subprocess.Popen, Optional[_ChildReaper]]:
+    """Start a job's shell, under the usage launcher where wait4() is available."""
+    options: dict[str, Any] = {
+        "cwd": workdir,
+        "stdout": subprocess.PIPE,
+        "stderr": subprocess.STDOUT,
+        "start_new_session": True,  # own process group, so a timeout kills the whole tree
     }
+    if not hasattr(os, "wait4"):
+        return subprocess.Popen(command, shell=True, **options), None
+
+    report_r, report_w = os.pipe()
+    try:
+        process = subprocess.Popen(
+            [sys.executable, "-I", "-S", "-c", _LAUNCHER, command, str(report_w)],
+            pass_fds=(report_w,),
+            **options,
+        )
+    except BaseException:
+        os.close(report_r)
+        raise
+    finally:
+        os.close(report_w)
+    return process, _ChildReaper(process, report_r)
 
 
-def _run_simple(
-    name: str,
+def _kill_tree(process: subprocess.Popen) -> None:
+    """Kill a job's shell and everything it started."""
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except (AttributeError, ProcessLookupError, PermissionError):
+        process.kill()
+
+
+def _execute(
     command: str,
     workdir: str,
     timeout: int,
-    log_file: Path,
-    start_time: datetime,
-) -> dict[str, Any]:
-    """Run a job without progress display (for daemon mode)."""
+    writer: RunLogWriter,
+    on_chunk: Optional[Callable[[bytes], None]] = None,
+) -> tuple[str, int, dict[str, Optional[float]]]:
+    """
+    Run a command, streaming interleaved stdout/stderr into `writer`.
+
+    Returns:
+        (status, exit code, resource usage) where status is 'success', 'failed'
+        or 'timeout'.
+    """
+    process: subprocess.Popen | None = None
+    reader: threading.Thread | None = None
+    reaper: _ChildReaper | None = None
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            cwd=workdir,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-        status = "success" if result.returncode == 0 else "failed"
-        returncode = result.returncode
-        stdout = result.stdout
-        stderr = result.stderr
+        process, reaper = _spawn(command, workdir)
+        reader = threading.Thread(target=writer.pump, args=(process.stdout, on_chunk), daemon=True)
+        reader.start()
+        if reaper:
+            returncode = reaper.wait(timeout)
+        else:
+            returncode = process.wait(timeout=timeout)
+        status = "success" if returncode == 0 else "failed"
     except subprocess.TimeoutExpired:
+        if process:
+            _kill_tree(process)
+            if reaper:
+                try:
+                    reaper.wait(5)  # collect the killed child's usage too
+                except subprocess.TimeoutExpired:
+                    pass
         status = "timeout"
         returncode = -1
-        stdout = ""
-        stderr = ""
+    except KeyboardInterrupt:
+        if process:
+            _kill_tree(process)
+        raise
     except Exception as e:
         status = "failed"
         returncode = -1
-        stdout = ""
-        stderr = str(e)
+        writer.write(f"\n{e}\n".encode())
+    finally:
+        # Children that outlive the shell can keep the pipe open; don't wait on them
+        if reader:
+            reader.join(timeout=5)
 
-    _write_log(log_file, name, command, workdir, status, returncode, start_time, stdout, stderr)
+    return status, returncode, reaper.resource_usage() if reaper else dict(_NO_USAGE)
 
-    return {
-        "status": status,
-        "exit_code": returncode,
-        "duration": (datetime.now() - start_time).total_seconds(),
-    }
+
+def _run_with_progress(
+    name: str,
+    command: str,
+    workdir: str,
+    timeout: int,
+    writer: RunLogWriter,
+) -> tuple[str, int, dict[str, Optional[float]]]:
+    """Run a job with Rich progress display."""
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task(f"[cyan]Running {name}...", total=None)
+
+        def show_last_line(chunk: bytes) -> None:
+            lines = chunk.decode("utf-8", "replace").strip().splitlines()
+            if lines:
+                progress.update(task, description=f"[cyan]{name}: {lines[-1].strip()[:50]}")
+
+        status, returncode, usage = _execute(command, workdir, timeout, writer, on_chunk=show_last_line)
+
+        if status == "timeout":
+            progress.update(task, description=f"[red]{name}: TIMEOUT")
+        else:
+            color = "green" if status == "success" else "red"
+            progress.update(task, description=f"[{color}]{name}: {status}")
+
+    return status, returncode, usage
 
 
 def _write_log(
@@ -185,39 +298,36 @@ def _write_log(
     status: str,
     returncode: int,
     start_time: datetime,
-    stdout: str,
-    stderr: str,
+    writer: RunLogWriter,
 ) -> None:
-    """Write execution log to file."""
+    """Append a run summary to the job's log; output lives in the run's segments."""
     with open(log_file, "a") as f:
         f.write(f"\n{'='*60}\n")
-        f.write(f"[{start_time.isoformat()}] Job: {name}\n")
+        f.write(f"[{start_time.isoformat()}] Job: {name} (run {writer.run_id})\n")
         f.write(f"Command: {command}\n")
         f.write(f"Workdir: {workdir}\n")
         f.write(f"Status: {status} (exit {returncode})\n")
         f.write(f"Duration: {(datetime.now() - start_time).total_seconds():.1f}s\n")
-        if stdout:
-            f.write(f"\n--- stdout ---\n{stdout}\n")
-        if stderr:
-            f.write(f"\n--- stderr ---\n{stderr}\n")
+        f.write(f"Output: {writer.directory / f'{writer.run_id}.idx.json'} "
+                f"({writer.bytes_written} bytes, {writer.lines_written} lines, {len(writer.segments)} segments)\n")
 
 
-def job_wrapper(job_name: str) -> None:
+def job_wrapper(job_name: str, queue_wait: Optional[float] = None) -> None:
     """
-    Wrapper function for APScheduler to execute a job.
+    Execute a triggered job.
 
-    This is the callback invoked by APScheduler when a job triggers.
-    It handles job tracking, metrics, and status updates.
+    In the daemon this runs on a job queue worker once the job's resources are
+    free (see job_queue.py). It handles job tracking, metrics, and status updates.
 
     Args:
         job_name: Name of the job to execute.
+        queue_wait: Seconds the job waited in the queue for resources.
     """
-    jobs = load_jobs()
-    if job_name not in jobs:
+    job = get_job(job_name)
+    if job is None:
         rprint(f"[yellow][scheduler][/yellow] Job not found: {job_name}")
         return
 
-    job = jobs[job_name]
     if not job.get("enabled", True):
         rprint(f"[yellow][scheduler][/yellow] Job disabled: {job_name}")
         return
@@ -229,11 +339,14 @@ def job_wrapper(job_name: str) -> None:
             "progress": "starting",
             "command": job["command"],
         }
+        if queue_wait is not None:
+            RUNNING_JOBS[job_name]["queue_wait"] = round(queue_wait, 3)
     with METRICS_LOCK:
         METRICS_COUNTERS["jobs_total"] += 1
 
     rprint(f"[blue][scheduler][/blue] Running job: [bold]{job_name}[/bold]")
-    result = run_job(job, show_progress=False)  # No progress in daemon mode
+    run_id = record_run_start(job_name)
+    result = run_job(job, show_progress=False, run_id=run_id)  # No progress in daemon mode
 
     # Update metrics
     with METRICS_LOCK:
@@ -244,12 +357,24 @@ def job_wrapper(job_name: str) -> None:
         else:
             METRICS_COUNTERS["jobs_failed"] += 1
 
+    JOB_METRICS.observe(job_name, result, queue_wait)
+
     # Remove from running jobs
     with RUNNING_JOBS_LOCK:
         RUNNING_JOBS.pop(job_name, None)
 
-    # Update job metadata
-    update_job_run_status(job_name, result["status"], result.get("duration"))
+    # Record the run and update job metadata
+    record_run_end(
+        run_id,
+        result["status"],
+        exit_code=result.get("exit_code"),
+        duration=result.get("duration"),
+        output_bytes=result.get("output_bytes"),
+        queue_wait=queue_wait,
+        cpu_user=result.get("cpu_user"),
+        cpu_system=result.get("cpu_system"),
+        max_rss_bytes=result.get("max_rss_bytes"),
+    )
 
     status_color = "green" if result["status"] == "success" else "red"
     rprint(f"[blue][scheduler][/blue] Job {job_name} completed: [{status_color}]{result['status']}[/{status_color}]")
@@ -0,0 +1,210 @@
+"""
+Job metrics - per-job run histograms and resource accounting for /metrics.
+
+Updated in memory as runs finish, so a scrape neither loads the registry nor
+queries run history. Totals and last-run values are seeded from the database
+when the daemon starts; histograms cover runs since then.
+"""
+import bisect
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+# Upper bounds (seconds) of the histogram buckets
+DURATION_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600, 7200)
+QUEUE_WAIT_BUCKETS = (0.1, 0.5, 1, 5, 15, 60, 300, 900, 3600)
+
+_STATUSES = ("success", "failed", "timeout")
+
+
+class Histogram:
+    """Cumulative Prometheus-style histogram."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        idx = bisect.bisect_left(self.buckets, value)
+        if idx < len(self.counts):
+            self.counts[idx] += 1
+        self.count += 1
+        self.sum += value
+
+    def lines(self, name: str, labels: str) -> list[str]:
+        """Bucket, sum and count samples for one label set."""
+        out = []
+        cumulative = 0
+        for bound, n in zip(self.buckets, self.counts):
+            cumulative += n
+            out.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+        out.append(f'{name}_bucket{{{labels},le="+Inf"}} {self.count}')
+        out.append(f"{name}_sum{{{labels}}} {self.sum:.3f}")
+        out.append(f"{name}_count{{{labels}}} {self.count}")
+        return out
+
+
+@dataclass
+class _JobStats:
+    duration: Histogram = field(default_factory=lambda: Histogram(DURATION_BUCKETS))
+    queue_wait: Histogram = field(default_factory=lambda: Histogram(QUEUE_WAIT_BUCKETS))
+    runs: dict[str, int] = field(default_factory=lambda: dict.fromkeys(_STATUSES, 0))
+    output_bytes: int = 0
+    cpu_user: float = 0.0
+    cpu_system: float = 0.0
+    peak_rss: int = 0
+    last_run: float = 0.0
+    last_duration: float = 0.0
+    last_success: int = 0
+    last_cpu: Optional[float] = None
+    last_rss: Optional[int] = None
+
+
+class JobMetrics:
+    """In-memory per-job metrics, safe to update from job threads."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._jobs: dict[str, _JobStats] = {}
+
+    def seed(self, jobs: dict[str, Any], run_stats: dict[str, dict[str, Any]]) -> None:
+        """
+        Initialise totals and last-run values from the registry and run history.
+
+        Args:
+            jobs: Registry jobs keyed by name (load_jobs()).
+            run_stats: Per-job aggregates over all history (get_run_stats()).
+        """
+        with self._lock:
+            for name, job in jobs.items():
+                stats = self._jobs.setdefault(name, _JobStats())
+                stats.last_run = job.get("last_run") or 0
+                stats.last_duration = job.get("last_duration") or 0
+                stats.last_success = 1 if job.get("last_status") == "success" else 0
+            for name, agg in run_stats.items():
+                stats = self._jobs.setdefault(name, _JobStats())
+                for status in _STATUSES:
+                    stats.runs[status] = agg.get(status) or 0
+                stats.output_bytes = agg.get("output_bytes") or 0
+                stats.cpu_user = agg.get("cpu_user") or 0.0
+                stats.cpu_system = agg.get("cpu_system") or 0.0
+                stats.peak_rss = agg.get("max_rss_bytes") or 0
+
+    def observe(self, name: str, result: dict[str, Any], queue_wait: Optional[float] = None) -> None:
+        """
+        Record a finished run.
+
+        Args:
+            name: Job name.
+            result: run_job() result.
+            queue_wait: Seconds the run waited for resources.
+        """
+        status = result["status"]
+        duration = result.get("duration") or 0.0
+        cpu_user = result.get("cpu_user")
+        cpu_system = result.get("cpu_system")
+        rss = result.get("max_rss_bytes")
+
+        with self._lock:
+            stats = self._jobs.setdefault(name, _JobStats())
+            stats.duration.observe(duration)
+            if queue_wait is not None:
+                stats.queue_wait.observe(queue_wait)
+            stats.runs[status] = stats.runs.get(status, 0) + 1
+            stats.output_bytes += result.get("output_bytes") or 0
+            stats.last_run = time.time()
+            stats.last_duration = duration
+            stats.last_success = 1 if status == "success" else 0
+            if cpu_user is not None and cpu_system is not None:
+                stats.cpu_user += cpu_user
+                stats.cpu_system += cpu_system
+                stats.last_cpu = cpu_user + cpu_system
+            if rss is not None:
+                stats.last_rss = rss
+                stats.peak_rss = max(stats.peak_rss, rss)
+
+    def prometheus_lines(self, running: dict[str, dict[str, Any]]) -> list[str]:
+        """
+        Per-job metrics in Prometheus text format.
+
+        Args:
+            running: RUNNING_JOBS snapshot, for the running-jobs gauges.
+        """
+        now = time.time()
+        with self._lock:
+            jobs = sorted(self._jobs.items())
+
+            def family(name: str, kind: str, help_text: str, samples: list[str]) -> list[str]:
+                if not samples:
+                    return []
+                return ["", f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", *samples]
+
+            lines = family(
+                "scheduler_job_running", "gauge", "1 while the job is running",
+                [f'scheduler_job_running{{job="{n}"}} {1 if n in running else 0}' for n, _ in jobs]
+                + [f'scheduler_job_running{{job="{n}"}} 1' for n in sorted(running) if n not in self._jobs],
+            )
+            lines += family(
+                "scheduler_job_running_seconds", "gauge", "Elapsed time of the current run",
+                [f'scheduler_job_running_seconds{{job="{n}"}} {now - info.get("started", now):.1f}'
+                 for n, info in sorted(running.items())],
+            )
+            lines += family(
+                "scheduler_job_last_run_timestamp", "gauge", "Last run timestamp",
+                [f'scheduler_job_last_run_timestamp{{job="{n}"}} {s.last_run:.0f}' for n, s in jobs],
+            )
+            lines += family(
+                "scheduler_job_last_duration_seconds", "gauge", "Duration of the last run",
+                [f'scheduler_job_last_duration_seconds{{job="{n}"}} {s.last_duration}' for n, s in jobs],
+            )
+            lines += family(
+                "scheduler_job_last_success", "gauge", "1 if the last run succeeded",
+                [f'scheduler_job_last_success{{job="{n}"}} {s.last_success}' for n, s in jobs],
+            )
+            lines += family(
+                "scheduler_job_runs_total", "counter", "Recorded runs by job and status",
+                [f'scheduler_job_runs_total{{job="{n}",status="{status}"}} {count}'
+                 for n, s in jobs for status, count in s.runs.items()],
+            )
+            lines += family(
+                "scheduler_job_output_bytes_total", "counter", "Bytes of output recorded by job",
+                [f'scheduler_job_output_bytes_total{{job="{n}"}} {s.output_bytes}' for n, s in jobs],
+            )
+            lines += family(
+                "scheduler_job_duration_seconds", "histogram", "Run duration",
+                [line for n, s in jobs if s.duration.count
+                 for line in s.duration.lines("scheduler_job_duration_seconds", f'job="{n}"')],
+            )
+            lines += family(
+                "scheduler_job_queue_wait_seconds", "histogram", "Time from trigger to start",
+                [line for n, s in jobs if s.queue_wait.count
+                 for line in s.queue_wait.lines("scheduler_job_queue_wait_seconds", f'job="{n}"')],
+            )
+            lines += family(
+                "scheduler_job_cpu_seconds_total", "counter", "Child CPU time by mode",
+                [f'scheduler_job_cpu_seconds_total{{job="{n}",mode="{mode}"}} {value:.3f}'
+                 for n, s in jobs for mode, value in (("user", s.cpu_user), ("system", s.cpu_system))],
+            )
+            lines += family(
+                "scheduler_job_last_cpu_seconds", "gauge", "Child CPU time (user + system) of the last run",
+                [f'scheduler_job_last_cpu_seconds{{job="{n}"}} {s.last_cpu:.3f}' for n, s in jobs
+                 if s.last_cpu is not None],
+            )
+            lines += family(
+                "scheduler_job_last_max_rss_bytes", "gauge", "Peak resident memory of the last run",
+                [f'scheduler_job_last_max_rss_bytes{{job="{n}"}} {s.last_rss}' for n, s in jobs
+                 if s.last_rss is not None],
+            )
+            lines += family(
+                "scheduler_job_peak_rss_bytes", "gauge", "Highest peak resident memory of any run",
+                [f'scheduler_job_peak_rss_bytes{{job="{n}"}} {s.peak_rss}' for n, s in jobs if s.peak_rss],
+            )
+        return lines
+
+
+# Shared by the executor (writes) and the metrics server (reads)
+JOB_METRICS = JobMetrics()
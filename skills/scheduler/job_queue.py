@@ -0,0 +1,350 @@
+"""
+Job queue - resource-aware dispatch of triggered jobs.
+
+APScheduler triggers only enqueue a job; a dispatcher thread starts it once the
+resource pools it needs (e.g. gpu=1, cpu=4, net=8) have room. Pending jobs are
+taken in priority order (higher first, then FIFO), and waiting raises a job's
+priority one level per SCHEDULER_PRIORITY_AGING seconds. A job that does not
+fit reserves the pools it is short on: lower-priority jobs needing those pools
+wait behind it, so small jobs cannot starve a big one, while jobs on other
+pools keep running.
+
+A job is queued at most once: triggers that fire while it is already waiting
+are coalesced into the pending entry, and a job never runs concurrently with
+itself.
+"""
+import itertools
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+from config import DEFAULT_JOB_RESOURCES, PRIORITY_AGING_SECONDS, RESOURCE_POOLS
+from utils import rprint
+
+ResourceSpec = Union[str, dict[str, Any], None]
+
+
+def parse_resources(spec: ResourceSpec) -> dict[str, int]:
+    """
+    Parse a resource spec into pool -> units.
+
+    Args:
+        spec: 'gpu=1,cpu=2' string, {'gpu': 1} mapping, or None.
+
+    Returns:
+        Dictionary of pool name to required units.
+
+    Raises:
+        ValueError: If the spec is malformed or a count is negative.
+    """
+    if not spec:
+        return {}
+    if isinstance(spec, str):
+        items = []
+        for part in spec.replace(" ", "").split(","):
+            if not part:
+                continue
+            pool, sep, count = part.partition("=")
+            if not pool or not sep:
+                raise ValueError(f"Invalid resource '{part}' (expected name=count)")
+            items.append((pool, count))
+    else:
+        items = list(spec.items())
+
+    resources: dict[str, int] = {}
+    for pool, count in items:
+        try:
+            units = int(count)
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid count for resource '{pool}': {count!r}") from None
+        if units < 0:
+            raise ValueError(f"Resource '{pool}' count must be >= 0")
+        if units:
+            resources[str(pool)] = units
+    return resources
+
+
+def format_resources(resources: dict[str, int]) -> str:
+    """Render pool -> units as 'gpu=1,cpu=2'."""
+    return ",".join(f"{pool}={units}" for pool, units in resources.items())
+
+
+@dataclass
+class _Pending:
+    name: str
+    priority: int
+    resources: dict[str, int]
+    enqueued_at: float
+    seq: int
+    coalesced: int = 0
+
+
+@dataclass
+class _WaitStats:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    coalesced: int = 0
+    last: float = 0.0
+
+
+class JobQueue:
+    """Priority queue that starts jobs when their resource pools have capacity."""
+
+    def __init__(
+        self,
+        run: Callable[[str, float], None],
+        pools: Optional[dict[str, int]] = None,
+        default_resources: Optional[dict[str, int]] = None,
+    ) -> None:
+        """
+        Args:
+            run: Called in a worker thread as run(job_name, queue_wait_seconds).
+            pools: Pool capacities (defaults to SCHEDULER_RESOURCES).
+            default_resources: Requirements of jobs that declare none
+                (defaults to SCHEDULER_DEFAULT_RESOURCES).
+        """
+        self._run = run
+        self.capacity = dict(parse_resources(RESOURCE_POOLS) if pools is None else pools)
+        self.default_resources = dict(
+            parse_resources(DEFAULT_JOB_RESOURCES) if default_resources is None else default_resources
+        )
+        self.in_use = {pool: 0 for pool in self.capacity}
+        self._pending: dict[str, _Pending] = {}
+        self._running: dict[str, dict[str, Any]] = {}
+        self._wait: dict[str, _WaitStats] = {}
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._stopped = False
+        self._warned: set[tuple[str, str]] = set()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the dispatcher thread."""
+        self._thread = threading.Thread(target=self._dispatch_loop, name="job-queue", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop dispatching; pending jobs are dropped, running jobs finish."""
+        with self._cond:
+            self._stopped = True
+            self._pending.clear()
+            self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # Submission
+    # ------------------------------------------------------------------
+
+    def requirements(self, job: dict[str, Any]) -> dict[str, int]:
+        """Resources a job needs, clamped to pool capacity."""
+        name = job["name"]
+        wanted = parse_resources(job["resources"]) if job.get("resources") else self.default_resources
+        needs: dict[str, int] = {}
+        for pool, units in wanted.items():
+            if pool not in self.capacity:
+                self._warn_once(name, pool, f"unknown resource pool '{pool}', not limited")
+                continue
+            if units > self.capacity[pool]:
+                self._warn_once(name, pool, f"needs {pool}={units}, pool has {self.capacity[pool]}; using all of it")
+                units = self.capacity[pool]
+            needs[pool] = units
+        return needs
+
+    def submit(self, job: dict[str, Any]) -> bool:
+        """
+        Queue a job for execution.
+
+        Args:
+            job: Job dictionary (uses 'name', 'priority' and 'resources').
+
+        Returns:
+            True if queued, False if coalesced into an already pending run.
+        """
+        name = job["name"]
+        needs = self.requirements(job)
+        with self._cond:
+            stats = self._wait.setdefault(name, _WaitStats())
+            pending = self._pending.get(name)
+            if pending is not None:
+                pending.coalesced += 1
+                stats.coalesced += 1
+                return False
+            self._pending[name] = _Pending(
+                name=name,
+                priority=int(job.get("priority", 0)),
+                resources=needs,
+                enqueued_at=time.time(),
+                seq=next(self._seq),
+            )
+            self._cond.notify_all()
+        return True
+
+    # ------------------------------------------------------------------
+    # Dispatch
+    # ------------------------------------------------------------------
+
+    def _short(self, needs: dict[str, int]) -> set[str]:
+        """Pools without room for `needs` right now."""
+        return {pool for pool, units in needs.items() if self.in_use[pool] + units > self.capacity[pool]}
+
+    def _ordered(self) -> list[_Pending]:
+        """Pending entries in dispatch order (caller holds the lock)."""
+        now = time.time()
+
+        def key(entry: _Pending) -> tuple[float, int]:
+            priority = entry.priority
+            if PRIORITY_AGING_SECONDS > 0:
+                priority += (now - entry.enqueued_at) / PRIORITY_AGING_SECONDS
+            return -priority, entry.seq
+
+        return sorted(self._pending.values(), key=key)
+
+    def _dispatch_loop(self) -> None:
+        with self._cond:
+            while not self._stopped:
+                blocked: set[str] = set()
+                for entry in self._ordered():
+                    if entry.name in self._running:
+                        continue  # waits for its own previous run, holds nothing back
+                    short = self._short(entry.resources) | blocked.intersection(entry.resources)
+                    if short:
+                        blocked.update(short)
+                        continue
+                    self._launch(entry)
+                self._cond.wait()
+
+    def _launch(self, entry: _Pending) -> None:
+        """Reserve resources and start a worker (caller holds the lock)."""
+        now = time.time()
+        wait = now - entry.enqueued_at
+        del self._pending[entry.name]
+        for pool, units in entry.resources.items():
+            self.in_use[pool] += units
+
+        stats = self._wait[entry.name]
+        stats.count += 1
+        stats.total += wait
+        stats.max = max(stats.max, wait)
+        stats.last = wait
+
+        self._running[entry.name] = {
+            "started": now,
+            "queue_wait": round(wait, 3),
+            "priority": entry.priority,
+            "resources": entry.resources,
+        }
+        threading.Thread(target=self._work, args=(entry, wait), name=f"job-{entry.name}").start()
+
+    def _work(self, entry: _Pending, wait: float) -> None:
+        try:
+            self._run(entry.name, wait)
+        except Exception as e:
+            rprint(f"[red][scheduler][/red] Job {entry.name} crashed: {e}")
+        finally:
+            with self._cond:
+                for pool, units in entry.resources.items():
+                    self.in_use[pool] -= units
+                self._running.pop(entry.name, None)
+                self._cond.notify_all()
+
+    def _warn_once(self, job: str, pool: str, message: str) -> None:
+        if (job, pool) not in self._warned:
+            self._warned.add((job, pool))
+            rprint(f"[yellow][scheduler][/yellow] {job}: {message}")
+
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, Any]:
+        """Pools, pending and running jobs, and per-job queue-wait stats."""
+        now = time.time()
+        with self._cond:
+            pending = self._ordered()
+            return {
+                "pools": {
+                    pool: {"capacity": cap, "in_use": self.in_use[pool]}
+                    for pool, cap in self.capacity.items()
+                },
+                "pending": [
+                    {
+                        "job": e.name,
+                        "priority": e.priority,
+                        "resources": e.resources,
+                        "waiting": round(now - e.enqueued_at, 3),
+                        "coalesced": e.coalesced,
+                    }
+                    for e in pending
+                ],
+                "running": {name: dict(info) for name, info in self._running.items()},
+                "wait": {
+                    name: {
+                        "count": s.count,
+                        "avg": round(s.total / s.count, 3) if s.count else 0.0,
+                        "max": round(s.max, 3),
+                        "last": round(s.last, 3),
+                        "coalesced": s.coalesced,
+                    }
+                    for name, s in self._wait.items()
+                },
+            }
+
+    def prometheus_lines(self) -> list[str]:
+        """Queue and pool metrics in Prometheus text format."""
+        now = time.time()
+        with self._cond:
+            lines = [
+                "# HELP scheduler_queue_depth Jobs waiting for resources",
+                "# TYPE scheduler_queue_depth gauge",
+                f"scheduler_queue_depth {len(self._pending)}",
+                "",
+                "# HELP scheduler_queue_oldest_wait_seconds Wait of the oldest pending job",
+                "# TYPE scheduler_queue_oldest_wait_seconds gauge",
+                f"scheduler_queue_oldest_wait_seconds "
+                f"{max((now - e.enqueued_at for e in self._pending.values()), default=0):.3f}",
+                "",
+                "# HELP scheduler_resource_capacity Units in each resource pool",
+                "# TYPE scheduler_resource_capacity gauge",
+            ]
+            lines += [f'scheduler_resource_capacity{{pool="{p}"}} {c}' for p, c in self.capacity.items()]
+            lines += [
+                "",
+                "# HELP scheduler_resource_in_use Units held by running jobs",
+                "# TYPE scheduler_resource_in_use gauge",
+            ]
+            lines += [f'scheduler_resource_in_use{{pool="{p}"}} {u}' for p, u in self.in_use.items()]
+            if self._wait:
+                # The per-job wait histogram is in job_metrics.py
+                lines += [
+                    "",
+                    "# HELP scheduler_job_queue_wait_max_seconds Longest queue wait since start",
+                    "# TYPE scheduler_job_queue_wait_max_seconds gauge",
+                ]
+                lines += [f'scheduler_job_queue_wait_max_seconds{{job="{n}"}} {s.max:.3f}' for n, s in self._wait.items()]
+                lines += [
+                    "",
+                    "# HELP scheduler_job_coalesced_total Triggers merged into an already pending run",
+                    "# TYPE scheduler_job_coalesced_total counter",
+                ]
+                lines += [f'scheduler_job_coalesced_total{{job="{n}"}} {s.coalesced}' for n, s in self._wait.items()]
+        return lines
+
+
+# The daemon's queue, for the metrics server and manual triggers
+_queue: Optional[JobQueue] = None
+
+
+def set_job_queue(queue: Optional[JobQueue]) -> None:
+    """Set the daemon's job queue."""
+    global _queue
+    _queue = queue
+
+
+def get_job_queue() -> Optional[JobQueue]:
+    """Get the daemon's job queue (None outside the daemon)."""
+    return _queue
@@ -1,14 +1,20 @@
 """
 Job registry - storage and management of scheduled jobs.
 
-Handles CRUD operations for jobs stored in JSON format.
+Jobs and their run history live in a SQLite database (WAL mode) so concurrent
+APScheduler threads update single rows transactionally instead of rewriting a
+shared JSON file. A legacy jobs.json is imported on first use.
 """
 import json
+import sqlite3
+import threading
 import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
-from config import JOBS_FILE
+from config import DB_FILE, JOBS_FILE
+from job_queue import ResourceSpec, parse_resources
 from utils import ensure_dirs, HAS_YAML
 
 # Lazy import yaml only when needed
@@ -16,27 +22,195 @@ if HAS_YAML:
     import yaml
 
 
+# ============================================================================
+# Database
+# ============================================================================
+
+# Columns kept outside the JSON definition so they can be updated and queried directly
+_STATUS_FIELDS = ("enabled", "created_at", "last_run", "last_status", "last_duration")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    name          TEXT PRIMARY KEY,
+    definition    TEXT NOT NULL,
+    enabled       INTEGER NOT NULL DEFAULT 1,
+    created_at    INTEGER,
+    last_run      INTEGER,
+    last_status   TEXT,
+    last_duration REAL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    job          TEXT NOT NULL,
+    started_at   REAL NOT NULL,
+    ended_at     REAL,
+    status       TEXT,
+    exit_code    INTEGER,
+    duration     REAL,
+    output_bytes INTEGER,
+    queue_wait   REAL,
+    cpu_user     REAL,
+    cpu_system   REAL,
+    max_rss_bytes INTEGER
+);
+CREATE INDEX IF NOT EXISTS runs_job_started ON runs (job, started_at);
+CREATE INDEX IF NOT EXISTS runs_status_started ON runs (status, started_at);
+CREATE INDEX IF NOT EXISTS runs_started ON runs (started_at);
+"""
+
+# Columns added to runs after the table was first created
+_RUN_COLUMNS_ADDED = {
+    "queue_wait": "REAL",
+    "cpu_user": "REAL",
+    "cpu_system": "REAL",
+    "max_rss_bytes": "INTEGER",
+}
+
+_local = threading.local()
+_init_lock = threading.Lock()
+_initialized = False
+
+
+def _connect() -> sqlite3.Connection:
+    """Return this thread's connection, creating the schema on first use."""
+    global _initialized
+
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        return conn
+
+    ensure_dirs()
+    conn = sqlite3.connect(DB_FILE, timeout=30, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=30000")
+
+    with _init_lock:
+        if not _initialized:
+            conn.executescript(_SCHEMA)
+            _add_run_columns(conn)
+            _migrate_json(conn)
+            _initialized = True
+
+    _local.conn = conn
+    return conn
+
+
+@contextmanager
+def _transaction() -> Iterator[sqlite3.Connection]:
+    """BEGIN IMMEDIATE ... COMMIT on this thread's connection (rolled back on error)."""
+    conn = _connect()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
+def _add_run_columns(conn: sqlite3.Connection) -> None:
+    """Add columns missing from a runs table created by an older version."""
+    existing = {row["name"] for row in conn.execute("PRAGMA table_info(runs)")}
+    for column, kind in _RUN_COLUMNS_ADDED.items():
+        if column not in existing:
+            conn.execute(f"ALTER TABLE runs ADD COLUMN {column} {kind}")
+
+
+def _migrate_json(conn: sqlite3.Connection) -> None:
+    """Import a legacy jobs.json into an empty database, then set it aside."""
+    if not JOBS_FILE.exists():
+        return
+    if conn.execute("SELECT 1 FROM jobs LIMIT 1").fetchone():
+        return
+    try:
+        jobs = json.loads(JOBS_FILE.read_text())
+    except (OSError, json.JSONDecodeError):
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for job in jobs.values():
+            _upsert_job(conn, job)
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    JOBS_FILE.rename(JOBS_FILE.with_suffix(".json.migrated"))
+
+
+def _upsert_job(conn: sqlite3.Connection, job: dict[str, Any]) -> None:
+    definition = {k: v for k, v in job.items() if k not in _STATUS_FIELDS}
+    conn.execute(
+        """
+        INSERT INTO jobs (name, definition, enabled, created_at, last_run, last_status, last_duration)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+        ON CONFLICT(name) DO UPDATE SET
+            definition = excluded.definition,
+            enabled = excluded.enabled,
+            created_at = COALESCE(jobs.created_at, excluded.created_at),
+            last_run = COALESCE(excluded.last_run, jobs.last_run),
+            last_status = COALESCE(excluded.last_status, jobs.last_status),
+            last_duration = COALESCE(excluded.last_duration, jobs.last_duration)
+        """,
+        (
+            job["name"],
+            json.dumps(definition),
+            1 if job.get("enabled", True) else 0,
+            job.get("created_at"),
+            job.get("last_run"),
+            job.get("last_status"),
+            job.get("last_duration"),
+        ),
+    )
+
+
+def _row_to_job(row: sqlite3.Row) -> dict[str, Any]:
+    job = json.loads(row["definition"])
+    job["enabled"] = bool(row["enabled"])
+    for field in ("created_at", "last_run", "last_status", "last_duration"):
+        if row[field] is not None:
+            job[field] = row[field]
+    return job
+
+
+# ============================================================================
+# Jobs
+# ============================================================================
+
 def load_jobs() -> dict[str, Any]:
     """
-    Load jobs from JSON file.
+    Load all jobs.
 
     Returns:
         Dictionary of jobs keyed by job name.
     """
-    if JOBS_FILE.exists():
-        return json.loads(JOBS_FILE.read_text())
-    return {}
+    rows = _connect().execute("SELECT * FROM jobs ORDER BY name").fetchall()
+    return {row["name"]: _row_to_job(row) for row in rows}
 
 
 def save_jobs(jobs: dict[str, Any]) -> None:
     """
-    Save jobs to JSON file.
+    Replace the whole registry with the given jobs.
 
     Args:
         jobs: Dictionary of jobs to save.
     """
-    ensure_dirs()
-    JOBS_FILE.write_text(json.dumps(jobs, indent=2))
+    with _transaction() as conn:
+        conn.execute("DELETE FROM jobs")
+        for job in jobs.values():
+            _upsert_job(conn, job)
+
+
+def count_jobs() -> tuple[int, int]:
+    """
+    Count registered jobs without loading their definitions.
+
+    Returns:
+        Tuple of (total, enabled).
+    """
+    row = _connect().execute("SELECT COUNT(*), COALESCE(SUM(enabled), 0) FROM jobs").fetchone()
+    return row[0], row[1]
 
 
 def get_job(name: str) -> Optional[dict[str, Any]]:
@@ -49,8 +223,8 @@ def get_job(name: str) -> Optional[dict[str, Any]]:
     Returns:
         Job dictionary if found, None otherwise.
     """
-    jobs = load_jobs()
-    return jobs.get(name)
+    row = _connect().execute("SELECT * FROM jobs WHERE name = ?", (name,)).fetchone()
+    return _row_to_job(row) if row else None
 
 
 def register_job(
@@ -62,6 +236,8 @@ def register_job(
     description: Optional[str] = None,
     enabled: bool = True,
     timeout: Optional[int] = None,
+    priority: int = 0,
+    resources: ResourceSpec = None,
 ) -> dict[str, Any]:
     """
     Register a new job.
@@ -75,17 +251,19 @@ def register_job(
         description: Human-readable description.
         enabled: Whether the job is enabled.
         timeout: Command timeout in seconds.
+        priority: Dispatch priority when jobs wait for resources (higher first).
+        resources: Resource pool units the job holds while running,
+            e.g. 'gpu=1,cpu=2' (default: SCHEDULER_DEFAULT_RESOURCES).
 
     Returns:
         The created job dictionary.
 
     Raises:
-        ValueError: If neither cron nor interval is specified.
+        ValueError: If neither cron nor interval is specified, or resources are malformed.
     """
     if not cron and not interval:
         raise ValueError("Must specify either cron or interval")
-
-    jobs = load_jobs()
+    parsed_resources = parse_resources(resources)
 
     job: dict[str, Any] = {
         "name": name,
@@ -104,9 +282,14 @@ def register_job(
         job["description"] = description
     if timeout:
         job["timeout"] = timeout
+    if priority:
+        job["priority"] = priority
+    if parsed_resources:
+        job["resources"] = parsed_resources
 
-    jobs[name] = job
-    save_jobs(jobs)
+    with _transaction() as conn:
+        conn.execute("DELETE FROM jobs WHERE name = ?", (name,))
+        _upsert_job(conn, job)
 
     return job
 
@@ -121,13 +304,8 @@ def unregister_job(name: str) -> bool:
     Returns:
         True if job was removed, False if not found.
     """
-    jobs = load_jobs()
-    if name not in jobs:
-        return False
-
-    del jobs[name]
-    save_jobs(jobs)
-    return True
+    with _transaction() as conn:
+        return conn.execute("DELETE FROM jobs WHERE name = ?", (name,)).rowcount > 0
 
 
 def set_job_enabled(name: str, enabled: bool) -> bool:
@@ -141,13 +319,9 @@ def set_job_enabled(name: str, enabled: bool) -> bool:
     Returns:
         True if job was updated, False if not found.
     """
-    jobs = load_jobs()
-    if name not in jobs:
-        return False
-
-    jobs[name]["enabled"] = enabled
-    save_jobs(jobs)
-    return True
+    with _transaction() as conn:
+        cur = conn.execute("UPDATE jobs SET enabled = ? WHERE name = ?", (1 if enabled else 0, name))
+        return cur.rowcount > 0
 
 
 def update_job_run_status(
@@ -166,17 +340,12 @@ def update_job_run_status(
     Returns:
         True if job was updated, False if not found.
     """
-    jobs = load_jobs()
-    if name not in jobs:
-        return False
-
-    jobs[name]["last_run"] = int(time.time())
-    jobs[name]["last_status"] = status
-    if duration is not None:
-        jobs[name]["last_duration"] = duration
-
-    save_jobs(jobs)
-    return True
+    with _transaction() as conn:
+        cur = conn.execute(
+            "UPDATE jobs SET last_run = ?, last_status = ?, last_duration = COALESCE(?, last_duration) WHERE name = ?",
+            (int(time.time()), status, duration, name),
+        )
+        return cur.rowcount > 0
 
 
 def load_services_yaml(yaml_path: Path) -> dict[str, Any]:
@@ -208,6 +377,7 @@ def load_services_yaml(yaml_path: Path) -> dict[str, Any]:
 def import_from_yaml(
     yaml_path: Path,
     include_disabled: bool = False,
+    replace: bool = False,
 ) -> tuple[int, int]:
     """
     Import jobs from a services.yaml file.
@@ -215,6 +385,8 @@ def import_from_yaml(
     Args:
         yaml_path: Path to the YAML configuration file.
         include_disabled: Whether to import disabled jobs.
+        replace: Also unregister jobs previously imported from this file that it
+            no longer defines (or now disables).
 
     Returns:
         Tuple of (loaded_count, skipped_count).
@@ -223,7 +395,7 @@ def import_from_yaml(
 
     config = load_services_yaml(yaml_path)
     workdir = config.get("workdir", str(yaml_path.parent))
-    jobs = load_jobs()
+    jobs: dict[str, Any] = {}
     loaded = 0
     skipped = 0
 
@@ -258,6 +430,10 @@ def import_from_yaml(
             job["env"] = job_config["env"]
         if "depends_on" in job_config:
             job["depends_on"] = job_config["depends_on"]
+        if "priority" in job_config:
+            job["priority"] = int(job_config["priority"])
+        if "resources" in job_config:
+            job["resources"] = parse_resources(job_config["resources"])
 
         jobs[name] = job
         loaded += 1
@@ -289,5 +465,13 @@ def import_from_yaml(
         jobs[name] = job
         loaded += 1
 
-    save_jobs(jobs)
+    # Definitions are updated; run status of existing jobs is kept
+    source = str(yaml_path)
+    with _transaction() as conn:
+        if replace:
+            for row in conn.execute("SELECT name, definition FROM jobs").fetchall():
+                if row["name"] not in jobs and json.loads(row["definition"]).get("source") == source:
+                    conn.execute("DELETE FROM jobs WHERE name = ?", (row["name"],))
+        for job in jobs.values():
+            _upsert_job(conn, job)
     return loaded, skipped
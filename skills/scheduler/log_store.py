@@ -0,0 +1,223 @@
+"""
+Run log storage - streamed, size-rotated output segments per job run.
+
+Job output is written straight from the child's pipe to disk, so the daemon
+never holds a run's output in memory. Layout under LOG_DIR/<job>/:
+
+    <run_id>.log          first output segment
+    <run_id>.<n>.log      later segments, rotated at LOG_SEGMENT_BYTES
+    <run_id>.idx.json     segment index (first line, lines, bytes per segment)
+
+Only the newest LOG_MAX_SEGMENTS segments of a run and LOG_RUNS_PER_JOB runs
+per job are kept. Tails read backwards from the end of the newest segment, so
+their cost depends on the lines requested, not on the size of the log.
+"""
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import IO, Any, Callable, Optional
+
+from config import LOG_DIR, LOG_MAX_SEGMENTS, LOG_RUNS_PER_JOB, LOG_SEGMENT_BYTES
+
+_READ_CHUNK = 64 * 1024
+_INDEX_RE = re.compile(r"^(\d+)\.idx\.json$")
+
+
+def run_log_dir(job: str) -> Path:
+    """Directory holding a job's run segments."""
+    return LOG_DIR / job
+
+
+def _index_path(job: str, run_id: int) -> Path:
+    return run_log_dir(job) / f"{run_id}.idx.json"
+
+
+class RunLogWriter:
+    """Append a run's output to rotating segments and keep the index current."""
+
+    def __init__(self, job: str, run_id: int) -> None:
+        self.job = job
+        self.run_id = run_id
+        self.directory = run_log_dir(job)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.bytes_written = 0
+        self.lines_written = 0
+        self.segments: list[dict[str, Any]] = []
+        self.dropped_segments = 0
+        self.closed = False
+        self._lock = threading.Lock()
+        self._file: Optional[IO[bytes]] = None
+        self._open_segment()
+
+    @property
+    def path(self) -> Path:
+        """Path of the first segment."""
+        return self.directory / f"{self.run_id}.log"
+
+    def _open_segment(self) -> None:
+        n = len(self.segments) + self.dropped_segments
+        name = f"{self.run_id}.log" if n == 0 else f"{self.run_id}.{n}.log"
+        self._file = open(self.directory / name, "ab")
+        self.segments.append({"file": name, "first_line": self.lines_written, "lines": 0, "bytes": 0})
+
+        # Drop the oldest segments of very chatty runs
+        while len(self.segments) > LOG_MAX_SEGMENTS:
+            old = self.segments.pop(0)
+            (self.directory / old["file"]).unlink(missing_ok=True)
+            self.dropped_segments += 1
+        self._write_index(complete=False)
+
+    def _append(self, data: bytes) -> None:
+        segment = self.segments[-1]
+        self._file.write(data)
+        lines = data.count(b"\n")
+        segment["bytes"] += len(data)
+        segment["lines"] += lines
+        self.bytes_written += len(data)
+        self.lines_written += lines
+
+    def write(self, data: bytes) -> None:
+        """Append output, rotating at a line boundary once the segment is full."""
+        with self._lock:
+            if self.closed or not data:
+                return
+            room = LOG_SEGMENT_BYTES - self.segments[-1]["bytes"]
+            if len(data) > room:
+                cut = data.rfind(b"\n", 0, max(room, 0)) + 1
+                if cut == 0 and self.segments[-1]["bytes"] == 0:
+                    cut = len(data)  # single huge line: keep it whole
+                self._append(data[:cut])
+                data = data[cut:]
+                if data:
+                    self._file.close()
+                    self._open_segment()
+            self._append(data)
+
+    def pump(self, stream: IO[bytes], on_chunk: Optional[Callable[[bytes], None]] = None) -> None:
+        """Copy a pipe to the log until EOF (run in a reader thread)."""
+        fd = stream.fileno()
+        while True:
+            chunk = os.read(fd, _READ_CHUNK)
+            if not chunk:
+                break
+            self.write(chunk)
+            if on_chunk:
+                on_chunk(chunk)
+
+    def close(self, status: Optional[str] = None, exit_code: Optional[int] = None) -> None:
+        """Flush the last segment, mark the index complete and prune old runs."""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            self._file.close()
+            self._write_index(complete=True, status=status, exit_code=exit_code)
+        prune_job_logs(self.job)
+
+    def _write_index(self, complete: bool, **extra: Any) -> None:
+        index = {
+            "job": self.job,
+            "run_id": self.run_id,
+            "segments": self.segments,
+            "dropped_segments": self.dropped_segments,
+            "total_lines": self.lines_written,
+            "total_bytes": self.bytes_written,
+            "complete": complete,
+            "updated_at": time.time(),
+            **{k: v for k, v in extra.items() if v is not None},
+        }
+        tmp = _index_path(self.job, self.run_id).with_suffix(".tmp")
+        tmp.write_text(json.dumps(index))
+        os.replace(tmp, _index_path(self.job, self.run_id))
+
+
+def read_index(job: str, run_id: int) -> Optional[dict[str, Any]]:
+    """Segment index for a run, or None if the run has no stored output."""
+    try:
+        return json.loads(_index_path(job, run_id).read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def list_run_ids(job: str) -> list[int]:
+    """Run ids with stored output, oldest first."""
+    directory = run_log_dir(job)
+    if not directory.is_dir():
+        return []
+    ids = [int(m.group(1)) for m in (_INDEX_RE.match(p) for p in os.listdir(directory)) if m]
+    return sorted(ids)
+
+
+def prune_job_logs(job: str, keep: Optional[int] = None) -> int:
+    """Delete all but the newest `keep` runs' output. Returns runs deleted."""
+    keep = LOG_RUNS_PER_JOB if keep is None else keep
+    run_ids = list_run_ids(job)
+    stale = run_ids[:-keep] if keep > 0 else run_ids
+    directory = run_log_dir(job)
+    for run_id in stale:
+        for path in directory.glob(f"{run_id}.*"):
+            path.unlink(missing_ok=True)
+    return len(stale)
+
+
+def tail_lines(path: Path, lines: int) -> tuple[list[bytes], bool]:
+    """
+    Last `lines` lines of a file, reading backwards from the end.
+
+    Returns:
+        (lines, whether the whole file was read)
+    """
+    if lines <= 0:
+        return [], path.stat().st_size == 0
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        data = b""
+        while pos > 0 and data.count(b"\n") <= lines:
+            step = min(_READ_CHUNK, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    found = data.splitlines(keepends=True)
+    if pos > 0:
+        found = found[1:]  # first line is partial
+    return found[-lines:], pos == 0 and len(found) <= lines
+
+
+def tail_run_log(job: str, run_id: int, lines: int = 100) -> Optional[dict[str, Any]]:
+    """
+    Last `lines` lines of a run's output across its segments.
+
+    Returns:
+        Dict with 'logs', 'lines', 'total_lines', 'total_bytes', 'complete' and
+        'truncated' (older output was rotated away), or None if not found.
+    """
+    index = read_index(job, run_id)
+    if index is None:
+        return None
+
+    collected: list[bytes] = []
+    directory = run_log_dir(job)
+    for segment in reversed(index["segments"]):
+        path = directory / segment["file"]
+        if not path.exists():
+            continue
+        found, whole = tail_lines(path, lines - len(collected))
+        collected = found + collected
+        if len(collected) >= lines or not whole:
+            break
+
+    return {
+        "job": job,
+        "run_id": run_id,
+        "lines": len(collected),
+        "total_lines": index["total_lines"],
+        "total_bytes": index["total_bytes"],
+        "complete": index["complete"],
+        "status": index.get("status"),
+        "truncated": index.get("dropped_segments", 0) > 0,
+        "logs": b"".join(collected).decode("utf-8", "replace"),
+    }
@@ -13,10 +13,15 @@ from config import (
     PORT_FILE,
     DEFAULT_METRICS_PORT,
     RUNNING_JOBS,
+    RUNNING_JOBS_LOCK,
     METRICS_COUNTERS,
     get_start_time,
 )
-from job_registry import load_jobs
+from job_metrics import JOB_METRICS
+from job_registry import count_jobs, load_jobs, get_job as registry_get_job
+from job_queue import get_job_queue
+from log_store import list_run_ids, tail_lines, tail_run_log
+from run_history import get_run_history, get_run_stats
 from utils import ensure_dirs, rprint, HAS_FASTAPI
 
 if HAS_FASTAPI:
@@ -50,40 +55,56 @@ def create_metrics_app() -> Optional["FastAPIApp"]:
         """Root endpoint with links."""
         return {
             "service": "pi-scheduler",
-            "endpoints": ["/status", "/jobs", "/jobs/{name}", "/jobs/{name}/logs", "/metrics"],
+            "endpoints": ["/status", "/jobs", "/jobs/{name}", "/jobs/{name}/runs", "/jobs/{name}/runs/{id}/log",
+                          "/jobs/{name}/logs", "/queue", "/metrics"],
         }
 
     @app.get("/status")
     def status() -> dict:
         """Scheduler daemon status."""
-        jobs = load_jobs()
-        enabled = sum(1 for j in jobs.values() if j.get("enabled", True))
+        total, enabled = count_jobs()
         start_time = get_start_time()
+        queue = get_job_queue()
         return {
             "running": True,  # If this endpoint responds, daemon is running
             "pid": os.getpid(),
             "uptime": time.time() - start_time if start_time else 0,
-            "jobs_total": len(jobs),
+            "jobs_total": total,
             "jobs_enabled": enabled,
             "jobs_running": len(RUNNING_JOBS),
+            "jobs_queued": len(queue.snapshot()["pending"]) if queue else 0,
             "metrics": METRICS_COUNTERS,
         }
 
+    @app.get("/queue")
+    def job_queue() -> dict:
+        """Resource pools, pending jobs in dispatch order, and queue-wait stats."""
+        queue = get_job_queue()
+        if queue is None:
+            raise HTTPException(status_code=503, detail="Job queue not running (daemon not started)")
+        return queue.snapshot()
+
     @app.get("/jobs")
     def list_jobs() -> dict:
-        """List all jobs with status."""
+        """List all jobs with status and 24h run counts."""
         jobs = load_jobs()
+        stats_24h = get_run_stats(since=time.time() - 86400)
         result = []
         for name, job in jobs.items():
             is_running = name in RUNNING_JOBS
+            stats = stats_24h.get(name, {})
             result.append({
                 "name": name,
                 "schedule": job.get("cron") or job.get("interval"),
                 "enabled": job.get("enabled", True),
                 "running": is_running,
+                "priority": job.get("priority", 0),
+                "resources": job.get("resources"),
                 "last_run": job.get("last_run"),
                 "last_status": job.get("last_status"),
                 "last_duration": job.get("last_duration"),
+                "runs_24h": stats.get("runs", 0),
+                "failures_24h": (stats.get("failed") or 0) + (stats.get("timeout") or 0),
                 "command": job.get("command"),
                 "workdir": job.get("workdir"),
             })
@@ -92,11 +113,10 @@ def create_metrics_app() -> Optional["FastAPIApp"]:
     @app.get("/jobs/{name}")
     def get_job(name: str) -> dict:
         """Get details for a specific job."""
-        jobs = load_jobs()
-        if name not in jobs:
+        job = registry_get_job(name)
+        if job is None:
             raise HTTPException(status_code=404, detail=f"Job not found: {name}")
 
-        job = jobs[name]
         is_running = name in RUNNING_JOBS
         running_info = RUNNING_JOBS.get(name, {})
 
@@ -105,35 +125,57 @@ def create_metrics_app() -> Optional["FastAPIApp"]:
             "running": is_running,
             "running_since": running_info.get("started"),
             "progress": running_info.get("progress"),
+            "recent_runs": get_run_history(name, limit=5),
         }
 
+    @app.get("/jobs/{name}/runs")
+    def get_job_runs(name: str, limit: int = 50) -> dict:
+        """Run history for a job, newest first."""
+        limit = max(1, min(int(limit), 1000))
+        if registry_get_job(name) is None:
+            raise HTTPException(status_code=404, detail=f"Job not found: {name}")
+        runs = get_run_history(name, limit=limit)
+        return {"job": name, "runs": runs, "count": len(runs)}
+
     @app.get("/jobs/{name}/logs")
     def get_job_logs(name: str, lines: int = 100) -> dict:
-        """Get recent logs for a job."""
+        """Get the last lines of a job's most recent run output."""
         lines = max(1, min(int(lines), 1000))
+        run_ids = list_run_ids(name)
+        if run_ids:
+            return tail_run_log(name, run_ids[-1], lines)
+
+        # Jobs that have not run since output moved to per-run segments
         log_file = LOG_DIR / f"{name}.log"
         if not log_file.exists():
             raise HTTPException(status_code=404, detail=f"No logs for job: {name}")
+        found, _ = tail_lines(log_file, lines)
+        return {
+            "job": name,
+            "lines": len(found),
+            "logs": b"".join(found).decode("utf-8", "replace"),
+        }
 
-        with open(log_file) as f:
-            all_lines = f.readlines()
-            return {
-                "job": name,
-                "lines": lines,
-                "total_lines": len(all_lines),
-                "logs": "".join(all_lines[-lines:]),
-            }
+    @app.get("/jobs/{name}/runs/{run_id}/log")
+    def get_run_log(name: str, run_id: int, lines: int = 100) -> dict:
+        """Get the last lines of one run's output."""
+        lines = max(1, min(int(lines), 10000))
+        result = tail_run_log(name, run_id, lines)
+        if result is None:
+            raise HTTPException(status_code=404, detail=f"No output stored for {name} run {run_id}")
+        return result
 
     @app.get("/metrics", response_class=PlainTextResponse)
     def prometheus_metrics() -> str:
-        """Prometheus-compatible metrics endpoint."""
-        jobs = load_jobs()
-        enabled = sum(1 for j in jobs.values() if j.get("enabled", True))
+        """Prometheus-compatible metrics endpoint (no per-scrape job loading)."""
+        total, enabled = count_jobs()
+        with RUNNING_JOBS_LOCK:
+            running = {name: dict(info) for name, info in RUNNING_JOBS.items()}
 
         lines = [
             "# HELP scheduler_jobs_total Total number of registered jobs",
             "# TYPE scheduler_jobs_total gauge",
-            f"scheduler_jobs_total {len(jobs)}",
+            f"scheduler_jobs_total {total}",
             "",
             "# HELP scheduler_jobs_enabled Number of enabled jobs",
             "# TYPE scheduler_jobs_enabled gauge",
@@ -141,7 +183,7 @@ def create_metrics_app() -> Optional["FastAPIApp"]:
             "",
             "# HELP scheduler_jobs_running Number of currently running jobs",
             "# TYPE scheduler_jobs_running gauge",
-            f"scheduler_jobs_running {len(RUNNING_JOBS)}",
+            f"scheduler_jobs_running {len(running)}",
             "",
             "# HELP scheduler_executions_total Total job executions",
             "# TYPE scheduler_executions_total counter",
@@ -160,20 +202,13 @@ def create_metrics_app() -> Optional["FastAPIApp"]:
             f"scheduler_executions_timeout {METRICS_COUNTERS['jobs_timeout']}",
         ]
 
-        # Per-job metrics
-        for name, job in jobs.items():
-            last_run = job.get("last_run", 0)
-            last_duration = job.get("last_duration", 0)
-            last_success = 1 if job.get("last_status") == "success" else 0
-
-            lines.extend([
-                "",
-                f"# HELP scheduler_job_last_run_timestamp Last run timestamp for {name}",
-                f"# TYPE scheduler_job_last_run_timestamp gauge",
-                f'scheduler_job_last_run_timestamp{{job="{name}"}} {last_run}',
-                f'scheduler_job_last_duration_seconds{{job="{name}"}} {last_duration}',
-                f'scheduler_job_last_success{{job="{name}"}} {last_success}',
-            ])
+        # Per-job histograms, totals and resource usage, kept in memory
+        lines.extend(JOB_METRICS.prometheus_lines(running))
+
+        queue = get_job_queue()
+        if queue is not None:
+            lines.append("")
+            lines.extend(queue.prometheus_lines())
 
         return "\n".join(lines) + "\n"
 
@@ -182,10 +217,15 @@ def create_metrics_app() -> Optional["FastAPIApp"]:
         """Trigger a job to run immediately (async)."""
         from executor import job_wrapper
 
-        jobs = load_jobs()
-        if name not in jobs:
+        if registry_get_job(name) is None:
             raise HTTPException(status_code=404, detail=f"Job not found: {name}")
 
+        # Through the daemon's queue so manual runs respect resource limits
+        queue = get_job_queue()
+        if queue is not None:
+            job = registry_get_job(name)
+            return {"status": "queued" if queue.submit(job) else "coalesced", "job": name}
+
         # Run in background thread
         thread = threading.Thread(target=job_wrapper, args=(name,))
         thread.start()
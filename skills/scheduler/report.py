@@ -4,11 +4,14 @@ Report generation - comprehensive status reports with metrics and failures.
 Provides both Rich TUI and plain text report output.
 """
 import json
+import time
 from datetime import datetime
 from typing import Any
 
-from config import LOG_DIR, METRICS_COUNTERS
+from config import METRICS_COUNTERS
 from job_registry import load_jobs
+from log_store import tail_run_log
+from run_history import get_run_stats, get_recent_failures
 from utils import rprint, is_daemon_running, get_daemon_pid, HAS_RICH, console
 
 # Conditional imports for rich components
@@ -25,6 +28,7 @@ def generate_report_data() -> dict[str, Any]:
         Dictionary containing all report metrics and job statistics.
     """
     jobs = load_jobs()
+    stats_24h = get_run_stats(since=time.time() - 86400)
 
     # Aggregate metrics
     total_jobs = len(jobs)
@@ -49,38 +53,31 @@ def generate_report_data() -> dict[str, Any]:
             "last_status": job.get("last_status"),
             "last_duration": job.get("last_duration", 0),
             "description": job.get("description", ""),
+            "runs_24h": stats_24h.get(name, {}).get("runs", 0),
         }
         job_stats.append(stat)
 
-        # Collect recent failures
-        if stat["last_status"] in ("failed", "timeout"):
-            log_file = LOG_DIR / f"{name}.log"
-            log_excerpt = ""
-            if log_file.exists():
-                with open(log_file) as f:
-                    lines = f.readlines()
-                    # Get last execution block
-                    last_block = []
-                    for line in reversed(lines):
-                        last_block.insert(0, line)
-                        if line.startswith("====="):
-                            break
-                        if len(last_block) > 20:
-                            break
-                    log_excerpt = "".join(last_block[-15:])
-
-            recent_failures.append({
-                "name": name,
-                "status": stat["last_status"],
-                "last_run": stat["last_run"],
-                "duration": stat["last_duration"],
-                "log_excerpt": log_excerpt.strip(),
-            })
+    # Recent failures from the run history (indexed by status, newest first)
+    for run in get_recent_failures(limit=5):
+        name = run["job"]
+        tail = tail_run_log(name, run["id"], 15)
+        log_excerpt = tail["logs"] if tail else ""
+
+        recent_failures.append({
+            "name": name,
+            "status": run["status"],
+            "last_run": int(run["started_at"]),
+            "duration": run["duration"] or 0,
+            "exit_code": run["exit_code"],
+            "log_excerpt": log_excerpt.strip(),
+        })
 
     # Calculate aggregate metrics
     total_duration = sum(j.get("last_duration", 0) for j in jobs.values() if j.get("last_run"))
     avg_duration = total_duration / jobs_run if jobs_run > 0 else 0
     success_rate = (successes / jobs_run * 100) if jobs_run > 0 else 0
+    runs_24h = sum(s["runs"] for s in stats_24h.values())
+    successes_24h = sum(s["success"] or 0 for s in stats_24h.values())
 
     return {
         "generated_at": datetime.now().isoformat(),
@@ -94,6 +91,8 @@ def generate_report_data() -> dict[str, Any]:
             "success_rate": round(success_rate, 1),
             "avg_duration_seconds": round(avg_duration, 2),
             "total_runtime_seconds": round(total_duration, 2),
+            "runs_24h": runs_24h,
+            "success_rate_24h": round(successes_24h / runs_24h * 100, 1) if runs_24h else None,
         },
         "daemon": {
             "running": is_daemon_running(),
@@ -101,7 +100,7 @@ def generate_report_data() -> dict[str, Any]:
             "metrics_counters": METRICS_COUNTERS,
         },
         "jobs": job_stats,
-        "recent_failures": recent_failures[:5],  # Top 5 recent failures
+        "recent_failures": recent_failures,  # 5 most recent failed runs
     }
 
 
@@ -0,0 +1,165 @@
+"""
+Run history - one row per job execution in the scheduler database.
+
+Shares job_registry's SQLite connection; record_run_end also updates the job's
+last-run columns in the same transaction.
+"""
+import time
+from typing import Any, Optional
+
+from config import RUN_HISTORY_DAYS
+from job_registry import _connect, _transaction
+
+
+def record_run_start(name: str, started_at: Optional[float] = None) -> int:
+    """
+    Append a run to the history.
+
+    Args:
+        name: Job name.
+        started_at: Start timestamp (defaults to now).
+
+    Returns:
+        Run id to pass to record_run_end.
+    """
+    with _transaction() as conn:
+        cur = conn.execute(
+            "INSERT INTO runs (job, started_at, status) VALUES (?, ?, 'running')",
+            (name, started_at or time.time()),
+        )
+        return int(cur.lastrowid)
+
+
+def record_run_end(
+    run_id: int,
+    status: str,
+    exit_code: Optional[int] = None,
+    duration: Optional[float] = None,
+    output_bytes: Optional[int] = None,
+    queue_wait: Optional[float] = None,
+    cpu_user: Optional[float] = None,
+    cpu_system: Optional[float] = None,
+    max_rss_bytes: Optional[int] = None,
+) -> None:
+    """
+    Complete a run and update the job's last-run status in one transaction.
+
+    Args:
+        run_id: Id returned by record_run_start.
+        status: Execution status ('success', 'failed', 'timeout').
+        exit_code: Process exit code.
+        duration: Execution duration in seconds.
+        output_bytes: Bytes of stdout + stderr.
+        queue_wait: Seconds spent waiting for resources before starting.
+        cpu_user: Child user CPU seconds.
+        cpu_system: Child system CPU seconds.
+        max_rss_bytes: Peak resident set size of the child.
+    """
+    now = time.time()
+    with _transaction() as conn:
+        row = conn.execute("SELECT job, started_at FROM runs WHERE id = ?", (run_id,)).fetchone()
+        if row is None:
+            return
+        if duration is None:
+            duration = now - row["started_at"]
+        conn.execute(
+            """
+            UPDATE runs SET ended_at = ?, status = ?, exit_code = ?, duration = ?, output_bytes = ?,
+                            queue_wait = ?, cpu_user = ?, cpu_system = ?, max_rss_bytes = ?
+            WHERE id = ?
+            """,
+            (now, status, exit_code, duration, output_bytes,
+             queue_wait, cpu_user, cpu_system, max_rss_bytes, run_id),
+        )
+        conn.execute(
+            "UPDATE jobs SET last_run = ?, last_status = ?, last_duration = ? WHERE name = ?",
+            (int(now), status, duration, row["job"]),
+        )
+
+
+def get_run_history(name: str, limit: int = 20) -> list[dict[str, Any]]:
+    """
+    Most recent runs of a job, newest first.
+
+    Args:
+        name: Job name.
+        limit: Maximum number of runs.
+
+    Returns:
+        List of run dictionaries.
+    """
+    rows = _connect().execute(
+        "SELECT * FROM runs WHERE job = ? ORDER BY started_at DESC LIMIT ?",
+        (name, limit),
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def get_run_stats(since: Optional[float] = None) -> dict[str, dict[str, Any]]:
+    """
+    Aggregate completed runs per job.
+
+    Args:
+        since: Only count runs started at or after this timestamp.
+
+    Returns:
+        Dictionary keyed by job name with runs, success/failed/timeout counts,
+        avg/max duration, total output bytes and CPU seconds, and peak RSS.
+    """
+    rows = _connect().execute(
+        """
+        SELECT job,
+               COUNT(*) AS runs,
+               SUM(status = 'success') AS success,
+               SUM(status = 'failed') AS failed,
+               SUM(status = 'timeout') AS timeout,
+               AVG(duration) AS avg_duration,
+               MAX(duration) AS max_duration,
+               SUM(COALESCE(output_bytes, 0)) AS output_bytes,
+               SUM(COALESCE(cpu_user, 0)) AS cpu_user,
+               SUM(COALESCE(cpu_system, 0)) AS cpu_system,
+               MAX(max_rss_bytes) AS max_rss_bytes
+        FROM runs
+        WHERE started_at >= ? AND status != 'running'
+        GROUP BY job
+        """,
+        (since or 0,),
+    ).fetchall()
+    return {row["job"]: dict(row) for row in rows}
+
+
+def get_recent_failures(limit: int = 5, since: Optional[float] = None) -> list[dict[str, Any]]:
+    """
+    Most recent failed or timed-out runs across all jobs.
+
+    Args:
+        limit: Maximum number of runs.
+        since: Only include runs started at or after this timestamp.
+
+    Returns:
+        List of run dictionaries, newest first.
+    """
+    rows = _connect().execute(
+        """
+        SELECT * FROM runs
+        WHERE status IN ('failed', 'timeout') AND started_at >= ?
+        ORDER BY started_at DESC LIMIT ?
+        """,
+        (since or 0, limit),
+    ).fetchall()
+    return [dict(row) for row in rows]
+
+
+def prune_run_history(days: Optional[float] = None) -> int:
+    """
+    Delete runs older than the retention window.
+
+    Args:
+        days: Retention in days (defaults to SCHEDULER_RUN_HISTORY_DAYS).
+
+    Returns:
+        Number of runs deleted.
+    """
+    cutoff = time.time() - 86400 * (RUN_HISTORY_DAYS if days is None else days)
+    with _transaction() as conn:
+        return conn.execute("DELETE FROM runs WHERE started_at < ?", (cutoff,)).rowcount
@@ -33,7 +33,11 @@ REQUIRED_MODULES=(
     "utils.py"
     "cron_parser.py"
     "job_registry.py"
+    "run_history.py"
+    "job_queue.py"
+    "job_metrics.py"
     "executor.py"
+    "log_store.py"
     "metrics_server.py"
     "daemon.py"
     "commands.py"
@@ -88,6 +92,10 @@ from config import DATA_DIR, JOBS_FILE
 from utils import rprint, ensure_dirs
 from cron_parser import parse_interval
 from job_registry import load_jobs, save_jobs
+from run_history import record_run_start
+from job_queue import JobQueue
+from job_metrics import JOB_METRICS
+from log_store import tail_run_log
 from executor import run_job
 from daemon import SchedulerDaemon
 from commands import cmd_status
@@ -3,7 +3,8 @@
 Scheduler CLI - Background task scheduler for Pi and Claude Code.
 
 A lightweight background task scheduler using APScheduler.
-Stores jobs in JSON, logs execution, supports cron and interval triggers.
+Stores jobs and run history in SQLite, streams job output to rotated
+per-run logs, supports cron and interval triggers.
 Features rich TUI output with progress indicators.
 
 This is a thin CLI entry point that delegates to modular components:
@@ -11,7 +12,11 @@ This is a thin CLI entry point that delegates to modular components:
 - utils.py: Common utilities, optional dependency handling
 - cron_parser.py: Cron and interval parsing
 - job_registry.py: Job storage and management
+- run_history.py: Per-run history records and stats
+- job_queue.py: Resource pools, priorities, queue-wait stats
+- job_metrics.py: Per-job histograms and resource accounting
 - executor.py: Job execution logic
+- log_store.py: Per-run output segments and tails
 - metrics_server.py: FastAPI metrics endpoints
 - daemon.py: Scheduler daemon class
 - commands.py: CLI command handlers
@@ -68,6 +73,8 @@ def main() -> None:
     p.add_argument("--workdir", help="Working directory")
     p.add_argument("--description", help="Job description")
     p.add_argument("--enabled", type=bool, default=True)
+    p.add_argument("--priority", type=int, default=0, help="Higher runs first when resources are busy")
+    p.add_argument("--resources", help="Resource units held while running (e.g., gpu=1,cpu=2)")
     p.add_argument("--json", action="store_true")
 
     # unregister
@@ -102,6 +109,8 @@ def main() -> None:
     p = subparsers.add_parser("load", help="Load jobs from services.yaml")
     p.add_argument("file", help="Path to services.yaml file")
     p.add_argument("--include-disabled", action="store_true", help="Also load disabled jobs")
+    p.add_argument("--replace", action="store_true",
+                   help="Unregister jobs previously loaded from this file that it no longer defines")
 
     # report
     p = subparsers.add_parser("report", help="Generate comprehensive status report")
@@ -166,8 +166,9 @@ class BatchJob:
 
     @property
     def completed_videos(self) -> int:
-        state = self._read_state()
-        return len(state.get("completed", []))
+        completed = self._read_state().get("completed", 0)
+        # Progress-journal headers store a count; legacy state files a list
+        return len(completed) if isinstance(completed, list) else completed
 
     @property
     def stats(self) -> dict:
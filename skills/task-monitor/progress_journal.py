@@ -0,0 +1,168 @@
+"""
+progress_journal.py - Compact incremental progress state for batch skills.
+
+A batch state file used to hold the full list of completed IDs, so every save
+rewrote (and every task-monitor poll parsed) a file that grows with the batch.
+A progress journal splits it in two:
+
+    <state>.json       Small JSON header: counters, stats, current item.
+                       Replaced atomically on save; never larger than
+                       HEADER_MAX_BYTES, whatever the number of items.
+    <state>.completed  Append-only log of completed IDs, one per line.
+                       Only read when a run resumes.
+
+The header keeps the standard task-monitor fields ("completed" is a count),
+so task-monitor and other JSON readers work unchanged and only ever read the
+header. Legacy state files with a "completed" list are migrated on load.
+
+Stdlib only, so any batch skill can use it:
+
+    sys.path.append(str(SKILLS_DIR / "task-monitor"))
+    from progress_journal import ProgressJournal
+
+    journal = ProgressJournal(output_dir / ".batch_state.json")
+    journal.load()
+    for vid in pending:
+        if journal.is_completed(vid):
+            continue
+        process(vid)
+        journal.mark_completed(vid)
+        journal.save(current_item="", stats=stats)
+"""
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+FORMAT = "progress-journal/1"
+HEADER_MAX_BYTES = 64 * 1024  # task-monitor reads at most this much of a state file
+
+
+def journal_path(state_file: Path) -> Path:
+    """Completed-ID log that belongs to a state file."""
+    return state_file.with_suffix(".completed")
+
+
+def read_header(state_file: Path) -> Optional[dict]:
+    """Read a state file's header without touching the completed-ID log.
+
+    Returns:
+        Header dictionary, or None if the file is missing, unreadable or too
+        large to be a header (a legacy state file).
+    """
+    try:
+        with open(state_file, "rb") as f:
+            data = f.read(HEADER_MAX_BYTES + 1)
+    except OSError:
+        return None
+    if len(data) > HEADER_MAX_BYTES:
+        return None
+    try:
+        header = json.loads(data)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return header if isinstance(header, dict) else None
+
+
+class ProgressJournal:
+    """Completed-ID log plus a small, atomically replaced header."""
+
+    def __init__(self, state_file: Path):
+        self.state_file = Path(state_file)
+        self.journal_file = journal_path(self.state_file)
+        self.completed: set[str] = set()
+        self.fields: dict[str, Any] = {}
+        self._log = None
+
+    def load(self) -> bool:
+        """Load the header and completed IDs (migrating a legacy state file).
+
+        Returns:
+            True if existing state was found, False otherwise
+        """
+        if not self.state_file.exists():
+            return False
+        header = read_header(self.state_file)
+        if header is None:
+            try:
+                with open(self.state_file) as f:
+                    header = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                return False
+
+        legacy = header.pop("completed", None)
+        header.pop("format", None)
+        header.pop("journal", None)
+        self.fields = header
+        self.completed = set(self._read_journal())
+        if isinstance(legacy, list):
+            # Old format: move the ID list into the journal once
+            self._append(item for item in dict.fromkeys(map(str, legacy)) if item not in self.completed)
+            self.completed.update(map(str, legacy))
+            self.save()
+        return True
+
+    def _read_journal(self) -> list[str]:
+        """Completed IDs from the log; a torn last line (crash mid-write) is dropped."""
+        try:
+            with open(self.journal_file, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            with open(self.journal_file, "r+b") as f:
+                f.truncate(end)
+        return [line for line in data[:end].decode("utf-8").splitlines() if line]
+
+    def _append(self, items: Iterable[str]) -> None:
+        if self._log is None:
+            self.journal_file.parent.mkdir(parents=True, exist_ok=True)
+            self._log = open(self.journal_file, "a", encoding="utf-8")
+        lines = "".join(f"{item}\n" for item in items)
+        if lines:
+            self._log.write(lines)
+            self._log.flush()
+
+    def is_completed(self, item_id: str) -> bool:
+        """Check if an item was already completed."""
+        return item_id in self.completed
+
+    def mark_completed(self, item_id: str) -> None:
+        """Record a completed item (one appended line; no header rewrite)."""
+        item_id = str(item_id)
+        if "\n" in item_id:
+            raise ValueError(f"Item ID contains a newline: {item_id!r}")
+        if item_id not in self.completed:
+            self._append([item_id])
+            self.completed.add(item_id)
+
+    def save(self, **fields: Any) -> None:
+        """Update header fields and write the header.
+
+        Args:
+            **fields: Header fields to set (stats, current_item, ...); earlier
+                values are kept. "completed" and "last_updated" are filled in.
+        """
+        self.fields.update(fields)
+        header = {
+            **self.fields,
+            "format": FORMAT,
+            "journal": self.journal_file.name,
+            "completed": len(self.completed),
+            "last_updated": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        data = json.dumps(header, indent=2).encode("utf-8")
+        if len(data) > HEADER_MAX_BYTES:
+            raise ValueError(f"State header is {len(data)} bytes (max {HEADER_MAX_BYTES})")
+        tmp = self.state_file.with_name(self.state_file.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, self.state_file)
+
+    def close(self) -> None:
+        """Close the completed-ID log."""
+        if self._log is not None:
+            self._log.close()
+            self._log = None
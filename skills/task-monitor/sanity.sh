@@ -35,6 +35,7 @@ MODULES=(
     "task_monitor/models.py"
     "task_monitor/stores.py"
     "task_monitor/utils.py"
+    "task_monitor/watcher.py"
     "task_monitor/tui.py"
     "task_monitor/http_api.py"
     "task_monitor/cli.py"
@@ -91,6 +92,7 @@ from task_monitor import config
 from task_monitor import models
 from task_monitor import stores
 from task_monitor import utils
+from task_monitor import watcher
 from task_monitor import tui
 from task_monitor import http_api
 from task_monitor import cli
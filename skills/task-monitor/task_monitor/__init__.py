@@ -8,6 +8,7 @@ Modules:
     models - Pydantic data models
     stores - Data persistence (TaskRegistry, HistoryStore, etc.)
     utils - Common utility functions
+    watcher - State file watching and in-memory status cache
     tui - Rich terminal UI components
     http_api - FastAPI HTTP server
     cli - Command-line interface
@@ -34,6 +35,7 @@ from task_monitor.utils import (
     get_task_status,
     read_task_state,
 )
+from task_monitor.watcher import StatusCache
 
 __all__ = [
     # Config
@@ -54,6 +56,8 @@ __all__ = [
     # Utils
     "get_task_status",
     "read_task_state",
+    # Watcher
+    "StatusCache",
 ]
 
 __version__ = "2.0.0"
@@ -16,7 +16,8 @@ REGISTRY_DIR = Path.home() / ".pi" / "task-monitor"
 REGISTRY_DIR.mkdir(parents=True, exist_ok=True)
 
 REGISTRY_FILE = REGISTRY_DIR / "registry.json"
-HISTORY_FILE = REGISTRY_DIR / "history.json"
+HISTORY_FILE = REGISTRY_DIR / "history.json"  # legacy, imported into HISTORY_DB
+HISTORY_DB = REGISTRY_DIR / "history.db"
 SESSIONS_FILE = REGISTRY_DIR / "sessions.json"
 QUALITY_DIR = REGISTRY_DIR / "quality"
 
@@ -48,7 +49,13 @@ MAX_HISTORY_ENTRIES = 10000
 MAX_SESSION_ENTRIES = 100
 
 # Quality metrics settings
-MAX_QUALITY_ENTRIES = 1000
+MAX_QUALITY_ENTRIES = 1000  # per task
+
+# Append-only stores trim old rows every N appends
+STORE_COMPACT_INTERVAL = 500
+
+# State files: progress-journal headers are at most this size (see progress_journal.py)
+STATE_HEADER_MAX_BYTES = 64 * 1024
 
 # TUI settings
 DEFAULT_REFRESH_INTERVAL = 2  # seconds
@@ -58,5 +65,9 @@ RATE_HISTORY_WINDOW = 600  # 10 minutes in seconds
 DEFAULT_API_PORT = 8765
 API_HOST = "0.0.0.0"
 
-# Hook polling interval
-HOOK_POLL_INTERVAL = 5  # seconds
+# State watching (event-driven status cache)
+WATCH_DEBOUNCE = 0.2  # seconds to coalesce bursts of file events
+WATCH_POLL_INTERVAL = 2  # seconds between stat() checks when inotify is unavailable
+WATCH_RESYNC_INTERVAL = 60  # seconds between full stat() resyncs
+STREAM_KEEPALIVE = 15  # seconds between SSE keepalive comments
+STREAM_QUEUE_SIZE = 1000  # pending events per SSE client before it is resynced
@@ -1,21 +1,26 @@
 """Task Monitor HTTP API - FastAPI server for remote monitoring.
 
 This module provides the HTTP API for task monitoring and management.
+Task status is served from an event-driven StatusCache (see watcher.py);
+GET /stream pushes status changes to clients as Server-Sent Events.
 """
 from __future__ import annotations
 
 import asyncio
+import json
 import subprocess
+import threading
 from datetime import datetime
 from pathlib import Path
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from rich.console import Console
 
-from task_monitor.config import BATCH_REPORT_PATHS, HOOK_POLL_INTERVAL
+from task_monitor.config import BATCH_REPORT_PATHS, STREAM_KEEPALIVE, STREAM_QUEUE_SIZE
 from task_monitor.models import HistoryEntry, QualityMetrics, TaskConfig
-from task_monitor.stores import HistoryStore, QualityStore, SessionTracker, TaskRegistry
-from task_monitor.utils import get_task_status
+from task_monitor.stores import HistoryStore, QualityStore, SessionTracker
+from task_monitor.watcher import StatusCache
 
 
 # =============================================================================
@@ -30,8 +35,8 @@ app_api = FastAPI(
 
 console = Console()
 
-# Global registry and quality store instances
-registry = TaskRegistry()
+# Global status cache (owns the task registry) and quality store instances
+status_cache = StatusCache()
 quality_store = QualityStore()
 
 
@@ -55,8 +60,9 @@ async def list_endpoints():
             "pause_task": "POST /tasks/{name}/pause",
             "resume_task": "POST /tasks/{name}/resume",
             "check_paused": "GET /tasks/{name}/paused",
+            "stream": "GET /stream (Server-Sent Events)",
         },
-        "task_count": len(registry.tasks),
+        "task_count": len(status_cache.registry.tasks),
     }
 
 
@@ -67,61 +73,107 @@ async def list_endpoints():
 @app_api.get("/tasks")
 async def list_tasks():
     """List all registered tasks."""
-    return {"tasks": list(registry.tasks.keys())}
+    return {"tasks": list(status_cache.registry.tasks.keys())}
 
 
 @app_api.get("/tasks/{name}")
 async def get_task(name: str):
     """Get status of a specific task."""
-    if name not in registry.tasks:
+    status = status_cache.get(name)
+    if status is None:
         raise HTTPException(status_code=404, detail=f"Task '{name}' not found")
-    return get_task_status(registry.tasks[name])
+    return status
 
 
 @app_api.get("/all")
 async def get_all_status():
     """Get status of all registered tasks."""
-    results = {}
-    totals = {"completed": 0, "total": 0}
+    return status_cache.snapshot()
 
-    for name, task in registry.tasks.items():
-        status = get_task_status(task)
-        results[name] = status
 
-        if "completed" in status and status["completed"]:
-            totals["completed"] += status["completed"]
-        if task.total:
-            totals["total"] += task.total
+@app_api.get("/stream")
+async def stream_status():
+    """Push task status changes as Server-Sent Events.
 
-    if totals["total"] > 0:
-        totals["progress_pct"] = (totals["completed"] / totals["total"]) * 100
+    The first event is a `snapshot` (same shape as GET /all), followed by
+    `update` and `removed` events carrying one task plus new totals. Every
+    event's id is the cache version; events with a version not newer than
+    the snapshot can be ignored. A client that falls behind gets a fresh
+    snapshot instead of the missed events.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+
+    def offer(event: dict) -> None:
+        try:
+            queue.put_nowait(event)
+        except asyncio.QueueFull:
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait({"type": "resync"})
+
+    def on_event(event: dict) -> None:
+        # Called from the watcher thread
+        loop.call_soon_threadsafe(offer, event)
 
-    return {"tasks": results, "totals": totals}
+    # Listen before taking the snapshot so no change falls in between
+    status_cache.add_listener(on_event)
+
+    async def events():
+        try:
+            snapshot = status_cache.snapshot()
+            yield _sse_message("snapshot", snapshot, snapshot["version"])
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=STREAM_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if event["type"] == "resync":
+                    snapshot = status_cache.snapshot()
+                    yield _sse_message("snapshot", snapshot, snapshot["version"])
+                else:
+                    yield _sse_message(event["type"], event, event["version"])
+        finally:
+            status_cache.remove_listener(on_event)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+def _sse_message(event: str, data: dict, event_id: int) -> str:
+    """Format one Server-Sent Events message."""
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data, default=str)}\n\n"
 
 
 @app_api.post("/tasks")
 async def register_task(config: TaskConfig):
     """Register a new task to monitor."""
-    registry.register(config)
+    status_cache.registry.register(config)
+    status_cache.reload_registry()
     return {"status": "registered", "name": config.name}
 
 
 @app_api.delete("/tasks/{name}")
 async def unregister_task(name: str):
     """Unregister a task."""
-    if name not in registry.tasks:
+    if name not in status_cache.registry.tasks:
         raise HTTPException(status_code=404, detail=f"Task '{name}' not found")
-    registry.unregister(name)
+    status_cache.registry.unregister(name)
+    status_cache.reload_registry()
     return {"status": "unregistered", "name": name}
 
 
 @app_api.post("/tasks/{name}/state")
 async def update_task_state(name: str, state: dict):
     """Update task state via API (Push mode)."""
-    if name not in registry.tasks:
+    if name not in status_cache.registry.tasks:
         raise HTTPException(status_code=404, detail=f"Task '{name}' not found")
 
-    task = registry.tasks[name]
+    task = status_cache.registry.tasks[name]
     path = Path(task.state_file)
 
     # Ensure directory exists
@@ -129,12 +181,12 @@ async def update_task_state(name: str, state: dict):
 
     # Write state to file
     try:
-        import json
         with open(path, 'w', encoding="utf-8") as f:
             json.dump(state, f, indent=2)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to write state file: {e}")
 
+    status_cache.refresh(name)  # don't wait for the watcher
     return {"status": "updated", "name": name}
 
 
@@ -182,34 +234,34 @@ async def get_quality_metrics(name: str, limit: int = 100):
 @app_api.post("/tasks/{name}/pause")
 async def pause_task(name: str):
     """Pause a task (for early termination)."""
-    if name not in registry.tasks:
+    if name not in status_cache.registry.tasks:
         raise HTTPException(status_code=404, detail=f"Task '{name}' not found")
 
-    task = registry.tasks[name]
+    task = status_cache.registry.tasks[name]
     task.paused = True
-    registry.register(task)  # Save update
+    status_cache.registry.register(task)  # Save update
     return {"status": "paused", "name": name}
 
 
 @app_api.post("/tasks/{name}/resume")
 async def resume_task(name: str):
     """Resume a paused task."""
-    if name not in registry.tasks:
+    if name not in status_cache.registry.tasks:
         raise HTTPException(status_code=404, detail=f"Task '{name}' not found")
 
-    task = registry.tasks[name]
+    task = status_cache.registry.tasks[name]
     task.paused = False
-    registry.register(task)  # Save update
+    status_cache.registry.register(task)  # Save update
     return {"status": "running", "name": name}
 
 
 @app_api.get("/tasks/{name}/paused")
 async def check_paused(name: str):
     """Check if a task is paused."""
-    if name not in registry.tasks:
+    if name not in status_cache.registry.tasks:
         return {"paused": False}  # Unknown tasks default to not paused
 
-    task = registry.tasks[name]
+    task = status_cache.registry.tasks[name]
     return {"paused": task.paused, "name": name}
 
 
@@ -255,62 +307,74 @@ async def get_resume_context():
 # =============================================================================
 
 @app_api.on_event("startup")
-async def start_hook_poller():
-    """Start background poller for task completion hooks."""
-    asyncio.create_task(monitor_hooks())
-
-
-async def monitor_hooks():
-    """Poll tasks and execute on_complete hooks."""
-    while True:
-        try:
-            # Reload registry to get latest state
-            current_registry = TaskRegistry()
-
-            for name, task in current_registry.tasks.items():
-                if task.on_complete and not task.hook_executed:
-                    status = get_task_status(task)
-                    completed = status.get("completed", 0) or 0
-                    total = task.total
-
-                    if total and completed >= total:
-                        # Task complete! Run hook.
-                        cmd = task.on_complete
-
-                        # Helper: "batch-report" shortcut
-                        if cmd == "batch-report":
-                            path = Path(task.state_file).parent
-                            batch_report_script = None
+async def start_status_cache():
+    """Start watching state files and run hooks of tasks that already finished."""
+    status_cache.add_listener(run_completion_hook)
+    status_cache.start()
+    for name, status in status_cache.snapshot()["tasks"].items():
+        run_completion_hook({"type": "update", "task": name, "status": status})
 
-                            for script_path in BATCH_REPORT_PATHS:
-                                if script_path.exists():
-                                    batch_report_script = script_path
-                                    break
 
-                            if batch_report_script:
-                                cmd = f"uv run {batch_report_script} analyze {path}"
-                            else:
-                                console.print("[red][Hook] Error: batch-report script not found[/]")
-                                continue
+@app_api.on_event("shutdown")
+async def stop_status_cache():
+    """Stop watching state files."""
+    status_cache.stop()
 
-                        # Replace placeholders
-                        if "{output_dir}" in cmd:
-                            cmd = cmd.format(output_dir=Path(task.state_file).parent)
 
-                        console.print(f"[green][Hook] Executing: {cmd}[/]")
+_hook_lock = threading.Lock()
 
-                        # Execute in background (detached)
-                        subprocess.Popen(cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
 
-                        # Mark executed
-                        task.hook_executed = True
-                        task.completed_at = datetime.now().isoformat()
-                        current_registry.register(task)  # Save updates to file
+def run_completion_hook(event: dict) -> None:
+    """Execute a task's on_complete hook when an update shows it finished.
 
-        except Exception as e:
-            console.print(f"[red][Hook] Error: {e}[/]")
-
-        await asyncio.sleep(HOOK_POLL_INTERVAL)
+    Registered as a StatusCache listener, so it runs when the task's state
+    file changes instead of on a polling interval.
+    """
+    if event["type"] != "update":
+        return
+    try:
+        with _hook_lock:
+            task = status_cache.registry.tasks.get(event["task"])
+            if task is None or not task.on_complete or task.hook_executed:
+                return
+            completed = event["status"].get("completed", 0) or 0
+            if not (task.total and completed >= task.total):
+                return
+
+            # Task complete! Run hook.
+            cmd = task.on_complete
+
+            # Helper: "batch-report" shortcut
+            if cmd == "batch-report":
+                path = Path(task.state_file).parent
+                batch_report_script = None
+
+                for script_path in BATCH_REPORT_PATHS:
+                    if script_path.exists():
+                        batch_report_script = script_path
+                        break
+
+                if batch_report_script:
+                    cmd = f"uv run {batch_report_script} analyze {path}"
+                else:
+                    console.print("[red][Hook] Error: batch-report script not found[/]")
+                    return
+
+            # Replace placeholders
+            if "{output_dir}" in cmd:
+                cmd = cmd.format(output_dir=Path(task.state_file).parent)
+
+            console.print(f"[green][Hook] Executing: {cmd}[/]")
+
+            # Execute in background (detached)
+            subprocess.Popen(cmd, shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+            # Mark executed
+            task.hook_executed = True
+            task.completed_at = datetime.now().isoformat()
+            status_cache.registry.register(task)  # Save updates to file
+    except Exception as e:
+        console.print(f"[red][Hook] Error: {e}[/]")
 
 
 def run_server(port: int):
@@ -325,5 +389,6 @@ def run_server(port: int):
     console.print(f"[green]Starting Task Monitor API on port {port}[/]")
     console.print(f"  GET http://localhost:{port}/all - All task status")
     console.print(f"  GET http://localhost:{port}/tasks/{{name}} - Specific task")
+    console.print(f"  GET http://localhost:{port}/stream - Live status updates (SSE)")
     console.print(f"  POST http://localhost:{port}/tasks - Register task")
     uvicorn.run(app_api, host=API_HOST, port=port, log_level="warning")
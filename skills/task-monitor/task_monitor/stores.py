@@ -1,16 +1,21 @@
 """Task Monitor Stores - Data persistence for history, sessions, and quality.
 
 This module provides storage classes for persisting task monitor data to disk.
+History and quality metrics are append-only SQLite tables; the registry and
+sessions are small JSON files.
 """
 from __future__ import annotations
 
 import json
+import sqlite3
+import threading
 import uuid
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from task_monitor.config import (
+    HISTORY_DB,
     HISTORY_FILE,
     MAX_HISTORY_ENTRIES,
     MAX_QUALITY_ENTRIES,
@@ -18,6 +23,7 @@ from task_monitor.config import (
     REGISTRY_DIR,
     REGISTRY_FILE,
     SESSIONS_FILE,
+    STORE_COMPACT_INTERVAL,
 )
 from task_monitor.models import (
     HistoryEntry,
@@ -67,69 +73,175 @@ class TaskRegistry:
         return self.tasks.copy()
 
 
-class HistoryStore:
-    """Store for task history - enables 'where was I?' queries."""
-
-    def __init__(self, history_file: Path = HISTORY_FILE):
-        self.history_file = history_file
-        self._history: list[dict] = []
-        self._load()
-
-    def _load(self):
-        """Load history from file."""
-        if self.history_file.exists():
-            try:
-                with open(self.history_file, encoding="utf-8") as f:
-                    self._history = json.load(f)
-            except (OSError, json.JSONDecodeError):
-                self._history = []
+class _SqliteStore:
+    """Append-only SQLite table shared by the history and quality stores.
+
+    Writes are single INSERTs (WAL journal, no rewrite of earlier entries);
+    old rows are trimmed every STORE_COMPACT_INTERVAL appends. Each thread
+    gets its own connection.
+    """
+
+    _schema = ""
+
+    def __init__(self, db_file: Path):
+        self.db_file = Path(db_file)
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_file, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(self._schema)
+            self._local.conn = conn
+            self._setup(conn)
+        return conn
+
+    def _setup(self, conn: sqlite3.Connection) -> None:
+        """Per-connection setup after the schema exists (migrations, FTS)."""
+
+    def _append(self, sql: str, params: tuple) -> int:
+        """Insert one row; return its id."""
+        return self._connect().execute(sql, params).lastrowid
+
+    def _due_for_compaction(self, row_id: int) -> bool:
+        return row_id % STORE_COMPACT_INTERVAL == 0
+
+
+class HistoryStore(_SqliteStore):
+    """Store for task history - enables 'where was I?' queries.
+
+    Entries live in an append-only SQLite table with a trigram FTS5 index on
+    task_name/project for substring search. A legacy history.json is imported
+    on first use and renamed to history.json.migrated.
+    """
+
+    _schema = """
+        CREATE TABLE IF NOT EXISTS history (
+            id INTEGER PRIMARY KEY,
+            task_name TEXT NOT NULL,
+            project TEXT,
+            action TEXT,
+            timestamp TEXT,
+            entry TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS history_project ON history (project, id);
+    """
+
+    _fts_schema = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5(
+            task_name, project, content='history', content_rowid='id', tokenize='trigram'
+        );
+        CREATE TRIGGER IF NOT EXISTS history_ai AFTER INSERT ON history BEGIN
+            INSERT INTO history_fts (rowid, task_name, project)
+            VALUES (new.id, new.task_name, coalesce(new.project, ''));
+        END;
+        CREATE TRIGGER IF NOT EXISTS history_ad AFTER DELETE ON history BEGIN
+            INSERT INTO history_fts (history_fts, rowid, task_name, project)
+            VALUES ('delete', old.id, old.task_name, coalesce(old.project, ''));
+        END;
+    """
+
+    def __init__(self, db_file: Path = HISTORY_DB, legacy_file: Path = HISTORY_FILE):
+        super().__init__(db_file)
+        self.legacy_file = Path(legacy_file)
+        self.has_fts = False
+
+    def _setup(self, conn: sqlite3.Connection) -> None:
+        try:
+            conn.executescript(self._fts_schema)
+            self.has_fts = True
+        except sqlite3.OperationalError:
+            self.has_fts = False  # SQLite without FTS5/trigram: search scans instead
+        if self.legacy_file.exists():
+            self._migrate_json(conn)
+
+    def _migrate_json(self, conn: sqlite3.Connection) -> None:
+        """Import entries from the old history.json."""
+        try:
+            with open(self.legacy_file, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            entries = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if not conn.execute("SELECT 1 FROM history LIMIT 1").fetchone():
+                conn.executemany(
+                    "INSERT INTO history (task_name, project, action, timestamp, entry) VALUES (?, ?, ?, ?, ?)",
+                    [self._row(e) for e in entries[-MAX_HISTORY_ENTRIES:]],
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        try:
+            self.legacy_file.rename(self.legacy_file.with_name(self.legacy_file.name + ".migrated"))
+        except FileNotFoundError:
+            pass  # another opener migrated it first; its rows are already committed
+
+    @staticmethod
+    def _row(entry: dict) -> tuple:
+        return (
+            entry.get("task_name", ""),
+            entry.get("project"),
+            entry.get("action"),
+            entry.get("timestamp"),
+            json.dumps(entry),
+        )
 
-    def _save(self):
-        """Save history to file."""
-        # Keep last N entries
-        if len(self._history) > MAX_HISTORY_ENTRIES:
-            self._history = self._history[-MAX_HISTORY_ENTRIES:]
-        with open(self.history_file, 'w', encoding="utf-8") as f:
-            json.dump(self._history, f, indent=2)
+    def _entries(self, sql: str, params: tuple = ()) -> list[dict]:
+        return [json.loads(row[0]) for row in self._connect().execute(sql, params)]
 
     def record(self, entry: HistoryEntry):
         """Record a history entry."""
-        self._history.append(entry.model_dump())
-        self._save()
+        row_id = self._append(
+            "INSERT INTO history (task_name, project, action, timestamp, entry) VALUES (?, ?, ?, ?, ?)",
+            self._row(entry.model_dump()),
+        )
+        if self._due_for_compaction(row_id):
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop entries beyond the newest MAX_HISTORY_ENTRIES."""
+        self._connect().execute(
+            "DELETE FROM history WHERE id <= (SELECT MAX(id) FROM history) - ?", (MAX_HISTORY_ENTRIES,)
+        )
 
     def search(self, term: str, limit: int = 50) -> list[dict]:
-        """Search history by task name or project."""
-        term_lower = term.lower()
-        results = []
-        for entry in reversed(self._history):
-            if (term_lower in entry.get("task_name", "").lower() or
-                term_lower in (entry.get("project") or "").lower()):
-                results.append(entry)
-                if len(results) >= limit:
-                    break
-        return results
+        """Search history by task name or project (case-insensitive substring)."""
+        self._connect()
+        if self.has_fts and len(term) >= 3:  # trigram index needs 3+ characters
+            phrase = '"' + term.replace('"', '""') + '"'
+            return self._entries(
+                "SELECT h.entry FROM history_fts JOIN history h ON h.id = history_fts.rowid "
+                "WHERE history_fts MATCH ? ORDER BY h.id DESC LIMIT ?",
+                (phrase, limit),
+            )
+        pattern = "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return self._entries(
+            "SELECT entry FROM history WHERE task_name LIKE ? ESCAPE '\\' OR project LIKE ? ESCAPE '\\' "
+            "ORDER BY id DESC LIMIT ?",
+            (pattern, pattern, limit),
+        )
 
     def get_recent(self, limit: int = 20) -> list[dict]:
         """Get recent history entries."""
-        return list(reversed(self._history[-limit:]))
+        return self._entries("SELECT entry FROM history ORDER BY id DESC LIMIT ?", (limit,))
 
     def get_by_project(self, project: str, limit: int = 100) -> list[dict]:
         """Get history for a specific project."""
-        results = []
-        for entry in reversed(self._history):
-            if entry.get("project") == project:
-                results.append(entry)
-                if len(results) >= limit:
-                    break
-        return results
+        return self._entries(
+            "SELECT entry FROM history WHERE project = ? ORDER BY id DESC LIMIT ?", (project, limit)
+        )
 
     def get_last_session_context(self) -> dict:
         """Get context about the last work session for 'where was I?'"""
-        if not self._history:
-            return {"message": "No history found"}
-
         # Find the most recent entries
-        recent = self._history[-50:]
+        recent = list(reversed(self.get_recent(limit=50)))
+        if not recent:
+            return {"message": "No history found"}
 
         # Group by task
         tasks_worked = {}
@@ -161,7 +273,7 @@ class HistoryStore:
         return {
             "incomplete_tasks": incomplete,
             "completed_tasks": completed,
-            "last_activity": self._history[-1] if self._history else None,
+            "last_activity": recent[-1],
             "suggestion": incomplete[0] if incomplete else None,
         }
 
@@ -259,52 +371,82 @@ class SessionTracker:
         return results
 
 
-class QualityStore:
-    """Store for quality metrics history."""
+class QualityStore(_SqliteStore):
+    """Store for quality metrics history.
+
+    Pushes are appended to one SQLite table indexed by (task_name, id);
+    each task keeps its newest MAX_QUALITY_ENTRIES. Legacy per-task JSON
+    files in the quality directory are imported on first use.
+    """
+
+    _schema = """
+        CREATE TABLE IF NOT EXISTS quality (
+            id INTEGER PRIMARY KEY,
+            task_name TEXT NOT NULL,
+            entry TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS quality_task ON quality (task_name, id);
+    """
 
     def __init__(self, store_dir: Path = REGISTRY_DIR):
         self.store_dir = store_dir / "quality"
-        self.store_dir.mkdir(parents=True, exist_ok=True)
+        super().__init__(self.store_dir / "quality.db")
 
-    def push(self, task_name: str, metrics: QualityMetrics) -> None:
-        """Push quality metrics for a task."""
-        file_path = self.store_dir / f"{task_name}.json"
+    def _setup(self, conn: sqlite3.Connection) -> None:
+        for path in sorted(self.store_dir.glob("*.json")):
+            self._migrate_json(conn, path)
 
-        # Load existing history
-        history = []
-        if file_path.exists():
-            try:
-                with open(file_path, encoding="utf-8") as f:
-                    history = json.load(f)
-            except (OSError, json.JSONDecodeError):
-                history = []
+    def _migrate_json(self, conn: sqlite3.Connection, path: Path) -> None:
+        """Import one task's old <task>.json history."""
+        try:
+            with open(path, encoding="utf-8") as f:
+                history = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            history = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if not conn.execute("SELECT 1 FROM quality WHERE task_name = ? LIMIT 1", (path.stem,)).fetchone():
+                conn.executemany(
+                    "INSERT INTO quality (task_name, entry) VALUES (?, ?)",
+                    [(path.stem, json.dumps(e)) for e in history[-MAX_QUALITY_ENTRIES:]],
+                )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        try:
+            path.rename(path.with_name(path.name + ".migrated"))
+        except FileNotFoundError:
+            pass  # another opener migrated it first; its rows are already committed
 
-        # Add new metrics with timestamp
+    def push(self, task_name: str, metrics: QualityMetrics) -> None:
+        """Push quality metrics for a task."""
         entry = metrics.model_dump()
         entry["timestamp"] = datetime.now().isoformat()
-        history.append(entry)
-
-        # Keep last N entries
-        if len(history) > MAX_QUALITY_ENTRIES:
-            history = history[-MAX_QUALITY_ENTRIES:]
-
-        # Save
-        with open(file_path, 'w', encoding="utf-8") as f:
-            json.dump(history, f, indent=2)
+        row_id = self._append("INSERT INTO quality (task_name, entry) VALUES (?, ?)", (task_name, json.dumps(entry)))
+        if self._due_for_compaction(row_id):
+            self.compact()
+
+    def compact(self) -> None:
+        """Drop each task's entries beyond its newest MAX_QUALITY_ENTRIES."""
+        self._connect().execute(
+            """
+            DELETE FROM quality WHERE id IN (
+                SELECT id FROM (
+                    SELECT id, ROW_NUMBER() OVER (PARTITION BY task_name ORDER BY id DESC) AS n
+                    FROM quality
+                ) WHERE n > ?
+            )
+            """,
+            (MAX_QUALITY_ENTRIES,),
+        )
 
     def get(self, task_name: str, limit: int = 100) -> list:
-        """Get quality metrics history for a task."""
-        file_path = self.store_dir / f"{task_name}.json"
-
-        if not file_path.exists():
-            return []
-
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                history = json.load(f)
-            return history[-limit:]
-        except (OSError, json.JSONDecodeError):
-            return []
+        """Get quality metrics history for a task (oldest first)."""
+        rows = self._connect().execute(
+            "SELECT entry FROM quality WHERE task_name = ? ORDER BY id DESC LIMIT ?", (task_name, limit)
+        ).fetchall()
+        return [json.loads(row[0]) for row in reversed(rows)]
 
     def get_latest(self, task_name: str) -> Optional[dict]:
         """Get latest quality metrics for a task."""
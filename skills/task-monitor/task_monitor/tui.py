@@ -1,10 +1,13 @@
 """Task Monitor TUI - Rich terminal user interface components.
 
 This module provides the nvtop-style terminal UI for monitoring tasks.
+Task status comes from a StatusCache, so the display redraws as soon as a
+state file changes and unchanged state files are not re-read.
 """
 from __future__ import annotations
 
 import signal
+import threading
 import time
 from datetime import datetime
 from typing import Optional
@@ -18,7 +21,8 @@ from rich.text import Text
 
 from task_monitor.config import DEFAULT_REFRESH_INTERVAL, RATE_HISTORY_WINDOW
 from task_monitor.stores import QualityStore, TaskRegistry
-from task_monitor.utils import get_scheduled_jobs, get_task_status
+from task_monitor.utils import get_scheduled_jobs
+from task_monitor.watcher import StatusCache
 
 
 console = Console()
@@ -94,11 +98,17 @@ class TaskMonitorTUI:
     """nvtop-style TUI for task monitoring."""
 
     def __init__(self, filter_term: Optional[str] = None):
-        self.registry = TaskRegistry()
+        self.cache = StatusCache()
         self.filter_term = filter_term.lower() if filter_term else None
         self.running = False
         self.start_time = time.time()
         self._history: dict[str, list[tuple[float, int]]] = {}
+        self._changed = threading.Event()
+
+    @property
+    def registry(self) -> TaskRegistry:
+        """Task registry, kept current by the status cache."""
+        return self.cache.registry
 
     def _get_rate(self, name: str, completed: int) -> float:
         """Calculate rate from history."""
@@ -154,7 +164,9 @@ class TaskMonitorTUI:
             if self.filter_term and self.filter_term not in name.lower():
                 continue
 
-            status = get_task_status(task)
+            status = self.cache.get(name)
+            if status is None:
+                continue
 
             completed = status.get("completed", 0) or 0
             total = task.total or 0
@@ -210,15 +222,9 @@ class TaskMonitorTUI:
 
     def create_totals_panel(self) -> Panel:
         """Create totals panel."""
-        total_completed = 0
-        total_items = 0
-
-        for name, task in self.registry.tasks.items():
-            status = get_task_status(task)
-            completed = status.get("completed", 0) or 0
-            total_completed += completed
-            if task.total:
-                total_items += task.total
+        totals = self.cache.snapshot()["totals"]
+        total_completed = totals["completed"]
+        total_items = totals["total"]
 
         pct = (total_completed / total_items * 100) if total_items else 0
         bar_width = 50
@@ -343,12 +349,24 @@ class TaskMonitorTUI:
 
         def signal_handler(sig, frame):
             self.running = False
+            self._changed.set()
 
         signal.signal(signal.SIGINT, signal_handler)
 
-        with Live(self.create_display(), console=console, refresh_per_second=1, screen=True) as live:
-            while self.running:
-                live.update(self.create_display())
-                time.sleep(refresh_interval)
+        # Redraw on state changes; the interval still ticks the clock and schedule
+        def listener(event: dict) -> None:
+            self._changed.set()
+
+        self.cache.add_listener(listener)
+        self.cache.start()
+        try:
+            with Live(self.create_display(), console=console, refresh_per_second=1, screen=True) as live:
+                while self.running:
+                    live.update(self.create_display())
+                    self._changed.wait(refresh_interval)
+                    self._changed.clear()
+        finally:
+            self.cache.remove_listener(listener)
+            self.cache.stop()
 
         console.print("\n[green]Monitor stopped.[/]")
@@ -8,13 +8,17 @@ import json
 from pathlib import Path
 from typing import Optional
 
-from task_monitor.config import SCHEDULER_JOBS_FILE, BATCH_REPORT_PATHS
+from task_monitor.config import SCHEDULER_JOBS_FILE, BATCH_REPORT_PATHS, STATE_HEADER_MAX_BYTES
 from task_monitor.models import TaskConfig
 
 
 def read_task_state(state_file: str) -> dict:
     """Read state from a task's state file.
 
+    Progress-journal state files (see progress_journal.py) keep completed IDs
+    in a separate log, so only their small header is read. Larger legacy
+    files with a full "completed" list are parsed whole.
+
     Args:
         state_file: Path to the JSON state file
 
@@ -27,9 +31,12 @@ def read_task_state(state_file: str) -> dict:
         return {"error": "State file not found", "state_file": state_file}
 
     try:
-        with open(path, encoding="utf-8") as f:
-            state = json.load(f)
-    except (OSError, json.JSONDecodeError) as e:
+        with open(path, "rb") as f:
+            data = f.read(STATE_HEADER_MAX_BYTES + 1)
+            if len(data) > STATE_HEADER_MAX_BYTES:
+                data += f.read()  # legacy state file
+        state = json.loads(data)
+    except (OSError, UnicodeDecodeError, json.JSONDecodeError) as e:
         return {"error": f"Failed to read state: {e}", "state_file": state_file}
 
     # Standard fields we look for
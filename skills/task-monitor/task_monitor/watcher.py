@@ -0,0 +1,406 @@
+"""Task Monitor Watcher - Event-driven state file watching and status cache.
+
+StateWatcher reports which watched files changed, using inotify on Linux
+(via ctypes, no extra dependency) and falling back to cheap stat() polling
+elsewhere. StatusCache keeps every task's parsed status in memory and
+re-parses a state file only when the watcher reports it changed, notifying
+listeners (SSE clients, the TUI, completion hooks) with per-task deltas.
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+from task_monitor.config import (
+    REGISTRY_FILE,
+    WATCH_DEBOUNCE,
+    WATCH_POLL_INTERVAL,
+    WATCH_RESYNC_INTERVAL,
+)
+from task_monitor.models import TaskConfig
+from task_monitor.stores import TaskRegistry
+from task_monitor.utils import get_task_status
+
+# inotify(7) constants
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_ONLYDIR = 0x01000000
+_IN_NONBLOCK = 0o4000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = (_IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+               | _IN_CREATE | _IN_DELETE | _IN_ONLYDIR)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_inotify():
+    """Return libc if it provides inotify, else None."""
+    if not hasattr(os, "uname") or os.uname().sysname != "Linux":
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class StateWatcher:
+    """Report changes to a set of files from a background thread.
+
+    Parent directories are watched rather than the files themselves, so state
+    files replaced by rename (atomic writes) keep being tracked. Bursts of
+    events are debounced. A periodic stat() resync catches anything inotify
+    missed; files whose directory does not exist yet are polled.
+    """
+
+    def __init__(self, on_change: Callable[[Optional[set[Path]]], None]):
+        """
+        Args:
+            on_change: Called with the set of changed files, or None when
+                events were lost and everything should be re-read.
+        """
+        self.on_change = on_change
+        self._paths: set[Path] = set()
+        self._stats: dict[Path, Optional[tuple[int, int]]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._libc = _load_inotify()
+        self._fd: Optional[int] = None
+        self._wd_dirs: dict[int, Path] = {}
+        self._dir_wds: dict[Path, int] = {}
+        if self._libc is not None:
+            fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+            self._fd = fd if fd >= 0 else None
+
+    @property
+    def mode(self) -> str:
+        """'inotify' or 'poll'."""
+        return "inotify" if self._fd is not None else "poll"
+
+    def set_paths(self, paths: Iterable[Path]) -> None:
+        """Replace the set of watched files."""
+        paths = {Path(p).absolute() for p in paths}
+        with self._lock:
+            self._paths = paths
+            self._stats = {p: self._stats.get(p) or self._stat(p) for p in paths}
+            if self._fd is None:
+                return
+            dirs = {p.parent for p in paths}
+            for directory in dirs - self._dir_wds.keys():
+                wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), _WATCH_MASK)
+                if wd >= 0:
+                    self._dir_wds[directory] = wd
+                    self._wd_dirs[wd] = directory
+            for directory in self._dir_wds.keys() - dirs:
+                wd = self._dir_wds.pop(directory)
+                self._wd_dirs.pop(wd, None)
+                self._libc.inotify_rm_watch(self._fd, wd)
+
+    def start(self) -> None:
+        """Start the watcher thread."""
+        self._thread = threading.Thread(target=self._run, name="task-monitor-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watcher thread and release the inotify descriptor."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[tuple[int, int]]:
+        try:
+            st = path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def _scan(self, only_unwatched: bool) -> set[Path]:
+        """Files whose mtime/size changed since the last look."""
+        changed = set()
+        with self._lock:
+            for path in self._paths:
+                if only_unwatched and path.parent in self._dir_wds:
+                    continue
+                stat = self._stat(path)
+                if stat != self._stats.get(path):
+                    self._stats[path] = stat
+                    changed.add(path)
+        return changed
+
+    def _read_events(self) -> Optional[set[Path]]:
+        """Drain inotify events into watched paths (None on queue overflow)."""
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    return None
+                directory = self._wd_dirs.get(wd)
+                if directory is not None and name:
+                    changed.add(directory / os.fsdecode(name))
+
+    def _run(self) -> None:
+        pending: set[Path] = set()
+        lost = False
+        flush_at: Optional[float] = None
+        next_resync = time.monotonic() + WATCH_RESYNC_INTERVAL
+        next_poll = time.monotonic() + WATCH_POLL_INTERVAL
+
+        while not self._stop.is_set():
+            now = time.monotonic()
+            wake = min(next_poll, next_resync, flush_at or float("inf"))
+            timeout = max(0.0, min(wake - now, 1.0))
+
+            if self._fd is not None:
+                ready, _, _ = select.select([self._fd], [], [], timeout)
+                if ready:
+                    events = self._read_events()
+                    if events is None:
+                        lost = True
+                    else:
+                        with self._lock:
+                            events &= self._paths
+                            for path in events:
+                                self._stats[path] = self._stat(path)
+                        pending |= events
+                    if (lost or pending) and flush_at is None:
+                        flush_at = time.monotonic() + WATCH_DEBOUNCE
+            else:
+                self._stop.wait(timeout)
+
+            now = time.monotonic()
+            if now >= next_poll:
+                # Polling fallback, and files whose directory is not watched yet
+                pending |= self._scan(only_unwatched=self._fd is not None)
+                next_poll = now + WATCH_POLL_INTERVAL
+                flush_at = flush_at or now
+            if now >= next_resync:
+                pending |= self._scan(only_unwatched=False)
+                next_resync = now + WATCH_RESYNC_INTERVAL
+                flush_at = flush_at or now
+
+            if flush_at is not None and now >= flush_at:
+                if lost:
+                    self._safe_notify(None)
+                elif pending:
+                    self._safe_notify(pending)
+                pending, lost, flush_at = set(), False, None
+
+    def _safe_notify(self, paths: Optional[set[Path]]) -> None:
+        try:
+            self.on_change(paths)
+        except Exception:  # a bad listener must not kill the watcher
+            pass
+
+
+class StatusCache:
+    """In-memory status of every registered task, refreshed on file changes."""
+
+    def __init__(self, registry_file: Path = REGISTRY_FILE):
+        self.registry_file = Path(registry_file).absolute()
+        self.registry = TaskRegistry(self.registry_file)
+        self.version = 0
+        self.reads = 0  # state files parsed since start
+        self._statuses: dict[str, dict] = {}
+        self._by_path: dict[Path, set[str]] = {}
+        self._status_inputs: dict[str, tuple] = {}
+        self._listeners: list[Callable[[dict], None]] = []
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._watcher: Optional[StateWatcher] = None
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Load every task and start watching its state file."""
+        self._ensure_loaded()
+        self._watcher = StateWatcher(self._on_files_changed)
+        self._watcher.set_paths(self._watch_paths())
+        self._watcher.start()
+
+    def stop(self) -> None:
+        """Stop watching."""
+        if self._watcher:
+            self._watcher.stop()
+            self._watcher = None
+
+    @property
+    def mode(self) -> str:
+        """Watcher mode ('inotify', 'poll') or 'off' when not started."""
+        return self._watcher.mode if self._watcher else "off"
+
+    def add_listener(self, listener: Callable[[dict], None]) -> None:
+        """Call `listener(event)` for every update/removed event (from the watcher thread)."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[dict], None]) -> None:
+        """Stop notifying `listener`."""
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+
+    # -------------------------------------------------------------------------
+    # Reads
+    # -------------------------------------------------------------------------
+
+    def get(self, name: str) -> Optional[dict]:
+        """Cached status of one task, or None if not registered."""
+        self._ensure_loaded()
+        with self._lock:
+            status = self._statuses.get(name)
+            return dict(status) if status is not None else None
+
+    def snapshot(self) -> dict:
+        """All statuses with totals, in the shape of GET /all."""
+        self._ensure_loaded()
+        with self._lock:
+            tasks = {name: dict(status) for name, status in self._statuses.items()}
+            version = self.version
+        return {"tasks": tasks, "totals": compute_totals(tasks), "version": version}
+
+    # -------------------------------------------------------------------------
+    # Updates
+    # -------------------------------------------------------------------------
+
+    def reload_registry(self) -> None:
+        """Re-read the registry; parse state files of new or changed tasks only."""
+        registry = TaskRegistry(self.registry_file)
+        events = []
+        with self._lock:
+            self.registry = registry
+            for name in self._statuses.keys() - registry.tasks.keys():
+                self._statuses.pop(name, None)
+                self.version += 1
+                events.append({
+                    "type": "removed",
+                    "task": name,
+                    "version": self.version,
+                    "totals": compute_totals(self._statuses),
+                })
+            for name, task in registry.tasks.items():
+                if name not in self._statuses or self._status_inputs.get(name) != _status_inputs(task):
+                    event = self._refresh_locked(name)
+                    if event:
+                        events.append(event)
+            self._index_paths()
+        if self._watcher:
+            self._watcher.set_paths(self._watch_paths())
+        self._emit(events)
+
+    def refresh(self, name: str) -> None:
+        """Re-parse one task's state file and notify listeners if it changed."""
+        with self._lock:
+            event = self._refresh_locked(name)
+        self._emit([event] if event else [])
+
+    def _ensure_loaded(self) -> None:
+        with self._lock:
+            if self._loaded:
+                return
+            for name in self.registry.tasks:
+                self._refresh_locked(name)
+            self._index_paths()
+            self._loaded = True
+
+    def _refresh_locked(self, name: str) -> Optional[dict]:
+        task = self.registry.tasks.get(name)
+        if task is None:
+            return None
+        status = get_task_status(task)
+        self.reads += 1
+        if self._statuses.get(name) == status:
+            return None
+        self._statuses[name] = status
+        self.version += 1
+        return {
+            "type": "update",
+            "task": name,
+            "status": dict(status),
+            "version": self.version,
+            "totals": compute_totals(self._statuses),
+        }
+
+    def _index_paths(self) -> None:
+        self._by_path = {}
+        for name, task in self.registry.tasks.items():
+            self._by_path.setdefault(Path(task.state_file).absolute(), set()).add(name)
+        # Registry objects are edited in place by their owners, so keep a copy
+        self._status_inputs = {name: _status_inputs(task) for name, task in self.registry.tasks.items()}
+
+    def _watch_paths(self) -> set[Path]:
+        with self._lock:
+            return set(self._by_path) | {self.registry_file}
+
+    def _on_files_changed(self, paths: Optional[set[Path]]) -> None:
+        if paths is None:
+            # Events were lost: re-read everything
+            self.reload_registry()
+            for name in list(self.registry.tasks):
+                self.refresh(name)
+            return
+        if self.registry_file in paths:
+            self.reload_registry()
+        with self._lock:
+            names = set().union(*(self._by_path.get(p, set()) for p in paths))
+        for name in names:
+            self.refresh(name)
+
+    def _emit(self, events: list[dict]) -> None:
+        if not events:
+            return
+        with self._lock:
+            listeners = list(self._listeners)
+        for event in events:
+            for listener in listeners:
+                try:
+                    listener(event)
+                except Exception:
+                    pass
+
+
+def _status_inputs(task: TaskConfig) -> tuple:
+    """Task config fields that get_task_status() depends on."""
+    return task.state_file, task.total, task.description
+
+
+def compute_totals(statuses: dict[str, dict]) -> dict:
+    """Overall completed/total across task statuses."""
+    totals = {"completed": 0, "total": 0}
+    for status in statuses.values():
+        if status.get("completed"):
+            totals["completed"] += status["completed"]
+        if status.get("total"):
+            totals["total"] += status["total"]
+    if totals["total"] > 0:
+        totals["progress_pct"] = (totals["completed"] / totals["total"]) * 100
+    return totals
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Recall@k vs latency benchmark for vector-store index types.
+
+Builds each index type from server.build_index on the same synthetic
+clustered corpus and compares it against exact (Flat) search.
+
+Usage:
+    uv run --project . python bench_ann.py --n 200000 --dim 384
+    uv run --project . python bench_ann.py --types hnsw ivf_pq --nprobe 8 32 --ef-search 32 128
+"""
+
+import argparse
+import time
+
+import faiss
+import numpy as np
+
+from server import CollectionConfig, build_index, search_params
+
+
+def synthetic_corpus(n: int, dim: int, n_queries: int, clusters: int, seed: int = 0):
+    """Clustered Gaussian vectors (closer to real embeddings than uniform noise)."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype("float32")
+    assign = rng.integers(0, clusters, n + n_queries)
+    data = centers[assign] + 0.5 * rng.standard_normal((n + n_queries, dim)).astype("float32")
+    faiss.normalize_L2(data)
+    return data[:n], data[n:]
+
+
+def recall_at_k(truth: np.ndarray, found: np.ndarray) -> float:
+    hits = sum(len(set(t) & set(f)) for t, f in zip(truth, found))
+    return hits / truth.size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--n", type=int, default=100000, help="Corpus size")
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--clusters", type=int, default=200)
+    parser.add_argument("--types", nargs="+", default=["hnsw", "ivf_flat", "ivf_pq"])
+    parser.add_argument("--nlist", type=int, default=1024)
+    parser.add_argument("--pq-m", type=int, default=48)
+    parser.add_argument("--train-size", type=int, default=50000)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 16, 64])
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[32, 64, 128])
+    args = parser.parse_args()
+
+    data, queries = synthetic_corpus(args.n, args.dim, args.queries, args.clusters)
+
+    flat = build_index(args.dim, CollectionConfig(index_type="flat"))
+    flat.add(data)
+    start = time.perf_counter()
+    _, truth = flat.search(queries, args.k)
+    flat_ms = (time.perf_counter() - start) * 1000 / len(queries)
+
+    print(f"corpus={args.n} dim={args.dim} queries={args.queries} k={args.k}")
+    print(f"{'type':<10} {'param':<14} {'build_s':>8} {'ms/query':>9} {'recall@k':>9}")
+    print(f"{'flat':<10} {'-':<14} {'-':>8} {flat_ms:>9.3f} {1.0:>9.3f}")
+
+    for index_type in args.types:
+        config = CollectionConfig(
+            index_type=index_type,
+            nlist=args.nlist,
+            pq_m=args.pq_m,
+            train_size=args.train_size,
+        )
+        start = time.perf_counter()
+        index = build_index(args.dim, config, n_train=min(args.n, args.train_size))
+        if not index.is_trained:
+            index.train(data[:args.train_size])
+        index.add(data)
+        build_s = time.perf_counter() - start
+
+        sweep = args.ef_search if index_type == "hnsw" else args.nprobe
+        for value in sweep:
+            params = search_params(config, ef_search=value, nprobe=value)
+            start = time.perf_counter()
+            _, found = index.search(queries, args.k, params=params)
+            ms = (time.perf_counter() - start) * 1000 / len(queries)
+            label = f"efSearch={value}" if index_type == "hnsw" else f"nprobe={value}"
+            print(f"{index_type:<10} {label:<14} {build_s:>8.2f} {ms:>9.3f} {recall_at_k(truth, found):>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/bin/bash
+# Save -> restart -> upsert/delete/save -> reload -> search, per index type.
+# Reloaded indexes are memory-mapped until their first write.
+# Each step runs in a fresh interpreter, as after a service restart.
+set -eo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+PYTHON="${PYTHON:-uv run --project ${SCRIPT_DIR} python}"
+DATA_DIR="$(mktemp -d)"
+trap 'rm -rf "$DATA_DIR"' EXIT
+
+echo "=== Vector Store Persistence Check ==="
+
+step() {
+    VECTOR_STORE_DATA_DIR="$DATA_DIR" PYTHONPATH="$SCRIPT_DIR" $PYTHON - "$@" <<'PY'
+import sys
+import numpy as np
+from server import Collection, CollectionConfig
+
+index_type, step = sys.argv[1], sys.argv[2]
+name = f"persist-{index_type}"
+rng = np.random.default_rng(0)
+vecs = rng.standard_normal((1000, 32)).astype("float32")
+vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+ids = [f"id{i}" for i in range(1000)]
+moved = -vecs[0:1]
+
+if step == "create":
+    config = CollectionConfig(index_type=index_type, nlist=16, nprobe=16, pq_m=8, train_size=500)
+    col = Collection(name, config)
+    col.upsert(ids, vecs, [{"n": i % 7} for i in range(1000)])
+    assert col.save()
+elif step == "mutate":
+    col = Collection.load(name)
+    assert col.mapped
+    col.upsert(["id0"], moved, [{"n": 100}])
+    assert col.delete(["id1"]) == 1
+    assert col.save()
+else:
+    col = Collection.load(name)
+    assert col.mapped
+    assert col.count == 999, col.count
+    live = col.index.ntotal - len(col.tombstones)
+    assert live == 999, f"index holds {live} live vectors"
+    found, _, _ = col.search(moved, 1)
+    assert found[0] == ["id0"], found
+    found, _, _ = col.search(vecs[1:2], 10)
+    assert "id1" not in found[0], found
+    found, _, _ = col.search(vecs[5:6], 10)
+    assert "id5" in found[0], found
+    found, _, _ = col.search(moved, 5, filter={"n": 100})
+    assert found[0] == ["id0"], found
+PY
+}
+
+for index_type in flat hnsw ivf_flat ivf_pq; do
+    for s in create mutate verify; do
+        if ! step "$index_type" "$s"; then
+            echo "  [FAIL] $index_type: $s"
+            exit 1
+        fi
+    done
+    echo "  [PASS] $index_type survives restart, upsert/delete and reload"
+done
+
+echo "Result: PASS"
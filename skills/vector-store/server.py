@@ -1,25 +1,672 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from typing import List, Optional
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+from typing import Any, Dict, List, Optional, Set, Tuple
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+import asyncio
+import io
+import json
+import os
+import re
+import shutil
+import sys
+import threading
 import faiss
 import numpy as np
 
 app = FastAPI(title="Vector Store Service")
 
-# Global Index State
-index: Optional[faiss.IndexFlatIP] = None
-dimension: int = 0
-stored_ids: List[str] = []
+# Persistence
+DATA_DIR = Path(os.environ.get("VECTOR_STORE_DATA_DIR", str(Path.home() / ".cache" / "vector-store")))
+CHECKPOINT_SECONDS = float(os.environ.get("VECTOR_STORE_CHECKPOINT_SECONDS", "300"))
+DEFAULT_COLLECTION = "default"
+COLLECTION_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]{0,127}$")
+
+INDEX_TYPES = ("flat", "hnsw", "ivf_flat", "ivf_pq")
+COMPACT_RATIO = float(os.environ.get("VECTOR_STORE_COMPACT_RATIO", "0.2"))
+FILTER_EXACT_MAX = int(os.environ.get("VECTOR_STORE_FILTER_EXACT_MAX", "4096"))
+
+# FAISS calls release the GIL; running them here keeps the event loop (and /health) responsive
+WORKERS = int(os.environ.get("VECTOR_STORE_WORKERS", str(min(4, os.cpu_count() or 1))))
+executor = ThreadPoolExecutor(max_workers=WORKERS, thread_name_prefix="vector-store")
+
+# Binary transport: .npy / .npz bodies, or raw little-endian float32 rows with ?dim=
+BINARY_MEDIA_TYPE = "application/octet-stream"
+
+
+class CollectionConfig(BaseModel):
+    """Index type and build/search parameters for a collection."""
+    index_type: str = "flat"
+    hnsw_m: int = 32
+    ef_construction: int = 200
+    ef_search: int = 64
+    nlist: int = 1024
+    nprobe: int = 16
+    pq_m: int = 16
+    pq_nbits: int = 8
+    train_size: int = 50000
+
+
+def build_index(dimension: int, config: CollectionConfig, n_train: Optional[int] = None) -> faiss.Index:
+    """
+    Create an empty inner-product index for the configured type.
+
+    IVF types cap nlist at the number of training vectors so small collections
+    can still be trained.
+    """
+    if config.index_type == "flat":
+        return faiss.IndexFlatIP(dimension)
+    if config.index_type == "hnsw":
+        index = faiss.IndexHNSWFlat(dimension, config.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = config.ef_construction
+        index.hnsw.efSearch = config.ef_search
+        return index
+
+    nlist = max(1, min(config.nlist, n_train or config.nlist))
+    if config.index_type == "ivf_flat":
+        spec = f"IVF{nlist},Flat"
+    elif config.index_type == "ivf_pq":
+        if dimension % config.pq_m != 0:
+            raise HTTPException(
+                status_code=400,
+                detail=f"pq_m={config.pq_m} must divide dimension {dimension}"
+            )
+        spec = f"IVF{nlist},PQ{config.pq_m}x{config.pq_nbits}"
+    else:
+        raise HTTPException(status_code=400, detail=f"Unknown index_type: {config.index_type}")
+
+    index = faiss.index_factory(dimension, spec, faiss.METRIC_INNER_PRODUCT)
+    faiss.extract_index_ivf(index).nprobe = config.nprobe
+    return index
+
+
+def search_params(
+    config: CollectionConfig,
+    ef_search: Optional[int] = None,
+    nprobe: Optional[int] = None,
+    sel: Optional[faiss.IDSelector] = None
+) -> Optional[faiss.SearchParameters]:
+    """Per-query search parameters (thread-safe; the index itself is not modified)."""
+    if config.index_type == "hnsw":
+        params = faiss.SearchParametersHNSW(efSearch=ef_search or config.ef_search)
+    elif config.index_type in ("ivf_flat", "ivf_pq"):
+        params = faiss.SearchParametersIVF(nprobe=nprobe or config.nprobe)
+    elif sel is not None:
+        params = faiss.SearchParameters()
+    else:
+        return None
+    if sel is not None:
+        params.sel = sel
+        params._sel = sel  # keep the selector alive as long as the params
+    return params
+
+
+class RWLock:
+    """
+    Shared/exclusive lock. Searches share it; mutations, saves and index swaps
+    take it exclusively. The exclusive side is reentrant (upsert -> train,
+    save -> compact), and waiting writers hold off new readers.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writer: Optional[int] = None
+        self._depth = 0
+        self._waiting = 0
+
+    @contextmanager
+    def read(self):
+        if self._writer == threading.get_ident():
+            yield  # already exclusive
+            return
+        with self._cond:
+            while self._writer is not None or self._waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer != me:
+                self._waiting += 1
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+                self._waiting -= 1
+                self._writer = me
+            self._depth += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._depth -= 1
+                if not self._depth:
+                    self._writer = None
+                    self._cond.notify_all()
+
+
+class Collection:
+    """
+    A named FAISS index keyed by external string ids, persisted under DATA_DIR/<name>/.
+
+    Vectors are keyed by internal int64 ids (IndexIDMap2 for flat/HNSW, native
+    ids for IVF), so upsert and delete never require a rebuild. Scalar metadata fields are kept in small
+    posting sets and turned into an IDSelector, so filtered searches are
+    pre-filtered inside FAISS instead of over-fetching.
+
+    On disk:
+        config.json      - CollectionConfig (index type and parameters)
+        index.faiss      - faiss.write_index output
+        ids.json         - external id <-> internal id map, tombstones
+        metadata.json    - internal id -> metadata dict
+        pending.npy      - vectors buffered before an IVF index is trained
+        pending_ids.npy  - internal ids for pending vectors
+
+    IVF collections buffer their first `train_size` vectors, train on them,
+    then add them; until then searches run brute force over the buffer.
+    HNSW cannot remove vectors, so deletes are tombstoned (excluded via the
+    selector) and compacted away on save.
+    """
+
+    def __init__(self, name: str, config: Optional[CollectionConfig] = None):
+        self.name = name
+        self.config = config or CollectionConfig()
+        self.index: Optional[faiss.Index] = None
+        self.dimension: int = 0
+        self.int_ids: Dict[str, int] = {}
+        self.ext_ids: Dict[int, str] = {}
+        self.next_id = 0
+        self.metadata: Dict[int, Dict[str, Any]] = {}
+        self._postings: Dict[str, Dict[Any, Set[int]]] = {}
+        self.tombstones: Set[int] = set()
+        self.pending: Optional[np.ndarray] = None
+        self.pending_ids: Optional[np.ndarray] = None
+        self.dirty = False
+        self.mapped = False
+        self.lock = RWLock()
+
+    @property
+    def trained(self) -> bool:
+        return self.index is not None and self.index.is_trained
+
+    @property
+    def path(self) -> Path:
+        return DATA_DIR / self.name
+
+    @property
+    def count(self) -> int:
+        return len(self.int_ids)
+
+    def _new_index(self, n_train: Optional[int] = None) -> faiss.Index:
+        index = build_index(self.dimension, self.config, n_train=n_train)
+        if self.config.index_type in ("ivf_flat", "ivf_pq"):
+            # IVF stores ids natively; IDMap2 would mislabel after remove_ids
+            return index
+        return faiss.IndexIDMap2(index)
+
+    # -- metadata -------------------------------------------------------------
+
+    def _index_metadata(self, iid: int, meta: Dict[str, Any]) -> None:
+        self.metadata[iid] = meta
+        for key, value in meta.items():
+            for v in value if isinstance(value, list) else [value]:
+                if isinstance(v, (str, int, float, bool)):
+                    self._postings.setdefault(key, {}).setdefault(v, set()).add(iid)
+
+    def _unindex_metadata(self, iid: int) -> None:
+        meta = self.metadata.pop(iid, None)
+        if not meta:
+            return
+        for key, value in meta.items():
+            for v in value if isinstance(value, list) else [value]:
+                if isinstance(v, (str, int, float, bool)):
+                    self._postings.get(key, {}).get(v, set()).discard(iid)
+
+    def _allowed_ids(self, filter: Optional[Dict[str, Any]]) -> Optional[Set[int]]:
+        """Internal ids matching every field (any of the listed values), or None for no filter."""
+        if not filter:
+            return None
+        allowed: Optional[Set[int]] = None
+        for key, wanted in filter.items():
+            postings = self._postings.get(key, {})
+            matched: Set[int] = set()
+            for v in wanted if isinstance(wanted, list) else [wanted]:
+                matched |= postings.get(v, set())
+            allowed = matched if allowed is None else allowed & matched
+            if not allowed:
+                return set()
+        return allowed
+
+    # -- mutation -------------------------------------------------------------
+
+    def _own_index(self) -> None:
+        """Copy a memory-mapped index into memory before FAISS modifies it."""
+        if self.mapped:
+            # Mapped codes are a read-only view; FAISS aborts the process if asked to resize them
+            self.index = faiss.deserialize_index(faiss.serialize_index(self.index))
+            self.mapped = False
+
+    def _drop_vectors(self, iids: List[int]) -> None:
+        """Remove vectors from the index or the training buffer; HNSW tombstones them."""
+        if not iids:
+            return
+        arr = np.array(iids, dtype="int64")
+        if self.pending_ids is not None:
+            keep = ~np.isin(self.pending_ids, arr)
+            self.pending = self.pending[keep]
+            self.pending_ids = self.pending_ids[keep]
+        if self.index is not None and self.index.ntotal > 0:
+            if self.config.index_type == "hnsw":
+                # HNSW does not support removal; exclude at search time
+                self.tombstones.update(iids)
+            else:
+                self._own_index()
+                self.index.remove_ids(arr)
+
+    def _forget(self, iids: List[int]) -> None:
+        """Drop id mappings and metadata of removed vectors."""
+        for iid in iids:
+            ext = self.ext_ids.pop(iid, None)
+            if ext is not None:
+                self.int_ids.pop(ext, None)
+            self._unindex_metadata(iid)
+
+    def upsert(
+        self,
+        ids: List[str],
+        vecs: np.ndarray,
+        metadata: Optional[List[Optional[Dict[str, Any]]]] = None
+    ) -> int:
+        """Insert or replace L2-normalized vectors by external id. Returns the new count."""
+        with self.lock.write():
+            new_dim = vecs.shape[1]
+            if self.dimension == 0:
+                self.dimension = new_dim
+                if self.config.index_type in ("flat", "hnsw"):
+                    self.index = self._new_index()
+            elif self.dimension != new_dim:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Dimension mismatch. Expected {self.dimension}, got {new_dim}"
+                )
+
+            # Last occurrence wins for ids repeated within the batch
+            rows = list({ext: row for row, ext in enumerate(ids)}.values())
+            if len(rows) != len(ids):
+                vecs = vecs[rows]
+                ids = [ids[r] for r in rows]
+                metadata = [metadata[r] for r in rows] if metadata else None
+
+            old_iids = [self.int_ids[ext] for ext in ids if ext in self.int_ids]
+            new_ids = np.arange(self.next_id, self.next_id + len(ids), dtype="int64")
+
+            # FAISS first: if it raises, the id maps still describe the index
+            if self.trained:
+                self._own_index()
+                self.index.add_with_ids(vecs, new_ids)
+                try:
+                    self._drop_vectors(old_iids)
+                except RuntimeError:
+                    self.index.remove_ids(new_ids)
+                    raise
+            else:
+                self._drop_vectors(old_iids)
+                if self.pending is None:
+                    self.pending, self.pending_ids = vecs, new_ids
+                else:
+                    self.pending = np.vstack([self.pending, vecs])
+                    self.pending_ids = np.concatenate([self.pending_ids, new_ids])
+
+            self._forget(old_iids)
+            self.next_id += len(ids)
+            for i, ext in enumerate(ids):
+                iid = int(new_ids[i])
+                self.int_ids[ext] = iid
+                self.ext_ids[iid] = ext
+                if metadata and metadata[i]:
+                    self._index_metadata(iid, metadata[i])
+            self.dirty = True
+
+            if not self.trained and len(self.pending) >= self.config.train_size:
+                self.train()
+            return self.count
+
+    def delete(self, ids: List[str]) -> int:
+        """Delete vectors by external id. Returns how many existed."""
+        with self.lock.write():
+            iids = [self.int_ids[ext] for ext in ids if ext in self.int_ids]
+            self._drop_vectors(iids)
+            self._forget(iids)
+            if iids:
+                self.dirty = True
+            return len(iids)
+
+    def train(self) -> bool:
+        """Build and train the index on buffered vectors, then add them."""
+        with self.lock.write():
+            if self.trained or self.pending is None or len(self.pending) == 0:
+                return False
+            index = self._new_index(n_train=len(self.pending))
+            index.train(self.pending)
+            index.add_with_ids(self.pending, self.pending_ids)
+            self.index = index
+            self.pending = None
+            self.pending_ids = None
+            self.dirty = True
+            return True
+
+    def compact(self) -> bool:
+        """Rebuild the index without tombstoned vectors."""
+        with self.lock.write():
+            if not self.tombstones or self.index is None:
+                return False
+            labels = faiss.vector_to_array(self.index.id_map)
+            vecs = self.index.index.reconstruct_n(0, self.index.ntotal)
+            keep = ~np.isin(labels, np.fromiter(self.tombstones, dtype="int64"))
+            index = self._new_index(n_train=int(keep.sum()))
+            if not index.is_trained:
+                index.train(vecs[keep])
+            index.add_with_ids(vecs[keep], labels[keep])
+            self.index = index
+            self.mapped = False
+            self.tombstones = set()
+            self.dirty = True
+            return True
+
+    # -- search ---------------------------------------------------------------
+
+    def search(
+        self,
+        qvec: np.ndarray,
+        k: int,
+        ef_search: Optional[int] = None,
+        nprobe: Optional[int] = None,
+        filter: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Search L2-normalized queries, optionally restricted by a metadata filter.
+
+        Returns:
+            (ids per query, scores per query, internal ids per query)
+        """
+        with self.lock.read():
+            empty = [[] for _ in range(len(qvec))]
+            if self.count == 0:
+                return empty, empty, empty
+
+            if qvec.shape[1] != self.dimension:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Dimension mismatch. Expected {self.dimension}, got {qvec.shape[1]}"
+                )
+
+            allowed = self._allowed_ids(filter)
+            if allowed is not None:
+                allowed -= self.tombstones
+                if not allowed:
+                    return empty, empty, empty
+            k = min(k, self.count if allowed is None else len(allowed))
+
+            if self.trained and allowed is not None and self.config.index_type == "hnsw" \
+                    and len(allowed) <= FILTER_EXACT_MAX:
+                # Graph traversal misses very selective filters; scan them exactly
+                labels = np.fromiter(allowed, dtype="int64")
+                candidates = self.index.reconstruct_batch(labels)
+                D, pos = faiss.knn(qvec, candidates, k, metric=faiss.METRIC_INNER_PRODUCT)
+                I = np.where(pos >= 0, labels[np.clip(pos, 0, None)], -1)
+            elif self.trained:
+                sel = None
+                if allowed is not None:
+                    sel = faiss.IDSelectorBatch(np.fromiter(allowed, dtype="int64"))
+                elif self.tombstones:
+                    dead = faiss.IDSelectorBatch(np.fromiter(self.tombstones, dtype="int64"))
+                    sel = faiss.IDSelectorNot(dead)
+                params = search_params(self.config, ef_search, nprobe, sel=sel)
+                D, I = self.index.search(qvec, k, params=params)
+            else:
+                # Not yet trained: brute force over the (filtered) buffer
+                candidates, labels = self.pending, self.pending_ids
+                if allowed is not None:
+                    mask = np.isin(labels, np.fromiter(allowed, dtype="int64"))
+                    candidates, labels = candidates[mask], labels[mask]
+                D, pos = faiss.knn(qvec, candidates, k, metric=faiss.METRIC_INNER_PRODUCT)
+                I = np.where(pos >= 0, labels[np.clip(pos, 0, None)], -1)
+
+            res_ids_batch = []
+            res_scores_batch = []
+            res_iids_batch = []
+            for i in range(len(qvec)):
+                row_ids = []
+                row_scores = []
+                row_iids = []
+                for score, iid in zip(D[i], I[i]):
+                    ext = self.ext_ids.get(int(iid))
+                    if iid != -1 and ext is not None:
+                        row_ids.append(ext)
+                        row_scores.append(float(score))
+                        row_iids.append(int(iid))
+                res_ids_batch.append(row_ids)
+                res_scores_batch.append(row_scores)
+                res_iids_batch.append(row_iids)
+            return res_ids_batch, res_scores_batch, res_iids_batch
+
+    # -- persistence ----------------------------------------------------------
+
+    def reset(self) -> None:
+        """Clear vectors in memory and on disk."""
+        with self.lock.write():
+            self.index = None
+            self.mapped = False
+            self.int_ids = {}
+            self.ext_ids = {}
+            self.next_id = 0
+            self.metadata = {}
+            self._postings = {}
+            self.tombstones = set()
+            self.pending = None
+            self.pending_ids = None
+            self.dimension = 0
+            self.dirty = False
+            shutil.rmtree(self.path, ignore_errors=True)
+            if self.config.index_type != "flat":
+                # Keep the configuration so the collection is rebuilt the same way
+                self.path.mkdir(parents=True, exist_ok=True)
+                (self.path / "config.json").write_text(self.config.model_dump_json())
+
+    def _write_atomic(self, name: str, data: Any) -> None:
+        tmp = self.path / f"{name}.tmp"
+        if isinstance(data, np.ndarray):
+            with open(tmp, "wb") as f:
+                np.save(f, data)
+        else:
+            tmp.write_text(json.dumps(data))
+        os.replace(tmp, self.path / name)
+
+    def save(self) -> bool:
+        """Atomically write index, id map and metadata. Returns True if anything was written."""
+        with self.lock.write():
+            if not self.dirty:
+                return False
+            if self.count == 0:
+                self.reset()
+                return True
+
+            if len(self.tombstones) > COMPACT_RATIO * max(1, self.index.ntotal if self.index else 0):
+                self.compact()
+
+            self.path.mkdir(parents=True, exist_ok=True)
+            (self.path / "config.json").write_text(self.config.model_dump_json())
+
+            if self.trained:
+                tmp_index = self.path / "index.faiss.tmp"
+                faiss.write_index(self.index, str(tmp_index))
+                os.replace(tmp_index, self.path / "index.faiss")
+                (self.path / "pending.npy").unlink(missing_ok=True)
+                (self.path / "pending_ids.npy").unlink(missing_ok=True)
+            else:
+                self._write_atomic("pending.npy", self.pending)
+                self._write_atomic("pending_ids.npy", self.pending_ids)
+                (self.path / "index.faiss").unlink(missing_ok=True)
+
+            self._write_atomic("metadata.json", {str(iid): meta for iid, meta in self.metadata.items()})
+            self._write_atomic("ids.json", {
+                "dimension": self.dimension,
+                "next_id": self.next_id,
+                "ext_ids": list(self.int_ids.keys()),
+                "int_ids": list(self.int_ids.values()),
+                "tombstones": sorted(self.tombstones),
+            })
+            self.dirty = False
+            return True
+
+    @classmethod
+    def load(cls, name: str) -> "Collection":
+        """Open a persisted collection."""
+        path = DATA_DIR / name
+        config_path = path / "config.json"
+        config = CollectionConfig.model_validate_json(config_path.read_text()) if config_path.exists() else None
+        col = cls(name, config)
+
+        index_path = path / "index.faiss"
+        ids_path = path / "ids.json"
+        if not ids_path.exists():
+            return col
+
+        if index_path.exists():
+            # Map the codes instead of reading them: restarts stay fast and untouched
+            # collections cost little RSS. The first write copies the index into memory.
+            col.index = faiss.read_index(str(index_path), faiss.IO_FLAG_MMAP_IFC)
+            col.mapped = True
+        elif (path / "pending.npy").exists():
+            col.pending = np.load(path / "pending.npy")
+        else:
+            return col
+
+        meta = json.loads(ids_path.read_text())
+        col.dimension = meta.get("dimension", 0)
+
+        col.next_id = meta.get("next_id", 0)
+        col.int_ids = dict(zip(meta.get("ext_ids", []), meta.get("int_ids", [])))
+        col.ext_ids = {iid: ext for ext, iid in col.int_ids.items()}
+        col.tombstones = set(meta.get("tombstones", []))
+        if col.pending is not None:
+            col.pending_ids = np.load(path / "pending_ids.npy")
+
+        metadata_path = path / "metadata.json"
+        if metadata_path.exists():
+            for iid, item in json.loads(metadata_path.read_text()).items():
+                col._index_metadata(int(iid), item)
+        return col
+
+    def info(self) -> Dict:
+        return {
+            "name": self.name,
+            "count": self.count,
+            "dimension": self.dimension,
+            "index_type": self.config.index_type,
+            "trained": self.trained,
+            "pending": 0 if self.pending is None else len(self.pending),
+            "tombstones": len(self.tombstones),
+            "metadata_fields": sorted(self._postings),
+            "config": self.config.model_dump(),
+            "persisted": (self.path / "ids.json").exists(),
+            "mapped": self.mapped,
+            "dirty": self.dirty,
+        }
+
+
+# Global collection registry
+collections: Dict[str, Collection] = {}
+_collections_lock = threading.Lock()
+
+
+def get_collection(name: str, create: bool = True) -> Collection:
+    """Look up a collection, optionally creating it."""
+    if not COLLECTION_NAME_RE.match(name):
+        raise HTTPException(status_code=400, detail=f"Invalid collection name: {name}")
+    with _collections_lock:
+        col = collections.get(name)
+        if col is None:
+            if not create:
+                raise HTTPException(status_code=404, detail=f"Collection not found: {name}")
+            col = Collection(name)
+            collections[name] = col
+        return col
+
+
+def load_collections() -> None:
+    """Open every persisted collection under DATA_DIR."""
+    loaded: Dict[str, Collection] = {}
+    if DATA_DIR.exists():
+        for child in sorted(DATA_DIR.iterdir()):
+            if child.is_dir() and COLLECTION_NAME_RE.match(child.name):
+                try:
+                    loaded[child.name] = Collection.load(child.name)
+                except Exception as e:
+                    print(f"Failed to load collection {child.name}: {e}", file=sys.stderr)
+    with _collections_lock:
+        collections.clear()
+        collections.update(loaded)
+
+
+def save_collections() -> List[str]:
+    """Checkpoint every dirty collection. Returns names that were written."""
+    with _collections_lock:
+        cols = list(collections.values())
+    return [col.name for col in cols if col.save()]
+
+
+async def _checkpoint_loop():
+    while True:
+        await asyncio.sleep(CHECKPOINT_SECONDS)
+        try:
+            saved = await run_blocking(save_collections)
+            if saved:
+                print(f"Checkpointed collections: {', '.join(saved)}", file=sys.stderr)
+        except Exception as e:
+            print(f"Checkpoint failed: {e}", file=sys.stderr)
+
+
+@app.on_event("startup")
+async def startup():
+    load_collections()
+    if CHECKPOINT_SECONDS > 0:
+        asyncio.get_event_loop().create_task(_checkpoint_loop())
+
+
+@app.on_event("shutdown")
+async def shutdown_save():
+    save_collections()
+
 
 class IndexRequest(BaseModel):
     ids: List[str]
     vectors: List[List[float]]
+    metadata: Optional[List[Optional[Dict[str, Any]]]] = None
     reset: bool = False
 
+class DeleteRequest(BaseModel):
+    ids: List[str]
+
 class SearchRequest(BaseModel):
     query: Optional[List[float]] = None
     queries: Optional[List[List[float]]] = None
     k: int = 10
+    ef_search: Optional[int] = None
+    nprobe: Optional[int] = None
+    filter: Optional[Dict[str, Any]] = None
+    include_metadata: bool = False
 
 class SearchResponse(BaseModel):
     ids: List[str]
@@ -29,97 +676,284 @@ class BatchSearchResponse(BaseModel):
     ids: List[List[str]]
     scores: List[List[float]]
 
-@app.post("/index")
-async def add_vectors(req: IndexRequest):
-    global index, dimension, stored_ids
-    
+
+async def run_blocking(fn, *args, **kwargs):
+    """Run CPU-heavy work on the bounded executor instead of the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(fn, *args, **kwargs))
+
+
+def _is_binary(request: Request) -> bool:
+    return request.headers.get("content-type", "").split(";")[0].strip() == BINARY_MEDIA_TYPE
+
+
+def _wants_binary(request: Request) -> bool:
+    return BINARY_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _validate(model, data):
+    """Validate a JSON body or query dict, reporting errors like FastAPI's own 422s."""
+    try:
+        if isinstance(data, (bytes, str)):
+            return model.model_validate_json(data)
+        return model.model_validate(data)
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False, include_context=False))
+
+
+def _load_arrays(body: bytes, dim: Optional[int]) -> Dict[str, np.ndarray]:
+    """Decode an .npz archive, a single .npy array (as "vectors") or raw float32 rows."""
+    try:
+        if body[:2] == b"PK":
+            with np.load(io.BytesIO(body), allow_pickle=False) as npz:
+                return {key: npz[key] for key in npz.files}
+        if body[:6] == b"\x93NUMPY":
+            return {"vectors": np.load(io.BytesIO(body), allow_pickle=False)}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid .npy/.npz body: {e}")
+
+    if not dim:
+        raise HTTPException(status_code=400, detail="Raw float32 bodies require a ?dim= query parameter")
+    if len(body) % (4 * dim):
+        raise HTTPException(status_code=400, detail=f"Body length {len(body)} is not a multiple of {dim} float32 values")
+    return {"vectors": np.frombuffer(body, dtype="<f4").reshape(-1, dim)}
+
+
+def _as_vectors(arr: Optional[np.ndarray], name: str = "vectors") -> np.ndarray:
+    """Writable, C-contiguous float32 matrix (normalize_L2 works in place)."""
+    if arr is None:
+        raise HTTPException(status_code=400, detail=f"Binary body is missing '{name}'")
+    arr = np.array(arr, dtype="float32", order="C", copy=True)
+    if arr.ndim == 1:
+        arr = arr.reshape(1, -1)
+    if arr.ndim != 2:
+        raise HTTPException(status_code=400, detail=f"'{name}' must be a 2-D array, got shape {arr.shape}")
+    return arr
+
+
+def _query_dict(request: Request) -> Dict[str, Any]:
+    params: Dict[str, Any] = dict(request.query_params)
+    params.pop("dim", None)
+    if "filter" in params:
+        try:
+            params["filter"] = json.loads(params["filter"])
+        except ValueError:
+            raise HTTPException(status_code=400, detail="'filter' query parameter must be JSON")
+    return params
+
+
+def _dim_param(request: Request) -> Optional[int]:
+    dim = request.query_params.get("dim")
+    return int(dim) if dim and dim.isdigit() else None
+
+
+async def _parse_index(request: Request) -> Tuple[IndexRequest, np.ndarray]:
+    """
+    Read an index request as JSON, or as binary: an .npz with "ids" and "vectors"
+    arrays (optional ?reset=true).
+    """
+    body = await request.body()
+    if _is_binary(request):
+        arrays = await run_blocking(_load_arrays, body, _dim_param(request))
+        if "ids" not in arrays:
+            raise HTTPException(status_code=400, detail="Binary index bodies must be an .npz with 'ids' and 'vectors'")
+        params = _query_dict(request)
+        params.update(ids=[str(i) for i in arrays["ids"].tolist()], vectors=[])
+        return _validate(IndexRequest, params), _as_vectors(arrays.get("vectors"))
+
+    req = await run_blocking(_validate, IndexRequest, body)
+    try:
+        vecs = np.array(req.vectors, dtype="float32")
+    except ValueError:
+        raise HTTPException(status_code=400, detail="All vectors must have the same dimension")
+    return req, vecs
+
+
+async def _parse_search(request: Request) -> Tuple[SearchRequest, Optional[np.ndarray], bool]:
+    """
+    Read a search request as JSON, or as binary: an .npy/.npz of queries (or raw
+    float32 rows with ?dim=) with k, ef_search, nprobe and filter as query parameters.
+    """
+    body = await request.body()
+    if _is_binary(request):
+        arrays = await run_blocking(_load_arrays, body, _dim_param(request))
+        qvec = arrays.get("queries", arrays.get("vectors"))
+        return _validate(SearchRequest, _query_dict(request)), _as_vectors(qvec, "queries"), True
+
+    req = _validate(SearchRequest, body)
+    if req.queries is not None:
+        q_raw, is_batch = req.queries, True
+    elif req.query:
+        q_raw, is_batch = [req.query], False
+    else:
+        raise HTTPException(status_code=400, detail="Either 'query' or 'queries' is required")
+    try:
+        return req, np.array(q_raw, dtype="float32"), is_batch
+    except ValueError:
+        raise HTTPException(status_code=400, detail="All queries must have the same dimension")
+
+
+def _add_vectors(col: Collection, req: IndexRequest, vecs: np.ndarray):
     if req.reset:
-        index = None
-        stored_ids = []
-        dimension = 0
+        col.reset()
 
-    if not req.ids or not req.vectors:
-        return {"count": len(stored_ids)}
+    if not req.ids or len(vecs) == 0:
+        return {"count": col.count}
 
-    if len(req.ids) != len(req.vectors):
+    if len(req.ids) != len(vecs):
         raise HTTPException(status_code=400, detail="Mismatched ids and vectors length")
+    if req.metadata is not None and len(req.metadata) != len(req.ids):
+        raise HTTPException(status_code=400, detail="Mismatched ids and metadata length")
 
-    vecs = np.array(req.vectors, dtype='float32')
-    
     # Normalize for Inner Product (Cosine Similarity)
     faiss.normalize_L2(vecs)
 
-    new_dim = vecs.shape[1]
-    
-    if index is None:
-        dimension = new_dim
-        index = faiss.IndexFlatIP(dimension)
-    elif dimension != new_dim:
-        raise HTTPException(status_code=400, detail=f"Dimension mismatch. Expected {dimension}, got {new_dim}")
+    return {"count": col.upsert(req.ids, vecs, req.metadata)}
 
-    index.add(vecs)
-    stored_ids.extend(req.ids)
-    
-    return {"count": len(stored_ids)}
 
-@app.post("/search")
-async def search(req: SearchRequest):
-    global index
-    
-    if index is None or index.ntotal == 0:
-        if req.queries:
-            return {"ids": [], "scores": []}
-        return {"ids": [], "scores": []}
-
-    is_batch = req.queries is not None
-    
-    if is_batch:
-        q_raw = req.queries
-    elif req.query:
-        q_raw = [req.query]
-    else:
-        raise HTTPException(status_code=400, detail="Either 'query' or 'queries' is required")
+def _delete(col: Collection, req: DeleteRequest):
+    return {"deleted": col.delete(req.ids), "count": col.count}
+
+
+def _configure(col: Collection, config: CollectionConfig) -> Dict:
+    with col.lock.write():
+        if col.count > 0 and col.config != config:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Collection {col.name} already has {col.count} vectors; reset it before changing its index"
+            )
+        col.config = config
+        col.path.mkdir(parents=True, exist_ok=True)
+        (col.path / "config.json").write_text(config.model_dump_json())
+    return col.info()
+
+
+def _search(col: Collection, req: SearchRequest, qvec: np.ndarray):
+    if col.count == 0:
+        empty = [[] for _ in range(len(qvec))]
+        return empty, empty, empty
 
-    qvec = np.array(q_raw, dtype='float32')
     faiss.normalize_L2(qvec)
-    
-    if qvec.shape[1] != dimension:
-        raise HTTPException(status_code=400, detail=f"Dimension mismatch. Expected {dimension}, got {qvec.shape[1]}")
-
-    k = min(req.k, index.ntotal)
-    D, I = index.search(qvec, k)
-    
-    res_ids_batch = []
-    res_scores_batch = []
-    
-    for i in range(len(q_raw)):
-        row_ids = []
-        row_scores = []
-        for score, idx in zip(D[i], I[i]):
-            if idx != -1 and idx < len(stored_ids):
-                row_ids.append(stored_ids[idx])
-                row_scores.append(float(score))
-        res_ids_batch.append(row_ids)
-        res_scores_batch.append(row_scores)
-            
+    return col.search(qvec, req.k, req.ef_search, req.nprobe, filter=req.filter)
+
+
+def _search_response(
+    col: Collection,
+    req: SearchRequest,
+    results: Tuple[List[List[str]], List[List[float]], List[List[int]]],
+    is_batch: bool,
+    binary: bool
+):
+    res_ids_batch, res_scores_batch, res_iids_batch = results
+
+    if binary:
+        # Rows are padded to the longest result: "" ids and NaN scores
+        width = max((len(row) for row in res_ids_batch), default=0)
+        longest = max((len(i) for row in res_ids_batch for i in row), default=1)
+        ids = np.full((len(res_ids_batch), width), "", dtype=f"<U{max(1, longest)}")
+        scores = np.full((len(res_ids_batch), width), np.nan, dtype="float32")
+        for i, (row_ids, row_scores) in enumerate(zip(res_ids_batch, res_scores_batch)):
+            ids[i, :len(row_ids)] = row_ids
+            scores[i, :len(row_scores)] = row_scores
+        buf = io.BytesIO()
+        np.savez(buf, ids=ids, scores=scores)
+        return Response(content=buf.getvalue(), media_type=BINARY_MEDIA_TYPE)
+
     if is_batch:
-        return {"ids": res_ids_batch, "scores": res_scores_batch}
+        result = {"ids": res_ids_batch, "scores": res_scores_batch}
     else:
-        return {"ids": res_ids_batch[0], "scores": res_scores_batch[0]}
+        result = {"ids": res_ids_batch[0], "scores": res_scores_batch[0]}
+
+    if req.include_metadata:
+        meta_batch = [[col.metadata.get(iid, {}) for iid in row] for row in res_iids_batch]
+        result["metadata"] = meta_batch if is_batch else meta_batch[0]
+    return result
+
+
+async def _index_endpoint(col: Collection, request: Request):
+    req, vecs = await _parse_index(request)
+    return await run_blocking(_add_vectors, col, req, vecs)
+
+
+async def _search_endpoint(col: Collection, request: Request):
+    req, qvec, is_batch = await _parse_search(request)
+    results = await run_blocking(_search, col, req, qvec)
+    return _search_response(col, req, results, is_batch, _wants_binary(request))
+
+
+@app.post("/index")
+async def add_vectors(request: Request):
+    return await _index_endpoint(get_collection(DEFAULT_COLLECTION), request)
+
+@app.post("/search")
+async def search(request: Request):
+    return await _search_endpoint(get_collection(DEFAULT_COLLECTION), request)
+
+@app.post("/delete")
+async def delete_vectors(req: DeleteRequest):
+    return await run_blocking(_delete, get_collection(DEFAULT_COLLECTION), req)
 
 @app.delete("/reset")
 async def reset():
-    global index, stored_ids, dimension
-    index = None
-    stored_ids = []
-    dimension = 0
+    await run_blocking(get_collection(DEFAULT_COLLECTION).reset)
     return {"status": "reset"}
 
+@app.get("/collections")
+async def list_collections():
+    with _collections_lock:
+        cols = list(collections.values())
+    return {"collections": [col.info() for col in cols]}
+
+@app.get("/collections/{name}")
+async def collection_info(name: str):
+    return get_collection(name, create=False).info()
+
+@app.post("/collections/{name}")
+async def collection_create(name: str, config: CollectionConfig):
+    if config.index_type not in INDEX_TYPES:
+        raise HTTPException(status_code=400, detail=f"index_type must be one of {INDEX_TYPES}")
+    # Waits for the collection's writers and searches, so not on the event loop
+    return await run_blocking(_configure, get_collection(name), config)
+
+@app.post("/collections/{name}/train")
+async def collection_train(name: str):
+    col = get_collection(name, create=False)
+    trained = await run_blocking(col.train)
+    return {"name": name, "trained": trained or col.trained, "count": col.count}
+
+@app.post("/collections/{name}/index")
+async def collection_add_vectors(name: str, request: Request):
+    return await _index_endpoint(get_collection(name), request)
+
+@app.post("/collections/{name}/delete")
+async def collection_delete_vectors(name: str, req: DeleteRequest):
+    return await run_blocking(_delete, get_collection(name, create=False), req)
+
+@app.post("/collections/{name}/search")
+async def collection_search(name: str, request: Request):
+    return await _search_endpoint(get_collection(name, create=False), request)
+
+@app.post("/collections/{name}/save")
+async def collection_save(name: str):
+    col = get_collection(name, create=False)
+    return {"name": name, "saved": await run_blocking(col.save), "count": col.count}
+
+@app.delete("/collections/{name}")
+async def collection_drop(name: str):
+    col = get_collection(name, create=False)
+    await run_blocking(col.reset)
+    shutil.rmtree(col.path, ignore_errors=True)
+    with _collections_lock:
+        collections.pop(name, None)
+    return {"status": "dropped", "name": name}
+
 @app.get("/info")
 async def info():
+    col = get_collection(DEFAULT_COLLECTION)
     return {
-        "count": len(stored_ids) if stored_ids else 0,
-        "dimension": dimension,
+        "count": col.count,
+        "dimension": col.dimension,
+        "collections": len(collections),
+        "data_dir": str(DATA_DIR),
         "backend": "faiss-cpu",
         "service": "vector-store",
         "status": "ready"
@@ -132,17 +966,14 @@ async def health():
 @app.post("/shutdown")
 async def shutdown():
     """Gracefully shutdown the service."""
-    import os, asyncio, sys
     print("Shutdown requested via API", file=sys.stderr)
+    await run_blocking(save_collections)
     asyncio.get_event_loop().call_later(0.5, lambda: os._exit(0))
     return {"status": "shutting_down"}
 
 @app.post("/reload")
 async def reload():
-    """Reload the service (resets index for transient logic)."""
-    global index, stored_ids, dimension
-    print("Reload requested via API (Resetting Index)", file=sys.stderr)
-    index = None
-    stored_ids = []
-    dimension = 0
-    return {"status": "reloaded", "count": 0}
+    """Reload collections from their last saved state on disk."""
+    print("Reload requested via API (reloading persisted collections)", file=sys.stderr)
+    await run_blocking(load_collections)
+    return {"status": "reloaded", "count": get_collection(DEFAULT_COLLECTION).count}